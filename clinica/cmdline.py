@@ -3,16 +3,14 @@
 The aim of this module is to execute pipelines from the command line,
 and gives to the user some other utils to work with the pipelines.
 """
+
 import os
 import sys
 
 import click
 
 import clinica
-from clinica.engine.template import cli as generate_cli
-from clinica.iotools.converters.cli import cli as convert_cli
-from clinica.iotools.utils.cli import cli as iotools_cli
-from clinica.pipelines.cli import cli as run_cli
+from clinica.utils.cli import LazyGroup
 from clinica.utils.exceptions import ClinicaException
 from clinica.utils.stream import cprint
 
@@ -23,13 +21,24 @@ CONTEXT_SETTINGS = dict(
     help_option_names=["-h", "--help"],
 )
 
+# The command groups are imported when they are invoked, so that the start-up
+# of a command does not pay for the import of the other ones.
+COMMANDS = {
+    "convert": "clinica.iotools.converters.cli:cli",
+    "generate": "clinica.engine.template:cli",
+    "iotools": "clinica.iotools.utils.cli:cli",
+    "run": "clinica.pipelines.cli:cli",
+}
+
 
-def setup_logging(verbose: bool = False) -> None:
+def setup_logging(verbose: bool = False, nipype: bool = True) -> None:
     """Setup Clinica's logging facilities.
 
     Args:
         verbosity (int): The desired level of verbosity for logging.
             (0 (default): WARNING, 1: INFO, 2: DEBUG)
+        nipype (bool): Whether to configure the logging of Nipype, which
+            requires importing it (only needed to run pipelines).
     """
     import logging
 
@@ -40,7 +49,8 @@ def setup_logging(verbose: bool = False) -> None:
     # Clinica logger configuration.
     setup_clinica_logging(logging_level)
     # Nipype logger configuration.
-    setup_nipype_logging()
+    if nipype:
+        setup_nipype_logging()
 
 
 def setup_nipype_logging():
@@ -95,17 +105,12 @@ def setup_clinica_logging(logging_level: str):
         clinica_logger.addHandler(console_handler)
 
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS, context_settings=CONTEXT_SETTINGS)
 @click.version_option(version=clinica.__version__)
 @click.option("-v", "--verbose", is_flag=True, help="Increase logging verbosity.")
-def cli(verbose: bool) -> None:
-    setup_logging(verbose=verbose)
-
-
-cli.add_command(convert_cli)
-cli.add_command(generate_cli)
-cli.add_command(iotools_cli)
-cli.add_command(run_cli)
+@click.pass_context
+def cli(ctx: click.Context, verbose: bool) -> None:
+    setup_logging(verbose=verbose, nipype=ctx.invoked_subcommand == "run")
 
 
 def main() -> None:
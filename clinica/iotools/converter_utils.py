@@ -1,5 +1,5 @@
 from os import PathLike
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 __all__ = [
     "MissingModsTracker",
@@ -57,15 +57,31 @@ class MissingModsTracker:
         modality : str
             The missing modality to add.
         """
+        self.add_missing_mods(session, {modality: 1})
+
+    def add_missing_mods(self, session: str, counts: Dict[str, int]) -> None:
+        """Increase the number of missing files for several modalities at once.
+
+        Parameters
+        ----------
+        session : str
+            Name of the session for which to add the modalities.
+
+        counts : dict
+            The number of missing files to add for each modality.
+            The key 'session' is the number of missing sessions.
+        """
         if session not in self.missing:
             raise ValueError(
                 f"Session {session} was not provided to the MissingModsTracker constructor."
             )
-        if modality not in self.missing[session]:
-            raise ValueError(
-                f"Modality {modality} is not tracked by this instance of MissingModsTracker."
-            )
-        self.missing[session][modality] += 1
+        for modality in counts:
+            if modality not in self.missing[session]:
+                raise ValueError(
+                    f"Modality {modality} is not tracked by this instance of MissingModsTracker."
+                )
+        for modality, count in counts.items():
+            self.missing[session][modality] += int(count)
 
     def increase_missing_ses(self, session: str) -> None:
         """Increase the session number.
@@ -274,7 +290,6 @@ def compute_longitudinal_analysis(
     summary : str
         The summary analysis as a string.
     """
-    from collections import Counter
     from pathlib import Path
 
     import pandas as pd
@@ -282,34 +297,87 @@ def compute_longitudinal_analysis(
     out_dir = Path(out_dir)
     bids_dir = Path(bids_dir)
     ses_avail = sort_session_list(ses_avail)
+    ses_dfs = {
+        ses: pd.read_csv(out_dir / (out_file_name + ses + ".tsv"), sep="\t").set_index(
+            "participant_id"
+        )
+        for ses in ses_avail
+    }
+    subjects = sorted(
+        set().union(
+            *(ses_df.index[ses_df.eq(1).any(axis=1)] for ses_df in ses_dfs.values())
+        )
+    )
+    diagnoses = _read_diagnoses(bids_dir, subjects)
     summary = "\n\n".join(
         ["*" * 46, f"Number of present diagnoses and modalities for each session:\n"]
     )
-    for ses in ses_avail:
-        ses_df = pd.read_csv(
-            out_dir / (out_file_name + ses + ".tsv"), sep="\t"
-        ).set_index("participant_id")
-        mods_avail = ses_df.columns.values
-        mod_dict = dict()
-        for mod in mods_avail:
-            diagnosis_counter = Counter()
-            subjects_avail = ses_df[ses_df[mod] == 1].index.values
-            for subject in subjects_avail:
-                subj_tsv_path = bids_dir / subject / f"{subject}_sessions.tsv"
-                subj_df = pd.read_csv(subj_tsv_path, sep="\t").set_index("session_id")
-                diagnosis = "missing"
-                if (
-                    ses in subj_df.index.values
-                    and "diagnosis" in subj_df.columns.values
-                ):
-                    diagnosis = subj_df.loc[ses, "diagnosis"]
-                    diagnosis = diagnosis if isinstance(diagnosis, str) else "n/a"
-                diagnosis_counter.update([diagnosis])
-            mod_dict[mod] = dict(diagnosis_counter)
+    for ses, ses_df in ses_dfs.items():
+        diagnosis = pd.Series(
+            [diagnoses.get((subject, ses), "missing") for subject in ses_df.index],
+            index=ses_df.index,
+        )
+        counts = ses_df.eq(1).groupby(diagnosis).sum()
+        mod_dict = {
+            mod: {d: int(n) for d, n in counts[mod].items() if n > 0}
+            for mod in ses_df.columns
+        }
         summary += f"{ses}\n{compute_table(mod_dict)}\n\n"
     return summary
 
 
+def _read_diagnoses(bids_dir: PathLike, subjects: List[str]) -> dict:
+    """Read the diagnoses of the provided subjects from their sessions TSV files.
+
+    The diagnoses of all the subjects are parsed into a single table of strings,
+    and converted the way `pandas.read_csv` would do it for each file: a diagnosis
+    is 'n/a' if it is missing, if the session is duplicated, or if all the
+    diagnoses of the subject are numbers or booleans.
+
+    Returns
+    -------
+    dict :
+        Dictionary mapping (participant_id, session_id) to the diagnosis.
+        Sessions of subjects without a 'diagnosis' column are not included.
+    """
+    import csv
+    import io
+    from pathlib import Path
+
+    import pandas as pd
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter="\t")
+    writer.writerow(["participant_id", "session_id", "diagnosis"])
+    for subject in subjects:
+        with open(Path(bids_dir) / subject / f"{subject}_sessions.tsv") as fp:
+            rows = [row for row in csv.reader(fp, delimiter="\t") if row]
+        if not rows or "diagnosis" not in rows[0] or "session_id" not in rows[0]:
+            continue
+        session_idx = rows[0].index("session_id")
+        diagnosis_idx = rows[0].index("diagnosis")
+        for row in rows[1:]:
+            row += [""] * (len(rows[0]) - len(row))
+            writer.writerow([subject, row[session_idx], row[diagnosis_idx]])
+    buffer.seek(0)
+    df = pd.read_csv(buffer, sep="\t", dtype=str)
+    is_number = pd.to_numeric(df.diagnosis, errors="coerce").notna() | (
+        df.diagnosis.str.lower().isin(["true", "false"])
+    )
+    is_text = (df.diagnosis.notna() & ~is_number).groupby(df.participant_id).any()
+    is_valid = (
+        df.diagnosis.notna()
+        & df.participant_id.map(is_text).astype(bool)
+        & ~df.duplicated(["participant_id", "session_id"], keep=False)
+    )
+    return dict(
+        zip(
+            zip(df.participant_id, df.session_id),
+            df.diagnosis.where(is_valid, "n/a"),
+        )
+    )
+
+
 def compute_table(mod_dict: dict) -> str:
     """Builds a table, encoded as a string, describing the
     modalities in the given dictionary.
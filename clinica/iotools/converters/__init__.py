@@ -1,3 +1,11 @@
-from .factory import convert
-
 __all__ = ["convert"]
+
+
+def __getattr__(name: str):
+    # The converter factory imports pandas: it is loaded on first access only,
+    # so that the command line of the converters starts quickly.
+    if name == "convert":
+        from .factory import convert
+
+        return convert
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
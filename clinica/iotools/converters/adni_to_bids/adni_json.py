@@ -443,30 +443,130 @@ class FuncWithException:
             return None, e
 
 
-def _run_parsers(xml_files: Iterable[Path]) -> Tuple[Iterable[dict], dict]:
+def _get_xml_cache_filename(xml_path: Path) -> Path:
+    import hashlib
+
+    from clinica.utils.filemanip import get_cache_folder
+
+    key = hashlib.sha256(str(Path(xml_path).resolve()).encode()).hexdigest()[:16]
+    return get_cache_folder("adni_xml") / f"{key}.pkl.gz"
+
+
+def _load_parsed_xml_files(cache_file: Path) -> pd.DataFrame:
+    """Load the table of metadata previously parsed from XML files.
+
+    The table has one row per XML file, with the path and modification time
+    of the file in the 'xml_file' and 'mtime' columns, and one column per
+    metadata field. An empty table is returned if the cache cannot be read.
+    """
+    try:
+        parsed = pd.read_pickle(cache_file)
+        if {"xml_file", "mtime"}.issubset(parsed.columns):
+            return parsed
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        cprint(
+            f"{LOGGING_HEADER} Ignoring invalid cache {cache_file}: {e}", lvl="debug"
+        )
+    return pd.DataFrame(columns=["xml_file", "mtime"], dtype=object)
+
+
+def _save_parsed_xml_files(parsed: pd.DataFrame, cache_file: Path) -> None:
+    import os
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        parsed.to_pickle(tmp, compression="gzip")
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        cprint(f"{LOGGING_HEADER} Could not save cache {cache_file}: {e}", lvl="debug")
+
+
+def _get_metadata_from_record(record: dict) -> dict:
+    """Return the metadata of a row of the cache, without the missing fields."""
+    return {
+        key: value
+        for key, value in record.items()
+        if key not in ("xml_file", "mtime")
+        and value is not None
+        and not (isinstance(value, float) and pd.isna(value))
+    }
+
+
+def _run_parsers(
+    xml_files: Iterable[Path],
+    n_procs: int = 1,
+    cache_file: Optional[Path] = None,
+) -> Tuple[Iterable[dict], dict]:
     """Run the parser `_parse_xml_file` on the list of files `xml_files`.
     Returns a tuple consisting if parsed images
     metadata and captured exceptions.
+
+    The files are parsed by a pool of `n_procs` processes. If `cache_file` is
+    provided, the metadata of the files whose modification time did not change
+    since the previous run are read from this file instead of being parsed
+    again, and the metadata of the newly parsed files are added to it. Files
+    which could not be parsed are not cached.
     """
     import os
 
-    parser = FuncWithException(_parse_xml_file)
-    images_with_exceptions = dict(
+    from clinica.utils.parallel import ParallelBackend, map_in_chunks
+
+    xml_files = list(xml_files)
+    keys = [str(Path(xml_file).resolve()) for xml_file in xml_files]
+    mtimes = [os.stat(xml_file).st_mtime_ns for xml_file in xml_files]
+    parsed = (
+        _load_parsed_xml_files(cache_file)
+        if cache_file is not None
+        else pd.DataFrame(columns=["xml_file", "mtime"], dtype=object)
+    )
+    cached_records = {
+        (record["xml_file"], record["mtime"]): record
+        for record in parsed.to_dict("records")
+    }
+    to_parse = [
+        i for i, key in enumerate(zip(keys, mtimes)) if key not in cached_records
+    ]
+    results = dict(
         zip(
-            xml_files,  # tqdm is buggy when chunksize > 1
-            [parser(xml_file) for xml_file in xml_files],
+            to_parse,
+            map_in_chunks(
+                FuncWithException(_parse_xml_file),
+                [xml_files[i] for i in to_parse],
+                n_procs=n_procs,
+                backend=ParallelBackend.PROCESSES,
+            ),
         )
     )
-    images = [
-        image
-        for image, exception in images_with_exceptions.values()
-        if exception is None
-    ]
-    exceptions = {
-        os.path.basename(xml_p): exception
-        for xml_p, (_, exception) in images_with_exceptions.items()
-        if exception is not None
-    }
+    images, exceptions, rows = [], {}, []
+    for i, (xml_file, key, mtime) in enumerate(zip(xml_files, keys, mtimes)):
+        if i in results:
+            image, exception = results[i]
+        else:
+            image = _get_metadata_from_record(cached_records[(key, mtime)])
+            exception = None
+        if exception is None:
+            images.append(image)
+            rows.append({"xml_file": key, "mtime": mtime, **image})
+        else:
+            exceptions[os.path.basename(xml_file)] = exception
+
+    if cache_file is not None and to_parse:
+        requested = set(keys)
+        others = parsed[
+            [
+                xml_file not in requested and os.path.exists(xml_file)
+                for xml_file in parsed.xml_file
+            ]
+        ]
+        _save_parsed_xml_files(
+            pd.concat(
+                [others, pd.DataFrame(rows, dtype=object)], ignore_index=True
+            ).astype(object),
+            cache_file,
+        )
     return images, exceptions
 
 
@@ -593,12 +693,22 @@ def _add_metadata_to_scans(df_meta: pd.DataFrame, bids_subjects_paths: Iterable[
 
 
 def create_json_metadata(
-    bids_subjects_paths: Iterable[Path], bids_ids: Iterable[str], xml_path: Path
+    bids_subjects_paths: Iterable[Path],
+    bids_ids: Iterable[str],
+    xml_path: Path,
+    n_procs: int = 1,
 ):
     """Create json metadata dictionary and add the metadata to the
-    appropriate files in the BIDS hierarchy."""
+    appropriate files in the BIDS hierarchy.
+
+    The XML files are parsed by `n_procs` processes, and the parsed metadata
+    are cached in the 'adni_xml' cache folder (see `get_cache_folder`) such
+    that only new or modified XML files are parsed by the following conversions.
+    """
     loni_ids = [_bids_id_to_loni(bids_id) for bids_id in bids_ids]
     xml_files = _read_xml_files(loni_ids, xml_path)
-    images, exe = _run_parsers(xml_files)
+    images, exe = _run_parsers(
+        xml_files, n_procs=n_procs, cache_file=_get_xml_cache_filename(xml_path)
+    )
     df_meta = _create_mri_meta_df(images)
     _add_metadata_to_scans(df_meta, bids_subjects_paths)
@@ -50,6 +50,7 @@ def convert(
         clinical_data_only=clinical_data_only,
         subjects=subjects,
         xml_path=xml_path,
+        n_procs=n_procs,
     )
 
 
@@ -68,6 +69,7 @@ class AdniToBids(Converter):
         clinical_data_only: bool = False,
         subjects: Optional[Path] = None,
         xml_path: Optional[Path] = None,
+        n_procs: Optional[int] = 1,
     ):
         """Convert the clinical data of ADNI specified into the file clinical_specifications_adni.xlsx.
 
@@ -77,6 +79,7 @@ class AdniToBids(Converter):
             clinical_data_only: process clinical data only
             subjects: restrict processing to this manifest of subjects
             xml_path: path to the XML metadata files
+            n_procs: number of processes used to parse the XML metadata files
         """
         from clinica.iotools.bids_utils import (
             StudyName,
@@ -164,7 +167,9 @@ class AdniToBids(Converter):
 
         if xml_path is not None:
             if xml_path.exists():
-                create_json_metadata(bids_subjects_paths, bids_ids, xml_path)
+                create_json_metadata(
+                    bids_subjects_paths, bids_ids, xml_path, n_procs=n_procs or 1
+                )
             else:
                 cprint(
                     msg=(
@@ -198,17 +203,41 @@ class AdniToBids(Converter):
 
         from .adni_utils import get_subjects_list
         from .modality_converters import modality_converter_factory
+        from .modality_converters._image_path_utils import (
+            build_image_index,
+            load_image_index,
+        )
 
         modalities = modalities or ADNIModality
         subjects = get_subjects_list(source_dir, clinical_dir, subjects)
 
         # Create the output folder if is not already existing
         (dest_dir / "conversion_info").mkdir(parents=True, exist_ok=True)
-        version_number = len([f for f in (dest_dir / "conversion_info").iterdir()])
+        # The journals of the conversions are also stored in this folder
+        version_number = len(
+            [f for f in (dest_dir / "conversion_info").iterdir() if f.name[0] == "v"]
+        )
         conversion_dir = dest_dir / "conversion_info" / f"v{version_number}"
         conversion_dir.mkdir(parents=True, exist_ok=True)
         cprint(f"Destination folder = {dest_dir}", lvl="debug")
 
+        # Walk the ADNI directory once and map each image ID to its series folder,
+        # the converters then look their images up in this table. The subjects
+        # whose folders did not change since the previous conversion are not walked.
+        cprint(f"Indexing the images of {source_dir} ...", lvl="info")
+        image_index = build_image_index(
+            source_dir,
+            subjects,
+            n_procs=n_procs or 1,
+            previous_index=load_image_index(
+                dest_dir
+                / "conversion_info"
+                / f"v{version_number - 1}"
+                / "image_index.tsv"
+            ),
+        )
+        image_index.to_csv(conversion_dir / "image_index.tsv", sep="\t", index=False)
+
         for modality in modalities:
             for converter in modality_converter_factory(modality):
                 converter(
@@ -219,6 +248,7 @@ class AdniToBids(Converter):
                     subjects=subjects,
                     mod_to_update=force_new_extraction,
                     n_procs=n_procs,
+                    image_index=image_index,
                 )
 
 
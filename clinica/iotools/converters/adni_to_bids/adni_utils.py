@@ -628,6 +628,13 @@ def paths_to_bids(
 ) -> List[Path]:
     """Images in the list are converted and copied to directory in BIDS format.
 
+    Images are converted as they are scheduled to the workers, and each
+    converted image is recorded in the journal of the modality (see
+    `ConversionJournal`). Images recorded in the journal by a previous,
+    possibly interrupted, conversion are not converted again, unless
+    `mod_to_update` is True. The logs of the workers are handled by the
+    current process, and the throughput of the conversion is reported.
+
     Parameters
     ----------
     images : pd.DataFrame
@@ -654,24 +661,129 @@ def paths_to_bids(
         This list contains None values for files where the
         conversion wasn't successful.
     """
+    import logging
     from functools import partial
     from multiprocessing import Pool
 
-    images_list = list([data for _, data in images.iterrows()])
-    create_file_ = partial(
-        _create_file,
+    from clinica.utils.stream import listen_to_worker_logs, setup_worker_logging
+
+    from .conversion_journal import ConversionJournal, get_journal_filename
+
+    journal = ConversionJournal(
+        get_journal_filename(bids_dir, modality.value), reset=mod_to_update
+    )
+    output_file_treated = [None] * len(images)
+    tasks = []
+    for position, (_, image) in enumerate(images.iterrows()):
+        if (output_image := journal.get(image.Image_ID)) is not None:
+            output_file_treated[position] = output_image
+        else:
+            tasks.append((position, image))
+    n_skipped = len(images) - len(tasks)
+    if n_skipped:
+        cprint(
+            f"[{modality.value}] {n_skipped} images already converted "
+            f"according to {journal.filename} are skipped.",
+            lvl="info",
+        )
+    convert_image_ = partial(
+        _convert_image,
         modality=modality,
         bids_dir=bids_dir,
         mod_to_update=mod_to_update,
     )
+    progress = _ConversionProgress(modality, len(tasks))
     # If n_procs==1 do not rely on a Process Pool to enable classical debugging
     if n_procs == 1:
-        return [create_file_(image) for image in images_list]
-    with Pool(processes=n_procs) as pool:
-        output_file_treated = pool.map(create_file_, images_list)
+        for task in tasks:
+            progress.update(journal, output_file_treated, *convert_image_(task))
+    else:
+        level = logging.getLogger("clinica").getEffectiveLevel()
+        with listen_to_worker_logs() as queue, Pool(
+            processes=n_procs,
+            initializer=setup_worker_logging,
+            initargs=(queue, level),
+        ) as pool:
+            for result in pool.imap_unordered(convert_image_, tasks):
+                progress.update(journal, output_file_treated, *result)
+            # Let the workers exit normally, such that their last records are
+            # flushed to the queue (leaving the block terminates the workers)
+            pool.close()
+            pool.join()
+    progress.report()
     return output_file_treated
 
 
+def _convert_image(
+    task: tuple,
+    modality: ADNIModalityConverter,
+    bids_dir: Path,
+    mod_to_update: bool,
+) -> tuple:
+    """Convert the image of the task (position, image metadata) with `_create_file`.
+
+    The position and the ID of the image are returned with the output image
+    and the durations of the conversion steps.
+    """
+    position, image = task
+    timings = {}
+    output_image = _create_file(image, modality, bids_dir, mod_to_update, timings)
+    return position, image.Image_ID, output_image, timings
+
+
+class _ConversionProgress:
+    """Follow the conversion of the images of a modality, and report its throughput."""
+
+    def __init__(self, modality: ADNIModalityConverter, n_images: int):
+        import time
+
+        self.modality = modality
+        self.n_images = n_images
+        self.n_done = 0
+        self.timings = {"dcm2niix": 0.0, "centering": 0.0}
+        self._start = time.perf_counter()
+        self._report_every = max(1, n_images // 10)
+
+    @property
+    def images_per_minute(self) -> float:
+        import time
+
+        return 60 * self.n_done / max(time.perf_counter() - self._start, 1e-6)
+
+    def update(
+        self,
+        journal,
+        output_file_treated: list,
+        position: int,
+        image_id: str,
+        output_image: Optional[Path],
+        timings: dict,
+    ) -> None:
+        output_file_treated[position] = output_image
+        if output_image is not None and pd.notna(output_image):
+            journal.record(image_id, output_image)
+        for step, duration in timings.items():
+            self.timings[step] = self.timings.get(step, 0.0) + duration
+        self.n_done += 1
+        if self.n_done % self._report_every == 0 and self.n_done < self.n_images:
+            cprint(
+                f"[{self.modality.value}] {self.n_done}/{self.n_images} images "
+                f"converted ({self.images_per_minute:.1f} images/min)",
+                lvl="info",
+            )
+
+    def report(self) -> None:
+        if not self.n_images:
+            return
+        cprint(
+            f"[{self.modality.value}] {self.n_done} images converted "
+            f"({self.images_per_minute:.1f} images/min). Time spent in dcm2niix: "
+            f"{self.timings['dcm2niix']:.1f} s, in centering: "
+            f"{self.timings['centering']:.1f} s.",
+            lvl="info",
+        )
+
+
 def _get_images_with_suffix(
     folder: Path,
     suffixes: Iterable[str],
@@ -732,6 +844,7 @@ def _create_file(
     modality: ADNIModalityConverter,
     bids_dir: Path,
     mod_to_update: bool,
+    timings: Optional[dict] = None,
 ) -> Optional[Path]:
     """Creates an image file at the corresponding output folder.
 
@@ -753,6 +866,10 @@ def _create_file(
         If True, pre-existing images in the BIDS directory will be
         erased and extracted again.
 
+    timings : dict, optional
+        If provided, the durations (in seconds) of the 'dcm2niix' and
+        'centering' steps are added to this dictionary.
+
     Returns
     -------
     output_image : Path
@@ -762,22 +879,16 @@ def _create_file(
     import os
     import re
     import shutil
+    import time
 
     import numpy as np
 
-    from clinica.cmdline import setup_clinica_logging
     from clinica.iotools.bids_utils import StudyName, bids_id_factory, run_dcm2niix
     from clinica.iotools.converter_utils import viscode_to_session
     from clinica.iotools.utils.data_handling import center_nifti_origin
     from clinica.utils.stream import cprint, log_and_raise, log_and_warn
 
-    # This function is executed in a multiprocessing context
-    # such that we need to re-configure the clinica logger in the child processes.
-    # Note that logging messages could easily be lost (for example when logging
-    # to a file from two different processes). A better solution would be to
-    # implement a logging process consuming logging messages from a multiprocessing.Queue...
-    setup_clinica_logging("INFO")
-
+    timings = timings if timings is not None else {}
     subject = image.Subject_ID
     viscode = image.VISCODE
 
@@ -822,6 +933,7 @@ def _create_file(
     output_image = file_without_extension.with_suffix(".nii.gz")
 
     if image.Is_Dicom:
+        start = time.perf_counter()
         success = run_dcm2niix(
             input_dir=image_path
             if modality != ADNIModalityConverter.FMAP
@@ -831,6 +943,7 @@ def _create_file(
             compress=not _should_be_centered(modality),
             bids_sidecar=_write_json_sidecar(modality),
         )
+        timings["dcm2niix"] = time.perf_counter() - start
         if not success:
             log_and_warn(
                 f"{logging_header} Error converting image {image_path} for subject {subject} and session {session}",
@@ -898,15 +1011,18 @@ def _create_file(
                 UserWarning,
             )
         if _should_be_centered(modality):
+            start = time.perf_counter()
             try:
                 output_image = center_nifti_origin(
                     file_without_extension.with_suffix(".nii"), output_image
                 )
             except Exception as e:
                 log_and_raise(str(e), ValueError)
+            timings["centering"] = time.perf_counter() - start
             file_without_extension.with_suffix(".nii").unlink()
     else:
         if _should_be_centered(modality):
+            start = time.perf_counter()
             try:
                 output_image = center_nifti_origin(image_path, output_image)
             except Exception as e:
@@ -918,6 +1034,7 @@ def _create_file(
                     ),
                     ValueError,
                 )
+            timings["centering"] = time.perf_counter() - start
         else:
             shutil.copy(image_path, output_image)
 
@@ -0,0 +1,79 @@
+"""Journal of the images converted by the ADNI to BIDS converter.
+
+The journal of a modality is a TSV file located in the 'conversion_info/journal'
+folder of the BIDS dataset. A line (Image_ID, output image) is appended and
+flushed as soon as an image is converted, such that a conversion which was
+interrupted (crash, walltime of a cluster job...) can be resumed without
+converting again the images which were already converted.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+__all__ = ["ConversionJournal", "get_journal_filename"]
+
+
+def get_journal_filename(bids_dir: Path, modality: str) -> Path:
+    """Return the journal of the provided modality converter in the BIDS dataset."""
+    return Path(bids_dir) / "conversion_info" / "journal" / f"{modality}.tsv"
+
+
+class ConversionJournal:
+    """Record of the images successfully converted into a BIDS dataset.
+
+    Parameters
+    ----------
+    filename : Path
+        The TSV file of the journal. It is created if it does not exist.
+
+    reset : bool, optional
+        If True, the images previously recorded in the journal are forgotten,
+        for instance because they must be converted again. Default=False.
+    """
+
+    def __init__(self, filename: Path, reset: bool = False):
+        self.filename = Path(filename)
+        self._converted: Dict[str, str] = {}
+        if reset:
+            self.filename.unlink(missing_ok=True)
+        else:
+            self._read()
+
+    def _read(self) -> None:
+        try:
+            with open(self.filename) as fp:
+                lines = fp.read().splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines[1:]:
+            # The last line may be incomplete if the conversion was killed
+            image_id, sep, output_image = line.partition("\t")
+            if sep and output_image:
+                self._converted[image_id] = output_image
+
+    def __len__(self) -> int:
+        return len(self._converted)
+
+    def get(self, image_id: Union[str, int]) -> Optional[Path]:
+        """Return the output image recorded for the provided Image_ID.
+
+        None is returned if the image was not converted, or if the output
+        image does not exist anymore.
+        """
+        if (output_image := self._converted.get(str(image_id))) is None:
+            return None
+        if not os.path.exists(output_image):
+            return None
+        return Path(output_image)
+
+    def record(self, image_id: Union[str, int], output_image: os.PathLike) -> None:
+        """Append the converted image to the journal."""
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        write_header = not self.filename.exists()
+        with open(self.filename, "a") as fp:
+            if write_header:
+                fp.write("Image_ID\toutput_image\n")
+            fp.write(f"{image_id}\t{output_image}\n")
+            fp.flush()
+        self._converted[str(image_id)] = str(output_image)
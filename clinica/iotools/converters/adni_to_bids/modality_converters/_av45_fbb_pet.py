@@ -1,7 +1,7 @@
 """Module for converting AV45 and Florbetaben PET of ADNI."""
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 import pandas as pd
 
@@ -16,6 +16,7 @@ def convert_av45_fbb_pet(
     subjects: Iterable[str],
     mod_to_update: bool = False,
     n_procs: int = 1,
+    image_index: Optional[pd.DataFrame] = None,
 ):
     """Convert AV-45 and Florbetaben PET images of ADNI into BIDS format.
 
@@ -44,6 +45,11 @@ def convert_av45_fbb_pet(
         The requested number of processes.
         If specified, it should be between 1 and the number of available CPUs.
         Default=1.
+
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
     """
     from clinica.iotools.converters.adni_to_bids.adni_utils import (
         ADNIModalityConverter,
@@ -55,7 +61,9 @@ def convert_av45_fbb_pet(
     cprint(
         f"Calculating paths of AV45 and Florbetaben PET images. Output will be stored in {conversion_dir}."
     )
-    images = _compute_av45_fbb_pet_paths(source_dir, csv_dir, subjects, conversion_dir)
+    images = _compute_av45_fbb_pet_paths(
+        source_dir, csv_dir, subjects, conversion_dir, image_index=image_index
+    )
     cprint(
         "Paths of AV45 and Florbetaben PET images found. Exporting images into BIDS ..."
     )
@@ -74,6 +82,7 @@ def _compute_av45_fbb_pet_paths(
     csv_dir: Path,
     subjects: Iterable[str],
     conversion_dir: Path,
+    image_index: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute the paths to the AV45 and Florbetaben PET images and store them in a TSV file.
 
@@ -91,6 +100,11 @@ def _compute_av45_fbb_pet_paths(
     conversion_dir : Path
         The path to the TSV files including the paths to original images.
 
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
+
     Returns
     -------
     images : pd.DataFrame
@@ -167,7 +181,9 @@ def _compute_av45_fbb_pet_paths(
         ]
         pet_amyloid_df.drop(error_ind, inplace=True)
 
-    images = find_image_path(pet_amyloid_df, source_dir, "Amyloid")
+    images = find_image_path(
+        pet_amyloid_df, source_dir, "Amyloid", image_index=image_index
+    )
     images.to_csv(conversion_dir / "amyloid_pet_paths.tsv", sep="\t", index=False)
 
     return images
@@ -16,6 +16,7 @@ def convert_dwi(
     subjects: Iterable[str],
     mod_to_update: bool = False,
     n_procs: int = 1,
+    image_index: Optional[pd.DataFrame] = None,
 ):
     """Convert DW images of ADNI into BIDS format.
 
@@ -44,6 +45,11 @@ def convert_dwi(
         The requested number of processes.
         If specified, it should be between 1 and the number of available CPUs.
         Default=1.
+
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
     """
     from clinica.iotools.converters.adni_to_bids.adni_utils import (
         ADNIModalityConverter,
@@ -56,7 +62,9 @@ def convert_dwi(
         f"Calculating paths of DWI images. Output will be stored in {conversion_dir}.",
         lvl="info",
     )
-    images = _compute_dwi_paths(source_dir, csv_dir, subjects, conversion_dir)
+    images = _compute_dwi_paths(
+        source_dir, csv_dir, subjects, conversion_dir, image_index=image_index
+    )
     cprint("Paths of DWI images found. Exporting images into BIDS ...", lvl="info")
     paths_to_bids(
         images,
@@ -73,6 +81,7 @@ def _compute_dwi_paths(
     csv_dir: Path,
     subjects: Iterable[str],
     conversion_dir: Path,
+    image_index: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute paths to DW images to convert to BIDS.
 
@@ -90,6 +99,11 @@ def _compute_dwi_paths(
     conversion_dir : Path
         The path to the TSV files including the paths to original images.
 
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
+
     Returns
     -------
     images : pd.DataFrame
@@ -98,7 +112,7 @@ def _compute_dwi_paths(
     from clinica.iotools.converters.adni_to_bids.adni_utils import load_clinical_csv
 
     from ._image_path_utils import find_image_path
-    from ._visits_utils import visits_to_timepoints
+    from ._visits_utils import visits_to_timepoints_by_subject
 
     dwi_df = _initialize_dwi_df()
     dwi_dfs_list = []
@@ -117,19 +131,17 @@ def _compute_dwi_paths(
             )
         )
     ]
+    # Obtain corresponding timepoints for the visits of all the subjects
+    timepoints = visits_to_timepoints_by_subject(mri_list, adni_merge, "DWI", subjects)
     for subject in subjects:
-        # Filter ADNIMERGE, MRI_LIST and QC for only one subject and
+        # Filter MRI_LIST and QC for only one subject and
         # sort the rows/visits by examination date
-        adnimerge_subj = adni_merge[adni_merge.PTID == subject]
-        adnimerge_subj = adnimerge_subj.sort_values("EXAMDATE")
-
         mri_list_subj = mri_list[mri_list.SUBJECT == subject]
         mri_list_subj = mri_list_subj.sort_values("SCANDATE")
 
         mayo_mri_qc_subj = mayo_mri_qc[mayo_mri_qc.RID == int(subject[-4:])]
 
-        # Obtain corresponding timepoints for the subject visits
-        visits = visits_to_timepoints(subject, mri_list_subj, adnimerge_subj, "DWI")
+        visits = timepoints.get(subject, {})
 
         for visit_info in visits.keys():
             timepoint = visit_info[0]
@@ -155,7 +167,7 @@ def _compute_dwi_paths(
         dwi_df.drop(error_ind, inplace=True)
 
     # Checking for images paths in filesystem
-    images = find_image_path(dwi_df, source_dir, "DWI")
+    images = find_image_path(dwi_df, source_dir, "DWI", image_index=image_index)
     images.to_csv(conversion_dir / "dwi_paths.tsv", sep="\t", index=False)
 
     return images
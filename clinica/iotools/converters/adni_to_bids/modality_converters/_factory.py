@@ -1,6 +1,8 @@
 from pathlib import Path
 from typing import Callable, Iterable, Optional, Union
 
+import pandas as pd
+
 from clinica.iotools.converters.adni_to_bids.adni_utils import (
     ADNIModality,
     ADNIModalityConverter,
@@ -10,7 +12,17 @@ __all__ = ["converter_factory", "modality_converter_factory"]
 
 
 ConverterInterface = Callable[
-    [Path, Path, Path, Path, Optional[Iterable[str]], bool, int], None
+    [
+        Path,
+        Path,
+        Path,
+        Path,
+        Optional[Iterable[str]],
+        bool,
+        int,
+        Optional[pd.DataFrame],
+    ],
+    None,
 ]
 
 
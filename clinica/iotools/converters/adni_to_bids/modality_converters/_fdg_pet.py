@@ -55,6 +55,7 @@ def _convert_fdg_pet(
     subjects: Iterable[str],
     mod_to_update: bool = False,
     n_procs: int = 1,
+    image_index: Optional[pd.DataFrame] = None,
 ):
     """Convert FDG PET images of ADNI into BIDS format.
 
@@ -86,6 +87,11 @@ def _convert_fdg_pet(
         The requested number of processes.
         If specified, it should be between 1 and the number of available CPUs.
         Default=1.
+
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
     """
     from clinica.iotools.converters.adni_to_bids.adni_utils import (
         load_clinical_csv,
@@ -98,7 +104,12 @@ def _convert_fdg_pet(
         f"Output will be stored in {conversion_dir}."
     )
     images = _compute_fdg_pet_paths(
-        source_dir, csv_dir, subjects, conversion_dir, preprocessing_step
+        source_dir,
+        csv_dir,
+        subjects,
+        conversion_dir,
+        preprocessing_step,
+        image_index=image_index,
     )
 
     cprint("Paths of FDG PET images found. Exporting images into BIDS ...")
@@ -137,6 +148,7 @@ def _compute_fdg_pet_paths(
     subjects: Iterable[str],
     conversion_dir: Path,
     preprocessing_step: ADNIPreprocessingStep,
+    image_index: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute the paths to the FDG PET images and store them in a TSV file.
 
@@ -161,6 +173,11 @@ def _compute_fdg_pet_paths(
     preprocessing_step : PreprocessingStep
         ADNI processing step, is an int between 0 and 5.
 
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
+
     Returns
     -------
     images : pd.DataFrame
@@ -171,7 +188,7 @@ def _compute_fdg_pet_paths(
     from ._image_path_utils import find_image_path
 
     pet_fdg_df = _get_pet_fdg_df(csv_dir, subjects, preprocessing_step)
-    images = find_image_path(pet_fdg_df, source_dir, "FDG")
+    images = find_image_path(pet_fdg_df, source_dir, "FDG", image_index=image_index)
     images.to_csv(
         conversion_dir / f"{Tracer.FDG.value}_pet_paths.tsv",
         sep="\t",
@@ -16,6 +16,7 @@ def convert_flair(
     subjects: Iterable[str],
     mod_to_update: bool = False,
     n_procs: int = 1,
+    image_index: Optional[pd.DataFrame] = None,
 ):
     """Convert FLAIR images of ADNI into BIDS format.
 
@@ -44,6 +45,11 @@ def convert_flair(
         The requested number of processes.
         If specified, it should be between 1 and the number of available CPUs.
         Default=1.
+
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
     """
     from clinica.iotools.converters.adni_to_bids.adni_utils import (
         ADNIModalityConverter,
@@ -56,7 +62,9 @@ def convert_flair(
         f"Calculating paths of {ADNIModalityConverter.FLAIR} images. Output will be stored in {conversion_dir}.",
         lvl="info",
     )
-    images = _compute_flair_paths(source_dir, csv_dir, subjects, conversion_dir)
+    images = _compute_flair_paths(
+        source_dir, csv_dir, subjects, conversion_dir, image_index=image_index
+    )
     cprint(
         f"Paths of {ADNIModalityConverter.FLAIR} images found. Exporting images into BIDS ...",
         lvl="info",
@@ -77,6 +85,7 @@ def _compute_flair_paths(
     csv_dir: Path,
     subjects: Iterable[str],
     conversion_dir: Path,
+    image_index: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute the paths to the FLAIR images and store them in a TSV file.
 
@@ -94,6 +103,11 @@ def _compute_flair_paths(
     conversion_dir : Path
         The path to the TSV files including the paths to original images.
 
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
+
     Returns
     -------
     images : pd.DataFrame
@@ -102,7 +116,7 @@ def _compute_flair_paths(
     from clinica.iotools.converters.adni_to_bids.adni_utils import load_clinical_csv
 
     from ._image_path_utils import find_image_path
-    from ._visits_utils import visits_to_timepoints
+    from ._visits_utils import visits_to_timepoints_by_subject
 
     flair_df = _initialize_flair_df()
     flair_dfs_list = []
@@ -118,18 +132,18 @@ def _compute_flair_paths(
     mri_list = mri_list[
         mri_list.SEQUENCE.map(lambda x: not any(subs in x for subs in ("_MPR_",)))
     ]
+    # Obtain corresponding timepoints for the visits of all the subjects
+    timepoints = visits_to_timepoints_by_subject(
+        mri_list, adni_merge, "FLAIR", subjects
+    )
     for subject in subjects:
-        # Filter ADNIMERGE, MRI_LIST and QC for only one subject and sort the rows/visits by examination date
-        adnimerge_subj = adni_merge[adni_merge.PTID == subject]
-        adnimerge_subj = adnimerge_subj.sort_values("EXAMDATE")
-
+        # Filter MRI_LIST and QC for only one subject and sort the rows/visits by examination date
         mri_list_subj = mri_list[mri_list.SUBJECT == subject]
         mri_list_subj = mri_list_subj.sort_values("SCANDATE")
 
         mayo_mri_qc_subj = mayo_mri_qc[mayo_mri_qc.RID == int(subject[-4:])]
 
-        # Obtain corresponding timepoints for the subject visits
-        visits = visits_to_timepoints(subject, mri_list_subj, adnimerge_subj, "FLAIR")
+        visits = timepoints.get(subject, {})
 
         for visit_info in visits.keys():
             timepoint = visit_info[0]
@@ -155,7 +169,7 @@ def _compute_flair_paths(
         flair_df.drop(error_ind, inplace=True)
 
     # Checking for images paths in filesystem
-    images = find_image_path(flair_df, source_dir, "FLAIR")
+    images = find_image_path(flair_df, source_dir, "FLAIR", image_index=image_index)
     images.to_csv(conversion_dir / "flair_paths.tsv", sep="\t", index=False)
 
     return images
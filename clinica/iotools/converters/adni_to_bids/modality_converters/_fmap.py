@@ -24,6 +24,7 @@ def convert_fmap(
     subjects: Iterable[str],
     mod_to_update: bool = False,
     n_procs: int = 1,
+    image_index: Optional[pd.DataFrame] = None,
 ):
     """Convert field map images of ADNI into BIDS format.
 
@@ -47,6 +48,11 @@ def convert_fmap(
     mod_to_update : bool
         If True, pre-existing images in the BIDS directory
         will be erased and extracted again.
+
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
     """
 
     from os import path
@@ -68,7 +74,9 @@ def convert_fmap(
         lvl="debug",
     )
 
-    images = compute_fmap_path(source_dir, csv_dir, subjects, conversion_dir)
+    images = compute_fmap_path(
+        source_dir, csv_dir, subjects, conversion_dir, image_index=image_index
+    )
 
     cprint("Paths of field maps found. Exporting images into BIDS ...")
 
@@ -81,7 +89,11 @@ def convert_fmap(
 
 
 def compute_fmap_path(
-    source_dir: Path, csv_dir: Path, subjs_list: Iterable[str], conversion_dir: Path
+    source_dir: Path,
+    csv_dir: Path,
+    subjs_list: Iterable[str],
+    conversion_dir: Path,
+    image_index: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute the paths to fMR images.
 
@@ -90,6 +102,7 @@ def compute_fmap_path(
         csv_dir: path to the clinical data directory
         subjs_list: subjects list
         conversion_dir: path to the TSV files including the paths to original images
+        image_index: table of the images of the ADNI directory, built from the folders of the subjects by default
 
     Returns:
         pandas Dataframe containing the path for each fmri
@@ -100,7 +113,7 @@ def compute_fmap_path(
     import pandas as pd
 
     from ._image_path_utils import find_image_path
-    from ._visits_utils import visits_to_timepoints
+    from ._visits_utils import visits_to_timepoints_by_subject
 
     fmap_col = [
         "Subject_ID",
@@ -136,18 +149,18 @@ def compute_fmap_path(
         mri_list.SEQUENCE.str.contains("apping")
     ]  # 'apping' includes all field map scans, but not others
 
+    # Obtain corresponding timepoints for the visits of all the subjects
+    timepoints = visits_to_timepoints_by_subject(
+        mri_list, adni_merge, "FMAP", subjs_list
+    )
     for subj in subjs_list:
-        # Filter ADNIMERGE, MRI_LIST and QC for only one subject and sort the rows/visits by examination date
-        adnimerge_subj = adni_merge[adni_merge.PTID == subj]
-        adnimerge_subj = adnimerge_subj.sort_values("EXAMDATE")
-
+        # Filter MRI_LIST and QC for only one subject and sort the rows/visits by examination date
         mri_list_subj = mri_list[mri_list.SUBJECT == subj]
         mri_list_subj = mri_list_subj.sort_values("SCANDATE")
 
         mayo_mri_qc_subj = mayo_mri_qc[mayo_mri_qc.RID == int(subj[-4:])]
 
-        # Obtain corresponding timepoints for the subject visits
-        visits = visits_to_timepoints(subj, mri_list_subj, adnimerge_subj, "FMAP")
+        visits = timepoints.get(subj, {})
 
         for visit_info, visit_str in visits.items():
             timepoint = visit_info[0]
@@ -222,7 +235,7 @@ def compute_fmap_path(
         fmap_df.drop(error_ind, inplace=True)
 
     # Checking for images paths in filesystem
-    images = find_image_path(fmap_df, source_dir, "FMAP")
+    images = find_image_path(fmap_df, source_dir, "FMAP", image_index=image_index)
     images.to_csv(conversion_dir / "fmap_paths.tsv", sep="\t", index=False)
 
     return images
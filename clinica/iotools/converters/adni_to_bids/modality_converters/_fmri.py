@@ -17,6 +17,7 @@ def convert_fmri(
     mod_to_update: bool = False,
     n_procs: int = 1,
     convert_multiband: bool = True,
+    image_index: Optional[pd.DataFrame] = None,
 ):
     """Convert fMR images of ADNI into BIDS format.
 
@@ -50,6 +51,11 @@ def convert_fmri(
         If True, the converter will also convert multiband fmri scans.
         Otherwise, they will be ignored.
         Default=True.
+
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
     """
     from clinica.iotools.converters.adni_to_bids.adni_utils import (
         ADNIModalityConverter,
@@ -63,7 +69,12 @@ def convert_fmri(
         lvl="info",
     )
     images = _compute_fmri_path(
-        source_dir, csv_dir, subjects, conversion_dir, convert_multiband
+        source_dir,
+        csv_dir,
+        subjects,
+        conversion_dir,
+        convert_multiband,
+        image_index=image_index,
     )
     cprint(
         f"Paths of {ADNIModalityConverter.FMRI} images found. Exporting images into BIDS ...",
@@ -85,6 +96,7 @@ def _compute_fmri_path(
     subjects: Iterable[str],
     conversion_dir: Path,
     convert_multiband: bool,
+    image_index: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute the paths to fMR images.
 
@@ -107,6 +119,11 @@ def _compute_fmri_path(
         Otherwise, they will be ignored.
         Default=True.
 
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
+
     Returns
     -------
     images : pd.DataFrame
@@ -115,7 +132,7 @@ def _compute_fmri_path(
     from clinica.iotools.converters.adni_to_bids.adni_utils import load_clinical_csv
 
     from ._image_path_utils import find_image_path
-    from ._visits_utils import visits_to_timepoints
+    from ._visits_utils import visits_to_timepoints_by_subject
 
     fmri_dfs_list = []
     fmri_df = _initialize_fmri_df()
@@ -141,19 +158,16 @@ def _compute_fmri_path(
             lambda x: not any(subs in x for subs in unwanted_sequences)
         )
     ]
+    # Obtain corresponding timepoints for the visits of all the subjects
+    timepoints = visits_to_timepoints_by_subject(mri_list, adni_merge, "fMRI", subjects)
     # We will convert the images for each subject in the subject list
     for subject in subjects:
-        # Filter ADNIMERGE, MRI_LIST and QC for only one subject and sort the rows/visits by examination date
-        adnimerge_subj = adni_merge[adni_merge.PTID == subject]
-        adnimerge_subj = adnimerge_subj.sort_values("EXAMDATE")
+        # Filter MRI_LIST and QC for only one subject and sort the rows/visits by examination date
         mri_list_subj = mri_list[mri_list.SUBJECT == subject]
         mri_list_subj = mri_list_subj.sort_values("SCANDATE")
         mayo_mri_qc_subj = mayo_mri_qc[mayo_mri_qc.RID == int(subject[-4:])]
 
-        # Obtain corresponding timepoints for the subject visits
-        visits = visits_to_timepoints(
-            subject, mri_list_subj, adnimerge_subj, modality="fMRI"
-        )
+        visits = timepoints.get(subject, {})
 
         for visit_info in visits.keys():
             timepoint = visit_info[0]
@@ -177,7 +191,9 @@ def _compute_fmri_path(
         ]
         fmri_df.drop(error_ind, inplace=True)
     # Checking for images paths in filesystem
-    images = find_image_path(fmri_df, source_dir, modality="fMRI")
+    images = find_image_path(
+        fmri_df, source_dir, modality="fMRI", image_index=image_index
+    )
     images.to_csv(conversion_dir / "fmri_paths.tsv", sep="\t", index=False)
 
     return images
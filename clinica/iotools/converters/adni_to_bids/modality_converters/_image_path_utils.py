@@ -1,16 +1,170 @@
+import re
 from pathlib import Path
+from typing import Iterable, Optional
 
 import pandas as pd
 
 from clinica.utils.stream import cprint
 
-__all__ = ["find_image_path"]
+__all__ = ["build_image_index", "find_image_path", "load_image_index"]
+
+_IMAGE_ID_PATTERN = re.compile(r"_I(\d+)\.")
+
+
+def build_image_index(
+    source_dir: Path,
+    subjects: Optional[Iterable[str]] = None,
+    n_procs: int = 1,
+    previous_index: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Map the image IDs of the ADNI directory to their series folder or image file.
+
+    The folders of the subjects are walked once, in parallel, and only the files
+    whose name contains an image ID ('_I<Image_ID>.') are kept, such that the
+    converters of all the modalities match their images against this table
+    instead of walking the folder of the subject for every image.
+
+    When the index of a previous conversion is given, the images of a subject are
+    taken from it if none of the folders of the subject, down to the series folders,
+    was modified since then. Only the other subjects are walked again.
+
+    Args:
+        source_dir: path to the ADNI directory
+        subjects: subjects for which images are indexed. By default, all the folders
+            located at the root of the ADNI directory are considered.
+        n_procs: number of threads used to walk the folders of the subjects
+        previous_index: index built by a previous conversion, as returned by
+            `load_image_index`
+
+    Returns: Dataframe with one row per (Subject_ID, Image_ID), with the path to the
+        image ('Path'), whether it is a DICOM folder ('Is_Dicom'), and the last
+        modification time of the folders of the subject ('Subject_Mtime'). If several
+        files match an image ID, the first one in alphabetical order is used.
+    """
+    from functools import partial
+
+    from clinica.utils.parallel import map_in_chunks
+
+    source_dir = Path(source_dir)
+    if subjects is None:
+        subjects = [folder.name for folder in source_dir.iterdir() if folder.is_dir()]
+    subjects = sorted({str(subject) for subject in subjects})
+    previous = {}
+    if previous_index is not None:
+        for subject, rows in previous_index.groupby("Subject_ID"):
+            # The previous conversion may have been run on another ADNI directory
+            if rows.Path.str.startswith(str(source_dir / subject)).all():
+                previous[subject] = rows
+    indexed = map_in_chunks(
+        partial(_index_subject, source_dir, previous), subjects, n_procs=n_procs
+    )
+    rescanned = sum(not reused for _, reused in indexed)
+    cprint(
+        f"Images of {rescanned} out of {len(subjects)} subjects were indexed, "
+        "the others were found in the index of the previous conversion.",
+        lvl="debug",
+    )
+    columns = ["Subject_ID", "Image_ID", "Path", "Is_Dicom", "Subject_Mtime"]
+    return pd.DataFrame(
+        [row for rows, _ in indexed for row in rows],
+        columns=columns,
+    ).astype({"Is_Dicom": bool, "Subject_Mtime": "int64"})
+
+
+def load_image_index(index_file: Path) -> Optional[pd.DataFrame]:
+    """Load the image index saved by a previous conversion.
+
+    Args:
+        index_file: path to the TSV file of the index
+
+    Returns: The index, as returned by `build_image_index`, or None if the
+        file does not exist or was written by another version of Clinica.
+    """
+    columns = {
+        "Subject_ID": str,
+        "Image_ID": str,
+        "Path": str,
+        "Is_Dicom": bool,
+        "Subject_Mtime": "int64",
+    }
+    if not Path(index_file).is_file():
+        return None
+    index = pd.read_csv(index_file, sep="\t", dtype=str)
+    if set(index.columns) != set(columns):
+        return None
+    index["Is_Dicom"] = index.Is_Dicom == "True"
+    return index.astype(columns)
+
+
+def _index_subject(
+    source_dir: Path, previous: dict[str, pd.DataFrame], subject: str
+) -> tuple[list[tuple], bool]:
+    """Return the rows of the index for the subject, and whether the previous ones were reused."""
+    mtime = _get_subject_mtime(source_dir / subject)
+    rows = previous.get(subject)
+    if rows is not None and (rows.Subject_Mtime == mtime).all():
+        return [
+            (subject, image_id, path, is_dicom, mtime)
+            for image_id, path, is_dicom in zip(rows.Image_ID, rows.Path, rows.Is_Dicom)
+        ], True
+    images = _find_images_of_subject(source_dir, subject)
+    return [
+        (subject, image_id) + _get_image_path(Path(path)) + (mtime,)
+        for image_id, path in sorted(images.items())
+    ], False
+
+
+def _get_subject_mtime(subject_dir: Path, depth: int = 3) -> int:
+    """Return the last modification time (ns) of the folders of the subject.
+
+    The folders are considered down to the series folders (subject/sequence/date/
+    series), whose modification time changes when an image file is added or removed.
+    The image files themselves are not listed.
+    """
+    import os
+
+    try:
+        mtime = os.stat(subject_dir).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+    folders = [subject_dir]
+    for _ in range(depth):
+        subfolders = []
+        for folder in folders:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        mtime = max(mtime, entry.stat().st_mtime_ns)
+                        subfolders.append(entry.path)
+        folders = subfolders
+    return mtime
+
+
+def _find_images_of_subject(source_dir: Path, subject: str) -> dict[str, str]:
+    """Return the first file, in alphabetical order, of each image ID of the subject."""
+    import os
+
+    images = {}
+    for folder, _, filenames in os.walk(source_dir / subject):
+        for filename in filenames:
+            path = os.path.join(folder, filename)
+            for image_id in _IMAGE_ID_PATTERN.findall(filename):
+                if image_id not in images or path < images[image_id]:
+                    images[image_id] = path
+    return images
+
+
+def _get_image_path(image_file: Path) -> tuple[str, bool]:
+    if "dcm" in image_file.suffix:
+        return str(image_file.parent), True
+    return str(image_file), False
 
 
 def find_image_path(
     images: pd.DataFrame,
     source_dir: Path,
     modality: str,
+    image_index: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """
     For each image, the path to an existing image file or folder is created from image metadata.
@@ -21,48 +175,31 @@ def find_image_path(
         images: List of images metadata
         source_dir: path to the ADNI directory
         modality: Imaging modality
+        image_index: Table of the images of the ADNI directory, as returned by
+            `build_image_index`. By default, it is built for the subjects of `images`.
 
     Returns: Dataframe containing metadata and existing paths
     """
-    is_dicom = []
-    image_folders = []
-    for _, image in images.iterrows():
-        image_path, dicom = _find_path_single_image(image, source_dir)
-        is_dicom.append(dicom)
-        image_folders.append(image_path)
-        if image_path == "":
-            cprint(
-                msg=(
-                    f"No {modality} image path found for subject {image.Subject_ID} in visit {image.VISCODE} "
-                    f"with image ID {image.Image_ID}"
-                ),
-                lvl="info",
-            )
-    images.loc[:, "Is_Dicom"] = pd.Series(is_dicom, index=images.index)
-    images.loc[:, "Path"] = pd.Series(image_folders, index=images.index)
+    if image_index is None:
+        image_index = build_image_index(source_dir, images.Subject_ID.unique())
+    keys = pd.MultiIndex.from_arrays(
+        [images.Subject_ID.astype(str), images.Image_ID.astype(str)]
+    )
+    found = image_index.set_index(["Subject_ID", "Image_ID"]).reindex(keys)
+    missing = found.Path.isna().to_numpy()
+    for _, image in images[missing].iterrows():
+        cprint(
+            msg=(
+                f"No {modality} image path found for subject {image.Subject_ID} in visit {image.VISCODE} "
+                f"with image ID {image.Image_ID}"
+            ),
+            lvl="info",
+        )
+    images.loc[:, "Is_Dicom"] = pd.Series(
+        found.Is_Dicom.fillna(True).astype(bool).to_numpy(), index=images.index
+    )
+    images.loc[:, "Path"] = pd.Series(
+        found.Path.fillna("").to_numpy(), index=images.index
+    )
 
     return images
-
-
-def _find_path_single_image(image: pd.Series, source_dir: Path) -> tuple[str, bool]:
-    path_to_sequence = source_dir / str(image["Subject_ID"])
-    image_folder_path = ""
-    is_dicom = True
-    if (
-        len(
-            (
-                found_images := [
-                    f
-                    for f in path_to_sequence.rglob(f"*_I{image['Image_ID']}.*")
-                    if f.is_file()
-                ]
-            )
-        )
-        > 0
-    ):
-        if "dcm" in found_images[0].suffix:
-            image_folder_path = str(found_images[0].parent)
-        else:
-            image_folder_path = str(found_images[0])
-            is_dicom = False
-    return image_folder_path, is_dicom
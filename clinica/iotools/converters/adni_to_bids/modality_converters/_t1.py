@@ -16,6 +16,7 @@ def convert_t1(
     subjects: Iterable[str],
     mod_to_update: bool = False,
     n_procs: int = 1,
+    image_index: Optional[pd.DataFrame] = None,
 ):
     """Convert T1 MR images of ADNI into BIDS format.
 
@@ -44,6 +45,11 @@ def convert_t1(
         The requested number of processes.
         If specified, it should be between 1 and the number of available CPUs.
         Default=1.
+
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
     """
     from clinica.iotools.converters.adni_to_bids.adni_utils import (
         ADNIModalityConverter,
@@ -59,7 +65,9 @@ def convert_t1(
         ),
         lvl="info",
     )
-    images = _compute_t1_paths(source_dir, csv_dir, subjects, conversion_dir)
+    images = _compute_t1_paths(
+        source_dir, csv_dir, subjects, conversion_dir, image_index=image_index
+    )
     cprint(
         f"Paths of {ADNIModalityConverter.T1.value} images found. Exporting images into BIDS ...",
         lvl="info",
@@ -79,6 +87,7 @@ def _compute_t1_paths(
     csv_dir: Path,
     subjects: Iterable[str],
     conversion_dir: Path,
+    image_index: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute the paths to T1 MR images and store them in a TSV file.
 
@@ -96,6 +105,11 @@ def _compute_t1_paths(
     conversion_dir : Path
         The path to the TSV files including the paths to original images.
 
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
+
     Returns
     -------
     images : pd.DataFrame
@@ -105,7 +119,7 @@ def _compute_t1_paths(
     from clinica.utils.stream import cprint
 
     from ._image_path_utils import find_image_path
-    from ._visits_utils import visits_to_timepoints
+    from ._visits_utils import visits_to_timepoints_by_subject
 
     t1_dfs_list = []
     t1_df = _initialize_t1_df()
@@ -117,27 +131,26 @@ def _compute_t1_paths(
     # Keep only T1 scans
     mayo_mri_qc = mayo_mri_qc[mayo_mri_qc.series_type == "T1"]
 
+    # Obtain corresponding timepoints for the visits of all the subjects
+    timepoints = visits_to_timepoints_by_subject(
+        mprage_meta,
+        adni_merge,
+        "T1",
+        subjects,
+        subject_field="SubjectID",
+        visit_field="Visit",
+        scandate_field="ScanDate",
+    )
     # We will convert the images for each subject in the subject list
     for subject in subjects:
-        # Filter ADNIMERGE, MPRAGE METADATA and QC for only one subject and sort the rows/visits by examination date
-        adnimerge_subj = adni_merge[adni_merge.PTID == subject]
-        adnimerge_subj = adnimerge_subj.sort_values("EXAMDATE")
-
+        # Filter MPRAGE METADATA and QC for only one subject and sort the rows/visits by examination date
         mprage_meta_subj = mprage_meta[mprage_meta.SubjectID == subject]
         mprage_meta_subj = mprage_meta_subj.sort_values("ScanDate")
 
         mri_quality_subj = mri_quality[mri_quality.RID == int(subject[-4:])]
         mayo_mri_qc_subj = mayo_mri_qc[mayo_mri_qc.RID == int(subject[-4:])]
 
-        # Obtain corresponding timepoints for the subject visits
-        visits = visits_to_timepoints(
-            subject=subject,
-            mri_list_subj=mprage_meta_subj,
-            adnimerge_subj=adnimerge_subj,
-            modality="T1",
-            visit_field="Visit",
-            scandate_field="ScanDate",
-        )
+        visits = timepoints.get(subject, {})
         for visit_info in visits.keys():
             cohort = visit_info[1]
             timepoint = visit_info[0]
@@ -182,7 +195,7 @@ def _compute_t1_paths(
         t1_df.drop(error_indices, inplace=True)
 
     # Checking for images paths in filesystem
-    images = find_image_path(t1_df, source_dir, modality="T1")
+    images = find_image_path(t1_df, source_dir, modality="T1", image_index=image_index)
     images.to_csv(conversion_dir / "t1_paths.tsv", sep="\t", index=False)
 
     return images
@@ -16,6 +16,7 @@ def convert_tau_pet(
     subjects: Iterable[str],
     mod_to_update: bool = False,
     n_procs: int = 1,
+    image_index: Optional[pd.DataFrame] = None,
 ):
     """Convert Tau PET images of ADNI into BIDS format.
 
@@ -44,6 +45,11 @@ def convert_tau_pet(
         The requested number of processes.
         If specified, it should be between 1 and the number of available CPUs.
         Default=1
+
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
     """
     from clinica.iotools.converters.adni_to_bids.adni_utils import (
         ADNIModalityConverter,
@@ -59,7 +65,9 @@ def convert_tau_pet(
         ),
         lvl="info",
     )
-    images = _compute_tau_pet_paths(source_dir, csv_dir, subjects, conversion_dir)
+    images = _compute_tau_pet_paths(
+        source_dir, csv_dir, subjects, conversion_dir, image_index=image_index
+    )
     cprint(
         f"Paths of {ADNIModalityConverter.PET_TAU.value} images found. Exporting images into BIDS ...",
         lvl="info",
@@ -79,6 +87,7 @@ def _compute_tau_pet_paths(
     csv_dir: Path,
     subjects: Iterable[str],
     conversion_dir: Path,
+    image_index: Optional[pd.DataFrame] = None,
 ) -> pd.DataFrame:
     """Compute the paths to Tau PET images.
 
@@ -96,6 +105,11 @@ def _compute_tau_pet_paths(
     conversion_dir : Path
         The path to the TSV files including the paths to original images.
 
+    image_index : pd.DataFrame, optional
+        The table of the images of the ADNI directory, as returned by
+        `build_image_index`. By default, it is built from the folders
+        of the subjects.
+
     Returns
     -------
     pd.DataFrame :
@@ -153,7 +167,7 @@ def _compute_tau_pet_paths(
         pet_tau_df.drop(error_ind, inplace=True)
 
     # Checking for images paths in filesystem
-    images = find_image_path(pet_tau_df, source_dir, "TAU")
+    images = find_image_path(pet_tau_df, source_dir, "TAU", image_index=image_index)
     images.to_csv(
         conversion_dir / f"{Tracer.AV1451.value}_pet_paths.tsv",
         sep="\t",
@@ -1,11 +1,11 @@
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 import pandas as pd
 
 from clinica.iotools.converters.adni_to_bids.adni_utils import ADNIStudy
 from clinica.utils.stream import cprint
 
-__all__ = ["visits_to_timepoints"]
+__all__ = ["visits_to_timepoints", "visits_to_timepoints_by_subject"]
 
 
 def visits_to_timepoints(
@@ -28,64 +28,222 @@ def visits_to_timepoints(
         scandate_field: field name corresponding to the scan date
 
     Returns:
-        [Returns]
+        Dictionary mapping the ADNIMERGE timepoints (VISCODE, COLPROT, ORIGPROT)
+        of the subject to the corresponding visits of the MRI list.
     """
+    return _match_visits_to_timepoints(
+        mri_list_subj.assign(**{_SUBJECT_FIELD: subject}),
+        adnimerge_subj.assign(PTID=subject),
+        modality,
+        _SUBJECT_FIELD,
+        visit_field,
+        scandate_field,
+    ).get(subject, {})
+
+
+def visits_to_timepoints_by_subject(
+    mri_list: pd.DataFrame,
+    adnimerge: pd.DataFrame,
+    modality: str,
+    subjects: Optional[Iterable[str]] = None,
+    subject_field: str = "SUBJECT",
+    visit_field: str = "VISIT",
+    scandate_field: str = "SCANDATE",
+) -> Dict[str, dict]:
+    """Establish the correspondence between ADNIMERGE and MRILIST visits for all subjects at once.
+
+    This is equivalent to calling `visits_to_timepoints` for each subject, with
+    its visits sorted by EXAMDATE in ADNIMERGE and its scans sorted by scan date
+    in the MRI list, but the dates are parsed once and the matching is done with
+    operations on the whole cohort.
+
+    Args:
+        mri_list: Dataframe containing the list of MRI scans
+        adnimerge: Dataframe containing the visits data (ADNIMERGE)
+        modality: Imaging modality
+        subjects: Subjects for which visits are matched. By default, all the
+            subjects of the MRI list are considered.
+        subject_field: field name of the MRI list corresponding to the subject
+        visit_field: field name corresponding to the visit
+        scandate_field: field name corresponding to the scan date
+
+    Returns:
+        Dictionary mapping each subject with at least one matched visit to the
+        dictionary returned by `visits_to_timepoints` for this subject.
+    """
+    if subjects is not None:
+        subjects = set(subjects)
+        mri_list = mri_list[mri_list[subject_field].isin(subjects)]
+        adnimerge = adnimerge[adnimerge.PTID.isin(subjects)]
+    return _match_visits_to_timepoints(
+        mri_list.sort_values(scandate_field, kind="stable"),
+        adnimerge.sort_values("EXAMDATE", kind="stable"),
+        modality,
+        subject_field,
+        visit_field,
+        scandate_field,
+    )
+
+
+_SUBJECT_FIELD = "_subject"
+_TIMEPOINT_KEY = ["VISCODE", "COLPROT", "ORIGPROT"]
+
+
+def _match_visits_to_timepoints(
+    mri_list: pd.DataFrame,
+    adnimerge: pd.DataFrame,
+    modality: str,
+    subject_field: str,
+    visit_field: str,
+    scandate_field: str,
+) -> Dict[str, dict]:
+    """Match the visits of the MRI list to ADNIMERGE timepoints, keeping the order of the rows.
+
+    For each subject, the visits whose name is the preferred visit name of an
+    ADNIMERGE timepoint are matched first. Each remaining visit is then matched,
+    using the date of its first scan, to the closest timepoint among the
+    timepoints which were not matched by name.
+    """
+    import numpy as np
+
     if modality == "T1":
-        mri_list_subj = mri_list_subj[mri_list_subj[visit_field] != "ADNI Baseline"]
-
-    visits = dict()
-    unique_visits = list(mri_list_subj[visit_field].unique())
-    pending_timepoints = []
-
-    # We try to obtain the corresponding image Visit for a given VISCODE
-    for adni_row in adnimerge_subj.iterrows():
-        visit = adni_row[1]
-        study = ADNIStudy(visit.ORIGPROT)
-        preferred_visit_name = _get_preferred_visit_name(study, visit.VISCODE)
-
-        if preferred_visit_name in unique_visits:
-            key_preferred_visit = (visit.VISCODE, visit.COLPROT, visit.ORIGPROT)
-            if key_preferred_visit not in visits:
-                visits[key_preferred_visit] = preferred_visit_name
-            elif visits[key_preferred_visit] != preferred_visit_name:
-                cprint(
-                    f"[{modality}] Subject {subject} has multiple visits for one timepoint.",
-                    lvl="info",
-                )
-
-            unique_visits.remove(preferred_visit_name)
-            continue
-
-        pending_timepoints.append(visit)
-
-    # Then for images.Visit non matching the expected labels we find the closest date in visits list
-    for visit in unique_visits:
-        image = (mri_list_subj[mri_list_subj[visit_field] == visit]).iloc[0]
-
-        closest_visit = _get_closest_visit(
-            image[scandate_field],
-            image[visit_field],
-            pending_timepoints,
-            subject,
+        mri_list = mri_list[mri_list[visit_field] != "ADNI Baseline"]
+    images = (
+        mri_list.drop_duplicates([subject_field, visit_field])
+        .rename(
+            columns={
+                subject_field: "PTID",
+                visit_field: "visit",
+                scandate_field: "SCANDATE",
+            }
+        )[["PTID", "visit", "SCANDATE"]]
+        .reset_index(drop=True)
+    )
+    timepoints = adnimerge[["PTID"] + _TIMEPOINT_KEY + ["EXAMDATE"]].reset_index(
+        drop=True
+    )
+    timepoints["visit"] = _get_preferred_visit_names(timepoints)
+
+    # A visit matches the first timepoint having its name as preferred visit name
+    named_visits = pd.MultiIndex.from_frame(images[["PTID", "visit"]])
+    is_matched = pd.MultiIndex.from_frame(timepoints[["PTID", "visit"]]).isin(
+        named_visits
+    ) & ~timepoints.duplicated(["PTID", "visit"])
+    matched = timepoints[is_matched]
+    pending = timepoints[~is_matched].drop(columns="visit")
+    images = images[
+        ~named_visits.isin(pd.MultiIndex.from_frame(matched[["PTID", "visit"]]))
+    ]
+
+    # The other visits are matched to the closest pending timepoint
+    candidates = images.reset_index(names="image").merge(
+        pending.reset_index(names="timepoint"), on="PTID", how="left"
+    )
+    candidates["days"] = (
+        (
+            pd.to_datetime(candidates.SCANDATE, format="%Y-%m-%d")
+            - pd.to_datetime(candidates.EXAMDATE, format="%Y-%m-%d")
+        )
+        .abs()
+        .dt.days
+    )
+    candidates = candidates.sort_values(["image", "days", "timepoint"], kind="stable")
+    rank = candidates.groupby("image").cumcount().to_numpy()
+    closest = candidates[rank == 0].set_index("image")
+    second = candidates[rank == 1].set_index("image").reindex(closest.index)
+    _log_visits_without_timepoint(closest[closest.timepoint.isna()], modality)
+    closest = closest[closest.timepoint.notna()]
+    second = second.loc[closest.index]
+    too_far = (closest.days > 90) & second.timepoint.notna()
+    _log_timepoints_too_far(closest[too_far], second[too_far])
+    # If the image is between the two closest timepoints, close to the middle,
+    # the earlier timepoint is preferred
+    use_second = (
+        too_far
+        & (closest.EXAMDATE > closest.SCANDATE)
+        & (closest.SCANDATE > second.EXAMDATE)
+        & (
+            np.abs(
+                (
+                    pd.to_datetime(closest.EXAMDATE, format="%Y-%m-%d")
+                    - pd.to_datetime(second.EXAMDATE, format="%Y-%m-%d")
+                ).dt.days
+                / 2.0
+                - closest.days
+            )
+            < 30
         )
-        if closest_visit is None:
-            cprint(f"No closest visit found for image {image}", lvl="debug")
-            continue
-        key_min_visit = (
-            closest_visit.VISCODE,
-            closest_visit.COLPROT,
-            closest_visit.ORIGPROT,
+    )
+    closest.loc[use_second] = second.loc[use_second]
+
+    visits = pd.concat([matched, closest], ignore_index=True)
+    duplicated = visits.duplicated(["PTID"] + _TIMEPOINT_KEY)
+    # As in the per-subject matching, a timepoint matched by name more than once
+    # is reported at the info level, and by date at the debug level
+    matched_by_name = visits.index < len(matched)
+    for row, by_name in zip(
+        visits[duplicated].itertuples(), matched_by_name[duplicated]
+    ):
+        cprint(
+            f"[{modality}] Subject {row.PTID} has multiple visits for one timepoint.",
+            lvl="info" if by_name else "debug",
         )
+    timepoints_by_subject = {}
+    for row in visits[~duplicated].itertuples(index=False):
+        timepoints_by_subject.setdefault(row.PTID, {})[
+            (row.VISCODE, row.COLPROT, row.ORIGPROT)
+        ] = row.visit
+    return timepoints_by_subject
+
+
+def _get_preferred_visit_names(timepoints: pd.DataFrame) -> pd.Series:
+    """Return the preferred visit name of each timepoint (with ORIGPROT and VISCODE)."""
+    pairs = timepoints[["ORIGPROT", "VISCODE"]].drop_duplicates()
+    names = {
+        (study, visit_code): _get_preferred_visit_name(ADNIStudy(study), visit_code)
+        for study, visit_code in pairs.itertuples(index=False)
+    }
+    return pd.Series(
+        [names[pair] for pair in zip(timepoints.ORIGPROT, timepoints.VISCODE)],
+        index=timepoints.index,
+        dtype=object,
+    )
 
-        if key_min_visit not in visits.keys():
-            visits[key_min_visit] = image[visit_field]
-        elif visits[key_min_visit] != image[visit_field]:
-            cprint(
-                f"[{modality}] Subject {subject} has multiple visits for one timepoint.",
-                lvl="debug",
-            )
 
-    return visits
+def _log_visits_without_timepoint(images: pd.DataFrame, modality: str) -> None:
+    for image in images.itertuples():
+        cprint(
+            "No corresponding timepoint in ADNIMERGE for "
+            f"subject {image.PTID} in visit {image.visit}",
+            lvl="info",
+        )
+        cprint(
+            f"[{modality}] No closest visit found for image of subject {image.PTID} "
+            f"in visit {image.visit} on {image.SCANDATE}",
+            lvl="debug",
+        )
+
+
+def _log_timepoints_too_far(closest: pd.DataFrame, second: pd.DataFrame) -> None:
+    import logging
+
+    if not logging.getLogger("clinica").isEnabledFor(logging.DEBUG):
+        return
+    for (_, closest_visit), (_, second_visit) in zip(
+        closest.iterrows(), second.iterrows()
+    ):
+        cprint(
+            _get_smallest_time_difference_too_large_message(
+                closest_visit.PTID,
+                closest_visit.visit,
+                closest_visit.SCANDATE,
+                closest_visit,
+                second_visit,
+                closest_visit.days,
+                second_visit.days,
+            ),
+            lvl="debug",
+        )
 
 
 def _get_preferred_visit_name(study: ADNIStudy, visit_code: str) -> str:
@@ -165,182 +323,6 @@ def _get_preferred_visit_name_adnigo(visit_code: str) -> str:
     return _get_preferred_visit_name_adni1(visit_code)
 
 
-def _get_closest_visit(
-    image_acquisition_date: str,
-    image_visit: str,
-    visits: list[pd.Series],
-    subject: str,
-) -> Optional[pd.Series]:
-    """Choose the visit with the closest date to a given image acquisition date.
-
-    Parameters
-    ----------
-    image_acquisition_date : str
-        The date in string format when the image was acquired.
-
-    image_visit : str
-        The string identifier of the visit.
-
-    visits : list of pd.Series
-        List of visit entries among which we have to find the closest one.
-
-    subject : str
-        Subject identifier.
-
-    Returns
-    -------
-    None or pd.Series
-        If the list of visits provided is empty, this function returns None.
-        Otherwise, it returns a pd.Series corresponding to the closest visit found.
-    """
-    if len(visits) == 0:
-        cprint(
-            "No corresponding timepoint in ADNIMERGE for "
-            f"subject {subject} in visit {image_visit}",
-            lvl="info",
-        )
-        return None
-
-    if len(visits) == 1:
-        return visits[0]
-
-    (
-        closest_visit,
-        second_closest_visit,
-        smallest_time_difference,
-        second_smallest_time_difference,
-    ) = _get_closest_and_second_closest_visits(visits, image_acquisition_date)
-
-    return (
-        _get_closest_visit_for_large_time_difference(
-            subject,
-            image_visit,
-            image_acquisition_date,
-            closest_visit,
-            second_closest_visit,
-            smallest_time_difference,
-            second_smallest_time_difference,
-        )
-        if smallest_time_difference > 90
-        else closest_visit
-    )
-
-
-def _get_closest_visit_for_large_time_difference(
-    subject: str,
-    image_visit: str,
-    image_acquisition_date: str,
-    closest_visit: pd.Series,
-    second_closest_visit: pd.Series,
-    smallest_time_difference: int,
-    second_smallest_time_difference: int,
-) -> pd.Series:
-    """Special case when the closest visit found is more than 90 days
-    apart from the image acquisition date.
-
-    In this situation, if the image acquisition date is in between the
-    closest visit and the second-closest visit, and the second-closest
-    visit is close enough from the image acquisition date, then select
-    the second-closest visit instead of the closest one.
-    """
-    cprint(
-        _get_smallest_time_difference_too_large_message(
-            subject,
-            image_visit,
-            image_acquisition_date,
-            closest_visit,
-            second_closest_visit,
-            smallest_time_difference,
-            second_smallest_time_difference,
-        ),
-        lvl="debug",
-    )
-    if _second_closest_visit_is_better(
-        closest_visit.EXAMDATE,
-        image_acquisition_date,
-        second_closest_visit.EXAMDATE,
-    ):
-        closest_visit = second_closest_visit
-    cprint(msg=f"We prefer {closest_visit.VISCODE}", lvl="debug")
-
-    return closest_visit
-
-
-def _second_closest_visit_is_better(
-    closest_visit_date: str,
-    image_acquisition_date: str,
-    second_closest_visit_date: str,
-) -> bool:
-    """If image is too close to the date between two visits we prefer the earlier visit."""
-    from datetime import datetime
-
-    date_format = "%Y-%m-%d"
-    if (
-        datetime.strptime(closest_visit_date, date_format)
-        > datetime.strptime(image_acquisition_date, date_format)
-        > datetime.strptime(second_closest_visit_date, date_format)
-    ):
-        diff = _compute_number_of_days_between(
-            closest_visit_date, second_closest_visit_date
-        )
-        smallest_time_difference = _compute_number_of_days_between(
-            image_acquisition_date, closest_visit_date
-        )
-        if abs((diff / 2.0) - smallest_time_difference) < 30:
-            return True
-    return False
-
-
-def _get_closest_and_second_closest_visits(
-    visits: list[pd.Series],
-    reference_date: str,
-) -> tuple[pd.Series, pd.Series, int, int]:
-    """Return the closest and second-closest visit from the reference date.
-
-    Parameters
-    ----------
-    visits : list of pd.Series
-        The list of visits to analyze. Should have a length greater than two.
-
-    reference_date : str
-        The reference date used to compute the time differences.
-
-    Returns
-    -------
-    closest_visit : pd.Series
-        The visit whose EXAMDATE is the closest to the reference date.
-
-    second_closest_visit : pd.Series
-        The second closest visit to the reference date.
-
-    min_time_difference : int
-        The number of days between the reference date and the closest visit.
-
-    second_min_time_difference : int
-        The number of days between the reference date and the second closest visit.
-    """
-    import numpy as np
-
-    if len(visits) < 2:
-        raise ValueError(f"Expected at least two visits, received {len(visits)}.")
-    time_differences_between_reference_and_visits_in_days = [
-        _compute_number_of_days_between(reference_date, visit_date)
-        for visit_date in [visit.EXAMDATE for visit in visits]
-    ]
-    idx = np.argsort(time_differences_between_reference_and_visits_in_days)
-    min_time_difference = time_differences_between_reference_and_visits_in_days[idx[0]]
-    second_min_time_difference = time_differences_between_reference_and_visits_in_days[
-        idx[1]
-    ]
-
-    return (
-        visits[idx[0]],
-        visits[idx[1]],
-        min_time_difference,
-        second_min_time_difference,
-    )
-
-
 def _get_smallest_time_difference_too_large_message(
     subject: str,
     image_visit: str,
@@ -366,12 +348,3 @@ def _get_smallest_time_difference_too_large_message(
         )
         idx += 1
     return msg
-
-
-def _compute_number_of_days_between(date_1: str, date_2: str) -> int:
-    """Calculate the days between two dates."""
-    from datetime import datetime
-
-    date_1 = datetime.strptime(date_1, "%Y-%m-%d")
-    date_2 = datetime.strptime(date_2, "%Y-%m-%d")
-    return abs((date_2 - date_1).days)
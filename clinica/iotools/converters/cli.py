@@ -1,31 +1,26 @@
 import click
 
-from .adni_to_bids import adni_to_bids_cli
-from .aibl_to_bids import aibl_to_bids_cli
-from .genfi_to_bids import genfi_to_bids_cli
-from .habs_to_bids import habs_to_bids_cli
-from .ixi_to_bids import ixi_to_bids_cli
-from .nifd_to_bids import nifd_to_bids_cli
-from .oasis3_to_bids import oasis3_to_bids_cli
-from .oasis_to_bids import oasis_to_bids_cli
-from .ukb_to_bids import ukb_to_bids_cli
+from clinica.utils.cli import LazyGroup
 
+# The module of a converter is imported only when its command is invoked.
+CONVERTER_COMMANDS = {
+    "adni-to-bids": "clinica.iotools.converters.adni_to_bids.adni_to_bids_cli:cli",
+    "aibl-to-bids": "clinica.iotools.converters.aibl_to_bids.aibl_to_bids_cli:cli",
+    "genfi-to-bids": "clinica.iotools.converters.genfi_to_bids.genfi_to_bids_cli:cli",
+    "habs-to-bids": "clinica.iotools.converters.habs_to_bids.habs_to_bids_cli:cli",
+    "ixi-to-bids": "clinica.iotools.converters.ixi_to_bids.ixi_to_bids_cli:cli",
+    "nifd-to-bids": "clinica.iotools.converters.nifd_to_bids.nifd_to_bids_cli:cli",
+    "oasis-to-bids": "clinica.iotools.converters.oasis_to_bids.oasis_to_bids_cli:cli",
+    "oasis3-to-bids": "clinica.iotools.converters.oasis3_to_bids.oasis3_to_bids_cli:cli",
+    "ukb-to-bids": "clinica.iotools.converters.ukb_to_bids.ukb_to_bids_cli:cli",
+}
 
-@click.group("convert")
+
+@click.group("convert", cls=LazyGroup, lazy_commands=CONVERTER_COMMANDS)
 def cli() -> None:
     """Convert popular neuroimaging datasets to the BIDS format."""
     pass
 
 
-cli.add_command(adni_to_bids_cli.cli)
-cli.add_command(aibl_to_bids_cli.cli)
-cli.add_command(habs_to_bids_cli.cli)
-cli.add_command(nifd_to_bids_cli.cli)
-cli.add_command(oasis_to_bids_cli.cli)
-cli.add_command(oasis3_to_bids_cli.cli)
-cli.add_command(ukb_to_bids_cli.cli)
-cli.add_command(genfi_to_bids_cli.cli)
-cli.add_command(ixi_to_bids_cli.cli)
-
 if __name__ == "__main__":
     cli()
@@ -10,6 +10,8 @@ def center_nifti(
     modalities: Optional[Iterable[str]] = None,
     center_all_files: bool = False,
     overwrite_existing_files: bool = False,
+    link_files: bool = False,
+    n_procs: int = 1,
 ):
     """Center NIfTI files in a BIDS dataset.
 
@@ -33,6 +35,14 @@ def center_nifti(
         they might be overwritten. If False, the output BIDS has to be empty
         or non-existing otherwise a ClinicaExistingDatasetError will be raised.
 
+    link_files : bool, optional
+        If True, the files which are not centered are reflinked or hardlinked
+        into the output BIDS directory instead of being copied, when the file
+        system supports it. Default=False.
+
+    n_procs : int, optional
+        Number of processes used to center the images. Default=1.
+
     Notes
     -----
     This tool is mainly useful as a preprocessing step of SPM. In some cases, SPM is not able to segment T1 volumes
@@ -67,6 +77,8 @@ def center_nifti(
         output_bids_directory,
         modalities,
         center_all_files,
+        link_files=link_files,
+        n_procs=n_procs,
     )
     # Write list of created files
     timestamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(time.time()))
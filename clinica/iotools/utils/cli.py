@@ -3,6 +3,8 @@ from typing import List, Optional, Union
 
 import click
 
+from clinica import option
+
 bids_directory = click.argument(
     "bids_directory", type=click.Path(exists=True, resolve_path=True)
 )
@@ -39,11 +41,23 @@ def describe(dataset: Union[str, Path]):
     help="Process selected modalities.",
 )
 @click.option("--center-all-files", is_flag=True, help="Force processing of all files.")
+@click.option(
+    "--link-files",
+    is_flag=True,
+    help=(
+        "Reflink or hardlink the files which are not centered instead of copying them. "
+        "Hardlinked files share their content with the input BIDS directory."
+    ),
+)
+@option.global_option_group
+@option.n_procs
 def center_nifti(
     bids_directory: str,
     output_bids_directory: str,
     modalities: Optional[List[str]] = None,
     center_all_files: bool = False,
+    link_files: bool = False,
+    n_procs: Optional[int] = None,
 ) -> None:
     """Center NIfTI files in a BIDS dataset."""
     import sys
@@ -59,6 +73,8 @@ def center_nifti(
             modalities=modalities,
             center_all_files=center_all_files,
             overwrite_existing_files=False,
+            link_files=link_files,
+            n_procs=n_procs or 1,
         )
     except ClinicaExistingDatasetError:
         click.echo(
@@ -71,6 +87,8 @@ def center_nifti(
                 modalities=modalities,
                 center_all_files=center_all_files,
                 overwrite_existing_files=True,
+                link_files=link_files,
+                n_procs=n_procs or 1,
             )
         else:
             click.echo("Clinica will now exit...")
@@ -87,17 +105,22 @@ def center_nifti(
     show_default=True,
     help="Prefix for the name of the output files.",
 )
+@option.global_option_group
+@option.n_procs
 def check_missing_modalities(
     bids_directory: str,
     output_directory: str,
     output_prefix: str = "missing_mods",
+    n_procs: Optional[int] = None,
 ) -> None:
     """Check missing modalities in a BIDS dataset."""
     from clinica.iotools.utils.data_handling import compute_missing_mods
     from clinica.utils.inputs import check_bids_folder
 
     check_bids_folder(bids_directory)
-    compute_missing_mods(bids_directory, output_directory, output_prefix)
+    compute_missing_mods(
+        bids_directory, output_directory, output_prefix, n_procs=n_procs or 1
+    )
 
 
 @cli.command()
@@ -212,6 +235,19 @@ def create_subjects_visits(current_directory: str, output_tsv: str) -> None:
     is_flag=True,
     help="Ignore session files. This may accelerate the procedure.",
 )
+@click.option(
+    "-of",
+    "--output_format",
+    "output_formats",
+    multiple=True,
+    type=click.Choice(["parquet", "feather"]),
+    help=(
+        "Columnar format in which the merged data is also written, next to the "
+        "output TSV file. This requires the 'pyarrow' package."
+    ),
+)
+@option.global_option_group
+@option.n_procs
 def merge_tsv(
     bids_directory: str,
     output_tsv: str,
@@ -225,6 +261,8 @@ def merge_tsv(
     subjects_sessions_tsv: Optional[str] = None,
     ignore_scan_files: bool = False,
     ignore_session_scan_files: bool = False,
+    output_formats: Optional[List[str]] = None,
+    n_procs: Optional[int] = None,
 ) -> None:
     """Merge clinical data into a single TSV file."""
     from .merge_tsv import merge_tsv as merge_tsv_
@@ -242,4 +280,6 @@ def merge_tsv(
         subjects_sessions_tsv=subjects_sessions_tsv,
         ignore_scan_files=ignore_scan_files,
         ignore_session_scan_files=ignore_session_scan_files,
+        output_formats=output_formats,
+        n_procs=n_procs or 1,
     )
@@ -17,6 +17,10 @@ __all__ = [
 def center_nifti_origin(input_image: PathLike, output_image: PathLike) -> PathLike:
     """Put the origin of the coordinate system at the center of the image.
 
+    If the image is a NIfTI-1 file which is already in closest canonical orientation,
+    only its header is rewritten, and the voxel data is copied without being decoded.
+    Otherwise, the image is reoriented and its data is written again.
+
     Parameters
     ----------
     input_image : PathLike
@@ -24,25 +28,32 @@ def center_nifti_origin(input_image: PathLike, output_image: PathLike) -> PathLi
 
     output_image : PathLike
         Path to the output image (where the result will be stored).
+        It can be the same as the input image.
 
     Returns
     -------
     PathLike :
         The path of the output image created.
     """
-    input_image = nib.load(Path(input_image))
+    input_path = Path(input_image)
+    input_image = nib.load(input_path)
     output_image = Path(output_image)
     canonical_image = nib.as_closest_canonical(input_image)
-    header = canonical_image.header
-    new_image = nib.Nifti1Image(
-        canonical_image.get_fdata(caching="unchanged"),
-        affine=_compute_qform(header),
-        header=header,
-    )
-    # Without deleting already-existing file, nib.save causes a severe bug on Linux system
-    if output_image.is_file():
-        output_image.unlink()
-    nib.save(new_image, output_image)
+    if not (
+        canonical_image is input_image
+        and type(input_image) is nib.Nifti1Image
+        and _copy_with_centered_header(input_image, input_path, output_image)
+    ):
+        header = canonical_image.header
+        new_image = nib.Nifti1Image(
+            canonical_image.get_fdata(caching="unchanged"),
+            affine=_compute_qform(header),
+            header=header,
+        )
+        # Without deleting already-existing file, nib.save causes a severe bug on Linux system
+        if output_image.is_file():
+            output_image.unlink()
+        nib.save(new_image, output_image)
     if not output_image.is_file():
         raise RuntimeError(
             f"NIfTI file created but Clinica could not save it to {output_image}. "
@@ -52,6 +63,57 @@ def center_nifti_origin(input_image: PathLike, output_image: PathLike) -> PathLi
     return output_image
 
 
+def _copy_with_centered_header(
+    image: nib.Nifti1Image, input_path: Path, output_path: Path
+) -> bool:
+    """Write the image with a centered header, copying the raw voxel data.
+
+    The header is the one `center_nifti_origin` would write, except that the
+    scaling of the data is kept since the raw data is unchanged.
+
+    Returns
+    -------
+    bool :
+        False if the header does not fit before the data of the input file,
+        in which case nothing is written.
+    """
+    import io
+    import os
+    import shutil
+
+    from nibabel.openers import ImageOpener
+
+    # The header of a loaded image keeps neither the offset nor the scaling of the data
+    offset = int(image.dataobj.offset)
+    slope, inter = float(image.dataobj.slope), float(image.dataobj.inter)
+    new_image = nib.Nifti1Image(
+        image.dataobj, affine=_compute_qform(image.header), header=image.header
+    )
+    new_image.update_header()
+    header = new_image.header
+    if (slope, inter) != (1.0, 0.0):
+        header.set_slope_inter(slope, inter)
+    header.set_data_offset(offset)
+    buffer = io.BytesIO()
+    header.write_to(buffer)
+    if len(buffer.getvalue()) > offset:
+        return False
+
+    # Written next to the output, such that the input can be the output
+    tmp_path = output_path.with_name(f".{os.getpid()}-{output_path.name}")
+    try:
+        with ImageOpener(input_path, "rb") as source, ImageOpener(
+            tmp_path, "wb"
+        ) as target:
+            target.write(buffer.getvalue().ljust(offset, b"\x00"))
+            source.seek(offset)
+            shutil.copyfileobj(source, target, 1 << 20)
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return True
+
+
 def _compute_qform(header: nib.Nifti1Header) -> np.ndarray:
     qform = np.zeros((4, 4))
     for i in range(1, 4):
@@ -276,11 +338,13 @@ def center_all_nifti(
     output_dir: PathLike,
     modalities: Optional[Iterable[str]] = None,
     center_all_files: bool = False,
+    link_files: bool = False,
+    n_procs: int = 1,
 ) -> List[Path]:
     """Center all the NIfTI images of the input BIDS folder into the empty output_dir specified in argument.
 
-    All the files from bids_dir are copied into output_dir, then all the NIfTI images found are replaced by their
-    centered version if their center is off the origin by more than 50 mm.
+    All the files from bids_dir are copied into output_dir, except the NIfTI images whose center is off the origin
+    by more than 50 mm, which are directly written centered into output_dir.
 
     Parameters
     ----------
@@ -296,44 +360,121 @@ def center_all_nifti(
     center_all_files:  bool, default=False
         Center files that may cause problem for SPM if set to False, all files otherwise.
 
+    link_files : bool, default=False
+        If True, the files which are not centered are reflinked (copy-on-write clones) or hardlinked
+        into output_dir when the file system supports it, instead of being copied. Beware that a
+        hardlinked file shares its content with the input file.
+
+    n_procs : int, default=1
+        Number of processes used to center the images.
+
     Returns
     -------
     list of Path
         Centered NIfTI files.
     """
-    from shutil import copy, copytree
+    from functools import partial
 
+    from clinica.utils.parallel import ParallelBackend, map_in_chunks
     from clinica.utils.stream import cprint
 
     bids_dir, output_dir = _validate_bids_and_output_dir(bids_dir, output_dir)
+    is_selected = partial(
+        _is_selected_nifti, modalities=modalities, center_all_files=center_all_files
+    )
+    # NIfTI images already in the output folder are centered in place
+    to_center: List[Tuple[Path, Path]] = [
+        (file, file)
+        for file in sorted(output_dir.glob("**/*.nii*"))
+        if is_selected(file)
+    ]
     for f in bids_dir.iterdir():
-        if f.is_dir() and not (output_dir / f.name).is_dir():
-            copytree(f, output_dir / f.name, copy_function=copy)
-        elif f.is_file() and not (output_dir / f.name).is_file():
-            copy(f, output_dir / f.name)
-    nifti_files_filtered: List[Path] = []
-    for f in output_dir.glob("**/*.nii*"):
-        if modalities is None or any(
-            elem.lower() in f.name.lower() for elem in modalities
-        ):
-            nifti_files_filtered.append(f)
-    if not center_all_files:
-        nifti_files_filtered = [
-            file for file in nifti_files_filtered if not _is_centered(file)
-        ]
-    errors: List[str] = []
-    for f in nifti_files_filtered:
-        cprint(msg=f"Handling file {f}", lvl="debug")
-        try:
-            center_nifti_origin(f, f)
-        except Exception as e:
-            errors.append(str(e))
+        if (output_dir / f.name).exists():
+            continue
+        for file in sorted(f.glob("**/*")) if f.is_dir() else [f]:
+            output_file = output_dir / file.relative_to(bids_dir)
+            if file.is_dir():
+                output_file.mkdir(parents=True, exist_ok=True)
+                continue
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            if is_selected(file):
+                to_center.append((file, output_file))
+            else:
+                _copy_file(file, output_file, link_files)
+
+    for input_file, _ in to_center:
+        cprint(msg=f"Handling file {input_file}", lvl="debug")
+    errors = [
+        error
+        for error in map_in_chunks(
+            _center_nifti_origin_with_error,
+            to_center,
+            n_procs=n_procs,
+            backend=ParallelBackend.PROCESSES,
+        )
+        if error is not None
+    ]
     if errors:
         raise RuntimeError(
             f"Clinica encountered {len(errors)} error(s) while trying to center all NIfTI images.\n"
             + "\n".join(errors)
         )
-    return nifti_files_filtered
+    return [output_file for _, output_file in to_center]
+
+
+def _is_selected_nifti(
+    file: Path, modalities: Optional[Iterable[str]], center_all_files: bool
+) -> bool:
+    from fnmatch import fnmatch
+
+    if not fnmatch(file.name, "*.nii*") or not file.is_file():
+        return False
+    if modalities is not None and not any(
+        elem.lower() in file.name.lower() for elem in modalities
+    ):
+        return False
+    return center_all_files or not _is_centered(file)
+
+
+def _center_nifti_origin_with_error(files: Tuple[Path, Path]) -> Optional[str]:
+    try:
+        center_nifti_origin(*files)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _copy_file(source: Path, target: Path, link_files: bool = False) -> None:
+    """Copy the file, or reflink / hardlink it if `link_files` is True and the file system supports it."""
+    import os
+    from shutil import copy
+
+    if link_files:
+        if _reflink(source, target):
+            return
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass
+    copy(source, target)
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone the file with the FICLONE ioctl (Btrfs, XFS...), and return whether it succeeded."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    ficlone = 0x40049409
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), ficlone, src.fileno())
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+    return True
 
 
 def _validate_bids_and_output_dir(
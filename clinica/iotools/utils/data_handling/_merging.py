@@ -22,6 +22,8 @@ def create_merge_file(
     pipelines: Optional[List[str]] = None,
     ignore_scan_files: bool = False,
     ignore_sessions_files: bool = False,
+    n_procs: int = 1,
+    output_formats: Optional[Iterable[str]] = None,
     **kwargs,
 ):
     """Merge all the TSV files containing clinical data of a BIDS compliant
@@ -49,12 +51,21 @@ def create_merge_file(
 
     ignore_sessions_files : bool, optional
         If True the information related to sessions and scans is not read.
+
+    n_procs : int, optional
+        Number of processes used to read the files of the BIDS and CAPS folders.
+        Default=1.
+
+    output_formats : Iterable of str, optional
+        Columnar formats ('parquet' or 'feather') in which the merged data is
+        also written, next to the TSV file. They require the 'pyarrow' package.
     """
     from os import path
 
     bids_dir = Path(bids_dir)
     caps_dir = _validate_caps_dir(caps_dir)
     out_path = _validate_output_tsv_path(out_tsv)
+    output_formats = _validate_output_formats(output_formats)
     if pipelines:
         pipelines = [
             PipelineNameForMetricExtraction(pipeline) for pipeline in pipelines
@@ -63,19 +74,25 @@ def create_merge_file(
         bids_dir, tsv_file, ignore_sessions_files
     )
     merged_df = _create_merge_file_from_bids(
-        bids_dir, sub_ses_df, participants_df, ignore_scan_files, ignore_sessions_files
+        bids_dir,
+        sub_ses_df,
+        participants_df,
+        ignore_scan_files,
+        ignore_sessions_files,
+        n_procs=n_procs,
     )
     merged_df.to_csv(out_path, sep="\t", index=False)
     cprint("End of BIDS information merge.", lvl="debug")
     merged_df.reset_index(drop=True, inplace=True)
     if caps_dir is not None:
         merged_df, merged_summary_df = _add_data_to_merge_file_from_caps(
-            caps_dir, merged_df, pipelines, **kwargs
+            caps_dir, merged_df, pipelines, n_procs=n_procs, **kwargs
         )
         summary_path = path.splitext(str(out_path))[0] + "_summary.tsv"
         merged_summary_df.to_csv(summary_path, sep="\t", index=False)
         merged_df.to_csv(out_path, sep="\t", index=False)
         cprint("End of CAPS information merge.", lvl="debug")
+    _write_columnar_files(merged_df, out_path, output_formats)
 
 
 def _validate_caps_dir(caps_dir: Optional[PathLike] = None) -> Optional[Path]:
@@ -116,6 +133,56 @@ def _validate_output_tsv_path(out_path: PathLike) -> Path:
     return out_path
 
 
+def _validate_output_formats(
+    output_formats: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """Check the requested columnar output formats and the availability of pyarrow."""
+    from clinica.utils.exceptions import ClinicaMissingDependencyError
+
+    output_formats = sorted(set(output_formats or []))
+    if unknown := [f for f in output_formats if f not in ("parquet", "feather")]:
+        log_and_raise(
+            f"Output formats {unknown} are not supported. "
+            "Supported formats are 'parquet' and 'feather'.",
+            ValueError,
+        )
+    if output_formats:
+        try:
+            import pyarrow  # noqa
+        except ImportError:
+            log_and_raise(
+                f"The package 'pyarrow' is required to write {' and '.join(output_formats)} files.",
+                ClinicaMissingDependencyError,
+            )
+    return output_formats
+
+
+def _write_columnar_files(
+    merged_df: pd.DataFrame, out_path: Path, output_formats: Iterable[str]
+) -> None:
+    """Write the merged dataframe next to the TSV file in the requested columnar formats.
+
+    Columns mixing several types (for instance numbers and strings) are
+    written as strings.
+    """
+    if not output_formats:
+        return
+    merged_df = merged_df.reset_index(drop=True)
+    for column in merged_df.select_dtypes(include="object").columns:
+        values = merged_df[column].dropna()
+        if values.map(type).nunique() > 1:
+            merged_df[column] = merged_df[column].where(
+                merged_df[column].isna(), merged_df[column].astype(str)
+            )
+    for output_format in output_formats:
+        output_path = out_path.with_suffix(f".{output_format}")
+        if output_format == "parquet":
+            merged_df.to_parquet(output_path, index=False)
+        else:
+            merged_df.to_feather(output_path)
+        cprint(f"Merged data written to {output_path}.", lvl="debug")
+
+
 def _get_participants_and_subjects_sessions_df(
     bids_dir: Path,
     tsv_file: Optional[PathLike] = None,
@@ -158,122 +225,118 @@ def _create_merge_file_from_bids(
     participants_df: pd.DataFrame,
     ignore_scan_files: bool = False,
     ignore_sessions_files: bool = False,
+    n_procs: int = 1,
 ) -> pd.DataFrame:
-    """Create a merge pandas dataframe for a given BIDS dataset."""
-    df = pd.DataFrame(columns=participants_df.columns.values)
-    for subject, subject_df in sub_ses_df.groupby(level=0):
-        row_subject_data_only = _get_row_data_from_participant_df(
-            participants_df, subject
-        )
-        if ignore_sessions_files:
-            rows_session_data_only = (
-                _compute_session_rows_for_subject_without_session_files(subject_df)
-            )
-        else:
-            rows_session_data_only = (
-                _compute_session_rows_for_subject_with_session_files(
-                    bids_dir, subject, subject_df, ignore_scan_files
-                )
-            )
-        for row_session_data_only in rows_session_data_only:
-            full_row = pd.concat([row_subject_data_only, row_session_data_only], axis=1)
-            df = pd.concat([df, full_row], axis=0)
-    return _post_process_merge_file_from_bids(df)
+    """Create a merge pandas dataframe for a given BIDS dataset.
 
-
-def _get_row_data_from_participant_df(
-    participants_df: pd.DataFrame, subject: str
-) -> pd.DataFrame:
-    """Return, for a given subject, part of a merged dataframe row.
-    This part of the full row only contains information found in the participants dataframe.
-    In order to make a full row entry, it will be concatenated with information from the sessions and scans.
+    The sessions, scans and JSON files of the subjects are read with a pool of
+    `n_procs` processes, since parsing many small files with pandas is bound
+    by the GIL. Each session is represented by a dictionary mapping column
+    names to values, and the dataframe is built once from all of them.
     """
-    row_subject_data = participants_df[participants_df["participant_id"] == subject]
-    row_subject_data.reset_index(inplace=True, drop=True)
-    if len(row_subject_data) == 0:
-        log_and_warn(
-            f"Participant {subject} does not exist in participants.tsv",
-            UserWarning,
-        )
-        row_subject_data = pd.DataFrame([[subject]], columns=["participant_id"])
+    from functools import partial
 
-    return row_subject_data
+    from clinica.utils.parallel import ParallelBackend, map_in_chunks
 
-
-def _compute_session_rows_for_subject_without_session_files(
-    subject_df: pd.DataFrame,
-) -> List[pd.DataFrame]:
-    """Compute all rows with session information for a given subject.
-    This will be concatenated with information from the participants TSV file
-    to build a full dataframe row with all relevant information.
-    This is a default implementation when sessions and scans are ignored.
-    """
-    return [
-        pd.DataFrame([[session]], columns=["session_id"])
-        for _, session in subject_df.index.values
+    participants = {}
+    for record in participants_df.to_dict("records"):
+        participants.setdefault(record["participant_id"], record)
+    subjects = [
+        (subject, [session for _, session in subject_df.index.values])
+        for subject, subject_df in sub_ses_df.groupby(level=0)
     ]
+    records_of_subjects = map_in_chunks(
+        partial(
+            _get_records_of_subject,
+            bids_dir=bids_dir,
+            ignore_scan_files=ignore_scan_files,
+            ignore_sessions_files=ignore_sessions_files,
+        ),
+        subjects,
+        n_procs=n_procs,
+        backend=ParallelBackend.PROCESSES,
+    )
+    records = []
+    for (subject, _), records_of_subject in zip(subjects, records_of_subjects):
+        if (participant := participants.get(subject)) is None:
+            log_and_warn(
+                f"Participant {subject} does not exist in participants.tsv",
+                UserWarning,
+            )
+            participant = {"participant_id": subject}
+        records.extend({**participant, **record} for record in records_of_subject)
+    columns = dict.fromkeys(participants_df.columns.values)
+    for record in records:
+        columns.update(dict.fromkeys(record))
+    df = pd.DataFrame.from_records(records, columns=list(columns))
+    # The columns of participants.tsv are kept as objects, such that integers
+    # are not converted to floats when some participants are missing.
+    participants_columns = list(participants_df.columns.values)
+    df[participants_columns] = pd.DataFrame(
+        records, columns=participants_columns, dtype=object
+    )
+    return _post_process_merge_file_from_bids(df)
 
 
-def _compute_session_rows_for_subject_with_session_files(
+def _get_records_of_subject(
+    subject_and_sessions: Tuple[str, List[str]],
     bids_dir: Path,
-    subject: str,
-    subject_df: pd.DataFrame,
     ignore_scan_files: bool,
-) -> List[pd.DataFrame]:
-    """Compute all rows with session information for a given subject.
-    This will be concatenated with information from the participants TSV file
-    to build a full dataframe row with all relevant information.
-    This function will try to incorporate data from the sessions and scans
-    if available.
+    ignore_sessions_files: bool,
+) -> List[dict]:
+    """Compute the session records, that is the dictionaries mapping column
+    names to values, of the provided subject and sessions.
+
+    These records will be completed with information from the participants TSV file
+    to build the rows of the merged dataframe. If the session files are not ignored,
+    data from the sessions and scans are incorporated if available.
     """
     from clinica.utils.exceptions import ClinicaDatasetError
 
-    rows = []
-    sub_path = bids_dir / subject
-    sessions_df = pd.read_csv(sub_path / f"{subject}_sessions.tsv", sep="\t")
-    for _, session in subject_df.index.values:
-        row_session_df = sessions_df[sessions_df.session_id == session]
-        row_session_df.reset_index(inplace=True, drop=True)
-        if len(row_session_df) == 0:
+    subject, sessions = subject_and_sessions
+    if ignore_sessions_files:
+        return [{"session_id": session} for session in sessions]
+    records = []
+    sessions_df = pd.read_csv(bids_dir / subject / f"{subject}_sessions.tsv", sep="\t")
+    sessions_records = sessions_df.to_dict("records")
+    for session in sessions:
+        session_records = [
+            dict(record)
+            for record in sessions_records
+            if record["session_id"] == session
+        ]
+        if len(session_records) == 0:
             log_and_raise(
                 f"The following sessions are not properly formatted : {sessions_df.loc[0, 'session_id']} / {session}",
                 ClinicaDatasetError,
             )
         scan_path = bids_dir / subject / session / f"{subject}_{session}_scans.tsv"
-        row_scans_df = _get_row_scan_df(scan_path, ignore_scan_files)
-        row_df = pd.concat([row_session_df, row_scans_df], axis=1)
-        rows.append(row_df.loc[:, ~row_df.columns.duplicated(keep="last")])
+        session_records[0].update(_get_scans_record(scan_path, ignore_scan_files))
+        records.extend(session_records)
+    return records
 
-    return rows
 
+def _get_scans_record(scan_path: Path, ignore_scan_files: bool) -> dict:
+    """Return a record for all scans associated with a given subject and session.
 
-def _get_row_scan_df(scan_path: Path, ignore_scan_files: bool) -> pd.DataFrame:
-    """Return a dataframe for all scans associated with a given subject and session.
-    The scan data come from the scan TSV file. If it doesn't exist, an empty dataframe
-    is returned.
+    The scan data come from the scan TSV file and the JSON sidecars of the NIfTI
+    images. If the scan TSV file doesn't exist, an empty record is returned.
     """
-    row_scans_df = pd.DataFrame()
     if ignore_scan_files or not scan_path.is_file():
-        return row_scans_df
-    scans_dict = dict()
-    scans_df = pd.read_csv(scan_path, sep="\t")
-    for idx in scans_df.index.values:
-        filepath = scans_df.loc[idx, "filename"]
+        return {}
+    scans_record = dict()
+    for scan in pd.read_csv(scan_path, sep="\t").to_dict("records"):
+        filepath = scan["filename"]
         if not filepath.endswith(".nii.gz"):
             continue
         filename = Path(filepath).name.split(".")[0]
         modality = "_".join(filename.split("_")[2::])
-        for col in scans_df.columns.values:
+        for col, value in scan.items():
             if col != "filename":
-                value = scans_df.loc[idx, col]
-                new_col_name = f"{modality}_{col}"
-                scans_dict.update({new_col_name: value})
+                scans_record[f"{modality}_{col}"] = value
         json_path = scan_path.parent / f"{filepath.split('.')[0]}.json"
-        scans_dict = _add_metadata_from_json(json_path, scans_dict, modality)
-    scans_dict = {str(key): str(value) for key, value in scans_dict.items()}
-    row_scans_df = pd.DataFrame(scans_dict, index=[0])
-
-    return row_scans_df
+        scans_record = _add_metadata_from_json(json_path, scans_record, modality)
+    return {str(key): str(value) for key, value in scans_record.items()}
 
 
 def _add_metadata_from_json(json_path: Path, scans_dict: dict, modality: str) -> dict:
@@ -312,6 +375,7 @@ def _add_data_to_merge_file_from_caps(
     caps_dir: Path,
     merged_df: pd.DataFrame,
     pipelines: Optional[Iterable[PipelineNameForMetricExtraction]] = None,
+    n_procs: int = 1,
     **kwargs,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     merged_summary_df = pd.DataFrame()
@@ -321,7 +385,9 @@ def _add_data_to_merge_file_from_caps(
     for pipeline in pipelines:
         metric_extractor = pipeline_metric_extractor_factory(pipeline)
         cprint(f"Extracting from CAPS pipeline output: {pipeline.value}...", lvl="info")
-        merged_df, summary_df = metric_extractor(caps_dir, merged_df, **kwargs)
+        merged_df, summary_df = metric_extractor(
+            caps_dir, merged_df, n_procs=n_procs, **kwargs
+        )
         if summary_df is not None and not summary_df.empty:
             merged_summary_df = pd.concat([merged_summary_df, summary_df])
         if summary_df is None or summary_df.empty:
@@ -23,10 +23,14 @@ class SubjectSession:
 
 
 def compute_missing_mods(
-    bids_dir: PathLike, out_dir: PathLike, output_prefix: str = ""
+    bids_dir: PathLike, out_dir: PathLike, output_prefix: str = "", n_procs: int = 1
 ) -> None:
     """Compute the list of missing modalities for each subject in a BIDS compliant dataset.
 
+    The BIDS dataset is scanned once (see `clinica.utils.dataset_index`), without
+    persisting the index in the cache of Clinica, and the missing modalities of all the sessions are computed from the table
+    of the files found in the modality folders.
+
     Parameters
     ----------
     bids_dir : PathLike
@@ -39,14 +43,10 @@ def compute_missing_mods(
         String that replaces the default prefix ('missing_mods_')
         in the name of all the created output files.
         Default = "".
-    """
-    import os
-    from glob import glob
-    from os import path
-    from pathlib import Path
-
-    import pandas as pd
 
+    n_procs : int, optional
+        Number of threads used to scan the BIDS directory. Default=1.
+    """
     from clinica.iotools.converter_utils import (
         MissingModsTracker,
         write_longitudinal_analysis,
@@ -57,132 +57,36 @@ def compute_missing_mods(
     bids_dir = Path(bids_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Find all the modalities and sessions available for the input dataset
-    mods_and_sess = _find_mods_and_sess(bids_dir)
-    sessions_found = mods_and_sess["sessions"]
-    mods_and_sess.pop("sessions")
-    mods_avail_dict = mods_and_sess
-    mods_avail = [j for i in mods_avail_dict.values() for j in i]
-    cols_dataframe = mods_avail[:]
-    cols_dataframe.insert(0, "participant_id")
-    mmt = MissingModsTracker(sessions_found, mods_avail)
+    subjects = _get_subjects(bids_dir)
+    if len(subjects) == 0:
+        raise IOError("No subjects found or dataset not BIDS compliant.")
+    files = _build_bids_files_table(bids_dir, subjects, n_procs=n_procs)
+    mods_and_sess = _get_mods_and_sess(files)
+    sessions_found = sorted(mods_and_sess.pop("sessions"))
+    mods_avail_dict = {
+        datatype: sorted(mods) for datatype, mods in sorted(mods_and_sess.items())
+    }
+    mods_avail = [mod for mods in mods_avail_dict.values() for mod in mods]
+    available, counted_as_missing = _compute_modality_matrices(
+        files, mods_avail_dict, subjects, sessions_found
+    )
 
     out_file_name = "missing_mods_" if output_prefix == "" else output_prefix + "_"
-
-    missing_mods_df = pd.DataFrame(columns=cols_dataframe)
-    row_to_append_df = pd.DataFrame(columns=cols_dataframe)
-    subjects_paths_lists = glob(path.join(bids_dir, "*sub-*"))
-    subjects_paths_lists.sort()
-
-    if len(subjects_paths_lists) == 0:
-        raise IOError("No subjects found or dataset not BIDS compliant.")
-    # Check the modalities available for each session
+    mmt = MissingModsTracker(sessions_found, mods_avail[:])
     for ses in sessions_found:
-        for sub_path in subjects_paths_lists:
-            mods_avail_bids = []
-            subj_id = sub_path.split(os.sep)[-1]
-            row_to_append_df["participant_id"] = pd.Series(subj_id)
-            ses_path_avail = glob(path.join(sub_path, ses))
-            if len(ses_path_avail) == 0:
-                mmt.increase_missing_ses(ses)
-                for mod in mods_avail:
-                    row_to_append_df[mod] = pd.Series("0")
-            else:
-                ses_path = ses_path_avail[0]
-                mods_paths_folders = glob(path.join(ses_path, "*/"))
-
-                for p in mods_paths_folders:
-                    p = p[:-1]
-                    mods_avail_bids.append(p.split("/").pop())
-
-                # Check if a modality folder is available and if is empty
-                if "func" in mods_avail_bids:
-                    # Extract all the task available
-                    for m in mods_avail_dict["func"]:
-                        tokens = m.split("_")
-                        task_name = tokens[1]
-                        task_avail_list = glob(
-                            path.join(ses_path, "func", "*" + task_name + "*")
-                        )
-
-                        if len(task_avail_list) == 0:
-                            row_to_append_df[m] = pd.Series("0")
-                        else:
-                            row_to_append_df[m] = pd.Series("1")
-                # If the folder is not available but the modality is
-                # in the list of the available one mark it as missing
-                else:
-                    if "func" in mods_avail_dict:
-                        for m in mods_avail_dict["func"]:
-                            row_to_append_df[m] = pd.Series("0")
-                            mmt.add_missing_mod(ses, m)
-
-                if "dwi" in mods_avail_bids:
-                    row_to_append_df["dwi"] = pd.Series("1")
-                else:
-                    if "dwi" in mods_avail:
-                        row_to_append_df["dwi"] = pd.Series("0")
-                        mmt.add_missing_mod(ses, "dwi")
-
-                if "anat" in mods_avail_bids:
-                    for m in mods_avail_dict["anat"]:
-                        anat_aval_list = glob(path.join(ses_path, "anat", "*.nii.gz"))
-                        anat_aval_list = [
-                            elem for elem in anat_aval_list if m.lower() in elem.lower()
-                        ]
-                        if len(anat_aval_list) > 0:
-                            row_to_append_df[m] = pd.Series("1")
-                        else:
-                            row_to_append_df[m] = pd.Series("0")
-                            mmt.add_missing_mod(ses, m)
-                else:
-                    if "anat" in mods_avail_dict:
-                        for m in mods_avail_dict["anat"]:
-                            row_to_append_df[m] = pd.Series("0")
-                            mmt.add_missing_mod(ses, m)
-
-                if "fmap" in mods_avail_bids:
-                    row_to_append_df["fmap"] = pd.Series("1")
-                else:
-                    if "fmap" in mods_avail:
-                        row_to_append_df["fmap"] = pd.Series("0")
-                        mmt.add_missing_mod(ses, "fmap")
-                if "pet" in mods_avail_bids:
-                    # Extract all the task available
-                    for m in mods_avail_dict["pet"]:
-                        tokens = m.split("_")
-                        pet_acq = tokens[1]
-                        acq_avail_list = glob(
-                            path.join(ses_path, "pet", "*" + pet_acq + "*")
-                        )
-
-                        if len(acq_avail_list) == 0:
-                            row_to_append_df[m] = pd.Series("0")
-                        else:
-                            row_to_append_df[m] = pd.Series("1")
-                # If the folder is not available but the modality is
-                # in the list of the available one mark it as missing
-                else:
-                    if "pet" in mods_avail_dict:
-                        for m in mods_avail_dict["pet"]:
-                            row_to_append_df[m] = pd.Series("0")
-                            mmt.add_missing_mod(ses, m)
-
-            missing_mods_df = pd.concat([missing_mods_df, row_to_append_df])
-            row_to_append_df = pd.DataFrame(columns=cols_dataframe)
-
-        missing_mods_df = missing_mods_df[cols_dataframe]
-        missing_mods_df.to_csv(
-            path.join(out_dir, out_file_name + ses + ".tsv"),
+        mmt.add_missing_mods(
+            ses, counted_as_missing.xs(ses, level="session_id").sum().to_dict()
+        )
+        available.xs(ses, level="session_id").astype(int).reset_index().to_csv(
+            out_dir / (out_file_name + ses + ".tsv"),
             sep="\t",
             index=False,
             encoding="utf-8",
         )
-        missing_mods_df = pd.DataFrame(columns=cols_dataframe)
 
     write_statistics(
         out_dir / (out_file_name + "summary.txt"),
-        len(subjects_paths_lists),
+        len(subjects),
         sessions_found,
         mmt,
     )
@@ -191,6 +95,165 @@ def compute_missing_mods(
     )
 
 
+def _get_subjects(bids_dir: Path) -> List[str]:
+    """Return the sorted names of the subject folders of the BIDS dataset."""
+    return sorted(
+        folder.name
+        for folder in bids_dir.iterdir()
+        if "sub-" in folder.name and folder.is_dir()
+    )
+
+
+def _build_bids_files_table(
+    bids_dir: Path, subjects: List[str], n_procs: int = 1
+) -> pd.DataFrame:
+    """Build the table of the sessions, modality folders and files of a BIDS dataset.
+
+    Parameters
+    ----------
+    bids_dir : Path
+        The path to the BIDS dataset.
+
+    subjects : list of str
+        The subject folders to scan.
+
+    n_procs : int, optional
+        Number of threads used to scan the subject folders. Default=1.
+
+    Returns
+    -------
+    pd.DataFrame :
+        Table with columns 'participant_id', 'session_id', 'datatype' and
+        'filename'. Each session folder has a row with an empty datatype,
+        and each modality folder (e.g. 'anat') has a row with an empty filename.
+    """
+    from clinica.utils.dataset_index import DatasetIndex
+
+    # The index is not saved, such that checking a dataset does not write anything
+    # outside the output folder
+    index = DatasetIndex(bids_dir)
+    index.refresh(subjects, n_procs=n_procs)
+    rows = []
+    for subject in subjects:
+        for file in index.iter_files(subject):
+            _, session, *path = file.path.split("/")
+            if "ses-" not in session:
+                continue
+            if not path:
+                if file.is_dir:
+                    rows.append((subject, session, "", ""))
+            elif len(path) == 1:
+                if file.is_dir:
+                    rows.append((subject, session, path[0], ""))
+            elif len(path) == 2:
+                rows.append((subject, session, path[0], path[1]))
+    return pd.DataFrame(
+        rows, columns=["participant_id", "session_id", "datatype", "filename"]
+    )
+
+
+def _get_mods_and_sess(files: pd.DataFrame) -> dict:
+    """Find the modalities and sessions available in the table of the files of a BIDS dataset.
+
+    See `_find_mods_and_sess` for the structure of the returned dictionary.
+    """
+    from collections import defaultdict
+
+    mods_dict = defaultdict(set)
+    datatypes = set(files.datatype)
+    for datatype in ("dwi", "fmap"):
+        if datatype in datatypes:
+            mods_dict[datatype].add(datatype)
+    for datatype, suffix in (("func", "bold.nii.gz"), ("pet", "pet.nii.gz")):
+        names = files.filename[files.datatype == datatype]
+        names = names[names.str.endswith(suffix)]
+        if datatype == "pet":
+            names = names.str.split(".").str[0]
+        labels = names.str.split("_").str[2].dropna()
+        mods_dict[datatype].update(f"{datatype}_{label}" for label in labels)
+    names = files.filename[(files.datatype == "anat") & (files.filename != "")]
+    is_nifti = names.str.contains(".nii.gz", regex=False)
+    stems = names.str.replace(".nii.gz", "", regex=False).where(
+        is_nifti, names.str.rsplit(".", n=1).str[0]
+    )
+    extensions = names.str.rsplit(".", n=1).str[1].where(~is_nifti, "nii.gz")
+    mods_dict["anat"].update(
+        stems[extensions != "json"].str.split("_").str[-1].str.lower()
+    )
+    return {"sessions": set(files.session_id)} | {
+        datatype: mods for datatype, mods in mods_dict.items() if mods
+    }
+
+
+def _compute_modality_matrices(
+    files: pd.DataFrame,
+    mods_avail_dict: dict,
+    subjects: List[str],
+    sessions: List[str],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Compute which modalities are available for each subject and session.
+
+    Parameters
+    ----------
+    files : pd.DataFrame
+        The table of the files of the BIDS dataset (see `_build_bids_files_table`).
+
+    mods_avail_dict : dict
+        The modalities to look for, grouped by datatype.
+
+    subjects : list of str
+        The subjects of the BIDS dataset.
+
+    sessions : list of str
+        The sessions of the BIDS dataset.
+
+    Returns
+    -------
+    available : pd.DataFrame
+        Boolean matrix indexed by (participant_id, session_id) with one column
+        per modality, which is True if the modality is available.
+
+    counted_as_missing : pd.DataFrame
+        Boolean matrix with an additional 'session' column, which is True if
+        the session or the modality is counted as missing in the statistics of
+        the dataset. Modalities of missing sessions are not counted, and a func
+        task or a PET tracer is only counted if the whole func or pet folder is
+        missing.
+    """
+    mods = [mod for mods in mods_avail_dict.values() for mod in mods]
+    found = pd.DataFrame(False, index=files.index, columns=["session"] + mods)
+    found["session"] = True
+    for datatype, datatype_mods in mods_avail_dict.items():
+        names = files.filename[files.datatype == datatype]
+        if datatype == "anat":
+            names = names[names.str.endswith(".nii.gz")].str.lower()
+        for mod in datatype_mods:
+            if datatype == "anat":
+                is_found = names.str.contains(mod.lower(), regex=False)
+            elif datatype in ("func", "pet"):
+                is_found = names.str.contains(mod.split("_")[1], regex=False)
+            else:
+                is_found = pd.Series(True, index=names.index)
+            found.loc[is_found.index[is_found.to_numpy()], mod] = True
+    for datatype in ("func", "pet"):
+        found[f"{datatype}_folder"] = files.datatype == datatype
+    keys = pd.MultiIndex.from_product(
+        [subjects, sessions], names=["participant_id", "session_id"]
+    )
+    found = (
+        found.groupby([files.participant_id, files.session_id])
+        .any()
+        .reindex(keys, fill_value=False)
+    )
+    available = found[mods]
+    counted_as_missing = ~available & found["session"].to_numpy()[:, None]
+    for datatype in ("func", "pet"):
+        for mod in mods_avail_dict.get(datatype, []):
+            counted_as_missing[mod] &= ~found[f"{datatype}_folder"]
+    counted_as_missing.insert(0, "session", ~found["session"])
+    return available, counted_as_missing
+
+
 def compute_missing_processing(
     bids_dir: PathLike, caps_dir: PathLike, out_file: PathLike
 ):
@@ -395,38 +458,6 @@ def _find_mods_and_sess(bids_dir: Path) -> dict:
             'dwi': ['dwi']
         }
     """
-    from collections import defaultdict
-
-    mods_dict = defaultdict(set)
-
-    for sub_path in bids_dir.glob("*sub-*"):
-        for session in sub_path.glob("*ses-*"):
-            mods_dict["sessions"].add(session.name)
-            for modality in session.glob("*/"):
-                if modality.name == "func":
-                    for func_path in modality.glob("*bold.nii.gz"):
-                        func_task = func_path.name.split("_")[2]
-                        mods_dict["func"].add(f"func_{func_task}")
-                if modality.name == "dwi":
-                    mods_dict["dwi"].add("dwi")
-                if modality.name == "fmap":
-                    mods_dict["fmap"].add("fmap")
-                if modality.name == "pet":
-                    for pet_path in modality.glob("*pet.nii.gz"):
-                        pet_name = pet_path.name.split(".")[0]
-                        pet_acq = pet_name.split("_")[2]
-                        mods_dict["pet"].add(f"pet_{pet_acq}")
-                if modality.name == "anat":
-                    for anat_file in modality.glob("*"):
-                        if ".nii.gz" in anat_file.name:
-                            anat_name = anat_file.name.replace(".nii.gz", "")
-                            anat_ext = "nii.gz"
-                        else:
-                            anat_name = anat_file.stem
-                            anat_ext = anat_file.suffix.lstrip(".")
-                        if anat_ext != "json":
-                            file_parts = anat_name.split("_")
-                            anat_type = file_parts[-1].lower()
-                            mods_dict["anat"].add(anat_type)
-
-    return mods_dict
+    return _get_mods_and_sess(
+        _build_bids_files_table(bids_dir, _get_subjects(bids_dir))
+    )
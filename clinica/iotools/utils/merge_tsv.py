@@ -17,6 +17,8 @@ def merge_tsv(
     subjects_sessions_tsv: Optional[Union[str, PathLike]] = None,
     ignore_scan_files: bool = False,
     ignore_session_scan_files: bool = False,
+    output_formats: Optional[Iterable[str]] = None,
+    n_procs: int = 1,
 ):
     """Merge clinical data into a single TSV file.
 
@@ -56,6 +58,13 @@ def merge_tsv(
     ignore_scan_files : bool, optional
 
     ignore_session_scan_files : bool, optional
+
+    output_formats : Iterable of str, optional
+        The columnar formats ('parquet' or 'feather') in which the merged
+        data is also written, next to the output TSV file.
+
+    n_procs : int, optional
+        The number of processes used to read the files. Default=1.
     """
     from clinica.iotools.utils.data_handling import create_merge_file
     from clinica.utils.inputs import check_bids_folder
@@ -84,4 +93,6 @@ def merge_tsv(
         tsv_file=subjects_sessions_tsv,
         group_selection=group_selection,
         tracers_selection=pet_tracers_selection,
+        n_procs=n_procs,
+        output_formats=output_formats,
     )
@@ -31,6 +31,7 @@ def _extract_metrics_from_pipeline(
     group_selection: Optional[Iterable[str]] = None,
     pvc_restriction: Optional[bool] = None,
     tracers_selection: Optional[Iterable[str]] = None,
+    n_procs: int = 1,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Extract and merge the data of the provided pipeline into the
     merged dataframe already containing the BIDS information.
@@ -67,6 +68,9 @@ def _extract_metrics_from_pipeline(
         Allows to choose the PET tracer to merge.
         If None, all tracers available will be used.
 
+    n_procs : int, optional
+        Number of processes used to read the statistics of the sessions. Default=1.
+
     Returns
     -------
     final_df : pd.DataFrame
@@ -93,6 +97,7 @@ def _extract_metrics_from_pipeline(
         atlas_selection,
         pvc_restriction,
         tracers_selection,
+        n_procs=n_procs,
     )
     if records:
         pipeline_df = pd.DataFrame.from_records(
@@ -185,40 +190,74 @@ def _get_records(
     atlas_selection: Optional[Iterable[str]] = None,
     pvc_restriction: Optional[bool] = None,
     tracers_selection: Optional[Iterable[str]] = None,
+    n_procs: int = 1,
+) -> List[dict]:
+    """Returns a list of dictionaries corresponding to the dataframe rows of the pipeline dataframe.
+
+    The sessions are processed by a pool of `n_procs` processes.
+    """
+    from clinica.utils.parallel import ParallelBackend, map_in_chunks
+
+    records_of_sessions = map_in_chunks(
+        partial(
+            _get_records_of_session,
+            caps_dir=caps_dir,
+            pipeline=pipeline,
+            metrics=metrics,
+            group_selection=group_selection,
+            atlas_selection=atlas_selection,
+            pvc_restriction=pvc_restriction,
+            tracers_selection=tracers_selection,
+        ),
+        df.index.values,
+        n_procs=n_procs,
+        backend=ParallelBackend.PROCESSES,
+    )
+    return [record for records in records_of_sessions for record in records]
+
+
+def _get_records_of_session(
+    participant_and_session: Tuple[str, str],
+    caps_dir: Path,
+    pipeline: PipelineNameForMetricExtraction,
+    metrics: Iterable[str],
+    group_selection: Iterable[str],
+    atlas_selection: Optional[Iterable[str]] = None,
+    pvc_restriction: Optional[bool] = None,
+    tracers_selection: Optional[Iterable[str]] = None,
 ) -> List[dict]:
-    """Returns a list of dictionaries corresponding to the dataframe rows of the pipeline dataframe."""
+    """Returns the records of the pipeline dataframe for a given participant and session, one per group."""
     from clinica.utils.stream import cprint
 
+    participant_id, session_id = participant_and_session
+    if (
+        mod_path := _get_modality_path(
+            caps_dir / "subjects" / participant_id / session_id, pipeline
+        )
+    ) is None or not mod_path.exists():
+        cprint(
+            f"Could not find a longitudinal dataset for participant {participant_id} {session_id}",
+            lvl="warning",
+        )
+        return []
     records = []
-    subjects_dir = caps_dir / "subjects"
-    for participant_id, session_id in df.index.values:
-        if (
-            mod_path := _get_modality_path(
-                subjects_dir / participant_id / session_id, pipeline
-            )
-        ) is None or not mod_path.exists():
-            cprint(
-                f"Could not find a longitudinal dataset for participant {participant_id} {session_id}",
-                lvl="warning",
+    for group_path in (
+        mod_path / group for group in group_selection if (mod_path / group).exists()
+    ):
+        records_of_group = [
+            _get_single_record(
+                group_path,
+                metric,
+                participant_id,
+                session_id,
+                pipeline,
+                atlas_selection,
+                pvc_restriction,
+                tracers_selection,
             )
-            continue
-        for group_path in (
-            mod_path / group for group in group_selection if (mod_path / group).exists()
-        ):
-            records_of_group = [
-                _get_single_record(
-                    group_path,
-                    metric,
-                    participant_id,
-                    session_id,
-                    pipeline,
-                    atlas_selection,
-                    pvc_restriction,
-                    tracers_selection,
-                )
-                for metric in metrics
-            ]
-            records.append(reduce(lambda x, y: {**x, **y}, records_of_group))
+            for metric in metrics
+        ]
+        records.append(reduce(lambda x, y: {**x, **y}, records_of_group))
     return records
 
 
@@ -363,21 +402,24 @@ def _get_records_for_atlas(
     group: str,
 ) -> dict:
     atlas_df = pd.read_csv(atlas_path, sep="\t")
-    label_list = _get_label_list(atlas_path, metric, pipeline, group)
+    label_list = _get_label_list(atlas_path, atlas_df, metric, pipeline, group)
     key = "label_value" if "freesurfer" in pipeline.value else "mean_scalar"
     values = atlas_df[key].to_numpy()
     return {label: value for label, value in zip(label_list, values)}
 
 
 def _get_label_list(
-    atlas_path: Path, metric: str, pipeline: PipelineNameForMetricExtraction, group: str
+    atlas_path: Path,
+    atlas_df: pd.DataFrame,
+    metric: str,
+    pipeline: PipelineNameForMetricExtraction,
+    group: str,
 ) -> List[str]:
     """Returns the list of labels to use in the session df depending on the
-    pipeline, the atlas, and the metric considered.
+    pipeline, the atlas (read from `atlas_path` into `atlas_df`), and the metric considered.
     """
     from clinica.iotools.converter_utils import replace_sequence_chars
 
-    atlas_df = pd.read_csv(atlas_path, sep="\t")
     atlas_name = _get_atlas_name(atlas_path, pipeline)
     if pipeline == PipelineNameForMetricExtraction.T1_FREESURFER:
         return [
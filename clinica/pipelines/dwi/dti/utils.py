@@ -50,8 +50,9 @@ def compute_statistics_on_atlases(
 
     from clinica.utils.atlas import atlas_factory
     from clinica.utils.bids import BIDSFileName
-    from clinica.utils.statistics import statistics_on_atlas
+    from clinica.utils.statistics import statistics_on_atlases
 
+    atlases = []
     atlas_statistics_list = []
     for atlas_name in ("JHUDTI81", "JHUTracts0", "JHUTracts25"):
         atlas = atlas_factory(atlas_name)
@@ -61,9 +62,9 @@ def compute_statistics_on_atlases(
         source.update_entity("map", name_map)
         source.suffix = "statistics"
         source.extension = ".tsv"
-        out_atlas_statistics = (Path.cwd() / source.name).resolve()
-        statistics_on_atlas(registered_map, atlas, out_atlas_statistics)
-        atlas_statistics_list.append(out_atlas_statistics)
+        atlases.append(atlas)
+        atlas_statistics_list.append((Path.cwd() / source.name).resolve())
+    statistics_on_atlases(registered_map, atlases, atlas_statistics_list)
 
     return atlas_statistics_list
 
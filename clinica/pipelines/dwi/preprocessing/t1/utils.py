@@ -4,7 +4,7 @@ import functools
 import shutil
 from os import PathLike
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -664,35 +664,20 @@ def _split_dwi_dataset_with_b_values(
     ValueError:
         If b_value_threshold < 0.
     """
-    from ..utils import check_b_value_threshold, check_dwi_dataset, get_b0_filter
+    from ..utils import check_b_value_threshold, check_dwi_dataset
 
     check_b_value_threshold(b_value_threshold)
     dwi_dataset = check_dwi_dataset(dwi_dataset)
-    b_values, _ = _check_b_values_and_b_vectors(dwi_dataset)
-    small_b_filter = get_b0_filter(
-        dwi_dataset.b_values, b_value_threshold=b_value_threshold
-    )
-    large_b_filter = np.array(
-        [i for i in range(len(b_values)) if i not in small_b_filter]
-    )
-    large = None
-    if len(small_b_filter) > 0:
-        small = _build_dwi_dataset_from_filter(
-            dwi_dataset,
-            "small_b",
-            small_b_filter,
-            working_directory=working_directory,
-        )
-    else:
+    small_b = np.loadtxt(dwi_dataset.b_values, ndmin=1) <= b_value_threshold
+    if not small_b.any():
         raise ValueError("No small dataset found.")
-    if len(large_b_filter) > 0:
-        large = _build_dwi_dataset_from_filter(
-            dwi_dataset,
-            "large_b",
-            large_b_filter,
-            working_directory=working_directory,
-        )
-    return small, large
+    filters = {"small_b": np.flatnonzero(small_b)}
+    if not small_b.all():
+        filters["large_b"] = np.flatnonzero(~small_b)
+    datasets = _partition_dwi_dataset(
+        dwi_dataset, filters, working_directory=working_directory
+    )
+    return datasets["small_b"], datasets.get("large_b")
 
 
 def _check_b_values_and_b_vectors(
@@ -713,124 +698,77 @@ def _check_b_values_and_b_vectors(
     return b_values, b_vectors
 
 
-def _build_dwi_dataset_from_filter(
+def _partition_dwi_dataset(
     dwi_dataset: DWIDataset,
-    filter_name: str,
-    filter_array: np.ndarray,
+    filters: Dict[str, np.ndarray],
     working_directory: Optional[Path] = None,
-) -> DWIDataset:
-    """Builds a new DWI dataset from a given DWI dataset and a filter.
+) -> Dict[str, DWIDataset]:
+    """Builds new DWI datasets from a given DWI dataset and several filters.
+
+    The DWI image, b-values and b-vectors are read once for all the filters.
 
     Parameters
     ----------
     dwi_dataset : DWIDataset
         The DWI dataset to filter.
 
-    filter_name : str
-        The name of the filter. This will be used to build the
-        file names associated with the new dataset.
-
-    filter_array : np.ndarray
-        1D array of indices to filter the DWI dataset.
+    filters : dict of np.ndarray
+        1D arrays of indices to filter the DWI dataset, by filter name.
+        The names are used to build the file names associated with the
+        new datasets.
 
     working_directory : Path, optional
         An optional working directory in which to write the filtered
-        DWI dataset. If not provided, it will be written in the same
+        DWI datasets. If not provided, they will be written in the same
         directory as the provided DWI dataset.
 
     Returns
     -------
-    DWIDataset :
-        The new filtered DWI dataset.
+    dict of DWIDataset :
+        The new filtered DWI datasets, by filter name.
     """
+    from clinica.utils.image import get_new_image_like, split_volumes
+
     from ..utils import check_dwi_dataset
 
-    return check_dwi_dataset(
-        DWIDataset(
-            dwi=_filter_dwi(
-                dwi_dataset,
-                filter_name,
-                filter_array,
-                working_directory=working_directory,
-            ),
-            b_values=_filter_b_values(
-                dwi_dataset,
-                filter_name,
-                filter_array,
-                working_directory=working_directory,
-            ),
-            b_vectors=_filter_b_vectors(
-                dwi_dataset,
-                filter_name,
-                filter_array,
-                working_directory=working_directory,
-            ),
+    b_values, b_vectors = _check_b_values_and_b_vectors(dwi_dataset)
+    volumes = split_volumes(dwi_dataset.dwi, filters)
+    datasets = {}
+    for filter_name, filter_array in filters.items():
+        dwi_filename = _get_filtered_filename(
+            dwi_dataset.dwi, filter_name, working_directory
         )
-    )
-
-
-def _filter_dwi(
-    dwi_dataset: DWIDataset,
-    filter_name: str,
-    filter_array: np.ndarray,
-    working_directory: Optional[Path] = None,
-) -> Path:
-    """Filters the dwi component of the provided DWI dataset."""
-    import nibabel as nib
-
-    from clinica.utils.image import compute_aggregated_volume, get_new_image_like
-
-    from ..utils import add_suffix_to_filename
-
-    dwi_filename = add_suffix_to_filename(dwi_dataset.dwi, filter_name)
-    if working_directory:
-        dwi_filename = working_directory / dwi_filename.name
-    try:
-        data = compute_aggregated_volume(
-            dwi_dataset.dwi, aggregator=None, volumes_to_keep=filter_array
+        get_new_image_like(dwi_dataset.dwi, volumes[filter_name]).to_filename(
+            dwi_filename
         )
-    except ValueError:
-        data = nib.load(dwi_dataset.dwi).get_fdata()
-    img = get_new_image_like(dwi_dataset.dwi, data)
-    img.to_filename(dwi_filename)
-
-    return dwi_filename
-
-
-def _filter_b_values(
-    dwi_dataset: DWIDataset,
-    filter_name: str,
-    filter_array: np.ndarray,
-    working_directory: Optional[Path] = None,
-) -> Path:
-    """Filters the b-values component of the provided DWI dataset."""
-    from ..utils import add_suffix_to_filename
-
-    b_values, _ = _check_b_values_and_b_vectors(dwi_dataset)
-    b_values_filename = add_suffix_to_filename(dwi_dataset.b_values, filter_name)
-    if working_directory:
-        b_values_filename = working_directory / b_values_filename.name
-    _write_b_values(b_values_filename, b_values[filter_array])
-
-    return b_values_filename
+        b_values_filename = _get_filtered_filename(
+            dwi_dataset.b_values, filter_name, working_directory
+        )
+        _write_b_values(b_values_filename, b_values[filter_array])
+        b_vectors_filename = _get_filtered_filename(
+            dwi_dataset.b_vectors, filter_name, working_directory
+        )
+        _write_b_vectors(b_vectors_filename, b_vectors[:, filter_array])
+        datasets[filter_name] = check_dwi_dataset(
+            DWIDataset(
+                dwi=dwi_filename,
+                b_values=b_values_filename,
+                b_vectors=b_vectors_filename,
+            )
+        )
+    return datasets
 
 
-def _filter_b_vectors(
-    dwi_dataset: DWIDataset,
-    filter_name: str,
-    filter_array: np.ndarray,
-    working_directory: Optional[Path] = None,
+def _get_filtered_filename(
+    filename: Path, filter_name: str, working_directory: Optional[Path] = None
 ) -> Path:
-    """Filters the b-vectors component of the provided DWI dataset."""
+    """Builds the name of a filtered file, in the working directory if provided."""
     from ..utils import add_suffix_to_filename
 
-    _, b_vectors = _check_b_values_and_b_vectors(dwi_dataset)
-    b_vectors_filename = add_suffix_to_filename(dwi_dataset.b_vectors, filter_name)
+    filtered_filename = add_suffix_to_filename(filename, filter_name)
     if working_directory:
-        b_vectors_filename = working_directory / b_vectors_filename.name
-    _write_b_vectors(b_vectors_filename, np.array([b[filter_array] for b in b_vectors]))
-
-    return b_vectors_filename
+        return working_directory / filtered_filename.name
+    return filtered_filename
 
 
 def _count_b0s(b_value_filename: PathLike, b_value_threshold: float = 5.0) -> int:
@@ -21,6 +21,10 @@ def clinica_pipeline(func):
     More precisely, this decorator takes care of:
         - registering the implemented command as a subcommand
           of `clinica run`.
+
+    The command is only registered once its module is imported: to be
+    available from the command line, it must also be declared in
+    `clinica.pipelines.cli.PIPELINE_COMMANDS`, which imports it on demand.
     """
     from clinica.pipelines.cli import cli as run_cli
 
@@ -40,11 +40,27 @@ class DualSVMAlgorithm(base.MLAlgorithm):
 
         return svc, y_hat, auc, y_hat_train
 
-    def _grid_search(self, kernel_train, x_test, y_train, y_test, c):
-        _, y_hat, _, _ = self._launch_svc(kernel_train, x_test, y_train, y_test, c)
-        res = utils.evaluate_prediction(y_test, y_hat)
+    def _grid_search(self, kernel_train, x_test, y_train, y_test):
+        """Return the balanced accuracy obtained with each C of `c_range` on an inner fold.
 
-        return res["balanced_accuracy"]
+        The balanced accuracy only depends on the predicted labels,
+        so the SVCs are fitted without probability calibration.
+        """
+        accuracies = {}
+        for c in self._algorithm_params["c_range"]:
+            svc = SVC(
+                C=c,
+                kernel="precomputed",
+                tol=1e-6,
+                class_weight="balanced" if self._algorithm_params["balanced"] else None,
+            )
+            svc.fit(kernel_train, y_train)
+            y_hat = svc.predict(x_test)
+            accuracies[c] = utils.evaluate_prediction(y_test, y_hat)[
+                "balanced_accuracy"
+            ]
+
+        return accuracies
 
     def _select_best_parameter(self, async_result):
         c_values = []
@@ -53,8 +69,7 @@ class DualSVMAlgorithm(base.MLAlgorithm):
             best_c = -1
             best_acc = -1
 
-            for c, async_acc in async_result[fold].items():
-                acc = async_acc.get()
+            for c, acc in async_result[fold].get().items():
                 if acc > best_acc:
                     best_c = c
                     best_acc = acc
@@ -69,8 +84,6 @@ class DualSVMAlgorithm(base.MLAlgorithm):
     def evaluate(self, train_index, test_index):
         inner_pool = ThreadPool(self._algorithm_params["n_threads"])
         async_result = {}
-        for i in range(self._algorithm_params["grid_search_folds"]):
-            async_result[i] = {}
 
         outer_kernel = self._kernel[train_index, :][:, train_index]
         y_train = self._y[train_index]
@@ -90,11 +103,10 @@ class DualSVMAlgorithm(base.MLAlgorithm):
                 y_train[inner_test_index],
             )
 
-            for c in self._algorithm_params["c_range"]:
-                async_result[i][c] = inner_pool.apply_async(
-                    self._grid_search,
-                    (inner_kernel, x_test_inner, y_train_inner, y_test_inner, c),
-                )
+            async_result[i] = inner_pool.apply_async(
+                self._grid_search,
+                (inner_kernel, x_test_inner, y_train_inner, y_test_inner),
+            )
         inner_pool.close()
         inner_pool.join()
 
@@ -210,11 +222,30 @@ class LogisticReg(base.MLAlgorithm):
 
         return classifier, y_hat, auc, y_hat_train
 
-    def _grid_search(self, x_train, x_test, y_train, y_test, c):
-        _, y_hat, _, _ = self._launch_logistic_reg(x_train, x_test, y_train, y_test, c)
-        res = utils.evaluate_prediction(y_test, y_hat)
+    def _grid_search(self, x_train, x_test, y_train, y_test):
+        """Return the balanced accuracy obtained with each C of `c_range` on an inner fold.
 
-        return res["balanced_accuracy"]
+        If `warm_start` is set, a single classifier walks the regularization path
+        from the smallest to the largest C, each fit starting from the previous
+        solution.
+        """
+        c_range = self._algorithm_params["c_range"]
+        classifier = LogisticRegression(
+            penalty=self._algorithm_params["penalty"],
+            tol=1e-6,
+            class_weight="balanced" if self._algorithm_params["balanced"] else None,
+            warm_start=self._algorithm_params["warm_start"],
+        )
+        accuracies = {}
+        for c in sorted(c_range):
+            classifier.set_params(C=c)
+            classifier.fit(x_train, y_train)
+            y_hat = classifier.predict(x_test)
+            accuracies[c] = utils.evaluate_prediction(y_test, y_hat)[
+                "balanced_accuracy"
+            ]
+
+        return {c: accuracies[c] for c in c_range}
 
     def _select_best_parameter(self, async_result):
         c_values = []
@@ -223,8 +254,7 @@ class LogisticReg(base.MLAlgorithm):
             best_c = -1
             best_acc = -1
 
-            for c, async_acc in async_result[fold].items():
-                acc = async_acc.get()
+            for c, acc in async_result[fold].get().items():
                 if acc > best_acc:
                     best_c = c
                     best_acc = acc
@@ -239,8 +269,6 @@ class LogisticReg(base.MLAlgorithm):
     def evaluate(self, train_index, test_index):
         inner_pool = ThreadPool(self._algorithm_params["n_threads"])
         async_result = {}
-        for i in range(self._algorithm_params["grid_search_folds"]):
-            async_result[i] = {}
 
         x_train = self._x[train_index]
         y_train = self._y[train_index]
@@ -258,11 +286,10 @@ class LogisticReg(base.MLAlgorithm):
             y_train_inner = y_train[inner_train_index]
             y_test_inner = y_train[inner_test_index]
 
-            for c in self._algorithm_params["c_range"]:
-                async_result[i][c] = inner_pool.apply_async(
-                    self._grid_search,
-                    (x_train_inner, x_test_inner, y_train_inner, y_test_inner, c),
-                )
+            async_result[i] = inner_pool.apply_async(
+                self._grid_search,
+                (x_train_inner, x_test_inner, y_train_inner, y_test_inner),
+            )
         inner_pool.close()
         inner_pool.join()
 
@@ -348,6 +375,7 @@ class LogisticReg(base.MLAlgorithm):
             "balanced": False,
             "grid_search_folds": 10,
             "c_range": np.logspace(-6, 2, 17),
+            "warm_start": True,
             "n_threads": 15,
         }
 
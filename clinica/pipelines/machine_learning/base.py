@@ -1,4 +1,12 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import as_completed
+from typing import Dict, Hashable, Optional
+
+from clinica.pipelines.machine_learning.checkpoint import (
+    ValidationCheckpoint,
+    compute_fingerprint,
+)
+from clinica.pipelines.machine_learning.executor import CrossValidationExecutor
 
 
 class MLWorkflow(ABC):
@@ -25,24 +33,41 @@ class MLWorkflow(ABC):
 
     def run(self):
         from os import makedirs, path
+        from pathlib import Path
 
         # Instantiating input class
         self._input = self._input_class(self._input_params)
 
         # Computing input values
-        x = self._input.get_x()
         y = self._input.get_y()
 
         # Instantiating classification algorithm
+        # The kernel and the features are read from the kernel cache when they
+        # were computed by a previous run on the same images, so that the images
+        # are not loaded again
         if self._algorithm_class.uses_kernel():
             kernel = self._input.get_kernel()
             self._algorithm = self._algorithm_class(kernel, y, self._algorithm_params)
         else:
+            x = self._input.get_x()
             self._algorithm = self._algorithm_class(x, y, self._algorithm_params)
 
         # Instantiating cross-validation method and classification algorithm
+        # Results of each split are saved as soon as they are computed,
+        # so that an interrupted classification resumes where it stopped,
+        # unless the images (or the parameters) were modified in the meantime
+        checkpoint = ValidationCheckpoint(
+            Path(self._output_dir) / "checkpoint",
+            compute_fingerprint(
+                y,
+                self._input.get_data_key(),
+                self._input_params,
+                self._validation_params,
+                self._algorithm_params,
+            ),
+        )
         self._validation = self._validation_class(
-            self._algorithm, self._validation_params
+            self._algorithm, self._validation_params, checkpoint=checkpoint
         )
 
         # Launching classification with selected cross-validation
@@ -54,7 +79,7 @@ class MLWorkflow(ABC):
 
         # Saving algorithm trained classifier
         self._algorithm.save_classifier(classifier, classifier_dir)
-        self._algorithm.save_weights(classifier, x, classifier_dir)
+        self._algorithm.save_weights(classifier, self._input.get_x(), classifier_dir)
         self._algorithm.save_parameters(best_params, classifier_dir)
 
         # Saving validation trained classifier
@@ -86,6 +111,16 @@ class MLInput(ABC):
     def get_y(self):
         pass
 
+    def get_data_key(self):
+        """
+        Returns: a key identifying the features of the subjects.
+        """
+        import hashlib
+
+        import numpy as np
+
+        return hashlib.sha256(np.ascontiguousarray(self.get_x()).data).hexdigest()
+
     @staticmethod
     @abstractmethod
     def get_default_parameters():
@@ -93,7 +128,12 @@ class MLInput(ABC):
 
 
 class MLValidation(ABC):
-    def __init__(self, ml_algorithm, validation_params):
+    def __init__(
+        self,
+        ml_algorithm,
+        validation_params,
+        checkpoint: Optional[ValidationCheckpoint] = None,
+    ):
         self._ml_algorithm = ml_algorithm
 
         self._validation_params = self.get_default_parameters()
@@ -102,11 +142,72 @@ class MLValidation(ABC):
         self._validation_results = []
         self._classifier = None
         self._best_params = None
+        self._checkpoint = checkpoint
 
     @abstractmethod
     def validate(self, y):
         pass
 
+    def _get_executor(self, n_tasks: int) -> CrossValidationExecutor:
+        return CrossValidationExecutor(
+            self._ml_algorithm,
+            self._validation_params["n_threads"],
+            n_tasks,
+            backend=self._validation_params.get("backend", "processes"),
+        )
+
+    def _load_splits_indices(self) -> None:
+        """Restore the split indices saved in the checkpoint, if not provided."""
+        if (
+            self._checkpoint is not None
+            and not self._validation_params["splits_indices"]
+        ):
+            self._validation_params["splits_indices"] = self._checkpoint.load_splits()
+
+    def _save_splits_indices(self) -> None:
+        if self._checkpoint is not None:
+            self._checkpoint.save_splits(self._validation_params["splits_indices"])
+
+    def _evaluate_splits(self, method: str, splits: Dict[Hashable, tuple]) -> Dict:
+        """Evaluate the algorithm on each split.
+
+        The results found in the checkpoint are not computed again, and new
+        results are saved in the checkpoint as soon as they are computed.
+
+        Args:
+            method: Name of the method of the algorithm evaluating a split.
+            splits: Train and test indices of each split, by key.
+
+        Returns:
+            The results of the evaluations, by key.
+        """
+        from clinica.utils.stream import cprint
+
+        results = {}
+        if self._checkpoint is not None:
+            for key in splits:
+                if (result := self._checkpoint.load_result(key)) is not None:
+                    results[key] = result
+            if results:
+                cprint(
+                    f"Resuming validation: {len(results)} out of {len(splits)} "
+                    f"splits were already evaluated in {self._checkpoint.folder}.",
+                    lvl="info",
+                )
+        missing = {key: split for key, split in splits.items() if key not in results}
+        if not missing:
+            return results
+        with self._get_executor(len(missing)) as executor:
+            futures = {
+                executor.submit(method, *split): key for key, split in missing.items()
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if self._checkpoint is not None:
+                    self._checkpoint.save_result(futures[future], future.result())
+
+        return results
+
     @staticmethod
     @abstractmethod
     def get_default_parameters():
@@ -0,0 +1,139 @@
+"""Checkpoints of the validations, used to resume interrupted classifications.
+
+A checkpoint is a folder containing:
+
+    - metadata.json : the fingerprint of the data and parameters of the validation
+    - splits.pkl : the indices of the train and test sets of all the splits
+    - results/<key>.pkl : the result of each evaluated split
+
+Each file is written atomically, so that an interrupted run leaves only complete
+files behind, and a new run evaluates only the splits without a result.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+
+__all__ = ["ValidationCheckpoint", "compute_fingerprint"]
+
+
+def compute_fingerprint(y: np.ndarray, data_key: str, *parameters: Dict) -> str:
+    """Return a key identifying the data and the parameters of a classification.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        The labels of the subjects.
+
+    data_key : str
+        The key identifying the features (or the kernel) of the subjects,
+        as given by `MLInput.get_data_key`.
+
+    parameters : dict
+        The parameters of the components of the classification.
+        The parameters which do not change the results ('n_threads' and 'backend')
+        are ignored, and the split indices are identified by their checksum.
+    """
+    hasher = hashlib.sha256(np.ascontiguousarray(y).data)
+    hasher.update(data_key.encode())
+    for component_parameters in parameters:
+        component_parameters = {
+            key: value
+            for key, value in component_parameters.items()
+            if key not in ("n_threads", "backend")
+        }
+        if component_parameters.get("splits_indices") is not None:
+            component_parameters["splits_indices"] = hashlib.sha256(
+                pickle.dumps(component_parameters["splits_indices"])
+            ).hexdigest()
+        hasher.update(
+            json.dumps(component_parameters, sort_keys=True, default=str).encode()
+        )
+    return hasher.hexdigest()
+
+
+def _write_atomically(filename: Path, content: bytes) -> None:
+    tmp = filename.with_name(f".{filename.name}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, filename)
+
+
+class ValidationCheckpoint:
+    """Folder storing the splits and the results of a validation as they are computed.
+
+    If the folder contains a checkpoint of another classification (with
+    a different fingerprint), it is cleared.
+
+    Parameters
+    ----------
+    folder : Path
+        The folder of the checkpoint.
+
+    fingerprint : str
+        The key of the classification, as given by `compute_fingerprint`.
+    """
+
+    def __init__(self, folder: Path, fingerprint: str):
+        from clinica.utils.stream import cprint
+
+        self.folder = Path(folder)
+        self.fingerprint = fingerprint
+        metadata = self.folder / "metadata.json"
+        try:
+            previous = json.loads(metadata.read_text())["fingerprint"]
+        except (OSError, ValueError, KeyError):
+            previous = None
+        if previous != fingerprint:
+            if previous is not None:
+                cprint(
+                    f"Checkpoint in {self.folder} was computed with other data or "
+                    "parameters and is discarded.",
+                    lvl="warning",
+                )
+            shutil.rmtree(self.folder, ignore_errors=True)
+            (self.folder / "results").mkdir(parents=True)
+            _write_atomically(
+                metadata, json.dumps({"fingerprint": fingerprint}).encode()
+            )
+
+    def __len__(self) -> int:
+        return len(list((self.folder / "results").glob("*.pkl")))
+
+    def _result_filename(self, key: Hashable) -> Path:
+        if isinstance(key, tuple):
+            key = "-".join(str(k) for k in key)
+        return self.folder / "results" / f"{key}.pkl"
+
+    @staticmethod
+    def _load(filename: Path) -> Optional[Any]:
+        try:
+            with open(filename, "rb") as fp:
+                return pickle.load(fp)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def load_splits(self) -> Optional[list]:
+        """Return the saved split indices, or None if they were not saved."""
+        return self._load(self.folder / "splits.pkl")
+
+    def save_splits(self, splits_indices: list) -> None:
+        _write_atomically(
+            self.folder / "splits.pkl",
+            pickle.dumps(splits_indices, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
+    def load_result(self, key: Hashable) -> Optional[Dict]:
+        """Return the result saved for the split `key`, or None if it was not saved."""
+        return self._load(self._result_filename(key))
+
+    def save_result(self, key: Hashable, result: Dict) -> None:
+        _write_atomically(
+            self._result_filename(key),
+            pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL),
+        )
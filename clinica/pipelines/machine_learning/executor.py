@@ -0,0 +1,221 @@
+"""Parallel execution of the evaluations of a cross-validation.
+
+The evaluations of the folds are sent to a pool of workers which are either
+threads or processes. With processes, the data of the algorithm (the kernel or the
+features, and the labels) is placed once in shared memory, or re-opened from its
+file when it is memory-mapped, so that tasks only transfer the indices of the
+train and test sets.
+
+The number of workers is capped across the nested levels: if N workers are
+available and the outer level runs P evaluations at the same time, each evaluation
+is given N // P workers for its inner grid search.
+"""
+
+import copy
+import mmap
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+__all__ = ["CrossValidationBackend", "CrossValidationExecutor", "SharedArray"]
+
+
+class CrossValidationBackend(str, Enum):
+    """The possible kinds of workers running the evaluations of a cross-validation."""
+
+    THREADS = "threads"
+    PROCESSES = "processes"
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Picklable description of an array which can be attached by other processes.
+
+    The array lives either in a block of shared memory (`shm_name`) or in
+    a memory-mapped file (`filename`).
+    """
+
+    shape: Tuple[int, ...]
+    dtype: str
+    shm_name: Optional[str] = None
+    filename: Optional[str] = None
+    offset: int = 0
+
+    @classmethod
+    def from_array(
+        cls, array: np.ndarray
+    ) -> Tuple["SharedArray", Optional[shared_memory.SharedMemory]]:
+        """Share the array with other processes.
+
+        Arrays memory-mapped from a named file are not copied.
+        Other arrays are copied into a new block of shared memory,
+        which is returned and must be released by the caller.
+        """
+        if (
+            isinstance(array, np.memmap)
+            and array.filename is not None
+            and isinstance(array.base, mmap.mmap)
+        ):
+            description = cls(
+                shape=array.shape,
+                dtype=array.dtype.str,
+                filename=str(array.filename),
+                offset=array.offset,
+            )
+            return description, None
+        array = np.ascontiguousarray(np.asarray(array))
+        memory = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[...] = array
+        description = cls(
+            shape=array.shape, dtype=array.dtype.str, shm_name=memory.name
+        )
+        return description, memory
+
+    def attach(self) -> Tuple[np.ndarray, Optional[shared_memory.SharedMemory]]:
+        """Return a read-only view of the array and the block of shared memory holding it.
+
+        The block must be kept referenced as long as the array is used.
+        """
+        if self.filename is not None:
+            array = np.memmap(
+                self.filename,
+                dtype=self.dtype,
+                mode="r",
+                shape=self.shape,
+                offset=self.offset,
+            )
+            return array, None
+        memory = shared_memory.SharedMemory(name=self.shm_name)
+        array = np.ndarray(self.shape, dtype=self.dtype, buffer=memory.buf)
+        array.flags.writeable = False
+        return array, memory
+
+
+_WORKER_ALGORITHM = None
+_WORKER_MEMORY: List[shared_memory.SharedMemory] = []
+
+
+def _initialize_worker(algorithm, shared_arrays: Dict[str, SharedArray]) -> None:
+    global _WORKER_ALGORITHM
+
+    for attribute, shared_array in shared_arrays.items():
+        array, memory = shared_array.attach()
+        setattr(algorithm, attribute, array)
+        if memory is not None:
+            _WORKER_MEMORY.append(memory)
+    _WORKER_ALGORITHM = algorithm
+
+
+def _run_in_worker(method: str, train_index: np.ndarray, test_index: np.ndarray):
+    return getattr(_WORKER_ALGORITHM, method)(train_index, test_index)
+
+
+def _get_data_attributes(ml_algorithm) -> List[str]:
+    return ["_kernel" if ml_algorithm.uses_kernel() else "_x", "_y"]
+
+
+class CrossValidationExecutor:
+    """Pool of workers running the evaluations of a cross-validation.
+
+    It must be used as a context manager, which releases the workers and the shared
+    memory on exit.
+
+    Parameters
+    ----------
+    ml_algorithm : MLAlgorithm
+        The algorithm whose methods are evaluated. It is not modified.
+
+    n_workers : int
+        The total number of workers available for the outer and inner levels.
+
+    n_tasks : int
+        The number of evaluations which will be submitted, used to split
+        the workers between the nested levels.
+
+    backend : str or CrossValidationBackend, optional
+        The kind of workers running the evaluations. Default="processes".
+    """
+
+    def __init__(
+        self,
+        ml_algorithm,
+        n_workers: int,
+        n_tasks: int,
+        backend: Union[str, CrossValidationBackend] = CrossValidationBackend.PROCESSES,
+    ):
+        self.backend = CrossValidationBackend(backend)
+        self.n_outer_workers = max(1, min(n_workers, n_tasks))
+        self.n_inner_workers = max(1, n_workers // self.n_outer_workers)
+        self._ml_algorithm = copy.copy(ml_algorithm)
+        self._ml_algorithm._algorithm_params = {
+            **ml_algorithm._algorithm_params,
+            "n_threads": self.n_inner_workers,
+        }
+        self._memory: List[shared_memory.SharedMemory] = []
+        self._pool = None
+
+    def __enter__(self) -> "CrossValidationExecutor":
+        if self.backend == CrossValidationBackend.THREADS:
+            self._pool = ThreadPoolExecutor(max_workers=self.n_outer_workers)
+            return self
+        shared_arrays = {}
+        try:
+            for attribute in _get_data_attributes(self._ml_algorithm):
+                shared_arrays[attribute], memory = SharedArray.from_array(
+                    getattr(self._ml_algorithm, attribute)
+                )
+                if memory is not None:
+                    self._memory.append(memory)
+                setattr(self._ml_algorithm, attribute, None)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_outer_workers,
+                initializer=_initialize_worker,
+                initargs=(self._ml_algorithm, shared_arrays),
+            )
+        except BaseException:
+            self._release_memory()
+            raise
+        return self
+
+    def __exit__(self, *args) -> None:
+        try:
+            self._pool.shutdown(wait=True, cancel_futures=args[0] is not None)
+        finally:
+            self._release_memory()
+
+    def _release_memory(self) -> None:
+        for memory in self._memory:
+            memory.close()
+            memory.unlink()
+        self._memory = []
+
+    def submit(
+        self, method: str, train_index: np.ndarray, test_index: np.ndarray
+    ) -> Future:
+        """Evaluate `method` of the algorithm on a split of the data.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method, like "evaluate" or "evaluate_no_cv".
+
+        train_index : np.ndarray
+            The indices of the training set.
+
+        test_index : np.ndarray
+            The indices of the test set.
+
+        Returns
+        -------
+        Future :
+            The future result of the evaluation.
+        """
+        if self.backend == CrossValidationBackend.THREADS:
+            return self._pool.submit(
+                getattr(self._ml_algorithm, method), train_index, test_index
+            )
+        return self._pool.submit(_run_in_worker, method, train_index, test_index)
@@ -10,9 +10,62 @@ import clinica.pipelines.machine_learning.tsv_based_io as tbio
 import clinica.pipelines.machine_learning.vertex_based_io as vtxbio
 import clinica.pipelines.machine_learning.voxel_based_io as vbio
 from clinica.pipelines.machine_learning import base
+from clinica.pipelines.machine_learning.kernel_cache import KernelCache
 from clinica.utils.stream import cprint
 
 
+def load_kernel(filename):
+    """Load a precomputed kernel saved in binary NumPy format (.npy) or as text."""
+    if str(filename).endswith(".npy"):
+        return np.load(filename)
+    return np.loadtxt(filename)
+
+
+def _get_kernel_name(kernel_function):
+    """
+    Returns: the name under which the kernel of `kernel_function` is cached, built
+    from its module, qualified name, code and default arguments, or None if the
+    function cannot be identified this way (callable objects, partials, closures).
+    """
+    import hashlib
+    import re
+
+    code = getattr(kernel_function, "__code__", None)
+    if code is None or code.co_freevars:
+        return None
+    description = repr(
+        (
+            code.co_code,
+            code.co_consts,
+            kernel_function.__defaults__,
+            kernel_function.__kwdefaults__,
+        )
+    )
+    name = re.sub(
+        r"\W", "_", f"{kernel_function.__module__}.{kernel_function.__qualname__}"
+    )
+    return f"{name}-{hashlib.sha256(description.encode()).hexdigest()[:16]}"
+
+
+def _compute_kernel(kernel_function, x, n_procs):
+    """
+    Returns: the kernel of x, computed with n_procs threads if `kernel_function`
+    accepts an `n_procs` keyword argument.
+    """
+    import inspect
+
+    try:
+        parameters = inspect.signature(kernel_function).parameters
+    except (TypeError, ValueError):
+        parameters = {}
+    if "n_procs" in parameters or any(
+        parameter.kind == inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters.values()
+    ):
+        return kernel_function(x, n_procs=n_procs)
+    return kernel_function(x)
+
+
 class CAPSInput(base.MLInput):
     def __init__(self, input_params):
         super().__init__(input_params)
@@ -52,7 +105,7 @@ class CAPSInput(base.MLInput):
                     or a filename to a numpy txt file containing an object with the described format."""
                     )
             elif type(self._input_params["precomputed_kernel"] == str):
-                self._kernel = np.loadtxt(self._input_params["precomputed_kernel"])
+                self._kernel = load_kernel(self._input_params["precomputed_kernel"])
             else:
                 raise Exception(
                     """Precomputed kernel provided is not in the correct format.
@@ -83,35 +136,107 @@ class CAPSInput(base.MLInput):
         self._y = np.array([unique.index(x) for x in self._diagnoses])
         return self._y
 
+    def get_cache(self):
+        """
+        Returns: the KernelCache entry of the images and input parameters,
+        or None if the input is not read from images.
+        """
+        if self.get_images() is None:
+            return None
+        excluded = (
+            "precomputed_kernel",
+            "n_threads",
+            "subjects_visits_tsv",
+            "diagnoses_tsv",
+        )
+        parameters = {
+            key: value
+            for key, value in self._input_params.items()
+            if key not in excluded
+        }
+        parameters["input"] = type(self).__name__
+        return KernelCache(self.get_images(), parameters)
+
     def get_kernel(
         self, kernel_function=utils.gram_matrix_linear, recompute_if_exists=False
     ):
         """
         Returns: a numpy 2d-array.
+
+        The kernel is read from the kernel cache when it was already computed
+        for the same images, input parameters and kernel function. Kernel
+        functions are identified by their module, qualified name, code and
+        default arguments: the kernels of callable objects, partials and
+        closures are not cached. `kernel_function` is given the number of
+        threads as `n_procs` keyword argument if it accepts it.
         """
         if self._kernel is not None and not recompute_if_exists:
             return self._kernel
 
+        cache = self.get_cache()
+        kernel_name = _get_kernel_name(kernel_function)
+        if cache is not None and kernel_name is not None and not recompute_if_exists:
+            self._kernel = cache.load_kernel(kernel_name)
+            if self._kernel is not None:
+                cprint(f"Kernel loaded from cache {cache.folder}")
+                return self._kernel
+
         if self._x is None:
             self.get_x()
 
         cprint("Computing kernel ...")
-        self._kernel = kernel_function(self._x)
+        self._kernel = _compute_kernel(
+            kernel_function, self._x, self._input_params.get("n_threads", 1)
+        )
+        if cache is not None and kernel_name is not None:
+            cache.save_kernel(self._kernel, kernel_name)
         cprint("Kernel computed")
         return self._kernel
 
+    def get_data_key(self):
+        """
+        Returns: a key identifying the images (paths, sizes and modification
+        times) and the input parameters, combined with the checksum of the
+        precomputed kernel, if any.
+        """
+        import hashlib
+
+        if (cache := self.get_cache()) is None:
+            key = super().get_data_key()
+        else:
+            key = cache.key
+        if self._input_params["precomputed_kernel"] is not None:
+            key += hashlib.sha256(np.ascontiguousarray(self._kernel).data).hexdigest()
+        return key
+
+    def _get_cached_x(self, load_data):
+        """
+        Returns: the features read from the kernel cache, or loaded with
+        `load_data` and written to the cache.
+        """
+        cache = self.get_cache()
+        if (features := cache.load_features()) is not None:
+            cprint(f"Subjects loaded from cache {cache.folder}")
+            return features[0]
+
+        cprint(f"Loading {len(self.get_images())} subjects")
+        x = load_data()
+        cache.save_features(x, x.shape[1:], None)
+        cprint("Subjects loaded")
+        return x
+
     def save_kernel(self, output_dir):
         """
 
         Args:
             output_dir:
 
-        Returns:
+        Returns: the path to the kernel saved in binary NumPy format.
 
         """
         if self._kernel is not None:
-            filename = path.join(output_dir, "kernel.txt")
-            np.savetxt(filename, self._kernel)
+            filename = path.join(output_dir, "kernel.npy")
+            np.save(filename, self._kernel)
             return filename
         raise Exception(
             "Unable to save the kernel. Kernel must have been computed before."
@@ -211,10 +336,21 @@ class CAPSVoxelBasedInput(CAPSInput):
         if self._x is not None:
             return self._x
 
+        cache = self.get_cache()
+        if (features := cache.load_features()) is not None:
+            self._x, self._orig_shape, self._data_mask = features
+            cprint(f"Subjects loaded from cache {cache.folder}")
+            return self._x
+
         cprint(f"Loading {len(self.get_images())} subjects")
+        cache.folder.mkdir(parents=True, exist_ok=True)
         self._x, self._orig_shape, self._data_mask = vbio.load_data(
-            self._images, mask=self._input_params["mask_zeros"]
+            self._images,
+            mask=self._input_params["mask_zeros"],
+            n_procs=self._input_params["n_threads"],
+            filename=cache.features_filename,
         )
+        cache.save_features(self._x, self._orig_shape, self._data_mask)
         cprint("Subjects loaded")
 
         return self._x
@@ -236,6 +372,7 @@ class CAPSVoxelBasedInput(CAPSInput):
         parameters_dict.setdefault("fwhm", 0)
         # t1-volume / pet-volume ?
         parameters_dict.setdefault("mask_zeros", True)
+        parameters_dict.setdefault("n_threads", 15)
         # t1-volume
         parameters_dict.setdefault("modulated", "on")
         # pet-volume
@@ -320,10 +457,9 @@ class CAPSRegionBasedInput(CAPSInput):
         if self._x is not None:
             return self._x
 
-        cprint(f"Loading {len(self.get_images())} subjects")
-        self._x = rbio.load_data(self._images, self._subjects)
-        cprint("Subjects loaded")
-
+        self._x = self._get_cached_x(
+            lambda: rbio.load_data(self._images, self._subjects)
+        )
         return self._x
 
     def save_weights_as_nifti(self, weights, output_dir):
@@ -416,9 +552,7 @@ class CAPSVertexBasedInput(CAPSInput):
         if self._x is not None:
             return self._x
 
-        cprint(f"Loading  str({len(self.get_images())} subjects")
-        self._x = vtxbio.load_data(self._images)
-        cprint(f"{len(self._x)} subjects loaded")
+        self._x = self._get_cached_x(lambda: vtxbio.load_data(self._images))
         return self._x
 
     def save_weights_as_datasurface(self, weights, output_dir):
@@ -0,0 +1,167 @@
+"""On-disk cache of the features and kernels computed by the machine learning inputs.
+
+A cache entry is a folder named after a key computed from the list of images
+(paths, sizes and modification times) and the input parameters. It contains:
+
+    - <kernel function>.npy : the kernel matrix, whose SHA256 checksum is stored
+      in metadata.json
+    - features.dat : the raw feature matrix (float32 for voxel-based inputs)
+    - mask.npy : the mask of the voxels kept in the feature matrix, if any
+    - metadata.json : the shapes and checksums needed to validate the entry
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from clinica.utils.filemanip import get_cache_folder
+
+__all__ = ["KernelCache"]
+
+
+def _compute_checksum(array: np.ndarray) -> str:
+    return hashlib.sha256(np.ascontiguousarray(array).data).hexdigest()
+
+
+def _is_memmap_of(array: np.ndarray, filename: Path) -> bool:
+    return (
+        isinstance(array, np.memmap)
+        and array.filename is not None
+        and Path(array.filename).resolve() == filename.resolve()
+    )
+
+
+def _describe_image(image: str) -> List:
+    stat = os.stat(image)
+    return [str(Path(image).resolve()), stat.st_size, stat.st_mtime_ns]
+
+
+class KernelCache:
+    """Cache entry for the kernel and features computed from a list of images.
+
+    Parameters
+    ----------
+    images : List of str
+        The images from which features are extracted, in the order of the rows.
+
+    parameters : dict
+        The parameters of the feature extraction and kernel computation.
+        Values which are not JSON-serializable are converted to strings.
+
+    folder : Path, optional
+        The root folder of the cache. Default is the 'kernels' folder given by
+        `get_cache_folder`.
+    """
+
+    def __init__(
+        self, images: List[str], parameters: Dict, folder: Optional[Path] = None
+    ):
+        description = json.dumps(
+            {
+                "images": [_describe_image(image) for image in images],
+                "parameters": parameters,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        self.key = hashlib.sha256(description.encode()).hexdigest()
+        self.folder = (folder or get_cache_folder("kernels")) / self.key
+
+    @property
+    def features_filename(self) -> Path:
+        return self.folder / "features.dat"
+
+    def _read_metadata(self) -> Dict:
+        try:
+            with open(self.folder / "metadata.json") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return {}
+
+    def _update_metadata(self, **kwargs) -> None:
+        metadata = self._read_metadata()
+        metadata.update(kwargs)
+        with open(self.folder / "metadata.json", "w") as fp:
+            json.dump(metadata, fp)
+
+    def load_kernel(self, name: str = "gram_matrix_linear") -> Optional[np.ndarray]:
+        """Return the cached kernel, or None if it is missing or corrupted.
+
+        Parameters
+        ----------
+        name : str, optional
+            The name of the kernel function. Default="gram_matrix_linear".
+        """
+        from clinica.utils.stream import cprint
+
+        if (checksum := self._read_metadata().get(f"{name}_sha256")) is None:
+            return None
+        try:
+            kernel = np.load(self.folder / f"{name}.npy")
+        except (OSError, ValueError):
+            return None
+        if _compute_checksum(kernel) != checksum:
+            cprint(f"Cached kernel in {self.folder} is corrupted.", lvl="warning")
+            return None
+        return kernel
+
+    def save_kernel(self, kernel: np.ndarray, name: str = "gram_matrix_linear") -> None:
+        self.folder.mkdir(parents=True, exist_ok=True)
+        np.save(self.folder / f"{name}.npy", kernel)
+        self._update_metadata(**{f"{name}_sha256": _compute_checksum(kernel)})
+
+    def load_features(
+        self,
+    ) -> Optional[Tuple[np.memmap, Tuple[int, ...], Optional[np.ndarray]]]:
+        """Return the cached (features, image shape, mask), or None if they are missing.
+
+        The features are memory-mapped in read-only mode.
+        """
+        metadata = self._read_metadata()
+        if "features_shape" not in metadata:
+            return None
+        shape = tuple(metadata["features_shape"])
+        dtype = np.dtype(metadata.get("features_dtype", "float32"))
+        try:
+            if self.features_filename.stat().st_size != dtype.itemsize * int(
+                np.prod(shape)
+            ):
+                return None
+            mask = np.load(self.folder / "mask.npy") if metadata["masked"] else None
+        except (OSError, ValueError):
+            return None
+        if mask is not None and _compute_checksum(mask) != metadata["mask_sha256"]:
+            return None
+        features = np.memmap(self.features_filename, dtype=dtype, mode="r", shape=shape)
+        return features, tuple(metadata["image_shape"]), mask
+
+    def save_features(
+        self,
+        features: np.ndarray,
+        image_shape: Tuple[int, ...],
+        mask: Optional[np.ndarray],
+    ) -> None:
+        """Record the features as valid.
+
+        The features are written to `features_filename`, unless they are
+        a memory-map of this file already.
+        """
+        self.folder.mkdir(parents=True, exist_ok=True)
+        if not _is_memmap_of(features, self.features_filename):
+            tmp = self.features_filename.with_suffix(f".{os.getpid()}.tmp")
+            np.ascontiguousarray(features).tofile(tmp)
+            os.replace(tmp, self.features_filename)
+        metadata = {
+            "features_shape": list(features.shape),
+            "features_dtype": features.dtype.str,
+            "image_shape": list(image_shape),
+            "masked": mask is not None,
+        }
+        if mask is not None:
+            np.save(self.folder / "mask.npy", mask)
+            metadata["mask_sha256"] = _compute_checksum(mask)
+        self._update_metadata(**metadata)
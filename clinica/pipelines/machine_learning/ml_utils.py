@@ -77,8 +77,46 @@ def evaluate_prediction(y, y_hat):
     return results
 
 
-def gram_matrix_linear(data):
-    return np.dot(data, data.transpose())
+def _partial_gram_matrix(data, blocks):
+    gram = np.zeros((data.shape[0], data.shape[0]))
+    for start, stop in blocks:
+        block = np.asarray(data[:, start:stop], dtype=np.float64)
+        gram += np.dot(block, block.transpose())
+    return gram
+
+
+def gram_matrix_linear(data, n_procs=1, block_size=65536):
+    """Compute the linear kernel of the data, block of features by block of features.
+
+    The kernel is accumulated in float64 over blocks of `block_size` columns, such that
+    only one block per worker is loaded in memory when `data` is a numpy.memmap.
+
+    Args:
+        data: The (n_samples, n_features) data matrix.
+        n_procs: Number of threads computing the blocks in parallel.
+        block_size: Number of features per block.
+
+    Returns:
+        The (n_samples, n_samples) float64 kernel matrix.
+    """
+    from functools import partial
+
+    from clinica.utils.parallel import map_in_chunks
+
+    n_features = data.shape[1]
+    blocks = [
+        (start, min(start + block_size, n_features))
+        for start in range(0, n_features, block_size)
+    ]
+    groups = [
+        group
+        for group in np.array_split(np.array(blocks), max(1, min(len(blocks), n_procs)))
+        if len(group)
+    ]
+    partial_grams = map_in_chunks(
+        partial(_partial_gram_matrix, data), groups, n_procs=n_procs, chunk_size=1
+    )
+    return sum(partial_grams, _partial_gram_matrix(data, []))
 
 
 def evaluate_prediction_multiclass(y, y_hat):
@@ -1,5 +1,4 @@
 import os
-from multiprocessing.pool import ThreadPool
 from os import path
 
 import numpy as np
@@ -7,10 +6,12 @@ import pandas as pd
 from sklearn.model_selection import StratifiedKFold, StratifiedShuffleSplit
 
 from clinica.pipelines.machine_learning import base
+from clinica.pipelines.machine_learning.executor import CrossValidationExecutor
 
 
 class KFoldCV(base.MLValidation):
     def validate(self, y):
+        self._load_splits_indices()
         if not self._validation_params["splits_indices"]:
             skf = StratifiedKFold(
                 n_splits=self._validation_params["n_folds"], shuffle=True
@@ -18,21 +19,18 @@ class KFoldCV(base.MLValidation):
             self._validation_params["splits_indices"] = list(
                 skf.split(np.zeros(len(y)), y)
             )
+        self._save_splits_indices()
 
-        async_pool = ThreadPool(self._validation_params["n_threads"])
-        async_result = {}
-
-        for i in range(self._validation_params["n_folds"]):
-            train_index, test_index = self._validation_params["splits_indices"][i]
-            async_result[i] = async_pool.apply_async(
-                self._ml_algorithm.evaluate, (train_index, test_index)
-            )
-
-        async_pool.close()
-        async_pool.join()
+        results = self._evaluate_splits(
+            "evaluate",
+            {
+                f"fold-{i}": self._validation_params["splits_indices"][i]
+                for i in range(self._validation_params["n_folds"])
+            },
+        )
 
         for i in range(self._validation_params["n_folds"]):
-            self._validation_results.append(async_result[i].get())
+            self._validation_results.append(results[f"fold-{i}"])
 
         self._classifier, self._best_params = self._ml_algorithm.apply_best_parameters(
             self._validation_results
@@ -141,6 +139,7 @@ class KFoldCV(base.MLValidation):
         parameters_dict = {
             "n_folds": 10,
             "n_threads": 15,
+            "backend": "processes",
             "splits_indices": None,
             "inner_cv": True,
         }
@@ -150,6 +149,7 @@ class KFoldCV(base.MLValidation):
 
 class RepeatedKFoldCV(base.MLValidation):
     def validate(self, y):
+        self._load_splits_indices()
         if not self._validation_params["splits_indices"]:
             self._validation_params["splits_indices"] = []
 
@@ -160,33 +160,26 @@ class RepeatedKFoldCV(base.MLValidation):
                 self._validation_params["splits_indices"].append(
                     list(skf.split(np.zeros(len(y)), y))
                 )
+        self._save_splits_indices()
 
-        async_pool = ThreadPool(self._validation_params["n_threads"])
-        async_result = {}
-
-        for i in range(self._validation_params["n_iterations"]):
-            train_index, test_index = self._validation_params["splits_indices"][i]
-            async_result[i] = async_pool.apply_async(
-                self._ml_algorithm.evaluate, (train_index, test_index)
-            )
-
-        for r in range(self._validation_params["n_iterations"]):
-            async_result[r] = {}
-            self._validation_results.append([])
-
-            for i in range(self._validation_params["n_folds"]):
-                train_index, test_index = self._validation_params["splits_indices"][r][
+        results = self._evaluate_splits(
+            "evaluate",
+            {
+                f"iteration-{r}_fold-{i}": self._validation_params["splits_indices"][r][
                     i
                 ]
-                async_result[r][i] = async_pool.apply_async(
-                    self._ml_algorithm.evaluate, (train_index, test_index)
-                )
+                for r in range(self._validation_params["n_iterations"])
+                for i in range(self._validation_params["n_folds"])
+            },
+        )
 
-        async_pool.close()
-        async_pool.join()
         for r in range(self._validation_params["n_iterations"]):
-            for i in range(self._validation_params["n_folds"]):
-                self._validation_results[r].append(async_result[r][i].get())
+            self._validation_results.append(
+                [
+                    results[f"iteration-{r}_fold-{i}"]
+                    for i in range(self._validation_params["n_folds"])
+                ]
+            )
 
         # TODO Find a better way to estimate best parameter
         flat_results = [result for fold in self._validation_results for result in fold]
@@ -341,6 +334,7 @@ class RepeatedKFoldCV(base.MLValidation):
             "n_iterations": 100,
             "n_folds": 10,
             "n_threads": 15,
+            "backend": "processes",
             "splits_indices": None,
             "inner_cv": True,
         }
@@ -350,6 +344,7 @@ class RepeatedKFoldCV(base.MLValidation):
 
 class RepeatedHoldOut(base.MLValidation):
     def validate(self, y):
+        self._load_splits_indices()
         if not self._validation_params["splits_indices"]:
             splits = StratifiedShuffleSplit(
                 n_splits=self._validation_params["n_iterations"],
@@ -358,26 +353,18 @@ class RepeatedHoldOut(base.MLValidation):
             self._validation_params["splits_indices"] = list(
                 splits.split(np.zeros(len(y)), y)
             )
+        self._save_splits_indices()
 
-        async_pool = ThreadPool(self._validation_params["n_threads"])
-        async_result = {}
-
-        for i in range(self._validation_params["n_iterations"]):
-            train_index, test_index = self._validation_params["splits_indices"][i]
-            if self._validation_params["inner_cv"]:
-                async_result[i] = async_pool.apply_async(
-                    self._ml_algorithm.evaluate, (train_index, test_index)
-                )
-            else:
-                async_result[i] = async_pool.apply_async(
-                    self._ml_algorithm.evaluate_no_cv, (train_index, test_index)
-                )
-
-        async_pool.close()
-        async_pool.join()
+        results = self._evaluate_splits(
+            "evaluate" if self._validation_params["inner_cv"] else "evaluate_no_cv",
+            {
+                f"iteration-{i}": self._validation_params["splits_indices"][i]
+                for i in range(self._validation_params["n_iterations"])
+            },
+        )
 
         for i in range(self._validation_params["n_iterations"]):
-            self._validation_results.append(async_result[i].get())
+            self._validation_results.append(results[f"iteration-{i}"])
 
         self._classifier, self._best_params = self._ml_algorithm.apply_best_parameters(
             self._validation_results
@@ -520,6 +507,7 @@ class RepeatedHoldOut(base.MLValidation):
             "n_iterations": 100,
             "test_size": 0.2,
             "n_threads": 15,
+            "backend": "processes",
             "splits_indices": None,
             "inner_cv": True,
         }
@@ -529,6 +517,7 @@ class RepeatedHoldOut(base.MLValidation):
 
 class LearningCurveRepeatedHoldOut(base.MLValidation):
     def validate(self, y):
+        self._load_splits_indices()
         if not self._validation_params["splits_indices"]:
             splits = StratifiedShuffleSplit(
                 n_splits=self._validation_params["n_iterations"],
@@ -537,13 +526,12 @@ class LearningCurveRepeatedHoldOut(base.MLValidation):
             self._validation_params["splits_indices"] = list(
                 splits.split(np.zeros(len(y)), y)
             )
+        self._save_splits_indices()
 
-        async_pool = ThreadPool(self._validation_params["n_threads"])
-        async_result = {}
+        learning_splits = {}
 
         for i in range(self._validation_params["n_iterations"]):
             train_index, test_index = self._validation_params["splits_indices"][i]
-            async_result[i] = {}
 
             skf = StratifiedKFold(
                 n_splits=self._validation_params["n_learning_points"], shuffle=False
@@ -556,18 +544,17 @@ class LearningCurveRepeatedHoldOut(base.MLValidation):
                 inner_train_index = np.concatenate(
                     [indexes[1] for indexes in inner_cv_splits[: j + 1]]
                 ).ravel()
-                async_result[i][j] = async_pool.apply_async(
-                    self._ml_algorithm.evaluate,
-                    (train_index[inner_train_index], test_index),
+                learning_splits[f"iteration-{i}_point-{j}"] = (
+                    train_index[inner_train_index],
+                    test_index,
                 )
 
-        async_pool.close()
-        async_pool.join()
+        results = self._evaluate_splits("evaluate", learning_splits)
 
         for j in range(self._validation_params["n_learning_points"]):
             learning_point_results = []
             for i in range(self._validation_params["n_iterations"]):
-                learning_point_results.append(async_result[i][j].get())
+                learning_point_results.append(results[f"iteration-{i}_point-{j}"])
 
             self._validation_results.append(learning_point_results)
 
@@ -700,6 +687,7 @@ class LearningCurveRepeatedHoldOut(base.MLValidation):
             "test_size": 0.2,
             "n_learning_points": 10,
             "n_threads": 15,
+            "backend": "processes",
             "splits_indices": None,
             "inner_cv": True,
         }
@@ -716,27 +704,27 @@ class RepeatedKFoldCV_Multiclass(base.MLValidation):
         self._cv = None
 
     def validate(self, y, n_iterations=100, n_folds=10, n_threads=15):
-        async_pool = ThreadPool(self._validation_params["n_threads"])
         async_result = {}
         self._cv = []
 
-        for r in range(n_iterations):
-            skf = StratifiedKFold(n_splits=n_folds, shuffle=True)
-            self._cv.append(list(skf.split(np.zeros(len(y)), y)))
-            async_result[r] = {}
-            self._repeated_validation_results.append([])
-
-            for i in range(n_folds):
-                train_index, test_index = self._cv[r][i]
-                async_result[r][i] = async_pool.apply_async(
-                    self._ml_algorithm.evaluate, (train_index, test_index)
-                )
+        with CrossValidationExecutor(
+            self._ml_algorithm, n_threads, n_iterations * n_folds
+        ) as executor:
+            for r in range(n_iterations):
+                skf = StratifiedKFold(n_splits=n_folds, shuffle=True)
+                self._cv.append(list(skf.split(np.zeros(len(y)), y)))
+                async_result[r] = {}
+                self._repeated_validation_results.append([])
+
+                for i in range(n_folds):
+                    train_index, test_index = self._cv[r][i]
+                    async_result[r][i] = executor.submit(
+                        "evaluate", train_index, test_index
+                    )
 
-        async_pool.close()
-        async_pool.join()
         for r in range(n_iterations):
             for i in range(n_folds):
-                self._repeated_validation_results[r].append(async_result[r][i].get())
+                self._repeated_validation_results[r].append(async_result[r][i].result())
 
         # TODO Find a better way to estimate best parameter
         flat_results = [
@@ -2,38 +2,64 @@ import nibabel as nib
 import numpy as np
 
 
-def load_data(image_list, mask=True):
-    """
+def _load_image_data(image):
+    """Load the voxel values of an image as a flat float32 array without NaNs."""
+    return np.nan_to_num(nib.load(image).get_fdata(dtype="float32").ravel())
 
-    Args:
-        image_list:
-        mask:
 
-    Returns:
+def _compute_nonzero_mask(image_list):
+    """Compute the mask of the voxels which are nonzero in at least one image."""
+    mask = None
+    for image in image_list:
+        nonzero = _load_image_data(image) != 0
+        mask = nonzero if mask is None else mask | nonzero
+    return mask
 
-    """
-    data = None
-    shape = None
-    data_mask = None
-    first = True
 
-    for i in range(len(image_list)):
-        subj = nib.load(image_list[i])
-        subj_data = np.nan_to_num(subj.get_fdata(dtype="float32").flatten())
+def load_data(image_list, mask=True, n_procs=1, filename=None):
+    """Load the images into a float32 (n_images, n_voxels) matrix backed by a file.
 
-        # Memory allocation for ndarray containing all data to avoid copying the array for each new subject
-        if first:
-            data = np.ndarray(
-                shape=(len(image_list), subj_data.shape[0]), dtype=float, order="C"
-            )
-            shape = subj.get_fdata(dtype="float32").shape
-            first = False
+    The images are streamed twice: a first pass computes the mask of the voxels
+    which are nonzero in at least one image, and a second pass fills the rows of
+    the matrix with the masked voxels. Only one image per worker is held in memory.
 
-        data[i, :] = subj_data
+    Args:
+        image_list: List of paths to the 3D images to load.
+        mask: If True, only the voxels which are nonzero in at least one image are kept.
+        n_procs: Number of threads used to load the images.
+        filename: Path to the file backing the matrix. If not provided, an anonymous
+            temporary file is used, which is deleted when the matrix is released.
 
+    Returns:
+        data: The numpy.memmap (n_images, n_kept_voxels) matrix.
+        shape: The shape of the images.
+        data_mask: The boolean mask of kept voxels, or None if mask is False.
+    """
+    import tempfile
+
+    from clinica.utils.parallel import map_in_chunks
+
+    shape = nib.load(image_list[0]).shape
+    data_mask = None
     if mask:
-        data_mask = (data != 0).sum(axis=0) != 0
-        data = data[:, data_mask]
+        chunks = np.array_split(image_list, max(1, min(len(image_list), 4 * n_procs)))
+        data_mask = np.logical_or.reduce(
+            map_in_chunks(_compute_nonzero_mask, chunks, n_procs=n_procs)
+        )
+    n_features = int(data_mask.sum()) if mask else int(np.prod(shape))
+    data = np.memmap(
+        filename if filename is not None else tempfile.TemporaryFile(),
+        dtype="float32",
+        mode="w+",
+        shape=(len(image_list), n_features),
+    )
+
+    def fill_row(i):
+        subj_data = _load_image_data(image_list[i])
+        data[i, :] = subj_data[data_mask] if mask else subj_data
+
+    map_in_chunks(fill_row, range(len(image_list)), n_procs=n_procs)
+    data.flush()
 
     return data, shape, data_mask
 
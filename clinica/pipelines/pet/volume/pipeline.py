@@ -479,11 +479,9 @@ class PETVolume(PETPipeline):
         from clinica.utils.spm import use_spm_standalone_if_available
 
         from .tasks import (
-            apply_binary_mask_task,
-            compute_atlas_statistics_task,
+            compute_suvr_images_task,
             create_binary_mask_task,
             create_pvc_mask_task,
-            normalize_to_reference_task,
         )
         from .utils import (
             build_pet_pvc_name,
@@ -563,17 +561,6 @@ class PETVolume(PETPipeline):
         # ======================================
         reslice = npe.Node(spmutils.Reslice(), name="reslice")
 
-        # Normalize PET values according to reference region
-        # ==================================================
-        norm_to_ref = npe.Node(
-            nutil.Function(
-                input_names=["pet_image", "region_mask"],
-                output_names=["suvr_pet_path"],
-                function=normalize_to_reference_task,
-            ),
-            name="norm_to_ref",
-        )
-
         # Create binary mask from segmented tissues
         # =========================================
         binary_mask = npe.Node(
@@ -586,16 +573,22 @@ class PETVolume(PETPipeline):
         )
         binary_mask.inputs.threshold = self.parameters["mask_threshold"]
 
-        # Mask PET image
-        # ==============
-        apply_mask = npe.Node(
+        # Normalize PET values according to reference region, mask
+        # the SUVR image and compute its atlas statistics in memory
+        # =========================================================
+        suvr = npe.Node(
             nutil.Function(
-                input_names=["image", "binary_mask"],
-                output_names=["masked_image_path"],
-                function=apply_binary_mask_task,
+                input_names=["pet_image", "region_mask", "binary_mask", "atlas_names"],
+                output_names=[
+                    "suvr_pet_path",
+                    "masked_image_path",
+                    "atlas_statistics",
+                ],
+                function=compute_suvr_images_task,
             ),
-            name="apply_mask",
+            name="suvr",
         )
+        suvr.inputs.atlas_names = self.parameters["atlases"]
 
         # Smoothing
         # =========
@@ -609,7 +602,7 @@ class PETVolume(PETPipeline):
             ]
             self.connect(
                 [
-                    (apply_mask, smoothing_node, [("masked_image_path", "in_files")]),
+                    (suvr, smoothing_node, [("masked_image_path", "in_files")]),
                     (
                         smoothing_node,
                         self.output_node,
@@ -620,19 +613,6 @@ class PETVolume(PETPipeline):
         else:
             self.output_node.inputs.pet_suvr_masked_smoothed = [[]]
 
-        # Atlas Statistics
-        # ================
-        atlas_stats_node = npe.MapNode(
-            nutil.Function(
-                input_names=["image", "atlas_names"],
-                output_names=["atlas_statistics"],
-                function=compute_atlas_statistics_task,
-            ),
-            name="atlas_stats_node",
-            iterfield=["in_image"],
-        )
-        atlas_stats_node.inputs.atlas_names = self.parameters["atlases"]
-
         self.connect(
             [
                 (self.input_node, init_node, [("pet_image", "pet_nii")]),
@@ -670,28 +650,24 @@ class PETVolume(PETPipeline):
                     [("coregistered_source", "apply_to_files")],
                 ),
                 (dartel_mni_reg, reslice, [("normalized_files", "space_defining")]),
-                (dartel_mni_reg, norm_to_ref, [("normalized_files", "pet_image")]),
-                (reslice, norm_to_ref, [("out_file", "region_mask")]),
-                (norm_to_ref, apply_mask, [("suvr_pet_path", "image")]),
-                (binary_mask, apply_mask, [("out_mask", "binary_mask")]),
-                (norm_to_ref, atlas_stats_node, [("suvr_pet_path", "image")]),
+                (dartel_mni_reg, suvr, [("normalized_files", "pet_image")]),
+                (reslice, suvr, [("out_file", "region_mask")]),
+                (binary_mask, suvr, [("out_mask", "binary_mask")]),
                 (
                     coreg_pet_t1,
                     self.output_node,
                     [("coregistered_source", "pet_t1_native")],
                 ),
                 (dartel_mni_reg, self.output_node, [("normalized_files", "pet_mni")]),
-                (norm_to_ref, self.output_node, [("suvr_pet_path", "pet_suvr")]),
                 (binary_mask, self.output_node, [("out_mask", "binary_mask")]),
                 (
-                    apply_mask,
-                    self.output_node,
-                    [("masked_image_path", "pet_suvr_masked")],
-                ),
-                (
-                    atlas_stats_node,
+                    suvr,
                     self.output_node,
-                    [("atlas_statistics", "atlas_statistics")],
+                    [
+                        ("suvr_pet_path", "pet_suvr"),
+                        ("masked_image_path", "pet_suvr_masked"),
+                        ("atlas_statistics", "atlas_statistics"),
+                    ],
                 ),
             ]
         )
@@ -739,27 +715,28 @@ class PETVolume(PETPipeline):
             # ======================================
             reslice_pvc = npe.Node(spmutils.Reslice(), name="reslice_pvc")
 
-            # Normalize PET values according to reference region
-            # ==================================================
-            norm_to_ref_pvc = npe.Node(
+            # Normalize PET values according to reference region, mask
+            # the SUVR image and compute its atlas statistics in memory
+            # =========================================================
+            suvr_pvc = npe.Node(
                 nutil.Function(
-                    input_names=["pet_image", "region_mask"],
-                    output_names=["suvr_pet_path"],
-                    function=normalize_to_reference_task,
+                    input_names=[
+                        "pet_image",
+                        "region_mask",
+                        "binary_mask",
+                        "atlas_names",
+                    ],
+                    output_names=[
+                        "suvr_pet_path",
+                        "masked_image_path",
+                        "atlas_statistics",
+                    ],
+                    function=compute_suvr_images_task,
                 ),
-                name="norm_to_ref_pvc",
+                name="suvr_pvc",
             )
+            suvr_pvc.inputs.atlas_names = self.parameters["atlases"]
 
-            # Mask PET image
-            # ==============
-            apply_mask_pvc = npe.Node(
-                nutil.Function(
-                    input_names=["image", "binary_mask"],
-                    output_names=["masked_image_path"],
-                    function=apply_binary_mask_task,
-                ),
-                name="apply_mask_pvc",
-            )
             # Smoothing
             # =========
             if (
@@ -778,7 +755,7 @@ class PETVolume(PETPipeline):
                 self.connect(
                     [
                         (
-                            apply_mask_pvc,
+                            suvr_pvc,
                             smoothing_pvc,
                             [("masked_image_path", "in_files")],
                         ),
@@ -791,19 +768,6 @@ class PETVolume(PETPipeline):
                 )
             else:
                 self.output_node.inputs.pet_pvc_suvr_masked_smoothed = [[]]
-            # Atlas Statistics
-            # ================
-            atlas_stats_pvc = npe.MapNode(
-                nutil.Function(
-                    input_names=["image", "atlas_names"],
-                    output_names=["atlas_statistics"],
-                    function=compute_atlas_statistics_task,
-                ),
-                name="atlas_stats_pvc",
-                iterfield=["in_image"],
-            )
-            atlas_stats_pvc.inputs.in_atlas_names = self.parameters["atlases"]
-
             # Connection
             # ==========
             self.connect(
@@ -854,13 +818,11 @@ class PETVolume(PETPipeline):
                     ),
                     (
                         dartel_mni_reg_pvc,
-                        norm_to_ref_pvc,
+                        suvr_pvc,
                         [("normalized_files", "pet_image")],
                     ),
-                    (reslice_pvc, norm_to_ref_pvc, [("out_file", "region_mask")]),
-                    (norm_to_ref_pvc, apply_mask_pvc, [("suvr_pet_path", "image")]),
-                    (binary_mask, apply_mask_pvc, [("out_mask", "binary_mask")]),
-                    (norm_to_ref_pvc, atlas_stats_pvc, [("suvr_pet_path", "image")]),
+                    (reslice_pvc, suvr_pvc, [("out_file", "region_mask")]),
+                    (binary_mask, suvr_pvc, [("out_mask", "binary_mask")]),
                     (petpvc, self.output_node, [("out_file", "pet_pvc")]),
                     (
                         dartel_mni_reg_pvc,
@@ -868,19 +830,13 @@ class PETVolume(PETPipeline):
                         [("normalized_files", "pet_pvc_mni")],
                     ),
                     (
-                        norm_to_ref_pvc,
+                        suvr_pvc,
                         self.output_node,
-                        [("suvr_pet_path", "pet_pvc_suvr")],
-                    ),
-                    (
-                        apply_mask_pvc,
-                        self.output_node,
-                        [("masked_image_path", "pet_pvc_suvr_masked")],
-                    ),
-                    (
-                        atlas_stats_pvc,
-                        self.output_node,
-                        [("atlas_statistics", "pvc_atlas_statistics")],
+                        [
+                            ("suvr_pet_path", "pet_pvc_suvr"),
+                            ("masked_image_path", "pet_pvc_suvr_masked"),
+                            ("atlas_statistics", "pvc_atlas_statistics"),
+                        ],
                     ),
                 ]
             )
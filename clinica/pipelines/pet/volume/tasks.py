@@ -1,19 +1,3 @@
-def apply_binary_mask_task(image: str, binary_mask: str) -> str:
-    from pathlib import Path
-
-    from clinica.pipelines.pet.volume.utils import apply_binary_mask
-
-    return str(apply_binary_mask(Path(image), Path(binary_mask)))
-
-
-def compute_atlas_statistics_task(image: str, atlas_names: list) -> list:
-    from pathlib import Path
-
-    from clinica.pipelines.pet.volume.utils import compute_atlas_statistics
-
-    return [str(p) for p in compute_atlas_statistics(Path(image), atlas_names)]
-
-
 def create_binary_mask_task(
     tissues: list,
     threshold: float = 0.3,
@@ -33,9 +17,18 @@ def create_pvc_mask_task(tissues: list) -> str:
     return str(create_pvc_mask([Path(tissue) for tissue in tissues]))
 
 
-def normalize_to_reference_task(pet_image: str, region_mask: str) -> str:
+def compute_suvr_images_task(
+    pet_image: str, region_mask: str, binary_mask: str, atlas_names: list
+) -> tuple:
     from pathlib import Path
 
-    from clinica.pipelines.pet.volume.utils import normalize_to_reference
+    from clinica.pipelines.pet.volume.utils import compute_suvr_images
 
-    return str(normalize_to_reference(Path(pet_image), Path(region_mask)))
+    suvr_pet_path, masked_image_path, atlas_statistics = compute_suvr_images(
+        Path(pet_image), Path(region_mask), Path(binary_mask), atlas_names
+    )
+    return (
+        str(suvr_pet_path),
+        str(masked_image_path),
+        [str(p) for p in atlas_statistics],
+    )
@@ -15,6 +15,7 @@ __all__ = [
     "init_input_node",
     "normalize_to_reference",
     "build_pet_pvc_name",
+    "compute_suvr_images",
 ]
 
 
@@ -68,7 +69,7 @@ def _aggregate_tissue_images(
     """
     _check_non_empty_tissue_list(tissues)
     first_image = nib.load(tissues[0])
-    data = np.zeros(shape=list(first_image.get_fdata(dtype="float32").shape))
+    data = np.zeros(shape=first_image.shape)
     for image in tissues:
         data += nib.load(image).get_fdata(dtype="float32")
     return data, first_image.affine, first_image.header
@@ -148,17 +149,15 @@ def create_pvc_mask(tissues: List[PathLike]) -> Path:
     out_mask : Path
         The path to the resulting mask Nifti1Image.
     """
-    background, affine, header = _aggregate_tissue_images(tissues)
-    shape = background.shape
-    shape += tuple([len(tissues) + 1])
-    data = np.empty(shape=shape, dtype=np.float64)
+    _check_non_empty_tissue_list(tissues)
+    first_image = nib.load(tissues[0])
+    data = np.empty(shape=first_image.shape + (len(tissues) + 1,), dtype=np.float64)
     for i, tissue in enumerate(tissues):
-        image = nib.load(tissue)
-        data[..., i] = np.array(image.get_fdata(dtype="float32"))
-    background = 1.0 - background
-    data[..., len(tissues)] = np.array(background)
+        data[..., i] = nib.load(tissue).get_fdata(dtype="float32")
+    # The background is computed from the tissues loaded above.
+    data[..., len(tissues)] = 1.0 - data[..., : len(tissues)].sum(axis=-1)
     out_mask = Path.cwd() / "pvc_mask.nii"
-    mask = nib.Nifti1Image(data, affine, header=header)
+    mask = nib.Nifti1Image(data, first_image.affine, header=first_image.header)
     nib.save(mask, out_mask)
 
     return out_mask
@@ -213,10 +212,9 @@ def normalize_to_reference(pet_image: Path, region_mask: Path) -> Path:
         The path to the normalized Nifti1Image.
     """
     pet = nib.load(pet_image)
-    ref = nib.load(region_mask)
-    region = pet.get_fdata(dtype="float32") * ref.get_fdata(dtype="float32")
-    region_mean = np.nanmean(np.where(region != 0, region, np.nan))
-    data = pet.get_fdata(dtype="float32") / region_mean
+    data = _normalize_to_reference(
+        pet.get_fdata(dtype="float32"), nib.load(region_mask).get_fdata(dtype="float32")
+    )
     suvr_pet_path = Path.cwd() / f"suvr_{pet_image.name}"
     suvr_pet = nib.Nifti1Image(data, pet.affine, header=pet.header)
     nib.save(suvr_pet, suvr_pet_path)
@@ -224,6 +222,81 @@ def normalize_to_reference(pet_image: Path, region_mask: Path) -> Path:
     return suvr_pet_path
 
 
+def _normalize_to_reference(pet: np.ndarray, region_mask: np.ndarray) -> np.ndarray:
+    """Divide the PET data by its mean value on the non-zero voxels of the region."""
+    region = pet * region_mask
+    region_mean = np.nanmean(np.where(region != 0, region, np.nan))
+    return pet / region_mean
+
+
+def compute_suvr_images(
+    pet_image: Path,
+    region_mask: Path,
+    binary_mask: Path,
+    atlas_names: List[str],
+) -> Tuple[Path, Path, List[Path]]:
+    """Compute the SUVR images of the PET image and their atlas statistics.
+
+    This chains `normalize_to_reference`, `apply_binary_mask` and
+    `compute_atlas_statistics` in memory: each input image is loaded once,
+    and the SUVR data is masked and parcellated without being read back
+    from the disk. The output files are the same as the ones of these
+    functions.
+
+    Parameters
+    ----------
+    pet_image : Path
+        The path to the Nifti1Image which should be normalized.
+
+    region_mask : Path
+        The path to the mask of the reference region.
+
+    binary_mask : Path
+        The path to the brain mask applied to the SUVR image.
+
+    atlas_names : List of str
+        List of names of atlas to be applied on the SUVR image.
+
+    Returns
+    -------
+    suvr_pet_path : Path
+        The path to the normalized Nifti1Image.
+
+    masked_image_path : Path
+        The path to the masked normalized Nifti1Image.
+
+    atlas_statistics : List of paths
+        List of paths to TSV files.
+    """
+    from clinica.utils.filemanip import get_filename_no_ext
+    from clinica.utils.statistics import statistics_on_atlases
+
+    pet = nib.load(pet_image)
+    suvr = _normalize_to_reference(
+        pet.get_fdata(dtype="float32"), nib.load(region_mask).get_fdata(dtype="float32")
+    )
+    suvr_pet = nib.Nifti1Image(suvr, pet.affine, header=pet.header)
+    suvr_pet_path = Path.cwd() / f"suvr_{pet_image.name}"
+    nib.save(suvr_pet, suvr_pet_path)
+
+    masked_image_path = Path.cwd() / f"masked_{suvr_pet_path.name}"
+    masked_image = nib.Nifti1Image(
+        suvr * nib.load(binary_mask).get_fdata(dtype="float32"),
+        pet.affine,
+        header=pet.header,
+    )
+    nib.save(masked_image, masked_image_path)
+
+    atlas_statistics = [
+        Path.cwd()
+        / f"{get_filename_no_ext(suvr_pet_path)}_space-{atlas}_statistics.tsv"
+        for atlas in atlas_names
+    ]
+    statistics_on_atlases(suvr_pet, atlas_names, atlas_statistics)
+
+    return suvr_pet_path, masked_image_path, atlas_statistics
+
+
 def compute_atlas_statistics(image: Path, atlas_names: List[str]) -> List[Path]:
     """Generate regional measure from atlas_list in TSV files.
 
@@ -244,16 +317,13 @@ def compute_atlas_statistics(image: Path, atlas_names: List[str]) -> List[Path]:
         List of paths to TSV files.
     """
     from clinica.utils.filemanip import get_filename_no_ext
-    from clinica.utils.statistics import statistics_on_atlas
+    from clinica.utils.statistics import statistics_on_atlases
 
-    atlas_statistics_list = []
-    for atlas in atlas_names:
-        out_atlas_statistics = (
-            Path.cwd() / f"{get_filename_no_ext(image)}_space-{atlas}_statistics.tsv"
-        )
-        statistics_on_atlas(image, atlas, out_atlas_statistics)
-        atlas_statistics_list.append(out_atlas_statistics)
-        break  # Why is there a break here ????
+    atlas_statistics_list = [
+        Path.cwd() / f"{get_filename_no_ext(image)}_space-{atlas}_statistics.tsv"
+        for atlas in atlas_names
+    ]
+    statistics_on_atlases(image, atlas_names, atlas_statistics_list)
     return atlas_statistics_list
 
 
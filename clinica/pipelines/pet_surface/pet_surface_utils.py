@@ -462,233 +462,83 @@ def mris_expand(in_surface):
     return out_in_node
 
 
-def surf2surf(
-    in_surface, reg_file, gtmsegfile, subject_id, session_id, caps_dir, is_longitudinal
+def sample_volume_on_surfaces(
+    volume, surfaces, orig_nu, coefficients=None, interpolation="nearest"
 ):
-    """surf2surf is a wrapper of freesurfer command mri_surf2surf. Here the aim is to convert a input surface (which is
-    the native space of the subject), into the same surface but in the gtmseg space (space of the volume generated by
-    the gtmsegmentation)
+    """sample_volume_on_surfaces projects the volume onto several surfaces and averages the projections with the
+    provided coefficients, in a single vectorized step.
 
-    Args:
-        (string) in_surface : surface file that needs to be converted
-        (string) reg_file   : Path to a registration file that represents the transformation needed to go from the native
-            space to the gtmsegspace (see https://surfer.nmr.mgh.harvard.edu/fswiki/FsAnat-to-NativeAnat for more
-            details)
-        (string) gtmsegfile : Path to the gtm segmentation file
-        (string) subject_id : The subject_id (something like sub-ADNI002S4213)
-        (string) session_id : The session id ( something like : ses-M012)
-        (string) caps_dir   : Path to the CAPS directory
-        (bool)   is_longitudinal: longitudinal files
-
-    Returns:
-        (string) Path to the converted surface in current directory
-    """
-    import os
-    import shutil
-    import subprocess
-    import sys
-
-    import clinica.pipelines.pet_surface.pet_surface_utils as utils
-
-    # set subjects_dir env. variable for mri_surf2surf to work properly
-    subjects_dir_backup = os.path.expandvars("$SUBJECTS_DIR")
-
-    root_env, freesurfer_id = utils.get_new_subjects_dir(
-        is_longitudinal, caps_dir, subject_id, session_id
-    )
-
-    os.environ["SUBJECTS_DIR"] = root_env
-
-    # make a copy of surface file to surface directory in CAPS in order to allow processing
-    shutil.copy(
-        in_surface,
-        os.path.join(os.path.expandvars("$SUBJECTS_DIR"), freesurfer_id, "surf"),
-    )
-
-    # TODO write nicer way to grab hemi & filename (difficulty caused by the dots in filenames)
-    # extract hemisphere based on filename
-    hemi = os.path.basename(in_surface)[0:2]
-    surfname = os.path.basename(in_surface)[3:]
-
-    # Perform surf2surf algorithm
-    tval = os.path.abspath("./" + os.path.basename(in_surface) + "_gtmsegspace")
-    cmd = (
-        "mri_surf2surf --reg %s %s --sval-xyz %s --hemi %s --tval-xyz %s --tval %s --s %s "
-        % (reg_file, gtmsegfile, surfname, hemi, gtmsegfile, tval, freesurfer_id)
-    )
-
-    # If system is MacOS, this export command must be run just before the mri_vol2surf command to bypass MacOs security
-    if sys.platform == "darwin":
-        cmd = "export DYLD_LIBRARY_PATH=$FREESURFER_HOME/lib/gcc/lib && " + cmd
-    subprocess_mri_surf2surf = subprocess.run(
-        cmd,
-        shell=True,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
-    if subprocess_mri_surf2surf.returncode != 0:
-        raise ValueError("mri_surf2surf failed, returned non-zero code")
-
-    # remove file in caps
-    os.remove(
-        os.path.join(
-            os.path.expandvars("$SUBJECTS_DIR"),
-            freesurfer_id,
-            "surf",
-            os.path.basename(in_surface),
-        )
-    )
-
-    # put back original subjects_dir env
-    os.environ["SUBJECTS_DIR"] = subjects_dir_backup
-
-    return tval
-
-
-def vol2surf(
-    volume, surface, subject_id, session_id, caps_dir, gtmsegfile, is_longitudinal
-):
-    """vol2surf is a wrapper of freesurfer command mri_vol2surf. It projects the volume into the surface : the value at
-    each vertex is given by the value of the voxel it intersects
+    The volume is loaded once, and sampled at the vertices of all the surfaces. The vertices, given in the tkregister
+    space of the conformed volume orig_nu, are mapped to the voxels of the volume through the scanner coordinates of
+    both images, as mri_surf2surf followed by mri_vol2surf --regheader do. Vertices falling outside the volume get 0.
 
     Args:
-        (string) volume     : Path to PET volume (in gtmseg space) that needs to be mapped into surface
-        (string) surface    : Path to surface file
-        (string) gtmsegfile :l Path to the gtm segmentation file (provides information on space, labels are not used
-        (string) subject_id : The subject_id (something like sub-ADNI002S4213)
-        (string) session_id : The session id ( something like : ses-M012)
-        (string) caps_dir   : Path to the CAPS directory
+        (string) volume           : Path to PET volume, registered on orig_nu by its header
+        (list of strings) surfaces : List of path to the surfaces generated by mris_expand (35 to 65 % of thickness)
+        (string) orig_nu          : Path to the conformed volume of FreeSurfer (orig_nu.mgz) on which surfaces are defined
+        (list of floats) coefficients : Weight of each surface. Default are the coefficients of a normal distribution
+            centered on the mid surface
+        (string) interpolation    : 'nearest' (as mri_vol2surf --interp nearest) or 'trilinear'
 
     Returns:
-        (string) Path to the data projected onto the surface
+        (string) Path to the averaged projection onto the surface
     """
     import os
-    import shutil
-    import subprocess
-    import sys
-
-    import clinica.pipelines.pet_surface.pet_surface_utils as utils
-
-    # set subjects_dir env. variable for mri_vol2surf to work properly
-    subjects_dir_backup = os.path.expandvars("$SUBJECTS_DIR")
 
-    root_env, freesurfer_id = utils.get_new_subjects_dir(
-        is_longitudinal, caps_dir, subject_id, session_id
-    )
-
-    os.environ["SUBJECTS_DIR"] = root_env
-
-    # TODO write nicer way to grab hemi & filename (difficulty caused by the dots in filenames)
-    # extract hemisphere based on filename
-    hemi = os.path.basename(surface)[0:2]
-    surfname = os.path.basename(surface)[3:]
-
-    # copy surface file in caps surf folder to allow processing
-    shutil.copy(
-        surface,
-        os.path.join(os.path.expandvars("$SUBJECTS_DIR"), freesurfer_id, "surf"),
-    )
+    import nibabel as nib
+    import numpy as np
+    from scipy.ndimage import map_coordinates
 
-    if not os.path.exists(
-        os.path.join(
-            os.path.expandvars("$SUBJECTS_DIR"), freesurfer_id, "mri", "gtmseg.mgz"
+    if coefficients is None:
+        coefficients = [0.1034, 0.1399, 0.1677, 0.1782, 0.1677, 0.1399, 0.1034]
+    if len(surfaces) != len(coefficients):
+        raise ValueError(
+            f"There should be {len(coefficients)} surfaces at this point of the pipeline, "
+            f"but found {len(surfaces)}, something went wrong..."
         )
-    ):
-        shutil.copy(
-            gtmsegfile,
-            os.path.join(
-                os.path.expandvars("$SUBJECTS_DIR"), freesurfer_id, "mri", "gtmseg.mgz"
-            ),
+    if interpolation not in ("nearest", "trilinear"):
+        raise ValueError(
+            f"Interpolation should be 'nearest' or 'trilinear', not {interpolation}."
         )
 
-    # execute vol2surf
-    output = os.path.abspath(
-        "./" + hemi + ".projection_" + os.path.basename(surface) + ".mgh"
+    pet = nib.load(volume)
+    data = np.asanyarray(pet.dataobj, dtype="float32")
+    if data.ndim > 3:
+        data = data.reshape(data.shape[:3])
+    orig_header = nib.load(orig_nu).header
+    tkr_to_voxel = (
+        np.linalg.inv(pet.affine)
+        @ orig_header.get_vox2ras()
+        @ np.linalg.inv(orig_header.get_vox2ras_tkr())
     )
-    cmd = "mri_vol2surf"
-    cmd += " --mov " + volume
-    cmd += " --o " + output
-    cmd += " --surf " + surfname
-    cmd += " --hemi " + hemi
-    cmd += " --regheader " + freesurfer_id
-    cmd += " --ref gtmseg.mgz"
-    cmd += " --interp nearest"
 
-    # If system is MacOS, this export command must be run just before the mri_vol2surf command to bypass MacOs security
-    if sys.platform == "darwin":
-        cmd = "export DYLD_LIBRARY_PATH=$FREESURFER_HOME/lib/gcc/lib && " + cmd
-    subprocess_mri_vol2surf = subprocess.run(
-        cmd,
-        shell=True,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
-    if subprocess_mri_vol2surf.returncode != 0:
-        raise ValueError("mri_vol2surf failed, returned non-zero code")
-
-    # remove file in caps
-    os.remove(
-        os.path.join(
-            os.path.expandvars("$SUBJECTS_DIR"),
-            freesurfer_id,
-            "surf",
-            os.path.basename(surface),
-        )
-    )
-    # TODO careful here...
-    # Removing gtmseg.mgz may lead to problems as other vol2surf are using it
-    os.remove(
-        os.path.join(
-            os.path.expandvars("$SUBJECTS_DIR"), freesurfer_id, "mri", "gtmseg.mgz"
-        )
-    )
-
-    # put back original subjects_dir env
-    os.environ["SUBJECTS_DIR"] = subjects_dir_backup
-
-    return output
-
-
-def weighted_mean(in_surfaces):
-    """weighted_mean make a weighted average at each node of the surface. The weight are defined by a normal
-    distribution (centered on the mid surface)
-
-    Args:
-        (list of strings) in_surfaces : List of path to the data projected on the 7 surfaces (35 to 65 % of thickness)
-            at each nodes)
-
-    Returns:
-        (string) Path to the data averaged
-    """
-    import os
-
-    import nibabel as nib
-    import numpy as np
+    # Coordinates of the vertices of all the surfaces, of shape (n_surfaces, n_vertices, 3)
+    vertices = np.stack([nib.freesurfer.read_geometry(s)[0] for s in surfaces])
+    voxels = vertices @ tkr_to_voxel[:3, :3].T + tkr_to_voxel[:3, 3]
 
-    # coefficient for normal repartition
-    coefficient = [0.1034, 0.1399, 0.1677, 0.1782, 0.1677, 0.1399, 0.1034]
-
-    # sample only to get dimension
-    sample = nib.load(in_surfaces[0])
-    data_normalized = np.zeros(sample.header.get_data_shape())
-
-    if len(in_surfaces) != 7:
-        raise Exception(
-            f"There should be 7 surfaces at this point of the pipeline, but found {len(in_surfaces)}, something went wrong..."
-        )
+    if interpolation == "nearest":
+        # mri_vol2surf rounds the voxel coordinates to the nearest integer
+        indices = np.floor(voxels + 0.5).astype(np.int64)
+        inside = np.all((indices >= 0) & (indices < data.shape), axis=-1)
+        samples = np.zeros(inside.shape, dtype="float32")
+        samples[inside] = data[tuple(indices[inside].T)]
+    else:
+        samples = map_coordinates(
+            data, voxels.reshape(-1, 3).T, order=1, mode="constant", cval=0.0
+        ).reshape(voxels.shape[:2])
 
-    for i in range(len(in_surfaces)):
-        current_surf = nib.load(in_surfaces[i])
-        data_normalized += current_surf.get_fdata(dtype="float32") * coefficient[i]
+    averaged = np.tensordot(
+        np.asarray(coefficients, dtype=np.float64), samples.astype(np.float64), axes=1
+    )
 
     # hemisphere name will always be in our case the first 2 letters of the filename
-    hemi = os.path.basename(in_surfaces[0])[0:2]
-    # data_normalized = np.atleast_3d(data_normalized)
+    hemi = os.path.basename(surfaces[0])[0:2]
     hemi_projection = nib.MGHImage(
-        data_normalized, affine=sample.affine, header=sample.header
+        averaged.astype("float32").reshape(-1, 1, 1), affine=None
+    )
+    out_surface = os.path.abspath(
+        "./" + hemi + ".averaged_projection_on_cortical_surface.mgh"
     )
-    out_surface = "./" + hemi + ".averaged_projection_on_cortical_surface.mgh"
-    out_surface = os.path.abspath(out_surface)
     nib.save(hemi_projection, out_surface)
 
     return out_surface
@@ -818,46 +668,28 @@ def produce_tsv(pet, atlas_files):
     import numpy as np
     import pandas as pds
 
-    from clinica.utils.stream import cprint
+    from clinica.utils.atlas import get_atlas_registry
+    from clinica.utils.statistics import compute_statistics_on_labels
 
     # Extract data from projected PET data
-    lh_pet_mgh = np.squeeze(nib.load(pet[0]).get_fdata(dtype="float32"))
-    rh_pet_mgh = np.squeeze(nib.load(pet[1]).get_fdata(dtype="float32"))
+    pet_data = [np.squeeze(nib.load(pet[i]).get_fdata(dtype="float32")) for i in (0, 1)]
 
     filename_tsv = []
     for atlas in atlas_files:
-        annot_atlas_left = nib.freesurfer.io.read_annot(
-            atlas_files[atlas]["lh"], orig_ids=False
-        )
-        annot_atlas_left[0][annot_atlas_left[0] == -1] = 0
-        annot_atlas_right = nib.freesurfer.io.read_annot(
-            atlas_files[atlas]["rh"], orig_ids=False
-        )
-        annot_atlas_right[0][annot_atlas_right[0] == -1] = 0
-
-        average_region = []
-        region_names = []
-        for r in range(len(annot_atlas_left[2])):
-            # cprint(annot_atlas_left[2][r])
-            region_names.append(annot_atlas_left[2][r].astype(str) + "_lh")
-            region_names.append(annot_atlas_left[2][r].astype(str) + "_rh")
-
-            mask_left = annot_atlas_left[0] == r
-            mask_left = np.uint(mask_left)
-
-            masked_data_left = mask_left * lh_pet_mgh
-            if np.sum(mask_left) == 0:
-                average_region.append(np.nan)
-            else:
-                average_region.append(np.sum(masked_data_left) / np.sum(mask_left))
-
-            mask_right = annot_atlas_right[0] == r
-            mask_right = np.uint(mask_right)
-            masked_data_right = mask_right * rh_pet_mgh
-            if np.sum(mask_right) == 0:
-                average_region.append(np.nan)
-            else:
-                average_region.append(np.sum(masked_data_right) / np.sum(mask_right))
+        # Annotation files are read once per process, and reused across subjects
+        annotations = [
+            get_atlas_registry().get_annotation(atlas_files[atlas][hemi])
+            for hemi in ("lh", "rh")
+        ]
+        names = annotations[0][1]
+        # Regions of both hemispheres are named after the left annotation file
+        average_region = np.column_stack(
+            [
+                compute_statistics_on_labels(data, labels, range(len(names)))["mean"]
+                for data, (labels, _) in zip(pet_data, annotations)
+            ]
+        ).ravel()
+        region_names = [f"{name}_{hemi}" for name in names for hemi in ("lh", "rh")]
 
         final_tsv = pds.DataFrame(
             {
@@ -927,7 +759,7 @@ def get_wf(
     import nipype.interfaces.io as nio
     import nipype.interfaces.utility as niu
     import nipype.pipeline.engine as pe
-    from nipype.interfaces.freesurfer import ApplyVolTransform, MRIConvert, Tkregister2
+    from nipype.interfaces.freesurfer import ApplyVolTransform, MRIConvert
     from nipype.interfaces.fsl import Merge
     from nipype.interfaces.petpvc import PETPVC
     from nipype.interfaces.spm import Coregister, Normalize12
@@ -996,8 +828,6 @@ def get_wf(
     gtmsegmentation.inputs.session_id = session_id
     gtmsegmentation.inputs.is_longitudinal = is_longitudinal
 
-    tkregister = pe.Node(Tkregister2(reg_header=True), name="tkreg")
-
     convert_gtmseg = convert_mgh.clone(name="convert_gtmseg")
 
     labelconversion = pe.Node(
@@ -1097,55 +927,13 @@ def get_wf(
         name="mris_expand_white",
     )
 
-    surf_conversion = pe.MapNode(
-        niu.Function(
-            input_names=[
-                "in_surface",
-                "reg_file",
-                "gtmsegfile",
-                "subject_id",
-                "session_id",
-                "caps_dir",
-                "is_longitudinal",
-            ],
-            output_names=["tval"],
-            function=utils.surf2surf,
-        ),
-        name="surf_conversion",
-        iterfield=["in_surface"],
-    )
-    surf_conversion.inputs.subject_id = subject_id
-    surf_conversion.inputs.session_id = session_id
-    surf_conversion.inputs.caps_dir = caps_dir
-    surf_conversion.inputs.is_longitudinal = is_longitudinal
-
-    vol_on_surf = pe.MapNode(
-        niu.Function(
-            input_names=[
-                "volume",
-                "surface",
-                "subject_id",
-                "session_id",
-                "caps_dir",
-                "gtmsegfile",
-                "is_longitudinal",
-            ],
-            output_names=["output"],
-            function=utils.vol2surf,
-        ),
-        name="vol_on_surf",
-        iterfield=["surface"],
-    )
-    vol_on_surf.inputs.subject_id = subject_id
-    vol_on_surf.inputs.session_id = session_id
-    vol_on_surf.inputs.caps_dir = caps_dir
-    vol_on_surf.inputs.is_longitudinal = is_longitudinal
-
+    # The volume is sampled on the 7 surfaces and averaged in a single node,
+    # instead of running mri_surf2surf and mri_vol2surf on each surface
     normal_average = pe.Node(
         niu.Function(
-            input_names=["in_surfaces"],
+            input_names=["volume", "surfaces", "orig_nu"],
             output_names=["out_surface"],
-            function=utils.weighted_mean,
+            function=utils.sample_volume_on_surfaces,
         ),
         name="normal_average",
     )
@@ -1390,14 +1178,12 @@ def get_wf(
             (unzip_orig_nu, coreg, [("out_file", "target")]),
             (coreg, removenan, [("coregistered_source", "volname")]),
             (removenan, vol2vol, [("vol_wo_nan", "source_file")]),
-            (inputnode, tkregister, [("orig_nu", "target_image")]),
             (unzip_orig_nu, normalize12, [("out_file", "image_to_align")]),
             (unzip_mask, apply_inverse_deformation, [("out_file", "img")]),
             (normalize12, apply_inverse_deformation, [("deformation_field", "deformation_field")]),
             (unzip_orig_nu, apply_inverse_deformation, [("out_file", "target")]),
             (apply_inverse_deformation, vol2vol_mask, [("freesurfer_space_eroded_mask", "source_file")]),
             (gtmsegmentation, vol2vol_mask, [("gtmseg_file", "target_file")]),
-            (gtmsegmentation, tkregister, [("gtmseg_file", "moving_image")]),
             (gtmsegmentation, convert_gtmseg, [("gtmseg_file", "in_file")]),
             (gtmsegmentation, vol2vol, [("gtmseg_file", "target_file")]),
             (vol2vol, pons_normalization, [("transformed_file", "pet_path")]),
@@ -1408,13 +1194,9 @@ def get_wf(
             (pons_normalization, pvc, [("suvr", "in_file")]),
             (reformat_surface_name, mris_exp, [("out", "in_surface")]),
             (mris_exp, extract_mid_surface, [("out_surface", "in_surfaces")]),
-            (mris_exp, surf_conversion, [("out_surface", "in_surface")]),
-            (tkregister, surf_conversion, [("reg_file", "reg_file")]),
-            (gtmsegmentation, surf_conversion, [("gtmseg_file", "gtmsegfile")]),
-            (pvc, vol_on_surf, [("out_file", "volume")]),
-            (surf_conversion, vol_on_surf, [("tval", "surface")]),
-            (gtmsegmentation, vol_on_surf, [("gtmseg_file", "gtmsegfile")]),
-            (vol_on_surf, normal_average, [("output", "in_surfaces")]),
+            (mris_exp, normal_average, [("out_surface", "surfaces")]),
+            (pvc, normal_average, [("out_file", "volume")]),
+            (inputnode, normal_average, [("orig_nu", "orig_nu")]),
             (normal_average, project_on_fsaverage, [("out_surface", "projection")]),
             (normal_average, gather_pet_projection, [("out_surface", "pet_projection_lh_rh")]),
             (gather_pet_projection, atlas_tsv, [("pet_projection_lh_rh", "pet")]),
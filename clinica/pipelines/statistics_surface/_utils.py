@@ -230,6 +230,8 @@ def run_clinica_surfstat(
         surface_file=pipeline_parameters["custom_file"],
         fwhm=pipeline_parameters["full_width_at_half_maximum"],
         cluster_threshold=pipeline_parameters["cluster_threshold"],
+        n_procs=pipeline_parameters.get("n_procs", 1),
+        use_cache=pipeline_parameters.get("use_cache", False),
     )
     return output_dir
 
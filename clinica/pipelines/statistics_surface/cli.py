@@ -82,6 +82,16 @@ pipeline_name = "statistics-surface"
     show_default=True,
     help="Threshold to define a cluster in the process of cluster-wise correction.",
 )
+@cli_param.option_group.option(
+    "--use_cache",
+    is_flag=True,
+    help=(
+        "Store the matrix of the surface data of all the subjects in the Clinica cache "
+        "(~/.cache/clinica/surfaces by default), such that the next analyses of the same "
+        "subjects and FWHM skip the reading of the surface files. "
+        "The matrix takes about 1.3 MB per subject and is never deleted."
+    ),
+)
 def cli(
     caps_directory: str,
     group_label: str,
@@ -96,6 +106,7 @@ def cli(
     custom_file: Optional[str] = None,
     measure_label: Optional[str] = None,
     cluster_threshold: float = 1e-3,
+    use_cache: bool = False,
     working_directory: Optional[str] = None,
     n_procs: Optional[int] = None,
 ) -> None:
@@ -147,6 +158,8 @@ def cli(
         "measure_label": measure_label,
         # Advanced arguments (i.e. tricky parameters)
         "cluster_threshold": cluster_threshold,
+        "use_cache": use_cache,
+        "n_procs": n_procs or 1,
     }
 
     pipeline = StatisticsSurface(
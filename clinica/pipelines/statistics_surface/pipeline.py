@@ -42,6 +42,8 @@ class StatisticsSurface(Pipeline):
         )
         self.parameters.setdefault("measure_label", "ct")
         self.parameters.setdefault("cluster_threshold", 0.001)
+        self.parameters.setdefault("n_procs", 1)
+        self.parameters.setdefault("use_cache", False)
         self.parameters.setdefault("glm_type", None)
 
         if self.parameters["orig_input_data"] == "pet-surface":
@@ -17,6 +17,8 @@ def clinica_surfstat(
     threshold_uncorrected_pvalue: Optional[float] = 0.001,
     threshold_corrected_pvalue: Optional[float] = 0.05,
     cluster_threshold: Optional[float] = 0.001,
+    n_procs: int = 1,
+    use_cache: bool = False,
 ) -> None:
     """This function mimics the previous function `clinica_surfstat`
     written in MATLAB and relying on the MATLAB package SurfStat.
@@ -124,6 +126,14 @@ def clinica_surfstat(
 
     cluster_threshold : float, optional
         The threshold to be used to declare clusters as significant. Default=0.05.
+
+    n_procs : int, optional
+        The number of threads used to read the surface files. Default=1.
+
+    use_cache : bool, optional
+        If True, the matrix of the surface data is stored in the 'surfaces'
+        folder of the Clinica cache, and read from it by the next analyses
+        of the same subjects and FWHM. Default=False.
     """
     from ._utils import (
         build_thickness_array,
@@ -137,7 +147,9 @@ def clinica_surfstat(
     surface_file: str = surface_file or get_t1_freesurfer_custom_file_template(
         input_dir
     )
-    thickness = build_thickness_array(input_dir, surface_file, df_subjects, fwhm)
+    thickness = build_thickness_array(
+        input_dir, surface_file, df_subjects, fwhm, n_procs=n_procs, use_cache=use_cache
+    )
 
     # Load average surface template
     average_surface, average_mesh = get_average_surface(
@@ -1,6 +1,6 @@
 import abc
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -20,6 +20,10 @@ from .results import (
 
 __all__ = ["GLM"]
 
+# Attributes of a brainstat SLM model set by the linear model fit,
+# which do not depend on the contrast.
+_LINEAR_MODEL_ATTRIBUTES = ("X", "V", "df", "coef", "SSE", "r", "dr", "resl")
+
 
 class GLM:
     """This class implements the functionalities common to all GLM models
@@ -138,6 +142,11 @@ class GLM:
     ) -> None:
         """Fit the GLM model instance.
 
+        The linear model (factorization of the design matrix, coefficients,
+        residual variance and resels) is fitted once on the whole data. The
+        T-statistics, P-values and FDR of each contrast are then derived from
+        this shared fit, instead of fitting a brainstat SLM model per contrast.
+
         Parameters
         ----------
         data : np.ndarray
@@ -148,26 +157,31 @@ class GLM:
 
         mask : np.ndarray, optional
             The mask to be used to mask the data. Default=None.
+
+        Raises
+        ------
+        ValueError
+            If the data is not two or three dimensional.
+
+        NotImplementedError
+            If a one-tailed test is requested on multivariate data, or if
+            Random Field Theory corrections are requested on more than three
+            variates.
         """
+        student_t_test = self._check_data(data)
         if mask is None:
             mask = data[0, :] > 0
         self.results_ = dict()
         self.slm_models_ = dict()
+        cprint(msg="Fitting the GLM model...", lvl="info")
+        linear_model = self._fit_linear_model(data, surface, mask)
         for contrast in self.contrasts:
-            slm_model = SLM(
-                self.model,
-                contrast=contrast.built_contrast,
-                surf=surface,
-                mask=mask,
-                two_tailed=self._two_tailed,
-                correction=self._correction,
-                cluster_threshold=self.cluster_threshold,
-            )
             cprint(
-                msg=f"Fitting the GLM model with contrast {contrast.name}...",
+                msg=f"Computing the statistics of the GLM model with contrast {contrast.name}...",
                 lvl="info",
             )
-            slm_model.fit(data)
+            slm_model = self._build_slm_model(contrast, surface, mask)
+            _fit_contrast(slm_model, linear_model, student_t_test=student_t_test)
             print_clusters(slm_model, self.threshold_corrected_pvalue)
             self.results_[contrast.name] = StatisticsResults.from_slm_model(
                 slm_model,
@@ -177,6 +191,50 @@ class GLM:
             )
             self.slm_models_[contrast.name] = slm_model
 
+    def _check_data(self, data: np.ndarray) -> bool:
+        """Perform the input checks of `SLM.fit` on the data.
+
+        Returns True if a Student T-test is performed (univariate data),
+        and False for a Hotelling T-test (multivariate data).
+        """
+        if data.ndim < 2 or data.ndim > 3:
+            raise ValueError("Input data must be two or three dimensional.")
+        if data.ndim == 2:
+            return True
+        if not self._two_tailed and data.shape[2] > 1:
+            raise NotImplementedError(
+                "One-tailed tests are not implemented for multivariate data."
+            )
+        if data.shape[2] > 3 and "rft" in self._correction:
+            raise NotImplementedError(
+                "Random Field Theory corrections are not implemented for more than three variates."
+            )
+        return data.shape[2] == 1
+
+    def _build_slm_model(
+        self, contrast: Contrast, surface: Dict, mask: np.ndarray
+    ) -> SLM:
+        return SLM(
+            self.model,
+            contrast=contrast.built_contrast,
+            surf=surface,
+            mask=mask,
+            two_tailed=self._two_tailed,
+            correction=self._correction,
+            cluster_threshold=self.cluster_threshold,
+        )
+
+    def _fit_linear_model(
+        self, data: np.ndarray, surface: Dict, mask: np.ndarray
+    ) -> Dict[str, Any]:
+        """Fit the linear model shared by all the contrasts on the masked data."""
+        from brainstat.stats.utils import apply_mask
+
+        slm_model = self._build_slm_model(self.contrasts[0], surface, mask)
+        slm_model._reset_fit_parameters()
+        slm_model._linear_model(apply_mask(data, slm_model.mask, axis=1))
+        return {name: getattr(slm_model, name) for name in _LINEAR_MODEL_ATTRIBUTES}
+
     def save_results(self, output_dir: Path, method: Union[str, List[str]]) -> None:
         """Save results to the provided output directory.
 
@@ -232,3 +290,23 @@ class GLM:
             )
             for meth in method:
                 plotter.plot(result, meth)
+
+
+def _fit_contrast(
+    slm_model: SLM, linear_model: Dict[str, Any], student_t_test: bool
+) -> None:
+    """Complete the fit of the SLM model from the shared linear model.
+
+    This performs the steps of `SLM.fit` which follow the linear model fit:
+    T-test of the contrast, unmasking, and multiple comparison corrections.
+    """
+    from copy import deepcopy
+
+    slm_model._reset_fit_parameters()
+    for name, value in linear_model.items():
+        setattr(slm_model, name, deepcopy(value))
+    slm_model._t_test()
+    if slm_model.mask is not None:
+        slm_model._unmask()
+    if slm_model.correction is not None:
+        slm_model.multiple_comparison_corrections(student_t_test)
@@ -16,18 +16,16 @@ def atlas_statistics(in_image, atlas_list):
     from nipype.utils.filemanip import split_filename
 
     from clinica.utils.filemanip import get_subject_id
-    from clinica.utils.statistics import statistics_on_atlas
+    from clinica.utils.statistics import statistics_on_atlases
     from clinica.utils.ux import print_end_image
 
     subject_id = get_subject_id(in_image)
 
     orig_dir, base, ext = split_filename(in_image)
-    atlas_statistics_list = []
-    for atlas in atlas_list:
-        out_atlas_statistics = Path(
-            f"./{base}_space-{atlas}_map-graymatter_statistics.tsv"
-        ).resolve()
-        statistics_on_atlas(in_image, atlas, out_atlas_statistics)
-        atlas_statistics_list.append(out_atlas_statistics)
+    atlas_statistics_list = [
+        Path(f"./{base}_space-{atlas}_map-graymatter_statistics.tsv").resolve()
+        for atlas in atlas_list
+    ]
+    statistics_on_atlases(in_image, atlas_list, atlas_statistics_list)
     print_end_image(subject_id)
     return atlas_statistics_list
@@ -1,10 +0,0 @@
-from . import (
-    machine_learning_spatial_svm,
-    pet_linear,
-    pet_volume,
-    statistics_volume,
-    statistics_volume_correction,
-    t1_freesurfer,
-    t1_linear,
-    t1_volume,
-)
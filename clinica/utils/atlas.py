@@ -12,14 +12,22 @@ Either a refactoring of this module or the use of an external API
 """
 
 import abc
+import hashlib
+import os
+import threading
 from enum import Enum
 from pathlib import Path
-from typing import Union
+from typing import Callable, Dict, Hashable, List, Tuple, TypeVar, Union
 
 import nibabel as nib
 import numpy as np
+import pandas as pd
 from nibabel import Nifti1Header
 
+from clinica.utils.filemanip import get_cache_folder
+
+T = TypeVar("T")
+
 
 class T1AndPetVolumeAtlasName(str, Enum):
     """Possible names for T1 / PET atlases."""
@@ -58,6 +66,117 @@ def _get_resolution_along_axis(label_image_header: Nifti1Header, axis: int) -> s
     return str(voxels_labels[axis])
 
 
+class AtlasRegistry:
+    """Process-wide cache of the files of atlases.
+
+    Each file is identified by its path, size and modification time, so that
+    a file is checksummed, decoded or parsed at most once per process as long
+    as it is not modified.
+
+    Decoded label images are also stored as uncompressed arrays in
+    the 'atlases' cache folder (see `get_cache_folder`), and memory-mapped in read-only mode, so that
+    worker processes share the same pages instead of decompressing their own copy.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple, object] = {}
+
+    @staticmethod
+    def _file_key(filename: Path) -> Tuple[str, int, int]:
+        filename = Path(filename).resolve()
+        stat = filename.stat()
+        return str(filename), stat.st_size, stat.st_mtime_ns
+
+    def _get(self, kind: Hashable, filename: Path, compute: Callable[[Path], T]) -> T:
+        try:
+            key = (kind,) + self._file_key(filename)
+        except OSError:
+            # Let `compute` report the missing file
+            return compute(Path(filename))
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+        value = compute(Path(key[1]))
+        with self._lock:
+            return self._cache.setdefault(key, value)
+
+    def get_checksum(self, filename: Path) -> str:
+        """Return the SHA256 checksum of the file, computed once per file version."""
+        from .inputs import compute_sha256_hash
+
+        return self._get("checksum", filename, lambda f: compute_sha256_hash(f))
+
+    def get_header(self, filename: Path) -> Nifti1Header:
+        """Return the header of the image."""
+        return self._get("header", filename, lambda f: nib.load(f).header)
+
+    def get_label_data(self, filename: Path) -> np.ndarray:
+        """Return the read-only array of labels of the image, as float32."""
+        return self._get("labels", filename, self._load_label_data)
+
+    def get_unique_labels(self, filename: Path) -> np.ndarray:
+        """Return the sorted unique labels of the image."""
+        return self._get(
+            "unique", filename, lambda f: np.unique(self.get_label_data(f))
+        )
+
+    def get_table(self, filename: Path) -> pd.DataFrame:
+        """Return the content of the TSV file.
+
+        The returned data frame is a copy which can be modified by the caller.
+        """
+        return self._get("table", filename, lambda f: pd.read_csv(f, sep="\t")).copy()
+
+    def get_annotation(self, filename: Path) -> Tuple[np.ndarray, List[str]]:
+        """Return the read-only labels of the vertices and the region names
+        of a FreeSurfer annotation file.
+
+        Vertices without any label (-1) are assigned to the first region.
+        """
+        return self._get("annotation", filename, _read_annotation)
+
+    def _load_label_data(self, filename: Path) -> np.ndarray:
+        digest = hashlib.sha256(repr(self._file_key(filename)).encode()).hexdigest()
+        cached = get_cache_folder("atlases") / f"{digest}.npy"
+        try:
+            return np.load(cached, mmap_mode="r")
+        except (OSError, ValueError):
+            pass
+        data = nib.load(filename).get_fdata(dtype="float32")
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(f".{cached.name}.{os.getpid()}.tmp")
+            with open(tmp, "wb") as fp:
+                np.save(fp, data)
+            os.replace(tmp, cached)
+            return np.load(cached, mmap_mode="r")
+        except OSError:
+            data.flags.writeable = False
+            return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def _read_annotation(filename: Path) -> Tuple[np.ndarray, List[str]]:
+    labels, _, names = nib.freesurfer.io.read_annot(filename, orig_ids=False)
+    labels[labels == -1] = 0
+    labels.flags.writeable = False
+    return labels, [
+        name.decode() if isinstance(name, bytes) else str(name) for name in names
+    ]
+
+
+_REGISTRY = AtlasRegistry()
+
+
+def get_atlas_registry() -> AtlasRegistry:
+    """Return the atlas registry of the current process."""
+    return _REGISTRY
+
+
 class BaseAtlas:
     """Base class for Atlas handling."""
 
@@ -95,10 +214,9 @@ class BaseAtlas:
     @property
     def spatial_resolution(self) -> str:
         """Return the spatial resolution of the atlas (in format "XxXxX" e.g. 1.5x1.5x1.5)."""
-        img_labels = nib.load(self.labels)
+        header = get_atlas_registry().get_header(self.labels)
         return "x".join(
-            _get_resolution_along_axis(img_labels.header, axis=axis)
-            for axis in range(3)
+            _get_resolution_along_axis(header, axis=axis) for axis in range(3)
         )
 
     @property
@@ -111,10 +229,9 @@ class BaseAtlas:
             If the checksum of the parcellation found is different from
             the expected checksum.
         """
-        from .inputs import compute_sha256_hash
-
         atlas_labels = self.atlas_dir / self.atlas_filename
-        if (checksum := compute_sha256_hash(atlas_labels)) != self.expected_checksum:
+        checksum = get_atlas_registry().get_checksum(atlas_labels)
+        if checksum != self.expected_checksum:
             raise IOError(
                 f"{atlas_labels} has an SHA256 checksum ({checksum}) "
                 f"differing from expected ({self.expected_checksum}), "
@@ -123,13 +240,22 @@ class BaseAtlas:
         return atlas_labels
 
     def get_index(self) -> np.ndarray:
-        img_labels = nib.load(self.labels)
-        img_labels = img_labels.get_fdata(dtype="float32")
-        labels = list(set(img_labels.ravel()))
-        index_vector = np.zeros(len(labels))
-        for index, n in enumerate(labels):
-            index_vector[index] = index
-        return index_vector
+        return np.arange(len(self.get_unique_labels()), dtype="float64")
+
+    def get_label_data(self) -> np.ndarray:
+        """Return the labels of the atlas as a read-only float32 array.
+
+        The array is decoded once and memory-mapped (see `AtlasRegistry`).
+        """
+        return get_atlas_registry().get_label_data(self.labels)
+
+    def get_unique_labels(self) -> np.ndarray:
+        """Return the sorted values of the labels found in the atlas."""
+        return get_atlas_registry().get_unique_labels(self.labels)
+
+    def get_roi_table(self) -> pd.DataFrame:
+        """Return the content of the parcellation TSV file (see `tsv_roi`)."""
+        return get_atlas_registry().get_table(self.tsv_roi)
 
 
 class FSLAtlas(BaseAtlas):
@@ -0,0 +1,57 @@
+"""Click helpers shared by the command line groups of Clinica."""
+
+from importlib import import_module
+from typing import Dict, List, Optional
+
+import click
+
+__all__ = ["LazyGroup"]
+
+
+class LazyGroup(click.Group):
+    """CLI group whose commands are imported only when they are invoked.
+
+    The commands are declared statically as a mapping from the command name
+    to the import path of the command object, in the "module:attribute" form.
+    A command module is thus imported when the command is run (or when its
+    help is displayed), and not when the group is created. This keeps the
+    start-up of the `clinica` executable from importing every pipeline
+    stack (Nipype, Pydra, scikit-learn...).
+
+    Commands are listed in declaration order, followed by the commands
+    added eagerly with `add_command`, in registration order.
+
+    Parameters
+    ----------
+    lazy_commands : dict of str, optional
+        Mapping from the command names to the import paths of the commands.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return list(self.lazy_commands) + [
+            name for name in self.commands if name not in self.lazy_commands
+        ]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            self.commands[cmd_name] = self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_commands[cmd_name].split(":")
+        command = getattr(import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"{self.lazy_commands[cmd_name]} is not a click command "
+                f"(it is a {type(command).__name__})."
+            )
+        if command.name != cmd_name:
+            raise ValueError(
+                f"The command {self.lazy_commands[cmd_name]} is named '{command.name}' "
+                f"but it is declared as '{cmd_name}' in the group '{self.name}'."
+            )
+        return command
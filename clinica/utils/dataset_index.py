@@ -0,0 +1,408 @@
+"""This module implements a persistent index of the files of a BIDS or CAPS dataset.
+
+The index records, for every directory of the dataset, the list of its entries
+together with the modification time of the directory at the time it was listed.
+Readers like `clinica_file_reader` query the index with glob patterns instead of
+walking the file system for every (subject, session, pattern) triplet.
+
+The index is stored in the 'index' cache folder (see `get_cache_folder`) and is updated
+incrementally: a directory is only listed again if its modification time changed
+since the last scan, such that building the input node of a pipeline on a large
+dataset only costs one `stat` call per directory once the index has been built.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from fnmatch import translate
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from clinica.utils.filemanip import get_cache_folder
+from clinica.utils.parallel import map_in_chunks
+
+__all__ = [
+    "DatasetIndex",
+    "IndexedFile",
+    "get_dataset_index",
+]
+
+_INDEX_FORMAT_VERSION = 1
+
+# Directories modified less than this duration before being listed are listed again
+# at the next refresh, since file systems with a coarse timestamp granularity could
+# hide a modification happening right after the listing (similar to "racy git").
+_RACY_WINDOW_NS = 2 * 10**9
+
+# In-process cache of the indexes, keyed by the resolved root of the dataset.
+_INDEXES: Dict[Path, "DatasetIndex"] = {}
+
+
+class IndexedFile(NamedTuple):
+    """An entry of the dataset index."""
+
+    path: str
+    lower_path: str
+    entities: Dict[str, str]
+    mtime: float
+    is_dir: bool
+
+
+@dataclass
+class _DirectoryRecord:
+    """The listing of a directory at a given time.
+
+    The entries map the name of each child to a tuple (is_dir, mtime).
+    """
+
+    mtime: int
+    scanned: int
+    entries: Dict[str, Tuple[bool, float]] = field(default_factory=dict)
+
+    def is_up_to_date(self, mtime: int) -> bool:
+        return mtime == self.mtime and self.scanned - self.mtime > _RACY_WINDOW_NS
+
+    @classmethod
+    def from_directory(cls, directory: Path, mtime: int):
+        scanned = time.time_ns()
+        entries = {}
+        with os.scandir(directory) as it:
+            for entry in it:
+                # Hidden files are ignored, as glob would do with '*' and '**'
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    entry_mtime = entry.stat(follow_symlinks=False).st_mtime
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                entries[entry.name] = (is_dir, entry_mtime)
+        return cls(mtime, scanned, entries)
+
+
+def _join(directory: str, name: str) -> str:
+    return f"{directory}/{name}" if directory else name
+
+
+def _compile_pattern(pattern: str) -> List[Optional[re.Pattern]]:
+    """Compile a glob pattern into a list of regular expressions, one per path segment.
+
+    The '**' segments are represented by None.
+    """
+    return [
+        None if segment == "**" else re.compile(translate(segment.lower()))
+        for segment in Path(pattern).as_posix().split("/")
+        if segment not in ("", ".")
+    ]
+
+
+def _match_segments(segments: List[str], compiled: List[Optional[re.Pattern]]) -> bool:
+    if not compiled:
+        return not segments
+    if compiled[0] is None:
+        return any(
+            _match_segments(segments[i:], compiled[1:])
+            for i in range(len(segments) + 1)
+        )
+    if not segments or not compiled[0].match(segments[0]):
+        return False
+    return _match_segments(segments[1:], compiled[1:])
+
+
+def _parse_entities(name: str) -> Dict[str, str]:
+    """Extract the BIDS entities (key-value pairs) from a file name."""
+    entities = {}
+    for token in name.split(".")[0].split("_"):
+        key, sep, value = token.partition("-")
+        if sep:
+            entities[key] = value
+    return entities
+
+
+class DatasetIndex:
+    """Persistent index of the files of a BIDS or CAPS dataset.
+
+    Parameters
+    ----------
+    root : str or PathLike
+        The root folder of the dataset.
+
+    Notes
+    -----
+    Paths stored in the index are relative to the root of the dataset and use
+    forward slashes as separators. Hidden files and folders are not indexed.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike]):
+        self.root = Path(root)
+        self._directories: Dict[str, _DirectoryRecord] = {}
+        self._resolved: Dict[str, List[str]] = {}
+        self._modified = False
+
+    def __len__(self) -> int:
+        return sum(len(record.entries) for record in self._directories.values())
+
+    @property
+    def filename(self) -> Path:
+        """The file in which the index is persisted."""
+        key = hashlib.sha256(str(self.root.resolve()).encode()).hexdigest()[:16]
+        return get_cache_folder("index") / f"{key}.json.gz"
+
+    @classmethod
+    def load(cls, root: Union[str, os.PathLike]):
+        """Load the index of the dataset from the cache, or return an empty index."""
+        from clinica.utils.stream import cprint
+
+        index = cls(root)
+        if not index.filename.exists():
+            return index
+        try:
+            with gzip.open(index.filename, "rt") as fp:
+                content = json.load(fp)
+            if content["version"] != _INDEX_FORMAT_VERSION or content["root"] != str(
+                index.root.resolve()
+            ):
+                return index
+            index._directories = {
+                directory: _DirectoryRecord(
+                    mtime, scanned, {name: (d, m) for name, d, m in entries}
+                )
+                for directory, (mtime, scanned, entries) in content[
+                    "directories"
+                ].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            cprint(f"Ignoring invalid dataset index {index.filename}: {e}", lvl="debug")
+        return index
+
+    def save(self) -> None:
+        """Persist the index in the cache folder if it was modified."""
+        from clinica.utils.stream import cprint
+
+        if not self._modified:
+            return
+        content = {
+            "version": _INDEX_FORMAT_VERSION,
+            "root": str(self.root.resolve()),
+            "directories": {
+                directory: [
+                    record.mtime,
+                    record.scanned,
+                    [[name, d, m] for name, (d, m) in record.entries.items()],
+                ]
+                for directory, record in self._directories.items()
+            },
+        }
+        try:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.filename.with_suffix(f".{os.getpid()}.tmp")
+            with gzip.open(tmp, "wt", compresslevel=1) as fp:
+                json.dump(content, fp)
+            os.replace(tmp, self.filename)
+            self._modified = False
+        except OSError as e:
+            cprint(f"Could not save dataset index {self.filename}: {e}", lvl="debug")
+
+    def refresh(
+        self, directories: Optional[Iterable[str]] = None, n_procs: int = 1
+    ) -> None:
+        """Update the index by listing again the directories modified since the last scan.
+
+        Parameters
+        ----------
+        directories : Iterable of str, optional
+            The folders, relative to the root of the dataset, to refresh
+            (including their whole sub-tree). The names are case-insensitive.
+            By default, the whole dataset is refreshed.
+
+        n_procs : int, optional
+            Number of threads used to refresh the directories. Default=1.
+        """
+        targets = [""] if directories is None else sorted(set(directories))
+        scans = map_in_chunks(self._scan_target, targets, n_procs=n_procs)
+        for target, (resolved, updated, removed) in zip(targets, scans):
+            self._resolved[target] = resolved
+            for directory in removed:
+                self._directories.pop(directory, None)
+            self._directories.update(updated)
+            self._modified |= bool(updated or removed)
+
+    def _scan_target(
+        self, target: str
+    ) -> Tuple[List[str], Dict[str, _DirectoryRecord], List[str]]:
+        resolved = self._resolve(target)
+        updated, removed = {}, []
+        if not resolved:
+            removed = self._subtree(target)
+        for directory in resolved:
+            u, r = self._scan_subtree(directory)
+            updated.update(u)
+            removed.extend(r)
+        return resolved, updated, removed
+
+    def _resolve(self, target: str) -> List[str]:
+        """Find the directories matching the target, ignoring case as glob does in Clinica."""
+        if target == "" or (self.root / target).is_dir():
+            return [target]
+        candidates = [""]
+        for segment in target.split("/"):
+            matches = []
+            for candidate in candidates:
+                try:
+                    with os.scandir(self.root / candidate) as it:
+                        matches.extend(
+                            _join(candidate, entry.name)
+                            for entry in it
+                            if entry.name.lower() == segment.lower() and entry.is_dir()
+                        )
+                except OSError:
+                    continue
+            candidates = matches
+        return candidates
+
+    def _subtree(self, directory: str) -> List[str]:
+        """List the indexed directories located in the provided directory, including itself."""
+        subtree, stack = [], [directory]
+        while stack:
+            current = stack.pop()
+            if (record := self._directories.get(current)) is None:
+                continue
+            subtree.append(current)
+            stack.extend(
+                _join(current, name)
+                for name, (is_dir, _) in record.entries.items()
+                if is_dir
+            )
+        return subtree
+
+    def _scan_subtree(
+        self, directory: str
+    ) -> Tuple[Dict[str, _DirectoryRecord], List[str]]:
+        """Scan the sub-tree rooted at the provided directory.
+
+        The index is not modified, the updated records and the removed
+        directories are returned instead.
+        """
+        updated, removed, stack = {}, [], [directory]
+        while stack:
+            current = stack.pop()
+            old = self._directories.get(current)
+            try:
+                mtime = os.stat(self.root / current).st_mtime_ns
+                if old is not None and old.is_up_to_date(mtime):
+                    record = old
+                else:
+                    record = _DirectoryRecord.from_directory(self.root / current, mtime)
+                    updated[current] = record
+            except OSError:
+                removed.extend(self._subtree(current))
+                continue
+            if old is not None and record is not old:
+                for name, (was_dir, _) in old.entries.items():
+                    if was_dir and not record.entries.get(name, (False,))[0]:
+                        removed.extend(self._subtree(_join(current, name)))
+            stack.extend(
+                _join(current, name)
+                for name, (is_dir, _) in record.entries.items()
+                if is_dir
+            )
+        return updated, removed
+
+    def iter_files(self, directory: str = "") -> Iterator[IndexedFile]:
+        """Iterate over the indexed entries located in the provided directory.
+
+        Parameters
+        ----------
+        directory : str, optional
+            The folder, relative to the root of the dataset, to iterate over.
+            By default, the whole dataset is considered.
+        """
+        for base in self._resolved.get(directory, [directory]):
+            for current in self._subtree(base):
+                for name, (is_dir, mtime) in self._directories[current].entries.items():
+                    path = _join(current, name)
+                    yield IndexedFile(
+                        path, path.lower(), _parse_entities(name), mtime, is_dir
+                    )
+
+    def glob(self, pattern: str, directory: str = "") -> List[str]:
+        """Return the paths matching 'directory/**/pattern' in a case-insensitive way.
+
+        Parameters
+        ----------
+        pattern : str
+            The glob pattern to match.
+
+        directory : str, optional
+            The folder, relative to the root of the dataset, in which to look for
+            the pattern. By default, the whole dataset is considered.
+
+        Returns
+        -------
+        List of str :
+            The sorted list of matching paths, relative to the root of the dataset.
+        """
+        return self.glob_many([pattern], directory)[0]
+
+    def glob_many(self, patterns: List[str], directory: str = "") -> List[List[str]]:
+        """Return the paths matching 'directory/**/pattern' for each provided pattern.
+
+        The sub-tree of `directory` is traversed only once for all patterns.
+        """
+        compiled = [_compile_pattern(pattern) for pattern in patterns]
+        found = [[] for _ in patterns]
+        for base in self._resolved.get(directory, [directory]):
+            offset = len(base) + 1 if base else 0
+            for current in self._subtree(base):
+                relative = current[offset:].lower()
+                parents = relative.split("/") if relative else []
+                for name in self._directories[current].entries:
+                    lower_name = name.lower()
+                    for results, segments in zip(found, compiled):
+                        if segments and (
+                            segments[-1] is None or segments[-1].match(lower_name)
+                        ):
+                            if _match_segments(
+                                parents + [lower_name], [None] + segments
+                            ):
+                                results.append(_join(current, name))
+        return [sorted(results) for results in found]
+
+
+def get_dataset_index(
+    root: Union[str, os.PathLike],
+    directories: Optional[Iterable[str]] = None,
+    n_procs: int = 1,
+) -> DatasetIndex:
+    """Return the up-to-date index of the provided dataset.
+
+    The index is loaded from the cache the first time it is requested in a process,
+    refreshed, and saved back to the cache if it was modified.
+
+    Parameters
+    ----------
+    root : str or PathLike
+        The root folder of the BIDS or CAPS dataset.
+
+    directories : Iterable of str, optional
+        The folders, relative to `root`, that need to be up-to-date.
+        By default, the whole dataset is refreshed.
+
+    n_procs : int, optional
+        Number of threads used to refresh the index. Default=1.
+
+    Returns
+    -------
+    DatasetIndex :
+        The index of the dataset.
+    """
+    key = Path(root).resolve()
+    if (index := _INDEXES.get(key)) is None:
+        index = _INDEXES[key] = DatasetIndex.load(key)
+    index.refresh(directories, n_procs=n_procs)
+    index.save()
+    return index
@@ -10,6 +10,7 @@ __all__ = [
     "extract_image_ids",
     "extract_metadata_from_json",
     "extract_subjects_sessions_from_filename",
+    "get_cache_folder",
     "get_filename_no_ext",
     "get_parent",
     "get_subject_id",
@@ -244,6 +245,31 @@ def save_participants_sessions(
         raise e
 
 
+def get_cache_folder(name: str) -> Path:
+    """Return the folder in which Clinica caches the provided kind of data.
+
+    All the caches of Clinica are sub-folders of the directory given by the
+    environment variable 'CLINICA_CACHE_DIR', which defaults to "~/.cache/clinica".
+    Nothing is ever evicted from these folders, which can be deleted safely
+    once no Clinica process is running.
+
+    Parameters
+    ----------
+    name : str
+        The name of the cache (e.g. 'index' or 'kernels').
+
+    Returns
+    -------
+    Path :
+        The folder of the cache. It is not created by this function.
+    """
+    import os
+
+    if root := os.getenv("CLINICA_CACHE_DIR"):
+        return Path(root) / name
+    return Path.home() / ".cache" / "clinica" / name
+
+
 def _check_bids_or_caps_compliance(filename: str, sep: str):
     import re
 
@@ -2,7 +2,16 @@ from dataclasses import dataclass
 from enum import Enum
 from os import PathLike
 from pathlib import Path
-from typing import Callable, Optional, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import nibabel as nib
 import numpy as np
@@ -14,6 +23,7 @@ __all__ = [
     "get_new_image_like",
     "merge_nifti_images_in_time_dimension",
     "remove_dummy_dimension_from_image",
+    "split_volumes",
     "crop_nifti",
     "get_mni_template",
     "get_mni_cropped_template",
@@ -31,6 +41,7 @@ def compute_aggregated_volume(
     image_filename: PathLike,
     aggregator: Optional[Callable] = None,
     volumes_to_keep: Optional[np.ndarray] = None,
+    chunk_size: int = 16,
 ) -> np.ndarray:
     """Computes the aggregated 3D volumes from a 4D image and an aggregator function.
 
@@ -38,6 +49,11 @@ def compute_aggregated_volume(
     It is possible to compute the aggregation on a subset of the volumes through the
     parameter 'volumes_to_keep'.
 
+    Only the kept volumes are read from the image, by chunks of `chunk_size`
+    volumes. Means, minima and maxima are accumulated chunk by chunk, while
+    the other aggregators (the median for instance) are computed on a single
+    float32 array holding the kept volumes.
+
     Parameters
     ----------
     image_filename : str
@@ -52,23 +68,167 @@ def compute_aggregated_volume(
         If None, all volumes of the input image will be kept during aggregation.
         Default = None.
 
+    chunk_size : int, optional
+        The maximum number of volumes read at once.
+        Default = 16.
+
     Returns
     -------
     np.ndarray:
-        The 3D volume data array obtained from the aggregation.
+        The 3D volume data array obtained from the aggregation, or the 4D array
+        of the kept volumes if no aggregator is given, as float32.
+
+    Raises
+    ------
+    ValueError :
+        If the image is not 4D or if no volume is kept.
     """
-    volumes = np.array(nib.four_to_three(nib.load(image_filename)))
-    if volumes_to_keep is None:
-        volumes_to_keep = volumes
-    else:
-        volumes_to_keep = volumes[volumes_to_keep]
-    data = [
-        volume.get_fdata(dtype="float32").astype(np.float32)
-        for volume in volumes_to_keep
-    ]
+    image = nib.load(image_filename)
+    if len(image.shape) != 4:
+        raise ValueError(
+            f"Expecting a 4D image, got an image of shape {image.shape} "
+            f"from {image_filename}."
+        )
+    volumes = np.arange(image.shape[-1])
+    if volumes_to_keep is not None:
+        volumes = volumes[volumes_to_keep]
+    if volumes.size == 0:
+        raise ValueError(f"No volume of {image_filename} is kept for aggregation.")
+    chunks = _read_volumes_by_chunks(image, volumes, chunk_size)
+
+    if aggregator in _CUMULATIVE_AGGREGATORS:
+        return _CUMULATIVE_AGGREGATORS[aggregator](chunks, len(volumes))
+    stack = np.empty(image.shape[:3] + (len(volumes),), dtype=np.float32)
+    for position, data in chunks:
+        stack[..., position : position + data.shape[-1]] = data
     if aggregator is None:
-        return np.stack(data, axis=-1)
-    return aggregator(data, axis=0)
+        return stack
+    # Aggregate by slabs of the first axis to bound the size of the temporary arrays.
+    aggregated = np.empty(image.shape[:3], dtype=np.float32)
+    for start in range(0, len(stack), chunk_size):
+        aggregated[start : start + chunk_size] = aggregator(
+            stack[start : start + chunk_size], axis=-1
+        )
+    return aggregated
+
+
+def split_volumes(
+    image_filename: PathLike,
+    volume_filters: Mapping[str, np.ndarray],
+    chunk_size: int = 16,
+) -> Dict[str, np.ndarray]:
+    """Splits the volumes of a 4D image into several 4D arrays in a single read.
+
+    The image is decoded once, by chunks of consecutive volumes, and each
+    chunk is dispatched to the arrays of the filters which select its volumes.
+    A 3D image is considered as a 4D image with a single volume.
+
+    Parameters
+    ----------
+    image_filename : PathLike
+        The path to the input image.
+
+    volume_filters : Mapping of str to np.ndarray
+        The 1D index arrays (or boolean masks) of the volumes to keep
+        in each output array, by name.
+
+    chunk_size : int, optional
+        The maximum number of volumes read at once.
+        Default = 16.
+
+    Returns
+    -------
+    dict of np.ndarray :
+        The float32 4D arrays of the volumes kept by each filter, by name.
+    """
+    image = nib.load(image_filename)
+    shape = image.shape if len(image.shape) == 4 else image.shape + (1,)
+    if len(shape) != 4:
+        raise ValueError(
+            f"Expecting a 3D or 4D image, got an image of shape {image.shape} "
+            f"from {image_filename}."
+        )
+    indices = {
+        name: np.arange(shape[-1])[volume_filter]
+        for name, volume_filter in volume_filters.items()
+    }
+    splits = {
+        name: np.empty(shape[:3] + (len(volumes),), dtype=np.float32)
+        for name, volumes in indices.items()
+    }
+    volumes_to_read = np.unique(
+        np.concatenate([np.empty(0, dtype=int), *indices.values()])
+    )
+    if len(image.shape) == 3:
+        volumes_to_read = None
+    for start, data in _read_volumes_by_chunks(image, volumes_to_read, chunk_size):
+        first = 0 if volumes_to_read is None else volumes_to_read[start]
+        for name, volumes in indices.items():
+            in_chunk = (volumes >= first) & (volumes < first + data.shape[-1])
+            splits[name][..., in_chunk] = data[..., volumes[in_chunk] - first]
+    return splits
+
+
+def _read_volumes_by_chunks(
+    image: Nifti1Image, volumes: Optional[np.ndarray] = None, chunk_size: int = 16
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yields the position in `volumes` and the float32 data of chunks of volumes.
+
+    A chunk is a run of consecutive volumes, which is read from the data proxy
+    of the image without loading the other volumes. If `volumes` is None, all
+    the volumes are read, and a 3D image is read as a single volume.
+    """
+    if len(image.shape) == 3:
+        yield 0, np.asarray(image.dataobj, dtype=np.float32)[..., np.newaxis]
+        return
+    if volumes is None:
+        volumes = np.arange(image.shape[-1])
+    start = 0
+    while start < len(volumes):
+        stop = start + 1
+        while (
+            stop < len(volumes)
+            and stop - start < chunk_size
+            and volumes[stop] == volumes[stop - 1] + 1
+        ):
+            stop += 1
+        data = np.asarray(
+            image.dataobj[..., volumes[start] : volumes[stop - 1] + 1],
+            dtype=np.float32,
+        )
+        yield start, data
+        start = stop
+
+
+def _cumulative_mean(
+    chunks: Iterable[Tuple[int, np.ndarray]], n_volumes: int
+) -> np.ndarray:
+    total = None
+    for _, data in chunks:
+        chunk_total = data.sum(axis=-1, dtype=np.float64)
+        total = chunk_total if total is None else total + chunk_total
+    return (total / n_volumes).astype(np.float32)
+
+
+def _cumulative_reduction(ufunc: np.ufunc) -> Callable:
+    def reduce(chunks: Iterable[Tuple[int, np.ndarray]], n_volumes: int) -> np.ndarray:
+        result = None
+        for _, data in chunks:
+            chunk_result = ufunc.reduce(data, axis=-1)
+            result = chunk_result if result is None else ufunc(result, chunk_result)
+        return result
+
+    return reduce
+
+
+_CUMULATIVE_AGGREGATORS = {
+    np.average: _cumulative_mean,
+    np.mean: _cumulative_mean,
+    np.min: _cumulative_reduction(np.minimum),
+    np.amin: _cumulative_reduction(np.minimum),
+    np.max: _cumulative_reduction(np.maximum),
+    np.amax: _cumulative_reduction(np.maximum),
+}
 
 
 def get_new_image_like(old_image: PathLike, new_image_data: np.ndarray) -> Nifti1Image:
@@ -123,8 +283,16 @@ def merge_nifti_images_in_time_dimension(
 
     images = _check_existence(images)
     out_file = out_file or os.path.abspath("merged_files.nii.gz")
-    volumes = _check_volumes_from_images(images)
-    merged_volume = np.concatenate(volumes, axis=-1)
+    shapes = _check_shapes_from_images(images)
+    merged_volume = np.empty(
+        shapes[0][:3] + (sum(shape[-1] for shape in shapes),), dtype=np.float32
+    )
+    position = 0
+    for image, shape in zip(images, shapes):
+        for start, data in _read_volumes_by_chunks(nib.load(image), chunk_size=16):
+            start += position
+            merged_volume[..., start : start + data.shape[-1]] = data
+        position += shape[-1]
     merged_image = get_new_image_like(images[0], merged_volume)
     nib.save(merged_image, out_file)
 
@@ -144,22 +312,28 @@ def _check_existence(filenames: Tuple[PathLike, ...]) -> Tuple[Path, ...]:
     return filenames
 
 
-def _check_volumes_from_images(images: Tuple[Path, ...]) -> Tuple[np.ndarray, ...]:
-    """Loads the images and check the dimensions."""
-    images = tuple(nib.load(i) for i in images)
-    volumes = tuple(i.get_fdata() for i in images)
-    four_dimensional_volumes = []
-    for volume in volumes:
-        if volume.ndim == 3:
-            four_dimensional_volumes.append(volume[..., np.newaxis])
-        elif volume.ndim == 4:
-            four_dimensional_volumes.append(volume)
+def _check_shapes_from_images(images: Tuple[Path, ...]) -> Tuple[Tuple[int, ...], ...]:
+    """Reads the shapes of the images as 4D shapes and check the dimensions.
+
+    Only the headers of the images are loaded.
+    """
+    shapes = []
+    for image in images:
+        shape = nib.load(image).shape
+        if len(shape) == 3:
+            shapes.append(shape + (1,))
+        elif len(shape) == 4:
+            shapes.append(shape)
         else:
             raise ValueError(
-                f"Only 3D or 4D images can be concatenated. A {volume.ndim}D image was found."
+                f"Only 3D or 4D images can be concatenated. A {len(shape)}D image was found."
             )
-
-    return tuple(four_dimensional_volumes)
+    if len({shape[:3] for shape in shapes}) > 1:
+        raise ValueError(
+            "Only images with the same spatial dimensions can be concatenated. "
+            f"Got images of shapes {[shape[:3] for shape in shapes]}."
+        )
+    return tuple(shapes)
 
 
 def remove_dummy_dimension_from_image(image: str, output: str) -> str:
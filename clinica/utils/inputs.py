@@ -8,6 +8,8 @@ from functools import partial
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from clinica.utils.dataset_index import DatasetIndex, get_dataset_index
+
 
 class DatasetType(str, Enum):
     """Defines the possible types of datasets in Clinica."""
@@ -279,6 +281,7 @@ def find_images_path(
     valid_paths: List[str],
     is_bids: bool,
     pattern: str,
+    index: Optional[DatasetIndex] = None,
 ) -> None:
     """Appends the resulting path corresponding to subject, session and pattern in valid_paths.
     If an error is encountered, its (subject,session) couple is added to the list `errors`.
@@ -313,18 +316,39 @@ def find_images_path(
 
     pattern : str
         Define the pattern of the final file.
-    """
-    from clinica.utils.stream import cprint
 
+    index : DatasetIndex, optional
+        The index of `input_directory` to query instead of the file system.
+        It is assumed to be up-to-date for the session folder.
+        If not provided, the session folder is searched with a recursive glob.
+    """
     input_directory = Path(input_directory)
-    if is_bids:
-        origin_pattern = input_directory / subject / session
+    session_folder = _get_session_folder(subject, session, is_bids)
+    if index is not None:
+        current_glob_found = [
+            str(input_directory / f) for f in index.glob(pattern, session_folder)
+        ]
     else:
-        origin_pattern = input_directory / "subjects" / subject / session
+        current_pattern = input_directory / session_folder / "**" / pattern
+        current_glob_found = insensitive_glob(str(current_pattern), recursive=True)
+    _add_found_files(current_glob_found, subject, session, errors, valid_paths)
+
+
+def _add_found_files(
+    found_files: List[str],
+    subject: str,
+    session: str,
+    errors: List[InvalidSubjectSession],
+    valid_paths: List[str],
+) -> None:
+    """Append the file found for the subject and session to `valid_paths`, or record an error.
+
+    If several files were found, the latest run is selected when they only differ
+    through their run number. Otherwise, the (subject, session) couple is added to `errors`.
+    """
+    from clinica.utils.stream import cprint
 
-    current_pattern = origin_pattern / "**" / pattern
-    current_glob_found = insensitive_glob(str(current_pattern), recursive=True)
-    if len(current_glob_found) > 1:
+    if len(found_files) > 1:
         # If we have more than one file at this point, there are two possibilities:
         #   - there is a problem somewhere which made us catch too many files
         #           --> In this case, we raise an error.
@@ -332,10 +356,10 @@ def find_images_path(
         #           --> In this case, we need to select one of these runs to proceed.
         #               Ideally, this should be done via QC but for now, we simply
         #               select the latest run and warn the user about it.
-        if _are_multiple_runs(current_glob_found):
-            selected = _select_run(current_glob_found)
+        if _are_multiple_runs(found_files):
+            selected = _select_run(found_files)
             list_of_found_files_for_reporting = ""
-            for filename in current_glob_found:
+            for filename in found_files:
                 list_of_found_files_for_reporting += f"- {filename}\n"
             cprint(
                 f"More than one run were found for subject {subject} and session {session} : "
@@ -346,11 +370,16 @@ def find_images_path(
             valid_paths.append(selected)
         else:
             errors.append(InvalidSubjectSession(subject, session))
-    elif len(current_glob_found) == 0:
+    elif len(found_files) == 0:
         errors.append(InvalidSubjectSession(subject, session))
     # Otherwise the file found is added to the result
     else:
-        valid_paths.append(current_glob_found[0])
+        valid_paths.append(found_files[0])
+
+
+def _get_session_folder(subject: str, session: str, is_bids: bool) -> str:
+    """Return the path of the session folder relative to the root of the BIDS or CAPS dataset."""
+    return f"{subject}/{session}" if is_bids else f"subjects/{subject}/{session}"
 
 
 def _are_multiple_runs(files: List[str]) -> bool:
@@ -661,7 +690,7 @@ def clinica_file_reader(
               needed to obtain the related file.
 
     n_procs : int, optional
-        Number of cores used to fetch files in parallel.
+        Number of threads used to refresh the index of the dataset in parallel.
         If set to 1, subjects and sessions will be processed sequentially.
         Default=1.
 
@@ -687,6 +716,9 @@ def clinica_file_reader(
     This function is case-insensitive, meaning that the pattern argument can, for example,
     contain upper case letters that do not exist in the existing file path.
 
+    The files are looked for in the persistent index of the dataset (see
+    `clinica.utils.dataset_index`), which is refreshed for the requested sessions only.
+
     Examples
     --------
     The paths are shortened for readability.
@@ -753,7 +785,30 @@ def clinica_file_reader(
     input_directory = Path(input_directory)
     _check_information(information)
     pattern = information["pattern"]
+    is_bids = _check_input_directory_and_sessions(input_directory, subjects, sessions)
+
+    if len(subjects) == 0:
+        return [], []
 
+    return _read_files_sequential(
+        input_directory,
+        subjects,
+        sessions,
+        is_bids,
+        pattern,
+        index=_get_sessions_index(
+            input_directory, subjects, sessions, is_bids, n_procs
+        ),
+    )
+
+
+def _check_input_directory_and_sessions(
+    input_directory: Path, subjects: Iterable[str], sessions: Iterable[str]
+) -> bool:
+    """Check the BIDS or CAPS input directory and the provided sessions.
+
+    Returns True if `input_directory` is a BIDS folder, False if it is a CAPS folder.
+    """
     is_bids = determine_caps_or_bids(input_directory)
     if is_bids:
         check_bids_folder(input_directory)
@@ -763,66 +818,112 @@ def clinica_file_reader(
     if len(subjects) != len(sessions):
         raise ValueError("Subjects and sessions must have the same length.")
 
-    if len(subjects) == 0:
-        return [], []
+    return is_bids
+
 
-    file_reader = _read_files_parallel if n_procs > 1 else _read_files_sequential
-    return file_reader(
+def _get_sessions_index(
+    input_directory: Path,
+    subjects: Iterable[str],
+    sessions: Iterable[str],
+    is_bids: bool,
+    n_procs: int = 1,
+) -> DatasetIndex:
+    """Return the index of the dataset, up-to-date for the provided sessions."""
+    return get_dataset_index(
         input_directory,
-        subjects,
-        sessions,
-        is_bids,
-        pattern,
+        directories=(
+            _get_session_folder(sub, ses, is_bids)
+            for sub, ses in zip(subjects, sessions)
+        ),
         n_procs=n_procs,
     )
 
 
-def _read_files_parallel(
+def _read_files_sequential(
     input_directory: os.PathLike,
     subjects: Iterable[str],
     sessions: Iterable[str],
     is_bids: bool,
     pattern: str,
-    n_procs: int,
+    index: Optional[DatasetIndex] = None,
 ) -> Tuple[List[str], List[InvalidSubjectSession]]:
-    from multiprocessing import Manager
-
-    from joblib import Parallel, delayed
-
-    manager = Manager()
-    shared_results = manager.list()
-    shared_errors_encountered = manager.list()
-    Parallel(n_jobs=n_procs)(
-        delayed(find_images_path)(
+    errors_encountered, results = [], []
+    for sub, ses in zip(subjects, sessions):
+        find_images_path(
             input_directory,
             sub,
             ses,
-            shared_errors_encountered,
-            shared_results,
+            errors_encountered,
+            results,
             is_bids,
             pattern,
+            index=index,
         )
-        for sub, ses in zip(subjects, sessions)
-    )
-    results = list(shared_results)
-    errors_encountered = list(shared_errors_encountered)
     return results, errors_encountered
 
 
-def _read_files_sequential(
-    input_directory: os.PathLike,
+def clinica_batch_file_reader(
     subjects: Iterable[str],
     sessions: Iterable[str],
-    is_bids: bool,
-    pattern: str,
-    **kwargs,
-) -> Tuple[List[str], List[InvalidSubjectSession]]:
-    errors_encountered, results = [], []
+    input_directory: os.PathLike,
+    list_information: List[Dict],
+    n_procs: int = 1,
+) -> Tuple[List[List[str]], List[List[InvalidSubjectSession]]]:
+    """Read files for several patterns in BIDS or CAPS directory based on participant ID(s).
+
+    This is equivalent to calling `clinica_file_reader` for each item of `list_information`,
+    but the input directory is checked once, and each session folder is traversed once
+    while matching all the patterns at the same time.
+
+    Parameters
+    ----------
+    subjects : List[str]
+        List of subjects.
+
+    sessions : List[str]
+        List of sessions. Must be same size as `subjects` and must correspond.
+
+    input_directory : PathLike
+        Path to the BIDS or CAPS directory to read from.
+
+    list_information : List[Dict]
+        List of information dictionaries described in `clinica_file_reader`.
+
+    n_procs : int, optional
+        Number of threads used to refresh the index of the dataset in parallel.
+        Default=1.
+
+    Returns
+    -------
+    results : List[List[str]]
+        For each item of `list_information`, the list of files respecting
+        the subject/session order provided in input.
+
+    errors : List[List[InvalidSubjectSession]]
+        For each item of `list_information`, the list of tuples (subject, session)
+        which were identified as invalid (too many files or none).
+    """
+    input_directory = Path(input_directory)
+    _check_information(list_information)
+    is_bids = _check_input_directory_and_sessions(input_directory, subjects, sessions)
+    results = [[] for _ in list_information]
+    errors = [[] for _ in list_information]
+    if len(subjects) == 0:
+        return results, errors
+
+    patterns = [information["pattern"] for information in list_information]
+    index = _get_sessions_index(input_directory, subjects, sessions, is_bids, n_procs)
     for sub, ses in zip(subjects, sessions):
-        find_images_path(
-            input_directory, sub, ses, errors_encountered, results, is_bids, pattern
-        )
-    return results, errors_encountered
+        found_files = index.glob_many(patterns, _get_session_folder(sub, ses, is_bids))
+        for files, valid_paths, errors_encountered in zip(found_files, results, errors):
+            _add_found_files(
+                [str(input_directory / f) for f in files],
+                sub,
+                ses,
+                errors_encountered,
+                valid_paths,
+            )
+    return results, errors
 
 
 def clinica_list_of_files_reader(
@@ -834,8 +935,9 @@ def clinica_list_of_files_reader(
 ) -> List[List[str]]:
     """Read list of BIDS or CAPS files.
 
-    This function iterates calls of `clinica_file_reader` to extract input files based
-    on information given by `list_information`.
+    This function relies on `clinica_batch_file_reader` to extract input files based
+    on information given by `list_information`, all the patterns being matched in a
+    single pass over each session folder.
 
     Parameters
     ----------
@@ -863,17 +965,15 @@ def clinica_list_of_files_reader(
     """
     from .exceptions import ClinicaBIDSError
 
-    all_errors = []
-    list_found_files = []
-    for info_file in list_information:
-        files, errors = clinica_file_reader(
-            participant_ids,
-            session_ids,
-            bids_or_caps_directory,
-            info_file,
-        )
-        all_errors.append(errors)
-        list_found_files.append([] if errors else files)
+    list_found_files, all_errors = clinica_batch_file_reader(
+        participant_ids,
+        session_ids,
+        bids_or_caps_directory,
+        list_information,
+    )
+    list_found_files = [
+        [] if errors else files for files, errors in zip(list_found_files, all_errors)
+    ]
 
     if any(all_errors) and raise_exception:
         error_message = "Clinica faced error(s) while trying to read files in your BIDS or CAPS directory.\n"
@@ -928,8 +1028,9 @@ def clinica_group_reader(
     caps_directory = Path(caps_directory)
     check_caps_folder(caps_directory)
 
-    current_pattern = caps_directory / "**" / pattern
-    found_files = insensitive_glob(str(current_pattern), recursive=True)
+    found_files = [
+        str(caps_directory / f) for f in get_dataset_index(caps_directory).glob(pattern)
+    ]
 
     # Since we are returning found_files[0], force raising even if raise_exception is False
     # Otherwise we'll get an uninformative IndexError...
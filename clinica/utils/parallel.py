@@ -0,0 +1,85 @@
+"""This module contains utilities to run tasks in parallel in Clinica."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from itertools import chain
+from math import ceil
+from typing import Callable, List, Optional, Sequence, TypeVar, Union
+
+__all__ = ["ParallelBackend", "map_in_chunks"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ParallelBackend(str, Enum):
+    """The possible kinds of workers to run tasks in parallel.
+
+    THREADS should be used for I/O-bound tasks like file system walks.
+    PROCESSES should be used for CPU-bound tasks holding the GIL.
+    """
+
+    THREADS = "threads"
+    PROCESSES = "processes"
+
+
+def _apply_to_chunk(func: Callable[[T], R], chunk: Sequence[T]) -> List[R]:
+    return [func(item) for item in chunk]
+
+
+def _split_in_chunks(items: Sequence[T], chunk_size: int) -> List[Sequence[T]]:
+    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def map_in_chunks(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    n_procs: int = 1,
+    chunk_size: Optional[int] = None,
+    backend: Union[str, ParallelBackend] = ParallelBackend.THREADS,
+) -> List[R]:
+    """Apply the function to all the items with a pool of workers.
+
+    The items are split into chunks which are sent to the workers, and each worker
+    returns the results computed for its chunk. Workers do not share any state.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to apply to each item. It must be picklable
+        (that is defined at the top level of a module) with the
+        PROCESSES backend.
+
+    items : Sequence
+        The items to process.
+
+    n_procs : int, optional
+        The number of workers. If set to 1, the items are processed sequentially
+        in the current process. Default=1.
+
+    chunk_size : int, optional
+        The number of items sent to a worker at once.
+        By default, items are split in four chunks per worker.
+
+    backend : str or ParallelBackend, optional
+        The kind of workers to use. Default="threads".
+
+    Returns
+    -------
+    List :
+        The results, in the order of the provided items.
+    """
+    backend = ParallelBackend(backend)
+    items = list(items)
+    if n_procs <= 1 or len(items) <= 1:
+        return _apply_to_chunk(func, items)
+    chunk_size = chunk_size or max(1, ceil(len(items) / (4 * n_procs)))
+    chunks = _split_in_chunks(items, chunk_size)
+    executor = (
+        ThreadPoolExecutor
+        if backend == ParallelBackend.THREADS
+        else ProcessPoolExecutor
+    )
+    with executor(max_workers=min(n_procs, len(chunks))) as pool:
+        results = pool.map(_apply_to_chunk, [func] * len(chunks), chunks)
+        return list(chain.from_iterable(results))
@@ -1,13 +1,175 @@
 """This module contains utilities for statistics.
 
-Currently, it contains one function to generate TSV file containing mean map based on a parcellation.
+Currently, it contains functions to generate TSV files containing mean maps based on a parcellation.
 """
+
 from os import PathLike
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from nibabel import Nifti1Image
 
 from clinica.utils.atlas import AtlasName, BaseAtlas
 
+__all__ = [
+    "compute_statistics_on_labels",
+    "statistics_on_atlas",
+    "statistics_on_atlases",
+]
+
+
+def compute_statistics_on_labels(
+    maps: np.ndarray,
+    labels: np.ndarray,
+    label_values: Sequence[int],
+) -> Dict[str, np.ndarray]:
+    """Compute the mean, standard deviation and number of voxels of maps on each label.
+
+    All labels are processed in a single pass over the voxels, and the maps of
+    a batch are processed together.
+
+    Parameters
+    ----------
+    maps : np.ndarray
+        The scalar map with the same shape as `labels`, or a batch of maps
+        stacked along the first axis.
+
+    labels : np.ndarray
+        The integer labels of the voxels (for instance the labels of an atlas).
+
+    label_values : Sequence of int
+        The labels on which statistics are computed.
+
+    Returns
+    -------
+    dict of np.ndarray :
+        The 'mean', 'std' and 'count' of the voxels of each label. Mean and standard
+        deviation have shape (len(label_values),) for a single map, and
+        (n_maps, len(label_values)) for a batch. Labels without any voxel have
+        NaN mean and standard deviation.
+    """
+    maps = np.asarray(maps)
+    single_map = maps.shape == labels.shape
+    if single_map:
+        maps = maps[np.newaxis]
+    if maps.shape[1:] != labels.shape:
+        raise ValueError(
+            f"The maps of shape {maps.shape[1:]} do not have the shape "
+            f"of the labels {labels.shape}."
+        )
+    labels = np.rint(labels).astype(np.int64, copy=False).ravel()
+    label_values = np.asarray(label_values, dtype=np.int64)
+    if labels.min(initial=0) < 0 or label_values.min(initial=0) < 0:
+        raise ValueError("Labels must be non-negative integers.")
+    n_bins = int(max(labels.max(initial=0), label_values.max(initial=0))) + 1
+
+    count = np.bincount(labels, minlength=n_bins)[label_values]
+    mean = np.empty((len(maps), len(label_values)))
+    std = np.empty((len(maps), len(label_values)))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for i, scalar_map in enumerate(maps):
+            scalar_map = scalar_map.ravel().astype(np.float64)
+            sums = np.bincount(labels, weights=scalar_map, minlength=n_bins)
+            squares = np.bincount(labels, weights=scalar_map**2, minlength=n_bins)
+            mean[i] = sums[label_values] / count
+            std[i] = np.sqrt(
+                np.maximum(squares[label_values] / count - mean[i] ** 2, 0)
+            )
+
+    if single_map:
+        mean, std = mean[0], std[0]
+    return {"mean": mean, "std": std, "count": count}
+
+
+def _get_default_output_filename(in_normalized_map: Path, atlas: BaseAtlas) -> Path:
+    filename, ext = in_normalized_map.stem, in_normalized_map.suffix
+    if ext == ".gz":
+        filename = Path(filename).stem
+    return Path(f"{filename}_statistics_{atlas.name}.tsv").resolve()
+
+
+def statistics_on_atlases(
+    in_normalized_map: Union[str, PathLike, Nifti1Image],
+    atlases: Sequence[Union[str, AtlasName, BaseAtlas]],
+    out_files: Optional[Sequence[Union[str, PathLike]]] = None,
+) -> List[str]:
+    """Compute statistics of a map on several atlases.
+
+    The map is loaded once for all the atlases.
+
+    Parameters
+    ----------
+    in_normalized_map : str or Nifti1Image
+        File containing a scalar image registered on the atlases,
+        or the image itself if it is already in memory. In the latter
+        case, `out_files` must be provided.
+
+    atlases : list of BaseAtlas or AtlasName or str
+        The atlases with a set of ROI. These ROI are used to compute statistics.
+        If strings are given, they are assumed to be the names of the atlases to be used.
+
+    out_files : list of str, optional
+        Names of the output files, one per atlas.
+
+    Returns
+    -------
+    out_files : list of str
+        TSV files containing the mean scalar of each ROI of each atlas.
+
+    See also
+    --------
+    statistics_on_atlas
+    """
+    import nibabel as nib
+    import pandas as pd
+
+    from clinica.utils.stream import cprint
+
+    from .atlas import atlas_factory
+
+    atlases = [atlas_factory(atlas) for atlas in atlases]
+    if isinstance(in_normalized_map, Nifti1Image):
+        if out_files is None:
+            raise ValueError(
+                "The output files must be provided to compute statistics "
+                "on an image in memory."
+            )
+        img_data = in_normalized_map.get_fdata(dtype="float32")
+    else:
+        in_normalized_map = Path(in_normalized_map)
+        img_data = nib.load(in_normalized_map).get_fdata(dtype="float32")
+    if out_files is None:
+        out_files = [
+            _get_default_output_filename(in_normalized_map, atlas) for atlas in atlases
+        ]
+    if len(out_files) != len(atlases):
+        raise ValueError(
+            f"{len(out_files)} output files were provided for {len(atlases)} atlases."
+        )
+
+    for atlas, out_file in zip(atlases, out_files):
+        atlas_labels_data = atlas.get_label_data()
+        atlas_correspondence = atlas.get_roi_table()
+        label_name = list(atlas_correspondence.roi_name)
+        # TODO create roi_value column in lut_*.txt and remove irrelevant RGB information
+        label_value = list(atlas_correspondence.roi_value)
+
+        statistics = compute_statistics_on_labels(
+            img_data, atlas_labels_data, label_value
+        )
+
+        try:
+            data = pd.DataFrame(
+                {"label_name": label_name, "mean_scalar": statistics["mean"]}
+            )
+            data.to_csv(out_file, sep="\t", index=True, encoding="utf-8")
+        except Exception as e:
+            cprint(msg=f"Impossible to save {out_file} with pandas", lvl="error")
+            raise e
+
+    return list(out_files)
+
 
 def statistics_on_atlas(
     in_normalized_map: Union[str, PathLike],
@@ -34,50 +196,14 @@ def statistics_on_atlas(
     Returns
     -------
     out_file : str
-        TSV file containing the statistics (content of the columns: label,
-        mean scalar, std of the scalar', number of voxels).
-    """
-    import nibabel as nib
-    import numpy as np
-    import pandas as pd
-
-    from clinica.utils.stream import cprint
-
-    from .atlas import atlas_factory
+        TSV file containing the statistics (content of the columns: label
+        name, mean scalar).
 
-    atlas = atlas_factory(atlas)
-    in_normalized_map = Path(in_normalized_map)
-    if not out_file:
-        filename, ext = in_normalized_map.stem, in_normalized_map.suffix
-        if ext == ".gz":
-            filename = Path(filename).stem
-        out_file = Path(f"{filename}_statistics_{atlas.name}.tsv").resolve()
-
-    atlas_labels = nib.load(atlas.labels)
-    atlas_labels_data = atlas_labels.get_fdata(dtype="float32")
-
-    img = nib.load(in_normalized_map)
-    img_data = img.get_fdata(dtype="float32")
-
-    atlas_correspondence = pd.read_csv(atlas.tsv_roi, sep="\t")
-    label_name = list(atlas_correspondence.roi_name)
-    # TODO create roi_value column in lut_*.txt and remove irrelevant RGB information
-    label_value = list(atlas_correspondence.roi_value)
-
-    mean_signal_value = []
-    for label in label_value:
-        current_mask_label = atlas_labels_data == label
-        masked_data = np.array(img_data, copy=True)
-        masked_data[np.invert(current_mask_label)] = 0
-        mean_signal_value.append(np.sum(masked_data) / np.sum(current_mask_label))
-
-    try:
-        data = pd.DataFrame(
-            {"label_name": label_name, "mean_scalar": mean_signal_value}
-        )
-        data.to_csv(out_file, sep="\t", index=True, encoding="utf-8")
-    except Exception as e:
-        cprint(msg=f"Impossible to save {out_file} with pandas", lvl="error")
-        raise e
-
-    return out_file
+    See also
+    --------
+    statistics_on_atlases
+    compute_statistics_on_labels
+    """
+    return statistics_on_atlases(
+        in_normalized_map, [atlas], None if not out_file else [out_file]
+    )[0]
@@ -1,7 +1,10 @@
 """This module handles stream and log redirection."""
+
+import logging
 import warnings
+from contextlib import contextmanager
 from enum import IntEnum
-from typing import Optional, Type, Union
+from typing import Iterator, Optional, Type, Union
 
 __all__ = [
     "LoggingLevel",
@@ -9,6 +12,8 @@ __all__ = [
     "cprint",
     "log_and_raise",
     "log_and_warn",
+    "listen_to_worker_logs",
+    "setup_worker_logging",
 ]
 
 
@@ -101,3 +106,59 @@ def log_and_warn(message: str, warning_type: Type[Warning]):
     """
     cprint(message, lvl=LoggingLevel.WARNING)
     warnings.warn(message, warning_type)
+
+
+class _ForwardingHandler(logging.Handler):
+    """Handle a record received from a worker with the logger of the same name."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+@contextmanager
+def listen_to_worker_logs() -> Iterator:
+    """Gather the records logged by worker processes in the current process.
+
+    The yielded queue should be given to `setup_worker_logging` in each worker
+    (for instance as the initializer of a process pool). The records put in the
+    queue by the workers are handled by a thread of the current process with
+    the loggers and handlers configured in this process, such that messages of
+    concurrent workers are neither lost nor interleaved. The workers should
+    exit normally (e.g. the pool is closed and joined) before leaving the
+    context, otherwise their last records may not reach the queue.
+
+    Yields
+    ------
+    multiprocessing.Queue :
+        The queue to which the workers send their records.
+    """
+    from logging.handlers import QueueListener
+    from multiprocessing import Queue
+
+    queue = Queue()
+    listener = QueueListener(queue, _ForwardingHandler())
+    listener.start()
+    try:
+        yield queue
+    finally:
+        listener.stop()
+        queue.close()
+
+
+def setup_worker_logging(queue, level: int) -> None:
+    """Send the records of the Clinica logger of a worker process to the provided queue.
+
+    Parameters
+    ----------
+    queue : multiprocessing.Queue
+        The queue yielded by `listen_to_worker_logs` in the parent process.
+
+    level : int
+        The logging level of the Clinica logger in the parent process.
+    """
+    from logging.handlers import QueueHandler
+
+    logger = logging.getLogger("clinica")
+    logger.handlers = [QueueHandler(queue)]
+    logger.setLevel(level)
+    logger.propagate = False
@@ -0,0 +1,102 @@
+"""Benchmark the cold start of the `clinica` command line.
+
+Each command is run in a fresh interpreter with `python -X importtime`, and the
+benchmark reports, per command:
+
+    - the wall-clock time of the process,
+    - the cumulative import time and the number of imported modules,
+    - the heavy third-party stacks which were imported.
+
+Usage:
+
+    python -m test.benchmarks.bench_cli_startup
+    python -m test.benchmarks.bench_cli_startup --command "run t1-linear --help"
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from typing import List, Set, Tuple
+
+DEFAULT_COMMANDS = [
+    "--help",
+    "iotools --help",
+    "iotools describe --help",
+    "convert --help",
+    "convert adni-to-bids --help",
+    "run --help",
+    "run t1-linear --help",
+    "run machinelearning-classification --help",
+]
+
+HEAVY_PACKAGES = [
+    "nipype",
+    "pydra",
+    "sklearn",
+    "xgboost",
+    "nilearn",
+    "brainstat",
+    "torch",
+]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> Tuple[float, Set[str]]:
+    """Return the total import time in seconds and the names of the imported modules."""
+    import_time, modules = 0.0, set()
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            modules.add(match.group(4))
+            # Cumulative times of the modules imported at the top level.
+            if len(match.group(3)) == 1:
+                import_time += int(match.group(2)) * 1e-6
+    return import_time, modules
+
+
+def run_command(command: str, n_repeats: int) -> Tuple[float, float, int, List[str]]:
+    durations = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "clinica.cmdline"]
+            + command.split(),
+            capture_output=True,
+            text=True,
+        )
+        durations.append(time.perf_counter() - start)
+    import_time, modules = parse_importtime(result.stderr)
+    packages = {module.split(".")[0] for module in modules}
+    imported = [package for package in HEAVY_PACKAGES if package in packages]
+    return min(durations), import_time, len(modules), imported
+
+
+def main(args) -> None:
+    print(
+        f"{'command':<45} {'wall (s)':>9} {'imports (s)':>12} {'modules':>8}   "
+        "heavy imports"
+    )
+    for command in args.command or DEFAULT_COMMANDS:
+        duration, import_time, n_modules, imported = run_command(
+            command, args.n_repeats
+        )
+        print(
+            f"{command:<45} {duration:9.2f} {import_time:12.2f} {n_modules:8d}   "
+            f"{', '.join(imported) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--command",
+        action="append",
+        help="Arguments of the clinica command to benchmark (repeatable).",
+    )
+    parser.add_argument("--n-repeats", type=int, default=3)
+    main(parser.parse_args())
@@ -0,0 +1,83 @@
+"""Benchmark the discovery of input files on a synthetic BIDS dataset.
+
+This compares, on a dataset with many sessions:
+
+    - the recursive glob of each session folder (`find_images_path` without index),
+    - building the dataset index sequentially and with a pool of threads,
+    - refreshing an up-to-date index and querying it with `clinica_file_reader`.
+
+Usage:
+
+    python -m test.benchmarks.bench_file_reader --n-sessions 10000 --n-procs 8
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from clinica.utils.dataset_index import DatasetIndex
+from clinica.utils.inputs import clinica_file_reader, find_images_path
+
+T1W = {"pattern": "sub-*_ses-*_t1w.nii*", "description": "T1w MRI"}
+
+
+def build_dataset(root: Path, n_sessions: int) -> tuple[list[str], list[str]]:
+    with open(root / "dataset_description.json", "w") as fp:
+        json.dump({"Name": "Benchmark", "BIDSVersion": "1.7.0"}, fp)
+    subjects, sessions = [], []
+    for i in range(n_sessions):
+        subject, session = f"sub-{i // 4:05d}", f"ses-M{6 * (i % 4):03d}"
+        for modality, suffix in (("anat", "T1w"), ("anat", "FLAIR"), ("pet", "pet")):
+            folder = root / subject / session / modality
+            folder.mkdir(parents=True, exist_ok=True)
+            for extension in (".nii.gz", ".json"):
+                (folder / f"{subject}_{session}_{suffix}{extension}").touch()
+        subjects.append(subject)
+        sessions.append(session)
+    return subjects, sessions
+
+
+def timeit(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{label:<50} {time.perf_counter() - start:8.2f} s")
+
+
+def main(n_sessions: int, n_procs: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        subjects, sessions = build_dataset(root, n_sessions)
+        folders = [f"{sub}/{ses}" for sub, ses in zip(subjects, sessions)]
+        print(f"Synthetic BIDS dataset with {n_sessions} sessions in {root}")
+
+        def glob_sessions():
+            errors, results = [], []
+            for sub, ses in zip(subjects, sessions):
+                find_images_path(root, sub, ses, errors, results, True, T1W["pattern"])
+
+        timeit("Recursive glob per session (sequential)", glob_sessions)
+        timeit(
+            "Build index (sequential)",
+            lambda: DatasetIndex(root).refresh(folders, n_procs=1),
+        )
+        timeit(
+            f"Build index ({n_procs} threads)",
+            lambda: DatasetIndex(root).refresh(folders, n_procs=n_procs),
+        )
+        clinica_file_reader(subjects, sessions, root, T1W, n_procs=n_procs)
+        time.sleep(2)
+        clinica_file_reader(subjects, sessions, root, T1W, n_procs=n_procs)
+        timeit(
+            "clinica_file_reader with up-to-date index",
+            lambda: clinica_file_reader(subjects, sessions, root, T1W),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-sessions", type=int, default=10000)
+    parser.add_argument("--n-procs", type=int, default=8)
+    args = parser.parse_args()
+    main(args.n_sessions, args.n_procs)
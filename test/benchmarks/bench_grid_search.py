@@ -0,0 +1,95 @@
+"""Benchmark the hyperparameter grid search of the kernel and linear classifiers.
+
+This runs the RepeatedKFoldCV validation of `DualSVMAlgorithm` and `LogisticReg`
+on synthetic data, with:
+
+    - the former grid search, fitting a calibrated classifier from scratch
+      for every (inner fold, C) pair,
+    - the current grid search, fitting uncalibrated classifiers along the
+      C path of each inner fold, with warm starts for the logistic regression.
+
+Usage:
+
+    python -m test.benchmarks.bench_grid_search --n-subjects 300 --n-features 5000
+"""
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from clinica.pipelines.machine_learning import algorithm, validation
+from clinica.pipelines.machine_learning.ml_utils import evaluate_prediction
+
+
+class FormerDualSVMAlgorithm(algorithm.DualSVMAlgorithm):
+    def _grid_search(self, kernel_train, x_test, y_train, y_test):
+        accuracies = {}
+        for c in self._algorithm_params["c_range"]:
+            _, y_hat, _, _ = self._launch_svc(kernel_train, x_test, y_train, y_test, c)
+            accuracies[c] = evaluate_prediction(y_test, y_hat)["balanced_accuracy"]
+        return accuracies
+
+
+class FormerLogisticReg(algorithm.LogisticReg):
+    def _grid_search(self, x_train, x_test, y_train, y_test):
+        accuracies = {}
+        for c in self._algorithm_params["c_range"]:
+            _, y_hat, _, _ = self._launch_logistic_reg(
+                x_train, x_test, y_train, y_test, c
+            )
+            accuracies[c] = evaluate_prediction(y_test, y_hat)["balanced_accuracy"]
+        return accuracies
+
+
+def run_validation(algorithm_class, data, y, args) -> float:
+    ml_algorithm = algorithm_class(data, y, {"n_threads": args.n_procs})
+    cv = validation.RepeatedKFoldCV(
+        ml_algorithm,
+        {
+            "n_iterations": args.n_iterations,
+            "n_folds": args.n_folds,
+            "n_threads": args.n_procs,
+        },
+    )
+    start = time.perf_counter()
+    _, best_parameters, _ = cv.validate(y)
+    duration = time.perf_counter() - start
+    print(
+        f"{algorithm_class.__name__:<25} {duration:8.2f} s   "
+        f"C={best_parameters['c']:.3g}   "
+        f"balanced accuracy={best_parameters['balanced_accuracy']:.3f}"
+    )
+    return duration
+
+
+def main(args) -> None:
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(args.n_subjects, args.n_features))
+    y = (x[:, :10].sum(axis=1) + rng.normal(size=args.n_subjects) > 0).astype(int)
+    kernel = x @ x.T
+    print(
+        f"RepeatedKFoldCV ({args.n_iterations} x {args.n_folds} folds, "
+        f"{args.n_procs} workers) on {args.n_subjects} subjects "
+        f"with {args.n_features} features"
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for former, current, data in (
+            (FormerDualSVMAlgorithm, algorithm.DualSVMAlgorithm, kernel),
+            (FormerLogisticReg, algorithm.LogisticReg, x),
+        ):
+            duration = run_validation(former, data, y, args)
+            speedup = duration / run_validation(current, data, y, args)
+            print(f"{'Speedup':<25} {speedup:8.2f} x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-subjects", type=int, default=300)
+    parser.add_argument("--n-features", type=int, default=5000)
+    parser.add_argument("--n-iterations", type=int, default=2)
+    parser.add_argument("--n-folds", type=int, default=5)
+    parser.add_argument("--n-procs", type=int, default=8)
+    main(parser.parse_args())
@@ -0,0 +1,171 @@
+"""Benchmark the matching of ADNI MRI visits with ADNIMERGE timepoints.
+
+This matches the visits of a synthetic ADNI cohort with:
+
+    - the former implementation, copied in this module, matching the visits of
+      each subject on the filtered and sorted ADNIMERGE and MRI list of this
+      subject,
+    - the current implementation, calling `visits_to_timepoints_by_subject`
+      once for the whole cohort.
+
+The benchmark checks that both implementations give the same timepoints.
+
+Usage:
+
+    python -m test.benchmarks.bench_visits_to_timepoints --n-subjects 2000
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from clinica.iotools.converters.adni_to_bids.adni_utils import ADNIStudy
+from clinica.iotools.converters.adni_to_bids.modality_converters._visits_utils import (
+    _get_preferred_visit_name,
+    visits_to_timepoints_by_subject,
+)
+
+VISIT_CODES = ["bl", "m03", "m06", "m12", "m18", "m24", "m36", "m48", "m60", "m72"]
+STUDIES = ["ADNI1", "ADNIGO", "ADNI2", "ADNI3"]
+
+
+def _days_between(date_1: str, date_2: str) -> int:
+    return abs(
+        (
+            datetime.strptime(date_2, "%Y-%m-%d")
+            - datetime.strptime(date_1, "%Y-%m-%d")
+        ).days
+    )
+
+
+def former_closest_visit(image_acquisition_date: str, visits: list):
+    if len(visits) == 0:
+        return None
+    if len(visits) == 1:
+        return visits[0]
+    differences = [_days_between(image_acquisition_date, v.EXAMDATE) for v in visits]
+    idx = np.argsort(differences)
+    closest, second = visits[idx[0]], visits[idx[1]]
+    # If the image is between the two closest timepoints, close to the middle,
+    # the earlier timepoint is preferred
+    if (
+        differences[idx[0]] > 90
+        and closest.EXAMDATE > image_acquisition_date > second.EXAMDATE
+        and abs(
+            _days_between(closest.EXAMDATE, second.EXAMDATE) / 2.0 - differences[idx[0]]
+        )
+        < 30
+    ):
+        return second
+    return closest
+
+
+def former_visits_to_timepoints(
+    subject, mri_list_subj, adnimerge_subj, modality, visit_field, scandate_field
+) -> dict:
+    if modality == "T1":
+        mri_list_subj = mri_list_subj[mri_list_subj[visit_field] != "ADNI Baseline"]
+    visits = dict()
+    unique_visits = list(mri_list_subj[visit_field].unique())
+    pending_timepoints = []
+    for _, visit in adnimerge_subj.iterrows():
+        preferred_visit_name = _get_preferred_visit_name(
+            ADNIStudy(visit.ORIGPROT), visit.VISCODE
+        )
+        if preferred_visit_name in unique_visits:
+            key = (visit.VISCODE, visit.COLPROT, visit.ORIGPROT)
+            if key not in visits:
+                visits[key] = preferred_visit_name
+            unique_visits.remove(preferred_visit_name)
+            continue
+        pending_timepoints.append(visit)
+    for visit in unique_visits:
+        image = (mri_list_subj[mri_list_subj[visit_field] == visit]).iloc[0]
+        closest_visit = former_closest_visit(image[scandate_field], pending_timepoints)
+        if closest_visit is None:
+            continue
+        key = (closest_visit.VISCODE, closest_visit.COLPROT, closest_visit.ORIGPROT)
+        if key not in visits:
+            visits[key] = image[visit_field]
+    return visits
+
+
+def make_cohort(n_subjects: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    adnimerge, mri_list = [], []
+    for i in range(n_subjects):
+        subject = f"{i % 1000:03d}_S_{i:04d}"
+        study = STUDIES[rng.integers(len(STUDIES))]
+        baseline = pd.Timestamp(2005, 1, 1) + pd.Timedelta(
+            days=int(rng.integers(0, 4000))
+        )
+        for visit_code in VISIT_CODES[: rng.integers(2, len(VISIT_CODES))]:
+            month = 0 if visit_code == "bl" else int(visit_code[1:])
+            exam_date = baseline + pd.Timedelta(days=30 * month)
+            adnimerge.append(
+                {
+                    "PTID": subject,
+                    "VISCODE": visit_code,
+                    "COLPROT": study,
+                    "ORIGPROT": study,
+                    "EXAMDATE": exam_date.strftime("%Y-%m-%d"),
+                }
+            )
+            if rng.random() < 0.2:
+                continue
+            if rng.random() < 0.6:
+                visit = _get_preferred_visit_name(ADNIStudy(study), visit_code)
+            else:
+                visit = f"Unscheduled {rng.integers(3)}"
+            jitter = int(rng.normal(0, 60))
+            for _ in range(rng.integers(1, 3)):
+                mri_list.append(
+                    {
+                        "SUBJECT": subject,
+                        "VISIT": visit,
+                        "SCANDATE": (exam_date + pd.Timedelta(days=jitter)).strftime(
+                            "%Y-%m-%d"
+                        ),
+                    }
+                )
+    return pd.DataFrame(mri_list), pd.DataFrame(adnimerge)
+
+
+def main(args) -> None:
+    mri_list, adnimerge = make_cohort(args.n_subjects)
+    subjects = list(adnimerge.PTID.unique())
+    print(
+        f"{len(subjects)} subjects, {len(adnimerge)} ADNIMERGE visits, "
+        f"{len(mri_list)} scans"
+    )
+
+    start = time.perf_counter()
+    former = {}
+    for subject in subjects:
+        adnimerge_subj = adnimerge[adnimerge.PTID == subject].sort_values("EXAMDATE")
+        mri_list_subj = mri_list[mri_list.SUBJECT == subject].sort_values("SCANDATE")
+        if visits := former_visits_to_timepoints(
+            subject, mri_list_subj, adnimerge_subj, "DWI", "VISIT", "SCANDATE"
+        ):
+            former[subject] = visits
+    former_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = visits_to_timepoints_by_subject(mri_list, adnimerge, "DWI", subjects)
+    current_duration = time.perf_counter() - start
+
+    if current != former:
+        different = [s for s in subjects if current.get(s) != former.get(s)]
+        raise AssertionError(f"Timepoints differ for subjects {different[:10]}")
+    print(f"{'Per-subject matching':<25} {former_duration:8.2f} s")
+    print(f"{'Cohort matching':<25} {current_duration:8.2f} s")
+    print(f"{'Speedup':<25} {former_duration / current_duration:8.2f} x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-subjects", type=int, default=2000)
+    main(parser.parse_args())
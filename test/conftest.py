@@ -25,3 +25,19 @@ def cmdopt(request):
     config_param["input"] = request.config.getoption("--input_data_directory")
     config_param["wd"] = request.config.getoption("--working_directory")
     return config_param
+
+
+@pytest.fixture(autouse=True)
+def clinica_cache_folders(tmp_path_factory, monkeypatch):
+    """Store the data cached by Clinica during the tests in a temporary folder."""
+    monkeypatch.setenv(
+        "CLINICA_CACHE_DIR", str(tmp_path_factory.getbasetemp() / "cache")
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_atlas_registry():
+    """Do not share the atlas files cached in memory between tests, which may mock them."""
+    from clinica.utils.atlas import get_atlas_registry
+
+    get_atlas_registry().clear()
@@ -1,4 +1,6 @@
+import os
 import shutil
+import subprocess
 from os import fspath
 from pathlib import Path
 from test.nonregression.testing_tools import configure_paths
@@ -79,6 +81,79 @@ def run_pet_surface(
             )
 
 
+@pytest.mark.slow
+@pytest.mark.skipif(
+    shutil.which("mri_vol2surf") is None, reason="FreeSurfer is not installed."
+)
+def test_sample_volume_on_surfaces_matches_mri_vol2surf(cmdopt, tmp_path, monkeypatch):
+    """The vectorized projection of the pipeline gives the output of mri_vol2surf."""
+    from clinica.pipelines.pet_surface.pet_surface_utils import (
+        sample_volume_on_surfaces,
+    )
+
+    base_dir = Path(cmdopt["input"])
+    input_dir, tmp_dir, _ = configure_paths(base_dir, tmp_path, "PETSurface")
+    subjects_dir = (
+        input_dir
+        / "caps"
+        / "subjects"
+        / "sub-ADNI011S4105"
+        / "ses-M000"
+        / "t1"
+        / "freesurfer_cross_sectional"
+    )
+    freesurfer_id = "sub-ADNI011S4105_ses-M000"
+    orig_nu = subjects_dir / freesurfer_id / "mri" / "orig_nu.mgz"
+    # A volume registered on orig_nu by its header, on a coarser grid
+    image = nib.load(orig_nu)
+    volume = tmp_dir / "volume.nii.gz"
+    nib.Nifti1Image(
+        np.asanyarray(image.dataobj, dtype="float32")[::2, ::2, ::2],
+        image.affine @ np.diag([2.0, 2.0, 2.0, 1.0]),
+    ).to_filename(volume)
+    monkeypatch.chdir(tmp_dir)
+
+    for hemisphere in HemiSphere:
+        reference = tmp_dir / f"{hemisphere.value}.mri_vol2surf.mgh"
+        subprocess.run(
+            [
+                "mri_vol2surf",
+                "--mov",
+                fspath(volume),
+                "--o",
+                fspath(reference),
+                "--surf",
+                "white",
+                "--hemi",
+                hemisphere.value,
+                "--regheader",
+                freesurfer_id,
+                "--ref",
+                "orig_nu.mgz",
+                "--interp",
+                "nearest",
+            ],
+            check=True,
+            env={**os.environ, "SUBJECTS_DIR": fspath(subjects_dir)},
+            stdout=subprocess.DEVNULL,
+        )
+        projection = sample_volume_on_surfaces(
+            fspath(volume),
+            [
+                fspath(
+                    subjects_dir / freesurfer_id / "surf" / f"{hemisphere.value}.white"
+                )
+            ],
+            fspath(orig_nu),
+            coefficients=[1.0],
+        )
+        expected = np.squeeze(nib.load(reference).get_fdata(dtype="float32"))
+        result = np.squeeze(nib.load(projection).get_fdata(dtype="float32"))
+        assert result.shape == expected.shape
+        # Vertices lying exactly between two voxels may be rounded differently
+        assert np.mean(np.isclose(result, expected)) > 0.999
+
+
 @pytest.mark.slow
 def test_run_pet_surface_longitudinal(cmdopt, tmp_path):
     base_dir = Path(cmdopt["input"])
@@ -0,0 +1,169 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from clinica.iotools.converters.adni_to_bids.modality_converters._image_path_utils import (
+    build_image_index,
+    find_image_path,
+    load_image_index,
+)
+
+
+@pytest.fixture
+def source_dir(tmp_path) -> Path:
+    dicom_folder = tmp_path / "123_S_4567" / "MPRAGE" / "2012-01-01" / "I100"
+    dicom_folder.mkdir(parents=True)
+    for slice_number in range(3):
+        (dicom_folder / f"ADNI_123_S_4567_MR_MPRAGE_{slice_number}_I100.dcm").touch()
+    nifti_folder = tmp_path / "123_S_4567" / "FDG" / "2013-01-01" / "I200"
+    nifti_folder.mkdir(parents=True)
+    (nifti_folder / "ADNI_123_S_4567_PT_FDG_I200.nii").touch()
+    other_subject = tmp_path / "234_S_5678" / "MPRAGE" / "I300"
+    other_subject.mkdir(parents=True)
+    (other_subject / "ADNI_234_S_5678_MR_MPRAGE_I300.dcm").touch()
+    return tmp_path
+
+
+def test_build_image_index(source_dir):
+    index = build_image_index(source_dir).set_index(["Subject_ID", "Image_ID"])
+
+    assert len(index) == 3
+    assert index.loc[("123_S_4567", "100")].Path == str(
+        source_dir / "123_S_4567" / "MPRAGE" / "2012-01-01" / "I100"
+    )
+    assert index.loc[("123_S_4567", "100")].Is_Dicom
+    assert index.loc[("123_S_4567", "200")].Path == str(
+        source_dir
+        / "123_S_4567"
+        / "FDG"
+        / "2013-01-01"
+        / "I200"
+        / "ADNI_123_S_4567_PT_FDG_I200.nii"
+    )
+    assert not index.loc[("123_S_4567", "200")].Is_Dicom
+
+
+def test_build_image_index_is_not_persisted(source_dir, tmp_path_factory, monkeypatch):
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("CLINICA_CACHE_DIR", str(cache_dir))
+    build_image_index(source_dir, ["123_S_4567"])
+    (source_dir / "123_S_4567" / "FDG" / "ADNI_123_S_4567_PT_FDG_I400.nii").touch()
+
+    index = build_image_index(source_dir, ["123_S_4567"])
+
+    assert set(index.Image_ID) == {"100", "200", "400"}
+    assert not any(cache_dir.iterdir())
+
+
+def test_load_image_index(source_dir, tmp_path_factory):
+    index_file = tmp_path_factory.mktemp("conversion_info") / "image_index.tsv"
+    assert load_image_index(index_file) is None
+    index = build_image_index(source_dir)
+    index.to_csv(index_file, sep="\t", index=False)
+
+    pd.testing.assert_frame_equal(load_image_index(index_file), index)
+
+
+def test_build_image_index_reuses_previous_index(source_dir, mocker):
+    import os
+
+    from clinica.iotools.converters.adni_to_bids.modality_converters import (
+        _image_path_utils,
+    )
+
+    previous_index = build_image_index(source_dir)
+    # Add an image to an existing series folder of the first subject
+    series_folder = source_dir / "123_S_4567" / "FDG" / "2013-01-01" / "I200"
+    (series_folder / "ADNI_123_S_4567_PT_FDG_I400.nii").touch()
+    mtime = os.stat(series_folder).st_mtime_ns
+    os.utime(series_folder, ns=(mtime, mtime + 10**9))
+    find_images = mocker.spy(_image_path_utils, "_find_images_of_subject")
+
+    index = build_image_index(source_dir, previous_index=previous_index)
+
+    find_images.assert_called_once_with(source_dir, "123_S_4567")
+    assert set(index.Image_ID) == {"100", "200", "300", "400"}
+    pd.testing.assert_frame_equal(
+        index[index.Subject_ID == "234_S_5678"].reset_index(drop=True),
+        previous_index[previous_index.Subject_ID == "234_S_5678"].reset_index(
+            drop=True
+        ),
+    )
+
+
+def test_build_image_index_ignores_previous_index_of_other_directory(
+    source_dir, tmp_path_factory, mocker
+):
+    from clinica.iotools.converters.adni_to_bids.modality_converters import (
+        _image_path_utils,
+    )
+
+    other_dir = tmp_path_factory.mktemp("adni")
+    previous_index = build_image_index(source_dir).assign(
+        Path=lambda df: df.Path.str.replace(str(source_dir), str(other_dir))
+    )
+    find_images = mocker.spy(_image_path_utils, "_find_images_of_subject")
+
+    index = build_image_index(source_dir, previous_index=previous_index)
+
+    assert find_images.call_count == 2
+    pd.testing.assert_frame_equal(index, build_image_index(source_dir))
+
+
+def test_find_image_path(source_dir):
+    images = pd.DataFrame(
+        {
+            "Subject_ID": ["123_S_4567", "123_S_4567", "123_S_4567", "234_S_5678"],
+            "VISCODE": ["bl", "m12", "m24", "bl"],
+            "Image_ID": ["200", "100", "300", "300"],
+        },
+        index=[3, 5, 7, 9],
+    )
+
+    images = find_image_path(images, source_dir, "T1")
+
+    assert list(images.Is_Dicom) == [False, True, True, True]
+    assert list(images.Path) == [
+        str(
+            source_dir
+            / "123_S_4567"
+            / "FDG"
+            / "2013-01-01"
+            / "I200"
+            / "ADNI_123_S_4567_PT_FDG_I200.nii"
+        ),
+        str(source_dir / "123_S_4567" / "MPRAGE" / "2012-01-01" / "I100"),
+        "",
+        str(source_dir / "234_S_5678" / "MPRAGE" / "I300"),
+    ]
+
+
+def test_find_image_path_with_image_index(source_dir):
+    image_index = build_image_index(source_dir, ["234_S_5678"])
+    images = pd.DataFrame(
+        {
+            "Subject_ID": ["123_S_4567", "234_S_5678"],
+            "VISCODE": ["bl", "bl"],
+            "Image_ID": ["100", "300"],
+        }
+    )
+
+    images = find_image_path(images, source_dir, "T1", image_index=image_index)
+
+    assert list(images.Path) == ["", str(source_dir / "234_S_5678" / "MPRAGE" / "I300")]
+
+
+def test_find_image_path_empty(source_dir):
+    images = pd.DataFrame(columns=["Subject_ID", "VISCODE", "Image_ID"])
+
+    images = find_image_path(images, source_dir, "T1")
+
+    assert list(images.columns) == [
+        "Subject_ID",
+        "VISCODE",
+        "Image_ID",
+        "Is_Dicom",
+        "Path",
+    ]
+    assert images.empty
@@ -1,6 +1,5 @@
 import pandas as pd
 import pytest
-from pandas.testing import assert_frame_equal, assert_series_equal
 
 from clinica.iotools.converters.adni_to_bids.adni_utils import ADNIStudy
 
@@ -56,71 +55,6 @@ def test_get_preferred_visit_name_visit_code_error():
         _get_preferred_visit_name(ADNIStudy("ADNI3"), "")
 
 
-@pytest.mark.parametrize(
-    "visits,expected", [([], 0), ([pd.Series({"EXAMDATE": "2010-06-06"})], 1)]
-)
-def test_get_closest_and_second_closest_visits_errors(visits, expected):
-    from clinica.iotools.converters.adni_to_bids.modality_converters._visits_utils import (
-        _get_closest_and_second_closest_visits,  # noqa
-    )
-
-    with pytest.raises(
-        ValueError,
-        match=f"Expected at least two visits, received {expected}.",
-    ):
-        _get_closest_and_second_closest_visits(visits, "2003-01-01")
-
-
-@pytest.fixture
-def visits() -> list[pd.Series]:
-    return [
-        pd.Series({"EXAMDATE": date})
-        for date in (
-            "2010-06-06",
-            "2015-10-23",
-            "2005-02-13",
-            "2018-02-16",
-            "2018-06-01",
-        )
-    ]
-
-
-@pytest.mark.parametrize(
-    (
-        "image_acquisition_date,"
-        "expected_closest_visit_date,"
-        "expected_second_closest_visit_date,"
-        "expected_difference_with_closest,"
-        "expected_difference_with_second_closest,"
-    ),
-    [
-        ("2003-01-01", "2005-02-13", "2010-06-06", 774, 2713),
-        ("2008-01-01", "2010-06-06", "2005-02-13", 887, 1052),
-        ("2015-10-23", "2015-10-23", "2018-02-16", 0, 847),
-    ],
-)
-def test_get_closest_and_second_closest_visits(
-    visits,
-    image_acquisition_date,
-    expected_closest_visit_date,
-    expected_second_closest_visit_date,
-    expected_difference_with_closest,
-    expected_difference_with_second_closest,
-):
-    from clinica.iotools.converters.adni_to_bids.modality_converters._visits_utils import (
-        _get_closest_and_second_closest_visits,  # noqa
-    )
-
-    closest, second, diff1, diff2 = _get_closest_and_second_closest_visits(
-        visits, image_acquisition_date
-    )
-
-    assert closest.EXAMDATE == expected_closest_visit_date
-    assert second.EXAMDATE == expected_second_closest_visit_date
-    assert diff1 == expected_difference_with_closest
-    assert diff2 == expected_difference_with_second_closest
-
-
 def test_get_smallest_time_difference_too_large_message():
     from clinica.iotools.converters.adni_to_bids.modality_converters._visits_utils import (
         _get_smallest_time_difference_too_large_message,  # noqa
@@ -146,104 +80,156 @@ def test_get_smallest_time_difference_too_large_message():
     )
 
 
-def test_get_closest_visit_empty():
+@pytest.fixture
+def closest_visit_timepoints() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            ("ADNI1", "bl", "foo", "2012-01-01"),
+            ("ADNI1", "m03", "bar", "2012-03-01"),
+            ("ADNI2", "m06", "baz", "2012-06-01"),
+            ("ADNI2", "m09", "foobarbaz", "2012-08-11"),
+            ("ADNI2", "m12", "foobar", "2013-03-20"),
+        ],
+        columns=["ORIGPROT", "VISCODE", "COLPROT", "EXAMDATE"],
+    )
+
+
+def _match_control_visit(scan_date: str, timepoints: pd.DataFrame) -> dict:
     from clinica.iotools.converters.adni_to_bids.modality_converters._visits_utils import (
-        _get_closest_visit,
+        visits_to_timepoints,
     )
 
-    assert _get_closest_visit("2012-03-04", "control visit", [], "sub-01") is None
+    return visits_to_timepoints(
+        "sub-01",
+        pd.DataFrame({"VISIT": ["control visit"], "SCANDATE": [scan_date]}),
+        timepoints,
+        "DWI",
+    )
 
 
-@pytest.fixture
-def closest_visit_timepoints() -> list[pd.Series]:
-    return [
-        pd.Series(
-            {
-                "ORIGPROT": "ADNI1",
-                "VISCODE": "bl",
-                "COLPROT": "foo",
-                "EXAMDATE": "2012-01-01",
-            }
-        ),
-        pd.Series(
-            {
-                "ORIGPROT": "ADNI1",
-                "VISCODE": "m03",
-                "COLPROT": "bar",
-                "EXAMDATE": "2012-03-01",
-            }
-        ),
-        pd.Series(
-            {
-                "ORIGPROT": "ADNI2",
-                "VISCODE": "m06",
-                "COLPROT": "baz",
-                "EXAMDATE": "2012-06-01",
-            }
-        ),
-        pd.Series(
-            {
-                "ORIGPROT": "ADNI2",
-                "VISCODE": "mfoo",
-                "COLPROT": "foobarbaz",
-                "EXAMDATE": "2012-08-11",
-            }
-        ),
-        pd.Series(
-            {
-                "ORIGPROT": "ADNI2",
-                "VISCODE": "m12",
-                "COLPROT": "foobar",
-                "EXAMDATE": "2013-03-20",
-            }
-        ),
-    ]
+def test_visits_to_timepoints_without_timepoint(closest_visit_timepoints):
+    assert _match_control_visit("2012-03-04", closest_visit_timepoints[:0]) == {}
+
+
+@pytest.mark.parametrize("scan_date", ["1809-03-04", "2012-01-01", "2066-12-31"])
+def test_visits_to_timepoints_single_timepoint(closest_visit_timepoints, scan_date):
+    assert _match_control_visit(scan_date, closest_visit_timepoints[:1]) == {
+        ("bl", "foo", "ADNI1"): "control visit"
+    }
 
 
 @pytest.mark.parametrize(
-    "image_acquisition_date", ["1809-03-04", "2012-01-01", "2066-12-31"]
+    "scan_date,expected",
+    [
+        ("2012-03-04", ("m03", "bar", "ADNI1")),
+        ("1989-06-16", ("bl", "foo", "ADNI1")),
+        ("2020-11-26", ("m12", "foobar", "ADNI2")),
+        # Special case where the second-closest timepoint is preferred over the closest one
+        ("2012-12-12", ("m09", "foobarbaz", "ADNI2")),
+    ],
 )
-def test_get_closest_visit_single_visit(
-    closest_visit_timepoints, image_acquisition_date
+def test_visits_to_timepoints_closest_timepoint(
+    closest_visit_timepoints, scan_date, expected
 ):
-    from clinica.iotools.converters.adni_to_bids.modality_converters._visits_utils import (
-        _get_closest_visit,
+    assert _match_control_visit(scan_date, closest_visit_timepoints) == {
+        expected: "control visit"
+    }
+
+
+@pytest.fixture
+def adnimerge() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            ("123_S_0001", "m12", "ADNI2", "ADNI2", "2013-01-01"),
+            ("123_S_0001", "bl", "ADNI2", "ADNI2", "2012-01-01"),
+            ("123_S_0001", "m03", "ADNI2", "ADNI2", "2012-04-01"),
+            ("123_S_0001", "m06", "ADNI2", "ADNI2", "2012-07-01"),
+            ("123_S_0002", "bl", "ADNI1", "ADNI1", "2008-01-01"),
+            ("123_S_0003", "bl", "ADNI3", "ADNI3", "2018-01-01"),
+        ],
+        columns=["PTID", "VISCODE", "COLPROT", "ORIGPROT", "EXAMDATE"],
     )
 
-    assert_series_equal(
-        _get_closest_visit(
-            image_acquisition_date,
-            "control visit",
-            closest_visit_timepoints[0:1],  # fake a single visit list
-            "sub-01",
-        ),
-        closest_visit_timepoints[0],
+
+@pytest.fixture
+def mri_list() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            ("123_S_0001", "Unscheduled", "2012-07-10"),
+            ("123_S_0001", "ADNI2 Screening MRI-New Pt", "2012-01-02"),
+            ("123_S_0001", "ADNI Baseline", "2012-04-03"),
+            ("123_S_0002", "Foo", "2010-01-01"),
+            ("123_S_0004", "ADNI Screening", "2018-01-01"),
+        ],
+        columns=["SUBJECT", "VISIT", "SCANDATE"],
     )
 
 
 @pytest.mark.parametrize(
-    "image_acquisition_date,expected",
+    "modality,expected",
     [
-        ("2012-03-04", 1),
-        ("1989-06-16", 0),
-        ("2020-11-26", -1),
         (
-            "2012-12-12",
-            -2,
-        ),  # Special case where the second-closest visit is preferred over the closest one
+            "T1",
+            {
+                "123_S_0001": {
+                    ("bl", "ADNI2", "ADNI2"): "ADNI2 Screening MRI-New Pt",
+                    ("m06", "ADNI2", "ADNI2"): "Unscheduled",
+                },
+                "123_S_0002": {("bl", "ADNI1", "ADNI1"): "Foo"},
+            },
+        ),
+        (
+            "DWI",
+            {
+                "123_S_0001": {
+                    ("bl", "ADNI2", "ADNI2"): "ADNI2 Screening MRI-New Pt",
+                    ("m03", "ADNI2", "ADNI2"): "ADNI Baseline",
+                    ("m06", "ADNI2", "ADNI2"): "Unscheduled",
+                },
+                "123_S_0002": {("bl", "ADNI1", "ADNI1"): "Foo"},
+            },
+        ),
     ],
 )
-def test_get_closest_visit(closest_visit_timepoints, image_acquisition_date, expected):
+def test_visits_to_timepoints_by_subject(mri_list, adnimerge, modality, expected):
     from clinica.iotools.converters.adni_to_bids.modality_converters._visits_utils import (
-        _get_closest_visit,
+        visits_to_timepoints,
+        visits_to_timepoints_by_subject,
     )
 
-    assert_series_equal(
-        _get_closest_visit(
-            image_acquisition_date,
-            "control visit",
-            closest_visit_timepoints,
-            "sub-01",
-        ),
-        closest_visit_timepoints[expected],
+    subjects = ["123_S_0001", "123_S_0002", "123_S_0003", "123_S_0004"]
+    timepoints = visits_to_timepoints_by_subject(
+        mri_list, adnimerge, modality, subjects
+    )
+
+    assert timepoints == expected
+    for subject in subjects:
+        assert timepoints.get(subject, {}) == visits_to_timepoints(
+            subject,
+            mri_list[mri_list.SUBJECT == subject].sort_values("SCANDATE"),
+            adnimerge[adnimerge.PTID == subject].sort_values("EXAMDATE"),
+            modality,
+        )
+
+
+def test_visits_to_timepoints_by_subject_prefers_earlier_timepoint():
+    """The image is far from its closest timepoint, and close to the middle of two timepoints."""
+    from clinica.iotools.converters.adni_to_bids.modality_converters._visits_utils import (
+        visits_to_timepoints_by_subject,
     )
+
+    adnimerge = pd.DataFrame(
+        [
+            ("123_S_0001", "m03", "ADNI1", "ADNI1", "2012-01-01"),
+            ("123_S_0001", "m06", "ADNI1", "ADNI1", "2012-10-01"),
+        ],
+        columns=["PTID", "VISCODE", "COLPROT", "ORIGPROT", "EXAMDATE"],
+    )
+    mri_list = pd.DataFrame(
+        [("123_S_0001", "Unscheduled", "2012-05-20")],
+        columns=["SUBJECT", "VISIT", "SCANDATE"],
+    )
+
+    assert visits_to_timepoints_by_subject(mri_list, adnimerge, "DWI") == {
+        "123_S_0001": {("m03", "ADNI1", "ADNI1"): "Unscheduled"}
+    }
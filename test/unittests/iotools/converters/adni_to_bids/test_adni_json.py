@@ -441,3 +441,53 @@ def test_add_json_scan_metadata(tmp_path, keep_none):
         else:
             assert new_metadata[k] == v
     os.remove(json_path)
+
+
+@pytest.mark.parametrize("n_procs", [1, 2])
+def test_run_parsers(tmp_path, n_procs):
+    """Test function `_run_parsers`."""
+    from clinica.iotools.converters.adni_to_bids.adni_json import (
+        _parse_xml_file,  # noqa
+        _run_parsers,  # noqa
+    )
+
+    xml_files = [
+        _write_xml_example(tmp_path, template_id=template_id)
+        for template_id in sorted(_get_xml_templates())
+    ]
+    xml_files.append(_write_xml_example(tmp_path, project="foo", suffix="bad"))
+
+    images, exceptions = _run_parsers(xml_files, n_procs=n_procs)
+
+    assert images == [_parse_xml_file(xml_file) for xml_file in xml_files[:-1]]
+    assert list(exceptions) == ["ADNI_123_S_4567_bad.xml"]
+    assert isinstance(exceptions["ADNI_123_S_4567_bad.xml"], ClinicaXMLParserError)
+
+
+def test_run_parsers_with_cache(tmp_path, mocker):
+    """Test that `_run_parsers` only parses the files modified since the previous run."""
+    from clinica.iotools.converters.adni_to_bids import adni_json
+
+    xml_files = [
+        _write_xml_example(tmp_path, template_id=template_id)
+        for template_id in sorted(_get_xml_templates())
+    ]
+    cache_file = tmp_path / "cache" / "metadata.pkl.gz"
+    images, _ = adni_json._run_parsers(xml_files, cache_file=cache_file)
+    parser = mocker.patch.object(
+        adni_json, "_parse_xml_file", side_effect=adni_json._parse_xml_file
+    )
+
+    assert adni_json._run_parsers(xml_files, cache_file=cache_file)[0] == images
+    assert adni_json._run_parsers(xml_files[:1], cache_file=cache_file)[0] == images[:1]
+    parser.assert_not_called()
+
+    _write_xml_example(
+        tmp_path, template_id=xml_files[1].stem, acq_time=pd.Timestamp(2018, 1, 1)
+    )
+    os.utime(xml_files[1], ns=(0, 10**9))
+    cached_images, _ = adni_json._run_parsers(xml_files, cache_file=cache_file)
+
+    parser.assert_called_once_with(xml_files[1])
+    assert cached_images[1]["acq_time"] == "2018-01-01T00:00:00"
+    assert cached_images[0] == images[0] and cached_images[2] == images[2]
@@ -290,3 +290,38 @@ def test_load_clinical_csv_value_error(tmp_path):
         "be loaded as a DataFrame. Please check your data.",
     ):
         load_clinical_csv(tmp_path, "adnimerge")
+
+
+def _fake_create_file(image, modality, bids_dir, mod_to_update, timings=None):
+    if image.Path == "":
+        return None
+    output_image = bids_dir / f"{image.Image_ID}.nii.gz"
+    output_image.touch()
+    timings["dcm2niix"] = 1.0
+    return output_image
+
+
+@pytest.mark.parametrize("n_procs", [1, 2])
+def test_paths_to_bids_resumes_from_journal(tmp_path, mocker, n_procs):
+    from clinica.iotools.converters.adni_to_bids import adni_utils
+    from clinica.iotools.converters.adni_to_bids.adni_utils import (
+        ADNIModalityConverter,
+        paths_to_bids,
+    )
+
+    create_file = mocker.patch.object(
+        adni_utils, "_create_file", side_effect=_fake_create_file
+    )
+    images = pd.DataFrame(
+        {"Image_ID": ["1", "2", "3"], "Path": ["a", "", "c"]}, index=[4, 5, 6]
+    )
+
+    outputs = paths_to_bids(images, tmp_path, ADNIModalityConverter.T1, n_procs=1)
+    resumed_outputs = paths_to_bids(
+        images, tmp_path, ADNIModalityConverter.T1, n_procs=n_procs
+    )
+
+    assert outputs == [tmp_path / "1.nii.gz", None, tmp_path / "3.nii.gz"]
+    assert resumed_outputs == outputs
+    assert create_file.call_count == 3 + (n_procs == 1)
+    assert (tmp_path / "conversion_info" / "journal" / "T1.tsv").exists()
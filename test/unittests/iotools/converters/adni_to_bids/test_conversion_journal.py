@@ -0,0 +1,44 @@
+from clinica.iotools.converters.adni_to_bids.conversion_journal import (
+    ConversionJournal,
+    get_journal_filename,
+)
+
+
+def test_get_journal_filename(tmp_path):
+    assert (
+        get_journal_filename(tmp_path, "T1")
+        == tmp_path / "conversion_info" / "journal" / "T1.tsv"
+    )
+
+
+def test_conversion_journal(tmp_path):
+    output_image = tmp_path / "sub-01_T1w.nii.gz"
+    output_image.touch()
+    journal = ConversionJournal(tmp_path / "journal" / "T1.tsv")
+    journal.record("100", output_image)
+    journal.record(200, tmp_path / "missing.nii.gz")
+
+    journal = ConversionJournal(tmp_path / "journal" / "T1.tsv")
+
+    assert len(journal) == 2
+    assert journal.get(100) == output_image
+    assert journal.get("200") is None
+    assert journal.get("300") is None
+
+
+def test_conversion_journal_incomplete_line(tmp_path):
+    output_image = tmp_path / "sub-01_T1w.nii.gz"
+    output_image.touch()
+    (tmp_path / "T1.tsv").write_text(f"Image_ID\toutput_image\n100\t{output_image}\n2")
+
+    assert len(ConversionJournal(tmp_path / "T1.tsv")) == 1
+
+
+def test_conversion_journal_reset(tmp_path):
+    journal = ConversionJournal(tmp_path / "T1.tsv")
+    journal.record("100", tmp_path)
+
+    journal = ConversionJournal(tmp_path / "T1.tsv", reset=True)
+
+    assert len(journal) == 0
+    assert not (tmp_path / "T1.tsv").exists()
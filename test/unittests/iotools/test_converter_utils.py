@@ -139,6 +139,23 @@ def test_missing_mods_tracker_add():
     assert tracker.missing["ses-M000"]["dwi"] == 1
 
 
+def test_missing_mods_tracker_add_missing_mods():
+    from clinica.iotools.converter_utils import MissingModsTracker
+
+    tracker = MissingModsTracker(["ses-M000", "ses-M006"], ["fmri", "dwi"])
+    tracker.add_missing_mods("ses-M006", {"session": 1, "dwi": 2, "fmri": 0})
+    tracker.add_missing_mods("ses-M006", {"dwi": 1})
+
+    assert tracker.missing["ses-M006"] == {"session": 1, "fmri": 0, "dwi": 3}
+    assert tracker.missing["ses-M000"] == {"session": 0, "fmri": 0, "dwi": 0}
+    with pytest.raises(
+        ValueError,
+        match="Modality foo is not tracked by this instance of MissingModsTracker.",
+    ):
+        tracker.add_missing_mods("ses-M000", {"dwi": 1, "foo": 1})
+    assert tracker.missing["ses-M000"]["dwi"] == 0
+
+
 def test_compute_statistics():
     from clinica.iotools.converter_utils import MissingModsTracker, compute_statistics
 
@@ -25,6 +25,8 @@ def center_all_nifti_mock(
     output_dir: PathLike,
     modalities: Optional[Iterable[str]] = None,
     center_all_files: bool = False,
+    link_files: bool = False,
+    n_procs: int = 1,
 ) -> List[Path]:
     result = []
     for filename in ("foo.txt", "bar.tsv", "baz.nii.gz"):
@@ -50,7 +52,14 @@ def test_center_nifti_log_file_creation_error(tmp_path, mocker):
             match="Could not create log file",
         ):
             center_nifti(tmp_path / "bids", tmp_path / "out", center_all_files=True)
-        mock.assert_called_once_with(tmp_path / "bids", tmp_path / "out", None, True)
+        mock.assert_called_once_with(
+            tmp_path / "bids",
+            tmp_path / "out",
+            None,
+            True,
+            link_files=False,
+            n_procs=1,
+        )
 
 
 def test_center_nifti(tmp_path):
@@ -66,7 +75,12 @@ def test_center_nifti(tmp_path):
     ) as mock:
         center_nifti(tmp_path / "bids", tmp_path / "out", ("anat", "pet", "dwi"))
         mock.assert_called_once_with(
-            tmp_path / "bids", tmp_path / "out", ("anat", "pet", "dwi"), False
+            tmp_path / "bids",
+            tmp_path / "out",
+            ("anat", "pet", "dwi"),
+            False,
+            link_files=False,
+            n_procs=1,
         )
         assert (
             len([f for f in output_dir.iterdir()]) == 4
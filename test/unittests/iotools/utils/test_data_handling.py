@@ -133,6 +133,112 @@ def test_build_warning_message(tmp_path):
     )
 
 
+def _write_image(filename: Path, affine: np.ndarray, dtype: str = "int16") -> Path:
+    import nibabel as nib
+
+    data = np.arange(6 * 7 * 8).reshape((6, 7, 8)).astype(dtype)
+    image = nib.Nifti1Image(data, affine)
+    image.header.set_slope_inter(0.5, 2.0)
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    image.to_filename(filename)
+    return filename
+
+
+@pytest.mark.parametrize("extension", [".nii", ".nii.gz"])
+@pytest.mark.parametrize("dtype", ["int16", "float32"])
+def test_center_nifti_origin_header_only(tmp_path, mocker, extension, dtype):
+    import nibabel as nib
+
+    from clinica.iotools.utils.data_handling import center_nifti_origin
+
+    affine = np.diag([1.2, 1.0, 1.5, 1.0])
+    affine[:3, 3] = [100.0, -50.0, 80.0]
+    input_image = _write_image(tmp_path / f"input{extension}", affine, dtype)
+    decode = mocker.spy(nib.Nifti1Image, "get_fdata")
+
+    output_image = center_nifti_origin(input_image, tmp_path / f"output{extension}")
+
+    decode.assert_not_called()
+    mocker.patch(
+        "clinica.iotools.utils.data_handling._centering._copy_with_centered_header",
+        return_value=False,
+    )
+    expected = nib.load(
+        center_nifti_origin(input_image, tmp_path / f"expected{extension}")
+    )
+    result = nib.load(output_image)
+    assert_array_equal(result.affine, expected.affine)
+    for field in ("qform_code", "sform_code", "srow_x", "srow_y", "srow_z", "pixdim"):
+        assert_array_equal(result.header[field], expected.header[field])
+    assert_array_equal(result.get_fdata(), nib.load(input_image).get_fdata())
+    assert_array_equal(
+        np.asanyarray(result.dataobj.get_unscaled()),
+        np.asanyarray(nib.load(input_image).dataobj.get_unscaled()),
+    )
+
+
+def test_center_nifti_origin_in_place_with_reorientation(tmp_path):
+    import nibabel as nib
+
+    from clinica.iotools.utils.data_handling import center_nifti_origin
+
+    affine = np.diag([-1.0, 1.0, 1.0, 1.0])
+    affine[:3, 3] = [100.0, -50.0, 80.0]
+    image = _write_image(tmp_path / "image.nii.gz", affine, "float32")
+    data = nib.load(image).get_fdata()
+
+    center_nifti_origin(image, image)
+
+    result = nib.load(image)
+    assert nib.aff2axcodes(result.affine) == ("R", "A", "S")
+    assert_array_equal(result.affine[:3, 3], [-3.0, -3.5, -4.0])
+    assert_array_equal(result.get_fdata(), data[::-1])
+
+
+@pytest.mark.parametrize("n_procs", [1, 2])
+def test_center_all_nifti(tmp_path, n_procs):
+    import os
+
+    import nibabel as nib
+
+    from clinica.iotools.utils.data_handling import center_all_nifti
+
+    bids_dir = tmp_path / "bids"
+    anat = bids_dir / "sub-01" / "ses-M000" / "anat"
+    (bids_dir / "dataset_description.json").parent.mkdir(parents=True)
+    (bids_dir / "dataset_description.json").write_text("{}")
+    affine = np.eye(4)
+    affine[:3, 3] = [100.0, -50.0, 80.0]
+    off_center = _write_image(anat / "sub-01_ses-M000_T1w.nii.gz", affine)
+    centered = _write_image(anat / "sub-01_ses-M000_flair.nii.gz", np.eye(4))
+    (anat / "sub-01_ses-M000_T1w.json").write_text("{}")
+    pet = _write_image(
+        bids_dir / "sub-01" / "ses-M000" / "pet" / "sub-01_ses-M000_pet.nii",
+        affine,
+    )
+    output_dir = tmp_path / "out"
+
+    result = center_all_nifti(
+        bids_dir, output_dir, modalities=["T1w"], link_files=True, n_procs=n_procs
+    )
+
+    output_anat = output_dir / "sub-01" / "ses-M000" / "anat"
+    assert result == [output_anat / "sub-01_ses-M000_T1w.nii.gz"]
+    assert np.linalg.norm(
+        nib.load(result[0]).affine @ np.array([3.0, 3.5, 4.0, 1.0])
+    ) < np.linalg.norm(affine[:3, 3])
+    assert not os.path.samefile(off_center, result[0])
+    for file in (
+        centered,
+        anat / "sub-01_ses-M000_T1w.json",
+        pet,
+        bids_dir / "dataset_description.json",
+    ):
+        output_file = output_dir / file.relative_to(bids_dir)
+        assert output_file.read_bytes() == file.read_bytes()
+    assert_array_equal(nib.load(off_center).affine, affine)
+
+
 def test_validate_output_tsv_path(tmp_path):
     from clinica.iotools.utils.data_handling._merging import _validate_output_tsv_path
 
@@ -201,6 +307,78 @@ def test_find_mods_and_sess(tmp_path):
     assert ses_mod["pet"] == {"pet_trc-18FFDG"}
 
 
+def test_compute_missing_mods(tmp_path, monkeypatch):
+    from clinica.iotools.utils.data_handling import compute_missing_mods
+
+    monkeypatch.setenv("CLINICA_CACHE_DIR", str(tmp_path / "cache"))
+    create_bids_dataset(tmp_path / "bids", write_tsv_files=True)
+    (
+        tmp_path
+        / "bids"
+        / "sub-03"
+        / "ses-M012"
+        / "anat"
+        / "sub-03_ses-M012_flair.nii.gz"
+    ).unlink()
+    (tmp_path / "bids" / "sub-01" / "ses-M000" / "func").mkdir()
+    (
+        tmp_path
+        / "bids"
+        / "sub-01"
+        / "ses-M000"
+        / "func"
+        / "sub-01_ses-M000_task-rest_bold.nii.gz"
+    ).touch()
+
+    compute_missing_mods(tmp_path / "bids", tmp_path / "out", "foo")
+
+    assert_frame_equal(
+        pd.read_csv(tmp_path / "out" / "foo_ses-M000.tsv", sep="\t"),
+        pd.DataFrame(
+            {
+                "participant_id": ["sub-01", "sub-02", "sub-03"],
+                "flair": [1, 1, 1],
+                "t1w": [1, 1, 1],
+                "func_task-rest": [1, 0, 0],
+                "pet_trc-18FFDG": [1, 1, 1],
+            }
+        ),
+    )
+    assert_frame_equal(
+        pd.read_csv(tmp_path / "out" / "foo_ses-M012.tsv", sep="\t"),
+        pd.DataFrame(
+            {
+                "participant_id": ["sub-01", "sub-02", "sub-03"],
+                "flair": [0, 0, 0],
+                "t1w": [0, 0, 1],
+                "func_task-rest": [0, 0, 0],
+                "pet_trc-18FFDG": [0, 0, 1],
+            }
+        ),
+    )
+    summary = (tmp_path / "out" / "foo_summary.txt").read_text()
+    assert "Number of sessions ses-M012 found: 1 (33.333333333333336%)" in summary
+    assert (
+        "ses-M000\nflair: 0 (0.0%) \nt1w: 0 (0.0%) \nfunc_task-rest: 2 (66.67%) "
+        in summary
+    )
+    assert (
+        "ses-M012\nflair: 1 (100.0%) \nt1w: 0 (0.0%) \nfunc_task-rest: 1 (100.0%) "
+        in summary
+    )
+    assert (tmp_path / "out" / "analysis.txt").exists()
+    assert not (tmp_path / "cache").exists()
+
+
+def test_compute_missing_mods_no_subjects(tmp_path):
+    from clinica.iotools.utils.data_handling import compute_missing_mods
+
+    (tmp_path / "bids").mkdir()
+
+    with pytest.raises(IOError, match="No subjects found"):
+        compute_missing_mods(tmp_path / "bids", tmp_path / "out")
+
+
 @pytest.fixture
 def expected_tsv_content() -> str:
     return (
@@ -416,6 +594,103 @@ def test_create_merge_file_from_bids(tmp_path):
     )
 
 
+def test_create_merge_file_from_bids_n_procs(tmp_path):
+    from clinica.iotools.utils.data_handling._merging import (
+        _create_merge_file_from_bids,
+        _get_participants_and_subjects_sessions_df,
+    )
+
+    create_bids_dataset(tmp_path / "bids", write_tsv_files=True)
+    participants, sessions = _get_participants_and_subjects_sessions_df(
+        tmp_path / "bids"
+    )
+
+    assert_frame_equal(
+        _create_merge_file_from_bids(
+            tmp_path / "bids", sessions, participants, n_procs=2
+        ),
+        _create_merge_file_from_bids(tmp_path / "bids", sessions, participants),
+    )
+
+
+def test_create_merge_file_from_bids_missing_participant(tmp_path):
+    from clinica.iotools.utils.data_handling._merging import (
+        _create_merge_file_from_bids,
+        _get_participants_and_subjects_sessions_df,
+    )
+
+    create_bids_dataset(tmp_path / "bids", write_tsv_files=True)
+    pd.DataFrame({"participant_id": ["sub-01", "sub-03"], "age": [72, 68]}).to_csv(
+        tmp_path / "bids" / "participants.tsv", sep="\t", index=False
+    )
+    participants, sessions = _get_participants_and_subjects_sessions_df(
+        tmp_path / "bids"
+    )
+
+    with pytest.warns(
+        UserWarning, match="Participant sub-02 does not exist in participants.tsv"
+    ):
+        df = _create_merge_file_from_bids(
+            tmp_path / "bids", sessions, participants, ignore_scan_files=True
+        )
+
+    assert df.columns.to_list() == ["participant_id", "session_id", "age"]
+    assert df.participant_id.to_list() == [
+        "sub-01",
+        "sub-01",
+        "sub-02",
+        "sub-03",
+        "sub-03",
+        "sub-03",
+    ]
+    assert df.age.dtype == object
+    assert df.age.to_list()[:2] + df.age.to_list()[3:] == [72, 72, 68, 68, 68]
+    assert pd.isna(df.age[2])
+
+
+def test_create_merge_file_output_formats_errors(tmp_path, mocker):
+    import sys
+
+    from clinica.iotools.utils.data_handling import create_merge_file
+    from clinica.utils.exceptions import ClinicaMissingDependencyError
+
+    create_bids_dataset(tmp_path / "bids", write_tsv_files=True)
+
+    with pytest.raises(
+        ValueError, match="Output formats \\['csv'\\] are not supported"
+    ):
+        create_merge_file(
+            tmp_path / "bids", tmp_path / "merge.tsv", output_formats=["csv"]
+        )
+    mocker.patch.dict(sys.modules, {"pyarrow": None})
+    with pytest.raises(
+        ClinicaMissingDependencyError,
+        match="The package 'pyarrow' is required to write parquet files.",
+    ):
+        create_merge_file(
+            tmp_path / "bids", tmp_path / "merge.tsv", output_formats=["parquet"]
+        )
+
+
+@pytest.mark.parametrize("output_format", ["parquet", "feather"])
+def test_create_merge_file_output_formats(tmp_path, output_format):
+    pytest.importorskip("pyarrow")
+    from clinica.iotools.utils.data_handling import create_merge_file
+
+    create_bids_dataset(tmp_path / "bids", write_tsv_files=True)
+
+    create_merge_file(
+        tmp_path / "bids", tmp_path / "merge.tsv", output_formats=[output_format]
+    )
+
+    read = pd.read_parquet if output_format == "parquet" else pd.read_feather
+    assert_frame_equal(
+        read(tmp_path / f"merge.{output_format}"),
+        pd.read_csv(tmp_path / "merge.tsv", sep="\t", dtype=str),
+        check_dtype=False,
+    )
+
+
 def test_post_process_merge_file_from_bids_column_reordering():
     from clinica.iotools.utils.data_handling._merging import (
         _post_process_merge_file_from_bids,
@@ -450,3 +450,47 @@ def test_extract_metrics_from_t1_freesurfer(tmp_path):
         "t1-freesurfer_atlas-destrieux_ROI-baz_thickness",
         "t1-freesurfer_segmentation-volumes_ROI-baz_volume",
     ]
+
+
+def test_extract_metrics_from_t1_freesurfer_n_procs(tmp_path):
+    from clinica.iotools.utils.pipeline_handling import (
+        pipeline_metric_extractor_factory,
+    )
+
+    caps = tmp_path / "caps"
+    for subject in ("sub-01", "sub-02", "sub-03"):
+        regional_measures_folder = (
+            caps
+            / "subjects"
+            / subject
+            / "ses-M000"
+            / "t1"
+            / "freesurfer_cross_sectional"
+            / "regional_measures"
+        )
+        regional_measures_folder.mkdir(parents=True)
+        for file in (
+            f"{subject}_ses-M000_parcellation-desikan_thickness.tsv",
+            f"{subject}_ses-M000_segmentationVolumes.tsv",
+        ):
+            write_fake_statistics(regional_measures_folder / file)
+    merged_df = pd.DataFrame(
+        {
+            "participant_id": ["sub-01", "sub-02", "sub-03", "sub-04"],
+            "session_id": ["ses-M000"] * 4,
+            "age": [85, 72, 64, 70],
+        }
+    )
+    extractor = pipeline_metric_extractor_factory(
+        PipelineNameForMetricExtraction.T1_FREESURFER
+    )
+
+    expected, expected_summary = extractor(caps, merged_df.copy())
+    result, summary = extractor(caps, merged_df.copy(), n_procs=2)
+
+    assert_frame_equal(result, expected)
+    assert_frame_equal(summary, expected_summary)
+    assert (
+        result["t1-freesurfer_atlas-desikan_ROI-foo_thickness"].to_list()[:3]
+        == [1.2] * 3
+    )
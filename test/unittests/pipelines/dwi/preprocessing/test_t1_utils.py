@@ -517,6 +517,59 @@ def test_split_dwi_dataset_with_b_values(tmp_path, extension):
     )
 
 
+def test_split_dwi_dataset_with_b_values_only_small_b(tmp_path):
+    from clinica.pipelines.dwi.preprocessing.t1.utils import (
+        _split_dwi_dataset_with_b_values,  # noqa
+    )
+    from clinica.utils.testing_utils import build_dwi_dataset
+
+    dwi_dataset = build_dwi_dataset(tmp_path, 9, 9, 9)
+    np.savetxt(dwi_dataset.b_values, [0] * 9)
+
+    small_b_dataset, large_b_dataset = _split_dwi_dataset_with_b_values(dwi_dataset)
+
+    assert large_b_dataset is None
+    assert nib.load(small_b_dataset.dwi).shape[-1] == 9
+
+
+def test_partition_dwi_dataset(tmp_path):
+    from clinica.pipelines.dwi.preprocessing.t1.utils import (
+        _partition_dwi_dataset,  # noqa
+    )
+    from clinica.pipelines.dwi.utils import DWIDataset
+
+    b_values = np.array([0, 1000, 2000, 0, 1000, 2000, 1000, 0])
+    b_vectors = np.random.random((3, 8))
+    np.savetxt(tmp_path / "foo.bval", b_values)
+    np.savetxt(tmp_path / "foo.bvec", b_vectors)
+    img_data = np.broadcast_to(np.arange(8.0), (5, 5, 5, 8))
+    nib.save(nib.Nifti1Image(img_data, affine=np.eye(4)), tmp_path / "foo.nii.gz")
+    working_directory = tmp_path / "working_directory"
+    working_directory.mkdir()
+    filters = {f"b{b}": np.flatnonzero(b_values == b) for b in (0, 1000, 2000)}
+
+    datasets = _partition_dwi_dataset(
+        DWIDataset(
+            dwi=tmp_path / "foo.nii.gz",
+            b_values=tmp_path / "foo.bval",
+            b_vectors=tmp_path / "foo.bvec",
+        ),
+        filters,
+        working_directory=working_directory,
+    )
+
+    for name, volumes in filters.items():
+        dataset = datasets[name]
+        assert dataset.dwi == working_directory / f"foo_{name}.nii.gz"
+        assert dataset.b_values == working_directory / f"foo_{name}.bval"
+        assert dataset.b_vectors == working_directory / f"foo_{name}.bvec"
+        assert_array_equal(nib.load(dataset.dwi).get_fdata()[0, 0, 0], volumes)
+        assert_array_equal(np.loadtxt(dataset.b_values, ndmin=1), b_values[volumes])
+        assert_array_almost_equal(
+            np.loadtxt(dataset.b_vectors), b_vectors[:, volumes], decimal=5
+        )
+
+
 def test_insert_b0_into_dwi(tmp_path):
     from clinica.pipelines.dwi.preprocessing.t1.utils import insert_b0_into_dwi
     from clinica.utils.testing_utils import build_dwi_dataset
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from clinica.pipelines.machine_learning import algorithm
+from clinica.pipelines.machine_learning.ml_utils import evaluate_prediction
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(60, 20))
+    y = (x[:, 0] + 0.5 * rng.normal(size=60) > 0).astype(int)
+    return x, y
+
+
+@pytest.mark.parametrize("balanced", [True, False])
+def test_dual_svm_grid_search(data, balanced):
+    x, y = data
+    kernel = x @ x.T
+    svm = algorithm.DualSVMAlgorithm(
+        kernel, y, {"balanced": balanced, "c_range": np.logspace(-4, 1, 6)}
+    )
+    train, test = np.arange(40), np.arange(40, 60)
+    args = (kernel[train][:, train], kernel[test][:, train], y[train], y[test])
+
+    accuracies = svm._grid_search(*args)
+
+    assert list(accuracies) == list(svm._algorithm_params["c_range"])
+    for c, accuracy in accuracies.items():
+        _, y_hat, _, _ = svm._launch_svc(*args, c)
+        assert accuracy == evaluate_prediction(y[test], y_hat)["balanced_accuracy"]
+
+
+@pytest.mark.parametrize("warm_start", [True, False])
+def test_logistic_regression_grid_search(data, warm_start):
+    x, y = data
+    c_range = np.logspace(1, -4, 6)
+    logistic = algorithm.LogisticReg(
+        x, y, {"c_range": c_range, "warm_start": warm_start}
+    )
+    train, test = np.arange(40), np.arange(40, 60)
+    args = (x[train], x[test], y[train], y[test])
+
+    accuracies = logistic._grid_search(*args)
+
+    assert list(accuracies) == list(c_range)
+    for c, accuracy in accuracies.items():
+        _, y_hat, _, _ = logistic._launch_logistic_reg(*args, c)
+        assert accuracy == evaluate_prediction(y[test], y_hat)["balanced_accuracy"]
+
+
+def test_select_best_parameter():
+    class Result:
+        def __init__(self, accuracies):
+            self._accuracies = accuracies
+
+        def get(self):
+            return self._accuracies
+
+    svm = algorithm.DualSVMAlgorithm(np.eye(2), np.array([0, 1]), {})
+    best = svm._select_best_parameter(
+        {
+            0: Result({0.01: 0.5, 0.1: 0.8, 1.0: 0.8}),
+            1: Result({0.01: 0.6, 0.1: 0.6, 1.0: 0.4}),
+        }
+    )
+
+    assert best["c"] == pytest.approx(np.sqrt(0.1 * 0.01))
+    assert best["balanced_accuracy"] == pytest.approx(0.7)
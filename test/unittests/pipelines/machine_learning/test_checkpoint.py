@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from clinica.pipelines.machine_learning.checkpoint import (
+    ValidationCheckpoint,
+    compute_fingerprint,
+)
+from clinica.pipelines.machine_learning.validation import RepeatedHoldOut
+
+
+class CountingAlgorithm:
+    def __init__(self, y):
+        self._kernel = np.eye(len(y))
+        self._y = y
+        self._algorithm_params = {"n_threads": 1}
+        self.evaluated = []
+
+    @staticmethod
+    def uses_kernel():
+        return True
+
+    def evaluate(self, train_index, test_index):
+        self.evaluated.append(tuple(test_index))
+        return {"y_index": test_index}
+
+    def apply_best_parameters(self, results):
+        return None, {}
+
+
+@pytest.fixture
+def y():
+    return np.array([0, 1] * 10)
+
+
+def test_checkpoint_results(tmp_path):
+    checkpoint = ValidationCheckpoint(tmp_path / "checkpoint", "key")
+    checkpoint.save_splits([(np.arange(3), np.arange(3, 5))])
+    checkpoint.save_result("iteration-0", {"auc": 0.5})
+
+    checkpoint = ValidationCheckpoint(tmp_path / "checkpoint", "key")
+
+    assert len(checkpoint) == 1
+    assert checkpoint.load_result("iteration-0") == {"auc": 0.5}
+    assert checkpoint.load_result("iteration-1") is None
+    assert_array_equal(checkpoint.load_splits()[0][1], np.arange(3, 5))
+
+
+def test_checkpoint_with_other_fingerprint_is_discarded(tmp_path):
+    checkpoint = ValidationCheckpoint(tmp_path / "checkpoint", "key")
+    checkpoint.save_splits([])
+    checkpoint.save_result("iteration-0", {"auc": 0.5})
+
+    checkpoint = ValidationCheckpoint(tmp_path / "checkpoint", "other_key")
+
+    assert len(checkpoint) == 0
+    assert checkpoint.load_splits() is None
+
+
+def test_compute_fingerprint(y):
+    fingerprint = compute_fingerprint(y, "data", {"n_iterations": 10, "n_threads": 4})
+
+    assert fingerprint == compute_fingerprint(
+        y, "data", {"n_iterations": 10, "n_threads": 8}
+    )
+    assert fingerprint != compute_fingerprint(
+        y, "data", {"n_iterations": 5, "n_threads": 4}
+    )
+    assert fingerprint != compute_fingerprint(
+        y[::-1], "data", {"n_iterations": 10, "n_threads": 4}
+    )
+    assert fingerprint != compute_fingerprint(
+        y, "other data", {"n_iterations": 10, "n_threads": 4}
+    )
+
+
+def test_repeated_hold_out_resumes_from_checkpoint(tmp_path, y):
+    params = {"n_iterations": 4, "n_threads": 1, "backend": "threads"}
+    checkpoint = ValidationCheckpoint(tmp_path / "checkpoint", "key")
+    algorithm = CountingAlgorithm(y)
+    _, _, results = RepeatedHoldOut(algorithm, params, checkpoint).validate(y)
+    (checkpoint.folder / "results" / "iteration-2.pkl").unlink()
+
+    resumed_algorithm = CountingAlgorithm(y)
+    _, _, resumed_results = RepeatedHoldOut(
+        resumed_algorithm, params, ValidationCheckpoint(checkpoint.folder, "key")
+    ).validate(y)
+
+    assert len(algorithm.evaluated) == 4
+    assert resumed_algorithm.evaluated == [tuple(results[2]["y_index"])]
+    for result, resumed_result in zip(results, resumed_results):
+        assert_array_equal(result["y_index"], resumed_result["y_index"])
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from clinica.pipelines.machine_learning.executor import (
+    CrossValidationExecutor,
+    SharedArray,
+)
+
+
+class DummyAlgorithm:
+    """Picklable algorithm returning what it sees of the data."""
+
+    def __init__(self, kernel, y):
+        self._kernel = kernel
+        self._y = y
+        self._algorithm_params = {"n_threads": 8}
+
+    @staticmethod
+    def uses_kernel():
+        return True
+
+    def evaluate(self, train_index, test_index):
+        return {
+            "kernel": np.array(self._kernel[test_index, :][:, train_index]),
+            "y": np.array(self._y[test_index]),
+            "n_threads": self._algorithm_params["n_threads"],
+        }
+
+
+@pytest.fixture
+def algorithm():
+    rng = np.random.default_rng(42)
+    kernel = rng.random((10, 10))
+    return DummyAlgorithm(kernel @ kernel.T, rng.integers(0, 2, 10))
+
+
+def test_shared_array_in_shared_memory():
+    array = np.arange(12, dtype="float32").reshape(3, 4)
+    description, memory = SharedArray.from_array(array)
+    try:
+        attached, attached_memory = description.attach()
+        assert_array_equal(attached, array)
+        assert not attached.flags.writeable
+        del attached
+        attached_memory.close()
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def test_shared_array_memmap_is_not_copied(tmp_path):
+    array = np.memmap(tmp_path / "x.dat", dtype="float32", mode="w+", shape=(3, 4))
+    array[:] = np.arange(12).reshape(3, 4)
+    array.flush()
+    description, memory = SharedArray.from_array(array)
+    attached, _ = description.attach()
+
+    assert memory is None
+    assert description.filename == str(tmp_path / "x.dat")
+    assert_array_equal(attached, array)
+
+
+@pytest.mark.parametrize(
+    "n_workers,n_tasks,expected_outer,expected_inner",
+    [(8, 10, 8, 1), (8, 2, 2, 4), (8, 3, 3, 2), (1, 10, 1, 1), (4, 0, 1, 4)],
+)
+def test_executor_caps_nested_workers(
+    algorithm, n_workers, n_tasks, expected_outer, expected_inner
+):
+    executor = CrossValidationExecutor(algorithm, n_workers, n_tasks)
+
+    assert executor.n_outer_workers == expected_outer
+    assert executor.n_inner_workers == expected_inner
+    assert algorithm._algorithm_params["n_threads"] == 8
+
+
+@pytest.mark.parametrize("backend", ["threads", "processes"])
+def test_executor_submit(algorithm, backend):
+    splits = [(np.arange(0, 6), np.arange(6, 10)), (np.arange(4, 10), np.arange(4))]
+    with CrossValidationExecutor(algorithm, 4, len(splits), backend) as executor:
+        futures = [executor.submit("evaluate", *split) for split in splits]
+
+    for future, (train_index, test_index) in zip(futures, splits):
+        result = future.result()
+        assert_array_equal(
+            result["kernel"], algorithm._kernel[test_index, :][:, train_index]
+        )
+        assert_array_equal(result["y"], algorithm._y[test_index])
+        assert result["n_threads"] == 2
+    assert algorithm._kernel is not None
@@ -0,0 +1,233 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+
+@pytest.fixture
+def images(tmp_path):
+    filenames = [tmp_path / f"image_{i}.nii.gz" for i in range(3)]
+    for filename in filenames:
+        filename.write_text(filename.name)
+    return [str(f) for f in filenames]
+
+
+def test_kernel_cache_key(images, tmp_path):
+    from clinica.pipelines.machine_learning.kernel_cache import KernelCache
+
+    cache = KernelCache(images, {"fwhm": 8}, tmp_path / "cache")
+
+    assert cache.folder.parent == tmp_path / "cache"
+    assert KernelCache(images, {"fwhm": 8}, tmp_path / "cache").key == cache.key
+    assert KernelCache(images, {"fwhm": 4}, tmp_path / "cache").key != cache.key
+    assert KernelCache(images[::-1], {"fwhm": 8}, tmp_path / "cache").key != cache.key
+    with open(images[0], "a") as fp:
+        fp.write("modified")
+    assert KernelCache(images, {"fwhm": 8}, tmp_path / "cache").key != cache.key
+
+
+def test_kernel_cache_kernel(images, tmp_path):
+    from clinica.pipelines.machine_learning.kernel_cache import KernelCache
+
+    cache = KernelCache(images, {}, tmp_path)
+    kernel = np.random.default_rng(0).random((3, 3))
+
+    assert cache.load_kernel() is None
+    cache.save_kernel(kernel)
+    assert_array_equal(cache.load_kernel(), kernel)
+    assert cache.load_kernel("other_kernel") is None
+
+    np.save(cache.folder / "gram_matrix_linear.npy", kernel + 1)
+    assert cache.load_kernel() is None
+
+
+def test_kernel_cache_features(images, tmp_path):
+    from clinica.pipelines.machine_learning.kernel_cache import KernelCache
+
+    cache = KernelCache(images, {}, tmp_path)
+    mask = np.array([True, False, True, True])
+    cache.folder.mkdir(parents=True)
+    features = np.memmap(
+        cache.features_filename, dtype="float32", mode="w+", shape=(3, 3)
+    )
+    features[:] = np.arange(9).reshape(3, 3)
+
+    assert cache.load_features() is None
+    cache.save_features(features, (2, 2), mask)
+    cached_features, shape, cached_mask = cache.load_features()
+
+    assert_array_equal(cached_features, features)
+    assert shape == (2, 2)
+    assert_array_equal(cached_mask, mask)
+
+
+def test_kernel_cache_features_in_memory(images, tmp_path):
+    from clinica.pipelines.machine_learning.kernel_cache import KernelCache
+
+    cache = KernelCache(images, {}, tmp_path)
+    features = np.random.default_rng(0).random((3, 5))
+
+    cache.save_features(features, features.shape[1:], None)
+    cached_features, shape, cached_mask = cache.load_features()
+
+    assert cached_features.dtype == np.float64
+    assert_array_equal(cached_features, features)
+    assert shape == (5,)
+    assert cached_mask is None
+
+
+@pytest.fixture
+def region_based_params(tmp_path):
+    import pandas as pd
+
+    subjects = [f"sub-{i:02d}" for i in range(4)]
+    pd.DataFrame({"participant_id": subjects, "session_id": "ses-M000"}).to_csv(
+        tmp_path / "subjects.tsv", sep="\t", index=False
+    )
+    pd.DataFrame({"diagnosis": ["AD", "CN"] * 2}).to_csv(
+        tmp_path / "diagnoses.tsv", sep="\t", index=False
+    )
+    rng = np.random.default_rng(0)
+    for subject in subjects:
+        folder = (
+            tmp_path
+            / "caps"
+            / "subjects"
+            / subject
+            / "ses-M000"
+            / "t1"
+            / "spm"
+            / "dartel"
+            / "group-UnitTest"
+            / "atlas_statistics"
+        )
+        folder.mkdir(parents=True)
+        pd.DataFrame(
+            {"index": range(5), "label_name": "x", "mean_scalar": rng.random(5)}
+        ).to_csv(
+            folder / f"{subject}_ses-M000_T1w_space-AAL2_map-graymatter_statistics.tsv",
+            sep="\t",
+            index=False,
+        )
+    params = {
+        "caps_directory": str(tmp_path / "caps"),
+        "subjects_visits_tsv": tmp_path / "subjects.tsv",
+        "diagnoses_tsv": tmp_path / "diagnoses.tsv",
+        "group_label": "UnitTest",
+        "image_type": "T1w",
+        "atlas": "AAL2",
+    }
+    return params
+
+
+def test_region_based_input_cache(region_based_params, mocker):
+    from clinica.pipelines.machine_learning import input, region_based_io
+
+    params = region_based_params
+    load_data = mocker.spy(region_based_io, "load_data")
+
+    kernel = input.CAPSRegionBasedInput(params).get_kernel()
+    second_input = input.CAPSRegionBasedInput(params)
+
+    assert_array_equal(second_input.get_kernel(), kernel)
+    assert_array_equal(second_input.get_x(), input.CAPSRegionBasedInput(params).get_x())
+    load_data.assert_called_once()
+
+
+def test_region_based_input_data_key(tmp_path):
+    import os
+
+    import pandas as pd
+
+    from clinica.pipelines.machine_learning import input
+
+    pd.DataFrame({"participant_id": ["sub-01"], "session_id": ["ses-M000"]}).to_csv(
+        tmp_path / "subjects.tsv", sep="\t", index=False
+    )
+    pd.DataFrame({"diagnosis": ["AD"]}).to_csv(
+        tmp_path / "diagnoses.tsv", sep="\t", index=False
+    )
+    image = (
+        tmp_path
+        / "caps"
+        / "subjects"
+        / "sub-01"
+        / "ses-M000"
+        / "t1"
+        / "spm"
+        / "dartel"
+        / "group-UnitTest"
+        / "atlas_statistics"
+        / "sub-01_ses-M000_T1w_space-AAL2_map-graymatter_statistics.tsv"
+    )
+    image.parent.mkdir(parents=True)
+    image.write_text("index\tlabel_name\tmean_scalar\n0\tx\t1.0\n")
+    params = {
+        "caps_directory": str(tmp_path / "caps"),
+        "subjects_visits_tsv": tmp_path / "subjects.tsv",
+        "diagnoses_tsv": tmp_path / "diagnoses.tsv",
+        "group_label": "UnitTest",
+        "image_type": "T1w",
+        "atlas": "AAL2",
+    }
+    key = input.CAPSRegionBasedInput(params).get_data_key()
+
+    assert input.CAPSRegionBasedInput(params).get_data_key() == key
+    assert (
+        input.CAPSRegionBasedInput(
+            {**params, "precomputed_kernel": np.ones((1, 1))}
+        ).get_data_key()
+        != key
+    )
+    stat = image.stat()
+    os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert input.CAPSRegionBasedInput(params).get_data_key() != key
+
+
+def _linear_kernel(x):
+    return x @ x.T
+
+
+def test_region_based_input_kernel_function(region_based_params):
+    from clinica.pipelines.machine_learning import input
+
+    kernel = input.CAPSRegionBasedInput(region_based_params).get_kernel(
+        kernel_function=_linear_kernel
+    )
+    second_input = input.CAPSRegionBasedInput(region_based_params)
+    x = second_input.get_x()
+
+    assert_array_almost_equal(kernel, x @ x.T)
+    assert_array_almost_equal(
+        second_input.get_kernel(kernel_function=lambda x: 2 * x @ x.T), 2 * kernel
+    )
+    assert_array_almost_equal(
+        input.CAPSRegionBasedInput(region_based_params).get_kernel(
+            kernel_function=_linear_kernel
+        ),
+        kernel,
+    )
+
+
+def test_get_kernel_name():
+    from functools import partial
+
+    from clinica.pipelines.machine_learning.input import _get_kernel_name
+    from clinica.pipelines.machine_learning.ml_utils import gram_matrix_linear
+
+    def _linear_kernel(x):
+        return -x @ x.T
+
+    scale = 2
+
+    assert _get_kernel_name(gram_matrix_linear).startswith(
+        "clinica_pipelines_machine_learning_ml_utils_gram_matrix_linear-"
+    )
+    assert _get_kernel_name(gram_matrix_linear) == _get_kernel_name(gram_matrix_linear)
+    assert _get_kernel_name(_linear_kernel) != _get_kernel_name(
+        globals()["_linear_kernel"]
+    )
+    assert _get_kernel_name(lambda x: x @ x.T) != _get_kernel_name(
+        lambda x: 2 * x @ x.T
+    )
+    assert _get_kernel_name(partial(gram_matrix_linear, block_size=2)) is None
+    assert _get_kernel_name(lambda x: scale * x @ x.T) is None
@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+
+@pytest.mark.parametrize("n_procs,block_size", [(1, 65536), (1, 7), (3, 10)])
+def test_gram_matrix_linear(tmp_path, n_procs, block_size):
+    from clinica.pipelines.machine_learning.ml_utils import gram_matrix_linear
+
+    rng = np.random.default_rng(42)
+    data = np.memmap(tmp_path / "x.dat", dtype="float32", mode="w+", shape=(6, 50))
+    data[:] = rng.random((6, 50))
+    expected = np.dot(data.astype(np.float64), data.astype(np.float64).T)
+
+    kernel = gram_matrix_linear(data, n_procs=n_procs, block_size=block_size)
+
+    assert kernel.dtype == np.float64
+    assert_allclose(kernel, expected)
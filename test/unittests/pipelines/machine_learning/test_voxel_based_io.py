@@ -0,0 +1,66 @@
+import nibabel as nib
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+
+@pytest.fixture
+def images(tmp_path):
+    rng = np.random.default_rng(42)
+    filenames = []
+    for i in range(5):
+        data = np.zeros((4, 5, 6))
+        data[1:3, 1:4, i] = rng.random((2, 3))
+        data[0, 0, 0] = np.nan
+        filename = tmp_path / f"image_{i}.nii.gz"
+        nib.save(nib.Nifti1Image(data, np.eye(4)), filename)
+        filenames.append(str(filename))
+    return filenames
+
+
+def _expected_data(images):
+    return np.vstack(
+        [
+            np.nan_to_num(nib.load(image).get_fdata(dtype="float32").ravel())
+            for image in images
+        ]
+    )
+
+
+@pytest.mark.parametrize("n_procs", [1, 3])
+def test_load_data(images, n_procs):
+    from clinica.pipelines.machine_learning.voxel_based_io import load_data
+
+    data, shape, data_mask = load_data(images, mask=True, n_procs=n_procs)
+    expected = _expected_data(images)
+
+    assert isinstance(data, np.memmap)
+    assert data.dtype == np.float32
+    assert shape == (4, 5, 6)
+    assert data_mask.sum() == 5 * 2 * 3
+    assert_array_equal(data_mask, (expected != 0).any(axis=0))
+    assert_array_equal(data, expected[:, data_mask])
+
+
+def test_load_data_without_mask(images, tmp_path):
+    from clinica.pipelines.machine_learning.voxel_based_io import load_data
+
+    data, shape, data_mask = load_data(images, mask=False, filename=tmp_path / "x.dat")
+
+    assert data_mask is None
+    assert (tmp_path / "x.dat").exists()
+    assert_array_equal(data, _expected_data(images))
+
+
+def test_revert_mask(images):
+    from clinica.pipelines.machine_learning.voxel_based_io import (
+        load_data,
+        revert_mask,
+    )
+
+    data, shape, data_mask = load_data(images)
+
+    assert_array_equal(
+        revert_mask(data[2], data_mask, shape),
+        np.nan_to_num(nib.load(images[2]).get_fdata(dtype="float32")),
+    )
@@ -0,0 +1,197 @@
+import nibabel as nib
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+
+def _write_annotation(filename, labels, names):
+    ctab = np.array([[i, 2 * i, 3 * i, 0] for i in range(len(names))], dtype=np.int32)
+    nib.freesurfer.io.write_annot(filename, labels, ctab, names)
+
+
+@pytest.fixture
+def surface_inputs(tmp_path):
+    rng = np.random.default_rng(0)
+    pet, atlas_files, labels = [], {}, {}
+    for hemi, n_vertices in (("lh", 50), ("rh", 40)):
+        filename = tmp_path / f"{hemi}.pet.mgh"
+        data = rng.random((n_vertices, 1, 1)).astype("float32")
+        nib.MGHImage(data, np.eye(4)).to_filename(filename)
+        pet.append(str(filename))
+    for atlas, names in (
+        ("desikan", ["unknown", "bankssts", "cuneus", "fusiform"]),
+        ("destrieux", ["Unknown", "G_and_S_frontomargin"]),
+    ):
+        atlas_files[atlas] = {}
+        for hemi, n_vertices in (("lh", 50), ("rh", 40)):
+            hemi_labels = rng.integers(-1, len(names), n_vertices)
+            # The last region has no vertex in the right hemisphere
+            if hemi == "rh":
+                hemi_labels[hemi_labels == len(names) - 1] = 0
+            filename = tmp_path / f"{hemi}.{atlas}.annot"
+            _write_annotation(filename, hemi_labels, names)
+            atlas_files[atlas][hemi] = str(filename)
+            labels[(atlas, hemi)] = hemi_labels
+    return pet, atlas_files, labels
+
+
+def test_produce_tsv(tmp_path, monkeypatch, surface_inputs):
+    from clinica.pipelines.pet_surface.pet_surface_utils import produce_tsv
+
+    pet, atlas_files, labels = surface_inputs
+    monkeypatch.chdir(tmp_path)
+
+    tsv_files = produce_tsv(pet, atlas_files)
+
+    assert tsv_files == (
+        str(tmp_path / "desikan.tsv"),
+        str(tmp_path / "destrieux.tsv"),
+    )
+    data = {
+        hemi: np.squeeze(nib.load(filename).get_fdata(dtype="float32"))
+        for hemi, filename in zip(("lh", "rh"), pet)
+    }
+    for atlas, tsv_file in zip(atlas_files, tsv_files):
+        names = nib.freesurfer.io.read_annot(atlas_files[atlas]["lh"])[2]
+        expected_names, expected_means = [], []
+        for region, name in enumerate(names):
+            for hemi in ("lh", "rh"):
+                hemi_labels = np.where(
+                    labels[(atlas, hemi)] == -1, 0, labels[(atlas, hemi)]
+                )
+                expected_names.append(f"{name.decode()}_{hemi}")
+                mask = hemi_labels == region
+                expected_means.append(data[hemi][mask].mean() if mask.any() else np.nan)
+        result = pd.read_csv(tsv_file, sep="\t")
+        assert list(result.columns) == ["index", "label_name", "mean_scalar"]
+        assert list(result["index"]) == list(range(len(expected_names)))
+        assert list(result.label_name) == expected_names
+        assert_array_almost_equal(result.mean_scalar, expected_means)
+        assert np.isnan(result.mean_scalar.iloc[-1])
+
+
+def test_produce_tsv_reads_annotations_once(
+    tmp_path, monkeypatch, surface_inputs, mocker
+):
+    from clinica.pipelines.pet_surface.pet_surface_utils import produce_tsv
+
+    pet, atlas_files, _ = surface_inputs
+    monkeypatch.chdir(tmp_path)
+    read_annot = mocker.spy(nib.freesurfer.io, "read_annot")
+
+    produce_tsv(pet, atlas_files)
+    produce_tsv(pet, atlas_files)
+
+    assert read_annot.call_count == 4
+
+
+@pytest.fixture
+def projection_inputs(tmp_path):
+    """Conformed T1 volume, PET volume and 7 surfaces on a grid shifted from the T1 grid."""
+    rng = np.random.default_rng(0)
+    orig = nib.MGHImage(np.zeros((32, 32, 32), dtype="float32"), None)
+    orig.header["Pxyz_c"] = np.array([3.5, -12.0, 20.25])
+    orig_nu = tmp_path / "orig_nu.mgz"
+    orig.to_filename(orig_nu)
+
+    affine = np.diag([2.0, 2.0, 2.0, 1.0])
+    affine[:3, 3] = [-30.0, -45.0, -10.0]
+    pet = tmp_path / "pet.nii.gz"
+    nib.Nifti1Image(rng.random((20, 25, 30)).astype("float32"), affine).to_filename(pet)
+
+    faces = np.array([[0, 1, 2]], dtype=np.int32)
+    surfaces = []
+    for i in range(7):
+        filename = tmp_path / f"lh.white_exp-{7 + i:03d}"
+        # Some vertices are outside the PET volume
+        vertices = rng.uniform(-22.0, 22.0, size=(200, 3))
+        nib.freesurfer.write_geometry(filename, vertices, faces)
+        surfaces.append(str(filename))
+    return str(pet), surfaces, str(orig_nu)
+
+
+def _sample_nearest_voxel(volume, surface, orig_nu):
+    """Projection of the volume on one surface, vertex by vertex, with nearest-voxel interpolation."""
+    pet = nib.load(volume)
+    data = pet.get_fdata(dtype="float32")
+    header = nib.load(orig_nu).header
+    tkr_to_scanner = header.get_vox2ras() @ np.linalg.inv(header.get_vox2ras_tkr())
+    vertices = nib.freesurfer.read_geometry(surface)[0]
+    samples = np.zeros(len(vertices))
+    for i, vertex in enumerate(vertices):
+        scanner = tkr_to_scanner @ np.append(vertex, 1.0)
+        voxel = np.linalg.inv(pet.affine) @ scanner
+        index = [int(np.floor(x + 0.5)) for x in voxel[:3]]
+        if all(0 <= k < n for k, n in zip(index, data.shape)):
+            samples[i] = data[tuple(index)]
+    return samples
+
+
+def test_sample_volume_on_surfaces(tmp_path, monkeypatch, projection_inputs):
+    from clinica.pipelines.pet_surface.pet_surface_utils import (
+        sample_volume_on_surfaces,
+    )
+
+    pet, surfaces, orig_nu = projection_inputs
+    coefficients = [0.1034, 0.1399, 0.1677, 0.1782, 0.1677, 0.1399, 0.1034]
+    expected = sum(
+        coefficient * _sample_nearest_voxel(pet, surface, orig_nu)
+        for coefficient, surface in zip(coefficients, surfaces)
+    )
+    monkeypatch.chdir(tmp_path)
+
+    projection = sample_volume_on_surfaces(pet, surfaces, orig_nu)
+
+    assert projection == str(
+        tmp_path / "lh.averaged_projection_on_cortical_surface.mgh"
+    )
+    result = nib.load(projection).get_fdata()
+    assert result.shape == (200, 1, 1)
+    assert np.count_nonzero(result) > 0
+    assert_array_almost_equal(result.ravel(), expected, decimal=6)
+
+
+def test_sample_volume_on_surfaces_trilinear(tmp_path, monkeypatch, projection_inputs):
+    from clinica.pipelines.pet_surface.pet_surface_utils import (
+        sample_volume_on_surfaces,
+    )
+
+    pet, surfaces, orig_nu = projection_inputs
+    # Trilinear interpolation of a linear function of the voxel coordinates is exact
+    image = nib.load(pet)
+    i, j, k = np.indices(image.shape)
+    nib.Nifti1Image(
+        (1.0 + i + 2 * j + 3 * k).astype("float32"), image.affine
+    ).to_filename(pet)
+    monkeypatch.chdir(tmp_path)
+
+    projection = sample_volume_on_surfaces(
+        pet, surfaces[:1], orig_nu, coefficients=[1.0], interpolation="trilinear"
+    )
+
+    header = nib.load(orig_nu).header
+    tkr_to_voxel = (
+        np.linalg.inv(image.affine)
+        @ header.get_vox2ras()
+        @ np.linalg.inv(header.get_vox2ras_tkr())
+    )
+    vertices = nib.freesurfer.read_geometry(surfaces[0])[0]
+    voxels = vertices @ tkr_to_voxel[:3, :3].T + tkr_to_voxel[:3, 3]
+    inside = np.all((voxels >= 0) & (voxels <= np.array(image.shape) - 1), axis=1)
+    expected = 1.0 + voxels @ np.array([1.0, 2.0, 3.0])
+    result = nib.load(projection).get_fdata().ravel()
+    assert inside.sum() > 0
+    assert_array_almost_equal(result[inside], expected[inside], decimal=3)
+
+
+def test_sample_volume_on_surfaces_errors(projection_inputs):
+    from clinica.pipelines.pet_surface.pet_surface_utils import (
+        sample_volume_on_surfaces,
+    )
+
+    pet, surfaces, orig_nu = projection_inputs
+    with pytest.raises(ValueError, match="There should be 7 surfaces"):
+        sample_volume_on_surfaces(pet, surfaces[:6], orig_nu)
+    with pytest.raises(ValueError, match="Interpolation should be"):
+        sample_volume_on_surfaces(pet, surfaces, orig_nu, interpolation="cubic")
@@ -140,3 +140,85 @@ def test_get_suvr_mask_error(label: str):
         match=f"'{label}' is not a valid SUVRReferenceRegion",
     ):
         get_suvr_mask(label)
+
+
+@pytest.fixture
+def pet_volume_images(tmp_path):
+    import nibabel as nib
+    import numpy as np
+
+    from clinica.utils.atlas import atlas_factory
+
+    atlas_image = nib.load(atlas_factory("AAL2").labels)
+    rng = np.random.default_rng(0)
+    images = {}
+    for name, data in (
+        ("pet", rng.random(atlas_image.shape, dtype="float32")),
+        ("region", (rng.random(atlas_image.shape) > 0.9).astype("float32")),
+        ("mask", (rng.random(atlas_image.shape) > 0.5).astype("float32")),
+    ):
+        images[name] = tmp_path / f"{name}.nii"
+        nib.save(nib.Nifti1Image(data, atlas_image.affine), images[name])
+    return images
+
+
+def test_compute_suvr_images(tmp_path, monkeypatch, pet_volume_images):
+    import nibabel as nib
+    import pandas as pd
+    from numpy.testing import assert_allclose
+
+    from clinica.pipelines.pet.volume.utils import (
+        apply_binary_mask,
+        compute_atlas_statistics,
+        compute_suvr_images,
+        normalize_to_reference,
+    )
+
+    (tmp_path / "fused").mkdir()
+    (tmp_path / "chained").mkdir()
+    monkeypatch.chdir(tmp_path / "fused")
+    suvr, masked, statistics = compute_suvr_images(
+        pet_volume_images["pet"],
+        pet_volume_images["region"],
+        pet_volume_images["mask"],
+        ["AAL2", "AICHA"],
+    )
+    monkeypatch.chdir(tmp_path / "chained")
+    expected_suvr = normalize_to_reference(
+        pet_volume_images["pet"], pet_volume_images["region"]
+    )
+    expected_masked = apply_binary_mask(expected_suvr, pet_volume_images["mask"])
+    expected_statistics = compute_atlas_statistics(expected_suvr, ["AAL2", "AICHA"])
+
+    for result, expected in zip(
+        [suvr, masked] + statistics,
+        [expected_suvr, expected_masked] + expected_statistics,
+    ):
+        assert result.parent == tmp_path / "fused"
+        assert result.name == expected.name
+    for result, expected in ((suvr, expected_suvr), (masked, expected_masked)):
+        assert_allclose(nib.load(result).get_fdata(), nib.load(expected).get_fdata())
+    for result, expected in zip(statistics, expected_statistics):
+        assert_allclose(
+            pd.read_csv(result, sep="\t").mean_scalar,
+            pd.read_csv(expected, sep="\t").mean_scalar,
+            rtol=1e-6,
+        )
+
+
+def test_create_pvc_mask(tmp_path, monkeypatch, pet_volume_images):
+    import nibabel as nib
+    from numpy.testing import assert_allclose
+
+    from clinica.pipelines.pet.volume.utils import create_pvc_mask
+
+    monkeypatch.chdir(tmp_path)
+    tissues = [pet_volume_images["pet"], pet_volume_images["mask"]]
+
+    mask = nib.load(create_pvc_mask(tissues)).get_fdata()
+
+    tissue_data = [nib.load(tissue).get_fdata() for tissue in tissues]
+    assert mask.shape == tissue_data[0].shape + (3,)
+    assert_allclose(mask[..., 0], tissue_data[0])
+    assert_allclose(mask[..., 1], tissue_data[1])
+    assert_allclose(mask[..., 2], 1.0 - tissue_data[0] - tissue_data[1], atol=1e-6)
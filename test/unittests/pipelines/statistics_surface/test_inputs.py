@@ -41,3 +41,115 @@ def test_read_and_check_tsv_file():
     df = read_and_check_tsv_file(Path(CURRENT_DIR) / "data/subjects.tsv")
     assert len(df) == 7
     assert set(df.columns) == {"group", "age", "sex"}
+
+
+@pytest.fixture
+def surface_dataset(tmp_path):
+    import nibabel as nib
+    import numpy as np
+
+    from clinica.pipelines.statistics_surface.surfstat._utils import (
+        get_t1_freesurfer_custom_file_template,
+    )
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "participant_id": ["sub-01", "sub-02", "sub-03"],
+            "session_id": ["ses-M000"] * 3,
+        }
+    ).set_index(["participant_id", "session_id"])
+    surface_file = get_t1_freesurfer_custom_file_template(tmp_path)
+    expected = []
+    for subject, session in df.index:
+        parts = []
+        for hemi, n_vertices in (("lh", 5), ("rh", 4)):
+            data = rng.random((n_vertices, 1, 1)).astype("float32")
+            filename = Path(
+                surface_file
+                % {"subject": subject, "session": session, "fwhm": 20, "hemi": hemi}
+            )
+            filename.parent.mkdir(parents=True, exist_ok=True)
+            nib.MGHImage(data, np.eye(4)).to_filename(filename)
+            parts.append(data.ravel())
+        expected.append(np.concatenate(parts))
+    return surface_file, df, np.vstack(expected)
+
+
+@pytest.mark.parametrize("n_procs", [1, 2])
+@pytest.mark.parametrize("use_cache", [True, False])
+def test_build_thickness_array(
+    tmp_path, monkeypatch, surface_dataset, n_procs, use_cache
+):
+    import numpy as np
+
+    from clinica.pipelines.statistics_surface.surfstat._utils import (
+        build_thickness_array,
+    )
+    from clinica.utils.filemanip import get_cache_folder
+
+    monkeypatch.setenv("CLINICA_CACHE_DIR", str(tmp_path / "cache"))
+    surface_file, df, expected = surface_dataset
+    thickness = build_thickness_array(
+        tmp_path, surface_file, df, 20, n_procs=n_procs, use_cache=use_cache
+    )
+
+    assert thickness.dtype == np.float32
+    np.testing.assert_array_equal(thickness, expected)
+    assert len(list(get_cache_folder("surfaces").glob("*.dat"))) == int(use_cache)
+
+
+def test_build_thickness_array_no_cache_by_default(
+    tmp_path, monkeypatch, surface_dataset
+):
+    from clinica.pipelines.statistics_surface.surfstat._utils import (
+        build_thickness_array,
+    )
+
+    monkeypatch.setenv("CLINICA_CACHE_DIR", str(tmp_path / "cache"))
+    surface_file, df, _ = surface_dataset
+    build_thickness_array(tmp_path, surface_file, df, 20)
+
+    assert not (tmp_path / "cache").exists()
+
+
+def test_build_thickness_array_cache(tmp_path, surface_dataset, mocker):
+    import nibabel as nib
+    import numpy as np
+
+    from clinica.pipelines.statistics_surface.surfstat._utils import (
+        build_thickness_array,
+    )
+
+    surface_file, df, expected = surface_dataset
+    build_thickness_array(tmp_path, surface_file, df, 20, use_cache=True)
+    fill_row = mocker.patch(
+        "clinica.pipelines.statistics_surface.surfstat._utils._fill_thickness_row"
+    )
+    thickness = build_thickness_array(
+        tmp_path, surface_file, df.assign(age=1), 20, use_cache=True
+    )
+
+    fill_row.assert_not_called()
+    np.testing.assert_array_equal(thickness, expected)
+    thickness[0, 0] = -1.0
+    np.testing.assert_array_equal(
+        build_thickness_array(tmp_path, surface_file, df, 20, use_cache=True),
+        expected,
+    )
+
+    mocker.stopall()
+    filename = surface_file % {
+        "subject": "sub-02",
+        "session": "ses-M000",
+        "fwhm": 20,
+        "hemi": "rh",
+    }
+    nib.MGHImage(np.zeros((4, 1, 1), dtype="float32"), np.eye(4)).to_filename(filename)
+    os.utime(filename, ns=(0, 0))
+    expected[1, 5:] = 0
+
+    np.testing.assert_array_equal(
+        build_thickness_array(tmp_path, surface_file, df, 20, use_cache=True),
+        expected,
+    )
@@ -322,3 +322,119 @@ def test_statistics_results_serializer(tmp_path):
             assert_array_almost_equal(mat[key]["mask"][0, 0], dummy_input)
         else:
             assert_array_almost_equal(mat[key], dummy_input)
+
+
+def _build_grid_surface(size: int) -> dict:
+    """Build a Brainstat surface of triangles on a square grid (1-based faces)."""
+    x, y = np.meshgrid(np.arange(size), np.arange(size))
+    coordinates = np.vstack([x.ravel(), y.ravel(), np.zeros(size * size)])
+    faces = []
+    for i in range(size - 1):
+        for j in range(size - 1):
+            vertex = i * size + j
+            faces.append([vertex, vertex + 1, vertex + size])
+            faces.append([vertex + 1, vertex + size + 1, vertex + size])
+    return {"coord": coordinates, "tri": np.array(faces) + 1}
+
+
+def _assert_slm_attribute_equal(result, expected, mask, name):
+    """Compare an attribute of two brainstat SLM models, on the vertices of the mask."""
+    if isinstance(expected, dict):
+        assert isinstance(result, dict) and result.keys() == expected.keys(), name
+        for key in expected:
+            _assert_slm_attribute_equal(
+                result[key], expected[key], mask, f"{name}.{key}"
+            )
+    elif isinstance(expected, (list, tuple)):
+        assert len(result) == len(expected), name
+        for i, (x, y) in enumerate(zip(result, expected)):
+            _assert_slm_attribute_equal(x, y, mask, f"{name}[{i}]")
+    elif isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(result, expected, obj=name)
+    elif isinstance(expected, np.ndarray):
+        # Values outside the mask are not defined (NaN T-statistics)
+        if expected.ndim > 0 and expected.shape[-1] == len(mask):
+            result, expected = result[..., mask], expected[..., mask]
+        assert_array_almost_equal(result, expected, err_msg=name)
+    else:
+        assert result is expected or result == expected, name
+
+
+@pytest.mark.parametrize("n_variates", [None, 1, 2])
+@pytest.mark.parametrize(
+    "model_type,design,contrast,group_label",
+    [
+        (GroupGLM, "1 + sex + age", "sex", "group_label"),
+        (GroupGLMWithInteraction, "1 + age", "age * sex", "group"),
+        (CorrelationGLM, "1 + age", "age", "group_label"),
+    ],
+)
+def test_glm_fit_matches_slm_fit(
+    df, model_type, design, contrast, group_label, n_variates
+):
+    """GLM.fit shares the linear model between the contrasts by calling the private
+    steps of brainstat SLM.fit: this fails if brainstat changes this sequence."""
+    from brainstat.stats.SLM import SLM
+
+    from clinica.pipelines.statistics_surface.surfstat.models.results import (
+        StatisticsResults,
+    )
+
+    surface = _build_grid_surface(8)
+    rng = np.random.default_rng(0)
+    shape = (len(df), 64) if n_variates is None else (len(df), 64, n_variates)
+    data = 2.0 + rng.normal(size=shape).cumsum(axis=1) / 10
+    mask = np.ones(64, dtype=bool)
+    mask[0] = False
+    model = model_type(design, df, "feature_label", contrast, group_label)
+    # One-tailed tests are not implemented for multivariate data
+    model._two_tailed = n_variates == 2
+
+    model.fit(data, surface, mask)
+
+    for contrast in model.contrasts:
+        slm_model = SLM(
+            model.model,
+            contrast=contrast.built_contrast,
+            surf=surface,
+            mask=mask,
+            two_tailed=model._two_tailed,
+            correction=["fdr", "rft"],
+            cluster_threshold=model.cluster_threshold,
+        )
+        slm_model.fit(data)
+        result = model.slm_models_[contrast.name]
+        assert vars(result).keys() == vars(slm_model).keys()
+        for name, expected in vars(slm_model).items():
+            _assert_slm_attribute_equal(getattr(result, name), expected, mask, name)
+        if n_variates is None:
+            expected = StatisticsResults.from_slm_model(slm_model, mask, 0.001, 0.05)
+            results = model.results[contrast.name]
+            assert_array_almost_equal(results.tstats, expected.tstats)
+            assert_array_almost_equal(
+                results.corrected_p_values.pvalues,
+                expected.corrected_p_values.pvalues,
+            )
+
+
+@pytest.mark.parametrize(
+    "shape,two_tailed,error,match",
+    [
+        ((7,), False, ValueError, "Input data must be two or three dimensional."),
+        ((7, 64, 1, 1), False, ValueError, "Input data must be two or three"),
+        ((7, 64, 2), False, NotImplementedError, "One-tailed tests are not"),
+        ((7, 64, 4), True, NotImplementedError, "Random Field Theory corrections"),
+    ],
+)
+def test_glm_fit_input_errors(df, shape, two_tailed, error, match):
+    surface = _build_grid_surface(8)
+    data = np.ones(shape)
+    mask = np.ones(64, dtype=bool)
+    model = GroupGLM("1 + sex + age", df, "feature_label", "sex", "group_label")
+    model._two_tailed = two_tailed
+    slm_model = model._build_slm_model(model.contrasts[0], surface, mask)
+
+    with pytest.raises(error, match=match):
+        slm_model.fit(data)
+    with pytest.raises(error, match=match):
+        model.fit(data, surface, mask)
@@ -362,3 +362,36 @@ def test_get_resolution_along_axis_error(test_image):
         ),
     ):
         _get_resolution_along_axis(test_image.header, axis=3)
+
+
+def test_atlas_registry_checksum_is_computed_once_per_file_version(tmp_path, mocker):
+    from clinica.utils.atlas import AtlasRegistry
+
+    mocked = mocker.patch("clinica.utils.inputs.compute_sha256_hash", return_value="1")
+    registry = AtlasRegistry()
+    (tmp_path / "labels.nii.gz").write_text("foo")
+    registry.get_checksum(tmp_path / "labels.nii.gz")
+    registry.get_checksum(tmp_path / "labels.nii.gz")
+
+    assert mocked.call_count == 1
+
+    (tmp_path / "labels.nii.gz").write_text("foo bar")
+    registry.get_checksum(tmp_path / "labels.nii.gz")
+
+    assert mocked.call_count == 2
+
+
+def test_atlas_label_data():
+    from clinica.utils.filemanip import get_cache_folder
+
+    atlas = AAL2()
+    expected = nib.load(atlas.labels).get_fdata(dtype="float32")
+    labels = atlas.get_label_data()
+
+    assert isinstance(labels, np.memmap)
+    assert not labels.flags.writeable
+    assert_array_equal(labels, expected)
+    assert len(list(get_cache_folder("atlases").glob("*.npy"))) >= 1
+    assert atlas.get_label_data() is labels
+    assert_array_equal(atlas.get_unique_labels(), np.unique(expected))
+    assert list(atlas.get_roi_table().columns[:2]) == ["roi_value", "roi_name"]
@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import pytest
+
+from clinica.utils.dataset_index import DatasetIndex, get_dataset_index
+
+
+@pytest.fixture
+def dataset(tmp_path) -> Path:
+    anat = tmp_path / "sub-01" / "ses-M000" / "anat"
+    anat.mkdir(parents=True)
+    (anat / "sub-01_ses-M000_T1w.nii.gz").touch()
+    (anat / "sub-01_ses-M000_T1w.json").touch()
+    (anat / ".hidden_T1w.nii.gz").touch()
+    pet = tmp_path / "sub-01" / "ses-M006" / "pet"
+    pet.mkdir(parents=True)
+    (pet / "sub-01_ses-M006_trc-18FFDG_pet.nii.gz").touch()
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pattern,directory,expected",
+    [
+        ("*_t1w.nii*", "", ["sub-01/ses-M000/anat/sub-01_ses-M000_T1w.nii.gz"]),
+        ("*_t1w.*", "sub-01/ses-M006", []),
+        (
+            "*_T1W.*",
+            "SUB-01/ses-m000",
+            [
+                "sub-01/ses-M000/anat/sub-01_ses-M000_T1w.json",
+                "sub-01/ses-M000/anat/sub-01_ses-M000_T1w.nii.gz",
+            ],
+        ),
+        (
+            "anat/*.nii.gz",
+            "sub-01",
+            ["sub-01/ses-M000/anat/sub-01_ses-M000_T1w.nii.gz"],
+        ),
+        ("ses-*/pet", "", ["sub-01/ses-M006/pet"]),
+        (
+            "sub-01/**/*pet.nii.gz",
+            "",
+            ["sub-01/ses-M006/pet/sub-01_ses-M006_trc-18FFDG_pet.nii.gz"],
+        ),
+        ("*.nii.gz", "sub-02", []),
+    ],
+)
+def test_dataset_index_glob(dataset, pattern, directory, expected):
+    index = DatasetIndex(dataset)
+    index.refresh([directory])
+
+    assert index.glob(pattern, directory) == expected
+
+
+def test_dataset_index_glob_many(dataset):
+    index = DatasetIndex(dataset)
+    index.refresh()
+
+    assert index.glob_many(["*_pet.nii.gz", "*.json", "*.mgz"], "sub-01") == [
+        ["sub-01/ses-M006/pet/sub-01_ses-M006_trc-18FFDG_pet.nii.gz"],
+        ["sub-01/ses-M000/anat/sub-01_ses-M000_T1w.json"],
+        [],
+    ]
+
+
+def test_dataset_index_iter_files(dataset):
+    index = DatasetIndex(dataset)
+    index.refresh()
+    files = {f.path: f for f in index.iter_files("sub-01/ses-M006")}
+
+    assert set(files) == {
+        "sub-01/ses-M006/pet",
+        "sub-01/ses-M006/pet/sub-01_ses-M006_trc-18FFDG_pet.nii.gz",
+    }
+    pet = files["sub-01/ses-M006/pet/sub-01_ses-M006_trc-18FFDG_pet.nii.gz"]
+    assert pet.lower_path == "sub-01/ses-m006/pet/sub-01_ses-m006_trc-18ffdg_pet.nii.gz"
+    assert pet.entities == {"sub": "01", "ses": "M006", "trc": "18FFDG"}
+    assert not pet.is_dir
+    assert files["sub-01/ses-M006/pet"].is_dir
+
+
+def test_dataset_index_refresh(dataset):
+    index = DatasetIndex(dataset)
+    index.refresh()
+    (
+        dataset / "sub-01" / "ses-M000" / "anat" / "sub-01_ses-M000_run-01_T1w.nii.gz"
+    ).touch()
+    (
+        dataset
+        / "sub-01"
+        / "ses-M006"
+        / "pet"
+        / "sub-01_ses-M006_trc-18FFDG_pet.nii.gz"
+    ).unlink()
+    (dataset / "sub-01" / "ses-M006" / "pet").rmdir()
+    index.refresh()
+
+    assert index.glob("*.nii.gz") == [
+        "sub-01/ses-M000/anat/sub-01_ses-M000_T1w.nii.gz",
+        "sub-01/ses-M000/anat/sub-01_ses-M000_run-01_T1w.nii.gz",
+    ]
+    assert "sub-01/ses-M006/pet" not in index._directories
+
+
+def test_dataset_index_refresh_does_not_list_unmodified_directories(dataset, mocker):
+    index = DatasetIndex(dataset)
+    index.refresh()
+    for record in index._directories.values():
+        record.scanned += 10**10
+    mocked = mocker.patch("clinica.utils.dataset_index._DirectoryRecord.from_directory")
+    index.refresh()
+
+    mocked.assert_not_called()
+
+
+def test_get_dataset_index_persistence(dataset, tmp_path_factory, monkeypatch):
+    from clinica.utils import dataset_index
+
+    monkeypatch.setenv("CLINICA_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+    monkeypatch.setattr(dataset_index, "_INDEXES", {})
+    index = get_dataset_index(dataset)
+
+    assert index.filename.exists()
+    loaded = DatasetIndex.load(dataset)
+    assert loaded._directories == index._directories
+    assert len(loaded) == 8
@@ -166,6 +166,17 @@ def test_get_filename_no_ext(filename, expected):
     assert get_filename_no_ext(filename) == expected
 
 
+def test_get_cache_folder(tmp_path, monkeypatch):
+    from clinica.utils.filemanip import get_cache_folder
+
+    monkeypatch.delenv("CLINICA_CACHE_DIR")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert get_cache_folder("index") == tmp_path / ".cache" / "clinica" / "index"
+
+    monkeypatch.setenv("CLINICA_CACHE_DIR", str(tmp_path / "cache"))
+    assert get_cache_folder("kernels") == tmp_path / "cache" / "kernels"
+
+
 def test_extract_image_ids_error():
     from clinica.utils.filemanip import extract_image_ids
 
@@ -3,7 +3,7 @@ import re
 import nibabel as nib
 import numpy as np
 import pytest
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_allclose, assert_array_equal
 
 
 @pytest.mark.parametrize(
@@ -33,6 +33,68 @@ def test_compute_aggregated_volume(tmp_path, aggregator, expected_value):
     )
 
 
+@pytest.mark.parametrize(
+    "aggregator", [None, np.average, np.mean, np.median, np.min, np.max, np.std]
+)
+@pytest.mark.parametrize(
+    "volumes_to_keep",
+    [None, np.array([0, 1, 2, 5, 6, 9, 10, 11]), np.arange(12) % 3 == 0],
+)
+def test_compute_aggregated_volume_by_chunks(tmp_path, aggregator, volumes_to_keep):
+    from clinica.utils.image import compute_aggregated_volume
+
+    img_data = np.random.default_rng(0).random((4, 5, 6, 12), dtype="float32")
+    nib.save(nib.Nifti1Image(img_data, affine=np.eye(4)), tmp_path / "foo.nii.gz")
+    kept = img_data if volumes_to_keep is None else img_data[..., volumes_to_keep]
+    expected = kept if aggregator is None else aggregator(kept, axis=-1)
+
+    result = compute_aggregated_volume(
+        tmp_path / "foo.nii.gz", aggregator, volumes_to_keep, chunk_size=2
+    )
+
+    assert result.dtype == np.float32
+    assert_allclose(result, expected, rtol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "shape,volumes_to_keep,message",
+    [
+        ((5, 5, 5), None, "Expecting a 4D image"),
+        ((5, 5, 5, 3), np.array([], dtype=int), "No volume"),
+    ],
+)
+def test_compute_aggregated_volume_errors(tmp_path, shape, volumes_to_keep, message):
+    from clinica.utils.image import compute_aggregated_volume
+
+    nib.save(nib.Nifti1Image(np.zeros(shape), affine=np.eye(4)), tmp_path / "foo.nii")
+
+    with pytest.raises(ValueError, match=message):
+        compute_aggregated_volume(tmp_path / "foo.nii", np.mean, volumes_to_keep)
+
+
+@pytest.mark.parametrize("shape", [(4, 5, 6, 12), (4, 5, 6)])
+def test_split_volumes(tmp_path, shape):
+    from clinica.utils.image import split_volumes
+
+    img_data = np.random.default_rng(0).random(shape, dtype="float32")
+    nib.save(nib.Nifti1Image(img_data, affine=np.eye(4)), tmp_path / "foo.nii.gz")
+    img_data = img_data.reshape(shape[:3] + (-1,))
+    n_volumes = img_data.shape[-1]
+    filters = {
+        "even": np.arange(0, n_volumes, 2),
+        "mask": np.arange(n_volumes) < 5,
+        "reversed": np.arange(n_volumes)[::-1],
+        "empty": np.array([], dtype=int),
+    }
+
+    splits = split_volumes(tmp_path / "foo.nii.gz", filters, chunk_size=3)
+
+    assert set(splits) == set(filters)
+    for name, volume_filter in filters.items():
+        assert splits[name].dtype == np.float32
+        assert_array_equal(splits[name], img_data[..., volume_filter])
+
+
 def test_get_new_image_like(tmp_path):
     from clinica.utils.image import get_new_image_like
 
@@ -147,6 +209,18 @@ def test_merge_nifti_images_in_time_dimension_3d_and_4d(
     assert_array_equal(out_img.get_fdata(), expected_data)
 
 
+def test_merge_nifti_images_in_time_dimension_spatial_shape_error(tmp_path):
+    from clinica.utils.image import merge_nifti_images_in_time_dimension
+
+    for i, shape in enumerate([(5, 5, 5, 2), (5, 5, 6)]):
+        nib.save(nib.Nifti1Image(np.zeros(shape), np.eye(4)), tmp_path / f"foo{i}.nii")
+
+    with pytest.raises(ValueError, match="same spatial dimensions"):
+        merge_nifti_images_in_time_dimension(
+            tuple(tmp_path / f"foo{i}.nii" for i in range(2))
+        )
+
+
 def test_remove_dummy_dimension_from_image(tmp_path):
     from clinica.utils.image import remove_dummy_dimension_from_image
 
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from clinica.utils.cli import LazyGroup
+
+
+@pytest.fixture
+def command_module(tmp_path, monkeypatch):
+    (tmp_path / "lazy_command_module.py").write_text(
+        "import click\n\n\n"
+        "@click.command(name='hello')\n"
+        "def cli():\n"
+        "    click.echo('hello')\n\n\n"
+        "not_a_command = 1\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_command_module"
+    sys.modules.pop("lazy_command_module", None)
+
+
+def test_lazy_group_imports_command_when_invoked(command_module):
+    group = LazyGroup(lazy_commands={"hello": f"{command_module}:cli"})
+    group.add_command(click.Command("eager"))
+
+    assert group.list_commands(click.Context(group)) == ["hello", "eager"]
+    assert command_module not in sys.modules
+
+    result = CliRunner().invoke(group, ["hello"])
+
+    assert result.exit_code == 0
+    assert result.output == "hello\n"
+    assert command_module in sys.modules
+
+
+@pytest.mark.parametrize(
+    "attribute,name,message",
+    [
+        ("cli", "goodbye", "is named 'hello'"),
+        ("not_a_command", "hello", "is not a click command"),
+    ],
+)
+def test_lazy_group_errors(command_module, attribute, name, message):
+    group = LazyGroup(
+        name="group", lazy_commands={name: f"{command_module}:{attribute}"}
+    )
+
+    with pytest.raises(ValueError, match=message):
+        group.get_command(click.Context(group), name)
+
+
+@pytest.mark.parametrize("group", ["convert", "run"])
+def test_declared_commands_exist(group):
+    from clinica.cmdline import cli
+
+    ctx = click.Context(cli)
+    lazy_group = cli.get_command(ctx, group)
+
+    for name in lazy_group.list_commands(ctx):
+        assert lazy_group.get_command(ctx, name).name == name
+
+
+def test_help_does_not_import_pipelines():
+    script = (
+        "import sys\n"
+        "from clinica.cmdline import cli\n"
+        "cli(['iotools', '--help'], standalone_mode=False)\n"
+        "print(sorted({'nipype', 'pydra', 'sklearn'} & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.splitlines()[-1] == "[]"
@@ -0,0 +1,34 @@
+import threading
+
+import pytest
+
+from clinica.utils.parallel import ParallelBackend, map_in_chunks
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+@pytest.mark.parametrize("backend", [ParallelBackend.THREADS, "processes"])
+@pytest.mark.parametrize("n_procs,chunk_size", [(1, None), (4, None), (3, 7)])
+def test_map_in_chunks(backend, n_procs, chunk_size):
+    assert map_in_chunks(
+        _square, range(100), n_procs=n_procs, chunk_size=chunk_size, backend=backend
+    ) == [x * x for x in range(100)]
+
+
+def test_map_in_chunks_empty():
+    assert map_in_chunks(_square, [], n_procs=4) == []
+
+
+def test_map_in_chunks_uses_workers():
+    thread_names = map_in_chunks(
+        lambda _: threading.current_thread().name, range(20), n_procs=4, chunk_size=5
+    )
+
+    assert threading.current_thread().name not in thread_names
+
+
+def test_map_in_chunks_error():
+    with pytest.raises(ValueError, match="'foo' is not a valid ParallelBackend"):
+        map_in_chunks(_square, range(10), n_procs=2, backend="foo")
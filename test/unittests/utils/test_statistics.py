@@ -0,0 +1,110 @@
+import nibabel as nib
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from clinica.utils.atlas import atlas_factory
+from clinica.utils.statistics import (
+    compute_statistics_on_labels,
+    statistics_on_atlas,
+    statistics_on_atlases,
+)
+
+
+def _naive_statistics(scalar_map, labels, label_values):
+    mean, std, count = [], [], []
+    for label in label_values:
+        values = scalar_map[labels == label].astype("float64")
+        count.append(values.size)
+        mean.append(values.mean() if values.size else np.nan)
+        std.append(values.std() if values.size else np.nan)
+    return np.array(mean), np.array(std), np.array(count)
+
+
+@pytest.fixture
+def labels():
+    return np.random.default_rng(0).integers(0, 6, size=(8, 9, 10)).astype("float32")
+
+
+def test_compute_statistics_on_labels(labels):
+    scalar_map = np.random.default_rng(1).random(labels.shape, dtype="float32")
+    label_values = [0, 1, 3, 5, 7]
+
+    statistics = compute_statistics_on_labels(scalar_map, labels, label_values)
+
+    mean, std, count = _naive_statistics(scalar_map, labels, label_values)
+    assert_allclose(statistics["mean"], mean, rtol=1e-6)
+    assert_allclose(statistics["std"], std, rtol=1e-5)
+    assert_array_equal(statistics["count"], count)
+    assert np.isnan(statistics["mean"][-1])
+
+
+def test_compute_statistics_on_labels_batch(labels):
+    maps = np.random.default_rng(2).random((3,) + labels.shape)
+
+    statistics = compute_statistics_on_labels(maps, labels, range(6))
+
+    assert statistics["mean"].shape == (3, 6)
+    for scalar_map, mean in zip(maps, statistics["mean"]):
+        assert_allclose(mean, _naive_statistics(scalar_map, labels, range(6))[0])
+
+
+@pytest.mark.parametrize(
+    "maps,label_values,message",
+    [
+        (np.zeros((2, 3)), [1], "do not have the shape"),
+        (np.zeros((8, 9, 10)), [-1], "non-negative"),
+    ],
+)
+def test_compute_statistics_on_labels_errors(labels, maps, label_values, message):
+    with pytest.raises(ValueError, match=message):
+        compute_statistics_on_labels(maps, labels, label_values)
+
+
+def test_statistics_on_atlases(tmp_path):
+    atlases = [atlas_factory("AAL2"), atlas_factory("AICHA")]
+    atlas_image = nib.load(atlases[0].labels)
+    scalar_map = np.random.default_rng(3).random(atlas_image.shape, dtype="float32")
+    nib.save(nib.Nifti1Image(scalar_map, atlas_image.affine), tmp_path / "map.nii.gz")
+    out_files = [tmp_path / "aal2.tsv", tmp_path / "aicha.tsv"]
+
+    statistics_on_atlases(tmp_path / "map.nii.gz", atlases, out_files)
+
+    for atlas, out_file in zip(atlases, out_files):
+        df = pd.read_csv(out_file, sep="\t", index_col=0)
+        roi = pd.read_csv(atlas.tsv_roi, sep="\t")
+        labels = nib.load(atlas.labels).get_fdata(dtype="float32")
+        expected, _, _ = _naive_statistics(scalar_map, labels, roi.roi_value)
+        assert list(df.columns) == ["label_name", "mean_scalar"]
+        assert list(df.label_name) == list(roi.roi_name)
+        assert_allclose(df.mean_scalar, expected, rtol=1e-5)
+
+
+def test_statistics_on_atlas_default_filename(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    atlas_image = nib.load(atlas_factory("AAL2").labels)
+    nib.save(
+        nib.Nifti1Image(
+            np.ones(atlas_image.shape, dtype="float32"), atlas_image.affine
+        ),
+        tmp_path / "sub-01_map.nii.gz",
+    )
+
+    out_file = statistics_on_atlas(tmp_path / "sub-01_map.nii.gz", "AAL2")
+
+    assert out_file == tmp_path / "sub-01_map_statistics_AAL2.tsv"
+    assert (pd.read_csv(out_file, sep="\t").mean_scalar == 1).all()
+
+
+def test_statistics_on_atlases_in_memory_image(tmp_path):
+    atlas_image = nib.load(atlas_factory("AAL2").labels)
+    image = nib.Nifti1Image(
+        np.full(atlas_image.shape, 2.0, dtype="float32"), atlas_image.affine
+    )
+
+    with pytest.raises(ValueError, match="output files must be provided"):
+        statistics_on_atlases(image, ["AAL2"])
+    statistics_on_atlases(image, ["AAL2"], [tmp_path / "aal2.tsv"])
+
+    assert (pd.read_csv(tmp_path / "aal2.tsv", sep="\t").mean_scalar == 2).all()
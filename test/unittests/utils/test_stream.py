@@ -71,3 +71,26 @@ def test_log_and_warn(message: str, warning_type: Type[Warning]):
         match=message,
     ):
         log_and_warn(message, warning_type)
+
+
+def _log_in_worker(message: str) -> None:
+    from clinica.utils.stream import cprint
+
+    cprint(message, lvl="warning")
+    cprint(f"{message} (debug)", lvl="debug")
+
+
+def test_listen_to_worker_logs(caplog):
+    from multiprocessing import Pool
+
+    from clinica.utils.stream import listen_to_worker_logs, setup_worker_logging
+
+    with listen_to_worker_logs() as queue:
+        with Pool(2, initializer=setup_worker_logging, initargs=(queue, 20)) as pool:
+            pool.map(_log_in_worker, ["foo", "bar"])
+            pool.close()
+            pool.join()
+
+    assert sorted(
+        record.message for record in caplog.records if record.name == "clinica"
+    ) == ["bar", "foo"]
@@ -805,6 +805,49 @@ def test_clinica_list_of_files_reader(tmp_path):
     assert len(results[1]) == 0
 
 
+def test_clinica_batch_file_reader(tmp_path):
+    from clinica.utils.inputs import clinica_batch_file_reader, clinica_file_reader
+
+    config = {
+        "sub-01": ["ses-M00"],
+        "sub-02": ["ses-M00", "ses-M06"],
+        "sub-06": ["ses-M00"],
+    }
+    build_bids_directory(tmp_path, config)
+    (
+        tmp_path / "sub-02" / "ses-M00" / "anat" / "sub-02_ses-M00_foo-bar_flair.nii.gz"
+    ).mkdir()
+    information = [
+        {"pattern": "sub-*_ses-*_t1w.nii*", "description": "T1w MRI"},
+        {"pattern": "sub-*_ses-*_flair.nii*", "description": "FLAIR T2w MRI"},
+        {"pattern": "sub-*_ses-*_pet.nii*", "description": "PET"},
+    ]
+    subjects = ["sub-02", "sub-06", "sub-02"]
+    sessions = ["ses-M00", "ses-M00", "ses-M06"]
+
+    results, errors = clinica_batch_file_reader(
+        subjects, sessions, tmp_path, information
+    )
+
+    assert (results, errors) == tuple(
+        map(
+            list,
+            zip(
+                *(
+                    clinica_file_reader(subjects, sessions, tmp_path, info)
+                    for info in information
+                )
+            ),
+        )
+    )
+    assert [len(r) for r in results] == [3, 2, 0]
+    assert errors[1] == [InvalidSubjectSession("sub-02", "ses-M00")]
+    assert clinica_batch_file_reader([], [], tmp_path, information) == (
+        [[], [], []],
+        [[], [], []],
+    )
+
+
 def test_clinica_group_reader(tmp_path):
     from clinica.utils.inputs import clinica_group_reader
 